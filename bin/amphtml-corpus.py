@@ -0,0 +1,840 @@
+"""
+This script generates a synthetic corpus of post content from the AMPHTML
+validator spec, to load test the sanitizers with realistic input at scale.
+
+Run it from the root of the plugin with:
+
+`python bin/amphtml-corpus.py amphtml/ --out-dir /tmp/corpus --documents 1000 --seed 1`
+
+The amphtml location can be a checkout or a .tar.gz, .tgz or .zip archive of
+one, as for amphtml-update.py. Each document is written to the output
+directory as document-NNNNN.html, and manifest.json lists the size, the
+number of elements and the seeded violations of each.
+
+The elements are built from the tag specs of the spec: with their mandatory
+attributes, a supported layout and its dimensions, some of their optional
+attributes, under the parents and ancestors they require and away from the
+ones they disallow, and with the children they require. Plain HTML
+containers nest them up to --depth levels deep, with text. With
+--error-rate, that fraction of the elements gets a seeded violation instead:
+a disallowed attribute, an invalid attribute value, an element under the
+wrong parent or ancestor, or, once per document, a stylesheet over the size
+limit of the spec. Without violations, the documents are valid, so
+amphtml-validate.py reports no errors for them.
+
+The same spec, options and --seed give the same corpus, so it makes for a
+deterministic benchmark of the sanitizers, and since the elements come from
+the spec, the corpus follows it when it is upgraded.
+"""
+
+import argparse
+import cgi
+import collections
+import imp
+import json
+import logging
+import os
+import random
+import re
+import sre_constants
+import sre_parse
+import sys
+import time
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(os.path.dirname(os.path.realpath(__file__)), 'amphtml-update.py'))
+amphtml_validate = imp.load_source('amphtml_validate', os.path.join(os.path.dirname(os.path.realpath(__file__)), 'amphtml-validate.py'))
+
+# The dimensions which each layout needs.
+LAYOUT_DIMENSIONS = {
+	'fixed': ('width', 'height'),
+	'fixed-height': ('height',),
+	'intrinsic': ('width', 'height'),
+	'responsive': ('width', 'height'),
+}
+
+# Elements of the document itself, which post content doesn't have.
+DOCUMENT_ELEMENTS = frozenset(['!doctype', 'body', 'head', 'html'])
+
+# Elements which get text and nested elements.
+FLOW_CONTAINERS = frozenset(['article', 'aside', 'blockquote', 'dd', 'details', 'div', 'fieldset', 'figure', 'footer', 'form', 'header', 'li', 'main', 'nav', 'noscript', 'section'])
+
+# Elements which get text and nested elements, but not block elements, which HTML parsers would move out of them.
+PHRASING_CONTAINERS = frozenset(['a', 'abbr', 'b', 'cite', 'code', 'dt', 'em', 'figcaption', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'i', 'label', 'mark', 'p', 'q', 's', 'small', 'span', 'strong', 'sub', 'summary', 'sup', 'time', 'u'])
+
+# Elements which only get text.
+TEXT_ELEMENTS = frozenset(['button', 'caption', 'option', 'pre', 'td', 'textarea', 'th', 'title'])
+
+# Elements which HTML parsers move out of phrasing content, closing an open p for instance.
+BLOCK_ELEMENTS = frozenset([
+	'address', 'article', 'aside', 'blockquote', 'dd', 'details', 'dialog', 'div', 'dl', 'dt', 'fieldset', 'figcaption',
+	'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre',
+	'section', 'table', 'ul',
+])
+
+# Elements which can't be nested in one another.
+NO_SELF_NESTING = frozenset(['a', 'button', 'form', 'label', 'p'])
+
+# The only children of some elements, and the only parents of others.
+CHILD_ELEMENTS = {'dl': ('dt', 'dd'), 'ol': ('li',), 'ul': ('li',)}
+PARENT_ELEMENTS = {'dd': ('dl',), 'dt': ('dl',), 'figcaption': ('figure',), 'li': ('ol', 'ul'), 'summary': ('details',)}
+
+# Attributes to seed as disallowed, when the element doesn't allow them.
+DISALLOWED_ATTRIBUTES = collections.OrderedDict([
+	('onclick', 'alert(document.cookie)'),
+	('onmouseover', 'track(this)'),
+	('contenteditable', 'true'),
+	('formaction', 'https://example.com/submit'),
+	('ping', 'https://example.com/track'),
+])
+
+# Violations which can be seeded.
+VIOLATIONS = ('disallowed_attribute', 'invalid_value', 'wrong_ancestor', 'oversized_css')
+
+WORDS = (
+	'amp', 'article', 'blog', 'caption', 'carousel', 'comment', 'content', 'design', 'editor', 'gallery', 'image', 'layout',
+	'lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit', 'sed', 'do', 'eiusmod', 'tempor', 'magna',
+	'media', 'news', 'page', 'post', 'quote', 'story', 'theme', 'video', 'widget', 'world', 'the', 'and', 'with', 'for',
+)
+
+# Characters to pick from for the character classes of regexes.
+REGEX_CHARACTERS = u'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.:/ '
+
+# The characters which the categories of regexes, like \d, match.
+REGEX_CATEGORIES = {
+	sre_constants.CATEGORY_DIGIT: re.compile(r'\d'),
+	sre_constants.CATEGORY_NOT_DIGIT: re.compile(r'\D'),
+	sre_constants.CATEGORY_SPACE: re.compile(r'\s'),
+	sre_constants.CATEGORY_NOT_SPACE: re.compile(r'\S'),
+	sre_constants.CATEGORY_WORD: re.compile(r'\w'),
+	sre_constants.CATEGORY_NOT_WORD: re.compile(r'\W'),
+}
+
+
+def Die(msg):
+	print >> sys.stderr, msg
+	sys.exit(1)
+
+
+def LoadRules(path):
+	"""Reads the rules of a spec revision, as ParseRules() gives them.
+
+	Args:
+		path: path to an amphtml checkout or archive.
+	Returns:
+		Tuple of the allowed tags, attribute lists, descendant lists, reference points and versions.
+	"""
+	if path.endswith(amphtml_update.ARCHIVE_EXTENSIONS) and os.path.isfile(path):
+		validator_directory = amphtml_update.ReadArchiveSpecFiles(path)
+	else:
+		validator_directory = os.path.join(path, 'validator')
+		if not os.path.exists(os.path.join(validator_directory, 'validator.proto')):
+			Die('Error: The amphtml directory does not exist: %s' % validator_directory)
+	return amphtml_update.ReadValidatorRules(os.path.join(validator_directory, 'validator.proto'), amphtml_update.GetValidatorProtoasciiFiles(validator_directory))
+
+
+class Node(object):
+	"""An element of a generated document."""
+
+	def __init__(self, tag_name, rule_spec=None):
+		self.tag_name = tag_name
+		self.rule_spec = rule_spec
+		self.attrs = collections.OrderedDict()
+		self.children = []
+		self.parent = None
+
+		# Tag names which the descendants are restricted to by a descendant tag list, or None.
+		self.allowed_descendants = None
+
+	def AppendChild(self, child):
+		child.parent = self
+		self.children.append(child)
+		if child.allowed_descendants is None:
+			child.allowed_descendants = self.allowed_descendants
+
+	def RemoveChild(self, child):
+		self.children.remove(child)
+		child.parent = None
+
+	def GetAncestors(self):
+		node = self
+		while node:
+			yield node
+			node = node.parent
+
+	def CountElements(self):
+		return sum(1 + child.CountElements() for child in self.children if isinstance(child, Node))
+
+	def Serialize(self):
+		html = u'<%s%s>' % (self.tag_name, u''.join(u' %s="%s"' % (attr_name, cgi.escape(value, True)) for (attr_name, value) in self.attrs.items()))
+		if self.tag_name in amphtml_validate.VOID_ELEMENTS:
+			return html
+		for child in self.children:
+			if isinstance(child, Node):
+				html += child.Serialize()
+			elif 'style' == self.tag_name:
+				html += child
+			else:
+				html += cgi.escape(child)
+		return html + u'</%s>' % self.tag_name
+
+
+def GenerateRegexMatch(pattern, rnd, flags=0):
+	"""Generates a string which a regex of the spec matches in full.
+
+	Args:
+		pattern: regex.
+		rnd: random.Random to pick with.
+		flags: flags of the regex, such as re.I.
+	Returns:
+		The string, or None if the regex uses syntax which isn't supported or no match could be generated.
+	"""
+	try:
+		parsed = sre_parse.parse(pattern, flags)
+		regex = re.compile(u'^(%s)$' % pattern, flags | re.UNICODE)
+	except (re.error, sre_constants.error):
+		return None
+
+	def PickFromClass(items):
+		negate = bool(items) and sre_constants.NEGATE == items[0][0]
+
+		def Matches(char):
+			for (op, av) in items:
+				if sre_constants.LITERAL == op and ord(char) == av:
+					return True
+				if sre_constants.RANGE == op and av[0] <= ord(char) <= av[1]:
+					return True
+				if sre_constants.CATEGORY == op and av in REGEX_CATEGORIES and REGEX_CATEGORIES[av].match(char):
+					return True
+			return False
+
+		candidates = [char for char in REGEX_CHARACTERS if Matches(char) != negate]
+		if not negate:
+			candidates.extend(unichr(av) for (op, av) in items if sre_constants.LITERAL == op)
+		return rnd.choice(candidates) if candidates else None
+
+	def Generate(items):
+		parts = []
+		for (op, av) in items:
+			if sre_constants.LITERAL == op:
+				parts.append(unichr(av))
+			elif sre_constants.NOT_LITERAL == op:
+				parts.append(rnd.choice([char for char in REGEX_CHARACTERS if ord(char) != av]))
+			elif sre_constants.ANY == op:
+				parts.append(rnd.choice(REGEX_CHARACTERS.strip()))
+			elif sre_constants.IN == op:
+				char = PickFromClass(av)
+				if char is None:
+					return None
+				parts.append(char)
+			elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+				(minimum, maximum, item) = av
+				for i in range(rnd.randint(minimum, min(maximum, minimum + 3))):
+					part = Generate(item)
+					if part is None:
+						return None
+					parts.append(part)
+			elif sre_constants.SUBPATTERN == op:
+				part = Generate(av[-1])
+				if part is None:
+					return None
+				parts.append(part)
+			elif sre_constants.BRANCH == op:
+				part = Generate(rnd.choice(av[1]))
+				if part is None:
+					return None
+				parts.append(part)
+			elif op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+				continue
+			else:
+				return None
+		return u''.join(parts)
+
+	for attempt in range(10):
+		value = Generate(parsed)
+		if value is not None and regex.match(value):
+			return value
+	return None
+
+
+class CorpusGenerator(object):
+	"""Generates documents of post content from the rules of the spec."""
+
+	def __init__(self, rules, depth=3, error_rate=0.0):
+		"""
+		Args:
+			rules: tuple of the allowed tags, attribute lists, descendant lists, reference points and versions, as
+				ParseRules() returns them.
+			depth: maximum depth to nest elements at, besides the children which elements require.
+			error_rate: fraction of the elements to seed a violation into.
+		"""
+		(self.allowed_tags, attr_lists, self.descendant_lists, self.reference_points, versions) = rules
+		self.globally_allowed_attrs = attr_lists['$GLOBAL_ATTRS']
+		self.layout_allowed_attrs = attr_lists['$AMP_LAYOUT_ATTRS']
+		self.depth = depth
+		self.error_rate = error_rate
+
+		# The rule specs of post content, which have no CDATA to generate.
+		self.rule_specs = []
+		for tag_name in sorted(self.allowed_tags):
+			if tag_name in DOCUMENT_ELEMENTS:
+				continue
+			for rule_spec in self.allowed_tags[tag_name]:
+				if 'extension_spec' not in rule_spec['tag_spec'] and not rule_spec.get('cdata'):
+					self.rule_specs.append((tag_name, rule_spec))
+
+		# The attributes which the parents and ancestors in spec names have, to tell contexts apart by.
+		self.spec_names = {}
+		spec_name_attrs = set()
+		for rule_specs in self.allowed_tags.values():
+			for rule_spec in rule_specs:
+				tag_spec = rule_spec['tag_spec']
+				for spec_name in [tag_spec.get('mandatory_parent'), tag_spec.get('mandatory_ancestor')] + list(tag_spec.get('disallowed_ancestor') or []):
+					if spec_name:
+						spec_name_attrs.update(self.ParseSpecName(spec_name)['attributes'])
+		self.spec_name_attrs = sorted(spec_name_attrs)
+
+		self.max_css_bytes = None
+		for rule_spec in self.allowed_tags.get('style', []):
+			if 'amp-custom' in rule_spec['attr_spec_list'] and 'max_bytes' in (rule_spec.get('cdata') or {}):
+				self.max_css_bytes = rule_spec['cdata']['max_bytes']
+
+		self.placeable_rule_specs = {}
+		self.misplaceable_rule_specs = {}
+		self.regexes = {}
+
+		# The state of the document being generated.
+		self.random = None
+		self.element_count = 0
+		self.unique_rule_specs = None
+		self.violations = None
+
+	def GenerateDocument(self, rnd, elements):
+		"""Generates a document.
+
+		Args:
+			rnd: random.Random to generate the document with.
+			elements: number of elements to generate, about.
+		Returns:
+			Tuple of the HTML of the document, its number of elements and the list of the violations seeded into it.
+		"""
+		self.random = rnd
+		self.element_count = 0
+		self.unique_rule_specs = set()
+		self.violations = []
+
+		html = Node('html')
+		html.AppendChild(Node('head'))
+		body = Node('body')
+		html.AppendChild(body)
+		while self.element_count < elements:
+			if not self.AddChild(body, 0):
+				break
+
+		return (u''.join(child.Serialize() + u'\n' for child in body.children), body.CountElements(), self.violations)
+
+	def AddChild(self, parent, depth):
+		"""Adds an element to a parent, with a violation at the error rate.
+
+		Returns:
+			Whether an element was added.
+		"""
+		if self.error_rate and self.random.random() < self.error_rate:
+			seeders = {
+				'disallowed_attribute': self.SeedDisallowedAttribute,
+				'invalid_value': self.SeedInvalidValue,
+				'wrong_ancestor': self.SeedWrongAncestor,
+				'oversized_css': self.SeedOversizedCss,
+			}
+			violations = list(VIOLATIONS)
+			self.random.shuffle(violations)
+			for violation in violations:
+				if seeders[violation](parent, depth):
+					return True
+		return self.AddValidElement(parent, depth) is not None
+
+	def AddValidElement(self, parent, depth):
+		"""Adds an element from one of the rule specs which can be placed in a parent.
+
+		Returns:
+			The element, or None if none could be generated.
+		"""
+		rule_specs = self.GetPlaceableRuleSpecs(parent)
+		for attempt in range(5):
+			if not rule_specs:
+				break
+			(tag_name, rule_spec) = self.random.choice(rule_specs)
+			node = self.GenerateElement(tag_name, rule_spec, parent, depth)
+			if node:
+				return node
+		return None
+
+	def GetContextKey(self, parent):
+		"""Gets what the placement of an element in a parent depends on: the tag names and attributes of its ancestors."""
+		ancestors = tuple((node.tag_name, tuple((attr_name, node.attrs[attr_name].lower()) for attr_name in self.spec_name_attrs if attr_name in node.attrs)) for node in parent.GetAncestors())
+		return (ancestors, tuple(sorted(parent.allowed_descendants)) if parent.allowed_descendants is not None else None)
+
+	def GetPlaceableRuleSpecs(self, parent):
+		"""Gets the rule specs of the elements which can be valid children of a parent."""
+		key = self.GetContextKey(parent)
+		if key not in self.placeable_rule_specs:
+			self.placeable_rule_specs[key] = [(tag_name, rule_spec) for (tag_name, rule_spec) in self.rule_specs if self.CanContain(parent, tag_name) and self.IsPlaceable(tag_name, rule_spec['tag_spec'], parent)]
+		return [(tag_name, rule_spec) for (tag_name, rule_spec) in self.placeable_rule_specs[key] if id(rule_spec) not in self.unique_rule_specs]
+
+	def CanContain(self, parent, tag_name):
+		"""Whether HTML parsers keep an element as a child of a parent, rather than moving it out."""
+		if tag_name in PARENT_ELEMENTS and parent.tag_name not in PARENT_ELEMENTS[tag_name]:
+			return False
+		if parent.tag_name in CHILD_ELEMENTS and tag_name not in CHILD_ELEMENTS[parent.tag_name]:
+			return False
+		if tag_name in BLOCK_ELEMENTS and any(node.tag_name in PHRASING_CONTAINERS for node in parent.GetAncestors()):
+			return False
+		if tag_name in NO_SELF_NESTING and any(tag_name == node.tag_name for node in parent.GetAncestors()):
+			return False
+		return True
+
+	def ParseSpecName(self, spec_name):
+		if spec_name not in self.spec_names:
+			self.spec_names[spec_name] = amphtml_update.ParseSpecName(spec_name)
+		return self.spec_names[spec_name]
+
+	def MatchesSpecName(self, node, spec_name):
+		"""Whether an element matches the spec name of a parent or ancestor, as in the sanitizer."""
+		parsed_spec_name = self.ParseSpecName(spec_name)
+		if node.tag_name != parsed_spec_name['tag_name']:
+			return False
+		for (attr_name, attr_value) in parsed_spec_name['attributes'].items():
+			if True is attr_value:
+				if attr_name not in node.attrs:
+					return False
+			elif node.attrs.get(attr_name, u'').lower() != attr_value:
+				return False
+		return True
+
+	def IsPlaceable(self, tag_name, tag_spec, parent):
+		"""Whether an element of a tag spec can be placed in a parent, like validate_tag_spec_for_node() checks."""
+		if parent.allowed_descendants is not None and tag_name not in parent.allowed_descendants:
+			return False
+		if tag_spec.get('mandatory_parent') and not self.MatchesSpecName(parent, tag_spec['mandatory_parent']):
+			return False
+		for disallowed_ancestor in tag_spec.get('disallowed_ancestor') or []:
+			if any(self.MatchesSpecName(node, disallowed_ancestor) for node in parent.GetAncestors()):
+				return False
+		if tag_spec.get('mandatory_ancestor') and not any(self.MatchesSpecName(node, tag_spec['mandatory_ancestor']) for node in parent.GetAncestors()):
+			return False
+		return True
+
+	def GenerateElement(self, tag_name, rule_spec, parent, depth):
+		"""Generates an element from a rule spec, with its attributes and children, and adds it to a parent.
+
+		Returns:
+			The element, or None if the attributes or children it requires could not be generated.
+		"""
+		tag_spec = rule_spec['tag_spec']
+		element_count = self.element_count
+		node = Node(tag_name, rule_spec)
+		parent.AppendChild(node)
+		if tag_spec.get('descendant_tag_list') in self.descendant_lists:
+			node.allowed_descendants = set(self.descendant_lists[tag_spec['descendant_tag_list']])
+			if parent.allowed_descendants is not None:
+				node.allowed_descendants &= parent.allowed_descendants
+
+		if not self.GenerateAttributes(node) or not self.GenerateChildren(node, depth):
+			parent.RemoveChild(node)
+			self.element_count = element_count
+			return None
+
+		if tag_spec.get('unique'):
+			self.unique_rule_specs.add(id(rule_spec))
+		self.element_count += 1
+		return node
+
+	def GetReferencePointAttrs(self, parent):
+		"""Gets the attribute specs which the reference points of a parent's tag spec give its children."""
+		attr_spec_list = {}
+		if parent.rule_spec:
+			for spec_name in sorted(parent.rule_spec['tag_spec'].get('reference_points', {})):
+				attr_spec_list.update(self.reference_points.get(spec_name, {}).get('attr_spec_list', {}))
+		return attr_spec_list
+
+	def GetAttrSpec(self, node, attr_name):
+		"""Gets the spec of an attribute of an element, from its tag spec, its parent's reference points or the global attributes."""
+		for attr_spec_list in (node.rule_spec['attr_spec_list'], self.GetReferencePointAttrs(node.parent), self.globally_allowed_attrs):
+			if attr_name in attr_spec_list:
+				return attr_spec_list[attr_name]
+		return None
+
+	def GenerateAttributes(self, node):
+		"""Generates the mandatory attributes of an element, its layout and some optional attributes.
+
+		Returns:
+			Whether the mandatory attributes could be generated.
+		"""
+		attr_spec_list = node.rule_spec['attr_spec_list']
+		tag_spec = node.rule_spec['tag_spec']
+
+		for attr_name in sorted(attr_spec_list):
+			if attr_spec_list[attr_name].get('mandatory'):
+				value = self.GenerateAttrValue(attr_name, attr_spec_list[attr_name])
+				if value is None:
+					return False
+				node.attrs[attr_name] = value
+
+		for (attr_name, attr_spec) in sorted(self.GetReferencePointAttrs(node.parent).items()):
+			if attr_name not in node.attrs and not attr_name.startswith('[') and self.random.random() < (0.8 if attr_spec.get('mandatory') else 0.2):
+				value = self.GenerateAttrValue(attr_name, attr_spec)
+				if value is not None:
+					node.attrs[attr_name] = value
+
+		layouts = [amphtml_update.LAYOUT_ENUM[layout] for layout in tag_spec.get('amp_layout', {}).get('supported_layouts', []) if layout in amphtml_update.LAYOUT_ENUM]
+		if layouts:
+			layout = self.random.choice(layouts)
+			node.attrs['layout'] = layout
+			for dimension in LAYOUT_DIMENSIONS.get(layout, ()):
+				if dimension not in node.attrs:
+					node.attrs[dimension] = self.GenerateAttrValue(dimension, attr_spec_list.get(dimension, {})) or u'300'
+
+		alternative_names = set()
+		for attr_spec in attr_spec_list.values():
+			alternative_names.update(attr_spec.get('alternative_names', []))
+		# The dimensions are only those of the layout, since fixed-height allows no width for instance.
+		optional_attrs = [attr_name for attr_name in sorted(attr_spec_list) if attr_name not in node.attrs and attr_name not in alternative_names and not attr_name.startswith('[') and 'dispatch_key' not in attr_spec_list[attr_name] and not (layouts and attr_name in ('height', 'width'))]
+		optional_attrs += [attr_name for attr_name in ('class', 'id', 'title') if attr_name in self.globally_allowed_attrs and attr_name not in node.attrs and attr_name not in attr_spec_list]
+		for attr_name in self.random.sample(optional_attrs, min(len(optional_attrs), self.random.randint(0, 2))):
+			value = self.GenerateAttrValue(attr_name, self.GetAttrSpec(node, attr_name))
+			if value is not None:
+				node.attrs[attr_name] = value
+
+		return True
+
+	def Search(self, pattern, value, flags=0):
+		"""Searches a value for a regex of the spec, taking a regex which Python can't compile to match nothing."""
+		key = (pattern, flags)
+		if key not in self.regexes:
+			try:
+				self.regexes[key] = re.compile(pattern, flags | re.UNICODE)
+			except re.error:
+				self.regexes[key] = None
+		return self.regexes[key] and self.regexes[key].search(value)
+
+	def GenerateAttrValue(self, attr_name, attr_spec):
+		"""Generates a valid value of an attribute.
+
+		Returns:
+			The value, or None if none could be generated.
+		"""
+		if 'value' in attr_spec or 'value_casei' in attr_spec:
+			values = attr_spec['value'] if 'value' in attr_spec else attr_spec['value_casei']
+			value = self.random.choice(values if isinstance(values, list) else [values])
+		elif 'value_regex' in attr_spec:
+			value = GenerateRegexMatch(attr_spec['value_regex'], self.random)
+		elif 'value_regex_casei' in attr_spec:
+			value = GenerateRegexMatch(attr_spec['value_regex_casei'], self.random, re.I)
+		elif 'value_url' in attr_spec:
+			value = self.GenerateUrl(attr_name, attr_spec)
+		elif 'value_properties' in attr_spec:
+			value = self.GenerateProperties(attr_spec['value_properties'])
+		elif attr_name in ('height', 'width'):
+			value = unicode(self.random.choice((100, 150, 200, 300, 400, 600, 800)))
+		elif 'id' == attr_name:
+			value = u'%s-%d' % (self.random.choice(WORDS), self.random.randint(1, 9999))
+		else:
+			value = u'-'.join(self.random.sample(WORDS, self.random.randint(1, 3)))
+
+		if value is not None and 'blacklisted_value_regex' in attr_spec and self.Search(attr_spec['blacklisted_value_regex'], value):
+			return None
+		return value
+
+	def GenerateUrl(self, attr_name, attr_spec):
+		"""Generates a URL with one of the protocols which an attribute allows."""
+		protocols = (attr_spec['value_url'] or {}).get('protocol') or ['https']
+		domain = u'example.com'
+		if domain in [disallowed_domain.lower() for disallowed_domain in attr_spec.get('disallowed_domain') or []]:
+			domain = u'example.org'
+		if attr_name.endswith('src') or attr_name in ('poster', 'srcset'):
+			path = u'/wp-content/uploads/%s-%d.jpg' % (self.random.choice(WORDS), self.random.randint(1, 999))
+		else:
+			path = u'/%s/%s/' % (self.random.choice(WORDS), self.random.choice(WORDS))
+
+		for protocol in ('https', 'http'):
+			if protocol in protocols:
+				return u'%s://%s%s' % (protocol, domain, path)
+		protocol = protocols[0]
+		if 'mailto' == protocol:
+			return u'mailto:editor@%s' % domain
+		if 'tel' == protocol:
+			return u'tel:+15555550100'
+		if 'data' == protocol:
+			return u'data:image/gif;base64,R0lGODlhAQABAAAAACw='
+		return u'%s://%s%s' % (protocol, domain, path)
+
+	def GenerateProperties(self, value_properties):
+		"""Generates the value of an attribute with properties, like the content of the viewport meta tag."""
+		pairs = []
+		for (prop_name, property_spec) in sorted(value_properties.items()):
+			property_spec = property_spec or {}
+			if not property_spec.get('mandatory') and (pairs or self.random.random() < 0.5):
+				continue
+			if 'value' in property_spec:
+				prop_value = property_spec['value']
+			elif 'value_double' in property_spec:
+				prop_value = u'%g' % property_spec['value_double']
+			else:
+				prop_value = unicode(self.random.randint(1, 5))
+			pairs.append(u'%s=%s' % (prop_name, prop_value))
+		return u','.join(pairs) if pairs else None
+
+	def GenerateText(self):
+		words = [self.random.choice(WORDS) for i in range(self.random.randint(3, 12))]
+		return u' '.join([words[0].capitalize()] + words[1:]) + u'. '
+
+	def GenerateChildren(self, node, depth):
+		"""Generates the children of an element: those which its tag spec requires, or else text and nested elements.
+
+		Returns:
+			Whether the children which it requires could be generated.
+		"""
+		tag_spec = node.rule_spec['tag_spec']
+		if node.tag_name in amphtml_validate.VOID_ELEMENTS:
+			return True
+		if tag_spec.get('child_tags'):
+			return self.GenerateRequiredChildren(node, tag_spec['child_tags'], depth)
+
+		has_text = node.tag_name in FLOW_CONTAINERS or node.tag_name in PHRASING_CONTAINERS or node.tag_name in TEXT_ELEMENTS
+		if has_text:
+			node.children.append(self.GenerateText())
+		if depth < self.depth and (node.tag_name in FLOW_CONTAINERS or node.tag_name in PHRASING_CONTAINERS or node.tag_name in CHILD_ELEMENTS or tag_spec.get('reference_points')):
+			for i in range(self.random.randint(1, 3)):
+				self.AddChild(node, depth + 1)
+				if has_text and self.random.random() < 0.5:
+					node.children.append(self.GenerateText())
+		return True
+
+	def GenerateRequiredChildren(self, node, child_tags, depth):
+		"""Generates the children of an element as its child_tags spec requires them.
+
+		Returns:
+			Whether the mandatory children could be generated.
+		"""
+		first_child_tag_names = child_tags.get('first_child_tag_name_oneof') or []
+		child_tag_names = child_tags.get('child_tag_name_oneof') or []
+		if 'mandatory_num_child_tags' in child_tags:
+			minimum = count = child_tags['mandatory_num_child_tags']
+		else:
+			minimum = child_tags.get('mandatory_min_num_child_tags', 1 if first_child_tag_names else 0)
+			count = max(minimum, self.random.randint(0, 3))
+
+		for i in range(count):
+			tag_names = first_child_tag_names if 0 == i and first_child_tag_names else child_tag_names
+			rule_specs = [(tag_name, rule_spec) for (tag_name, rule_spec) in self.GetPlaceableRuleSpecs(node) if not tag_names or tag_name in tag_names]
+			child = None
+			for attempt in range(5):
+				if not rule_specs:
+					break
+				(tag_name, rule_spec) = self.random.choice(rule_specs)
+				child = self.GenerateElement(tag_name, rule_spec, node, depth + 1)
+				if child:
+					break
+			if not child:
+				return i >= minimum
+		return True
+
+	def AddViolation(self, violation, node, attr_name=None):
+		details = {'type': violation, 'tag_name': node.tag_name, 'parent_name': node.parent.tag_name}
+		if attr_name:
+			details['attr_name'] = attr_name
+		self.violations.append(details)
+
+	def SeedDisallowedAttribute(self, parent, depth):
+		"""Adds an element with an attribute which it doesn't allow.
+
+		Returns:
+			Whether the violation was seeded.
+		"""
+		node = self.AddValidElement(parent, depth)
+		if not node:
+			return False
+		attr_names = [attr_name for attr_name in DISALLOWED_ATTRIBUTES if attr_name not in node.attrs and self.GetAttrSpec(node, attr_name) is None and not (node.rule_spec['tag_spec'].get('amp_layout') and attr_name in self.layout_allowed_attrs)]
+		if not attr_names:
+			return False
+		attr_name = self.random.choice(attr_names)
+		node.attrs[attr_name] = DISALLOWED_ATTRIBUTES[attr_name]
+		self.AddViolation('disallowed_attribute', node, attr_name)
+		return True
+
+	def GetInvalidValue(self, attr_spec):
+		"""Gets a value which an attribute doesn't allow, or None for an attribute which allows any value."""
+		if 'value' in attr_spec or 'value_casei' in attr_spec:
+			values = attr_spec['value'] if 'value' in attr_spec else attr_spec['value_casei']
+			values = [value.lower() for value in (values if isinstance(values, list) else [values])]
+			for value in (u'invalid-%s' % self.random.choice(WORDS), u'invalid-value-%d' % self.random.randint(1, 9999)):
+				if value not in values:
+					return value
+		for (key, flags) in (('value_regex', 0), ('value_regex_casei', re.I)):
+			if key in attr_spec:
+				for value in (u'invalid value!', u'#', u'-'):
+					if not self.Search(u'^(%s)$' % attr_spec[key], value, flags):
+						return value
+		value_url = attr_spec.get('value_url') or {}
+		if 'value_url' in attr_spec and True is not value_url.get('allow_empty') and 'javascript' not in (value_url.get('protocol') or []):
+			return u'javascript:alert(document.cookie)'
+		return None
+
+	def SeedInvalidValue(self, parent, depth):
+		"""Adds an element with an attribute value which it doesn't allow.
+
+		Returns:
+			Whether the violation was seeded.
+		"""
+		node = self.AddValidElement(parent, depth)
+		if not node:
+			return False
+		invalid_values = collections.OrderedDict()
+		for attr_name in node.attrs:
+			if 'layout' == attr_name and node.rule_spec['tag_spec'].get('amp_layout'):
+				invalid_values[attr_name] = u'invalid-layout'
+				continue
+			attr_spec = self.GetAttrSpec(node, attr_name)
+			value = self.GetInvalidValue(attr_spec) if attr_spec is not None else None
+			if value is not None:
+				invalid_values[attr_name] = value
+		if not invalid_values:
+			return False
+		attr_name = self.random.choice(list(invalid_values))
+		node.attrs[attr_name] = invalid_values[attr_name]
+		self.AddViolation('invalid_value', node, attr_name)
+		return True
+
+	def SeedWrongAncestor(self, parent, depth):
+		"""Adds an element in a parent where none of the tag specs of its tag allow it.
+
+		Returns:
+			Whether the violation was seeded.
+		"""
+		key = self.GetContextKey(parent)
+		if key not in self.misplaceable_rule_specs:
+			self.misplaceable_rule_specs[key] = []
+			for (tag_name, rule_spec) in self.rule_specs:
+				tag_spec = rule_spec['tag_spec']
+				# Elements which only the head allows would be moved there by HTML parsers.
+				if tag_spec.get('mandatory_parent') and self.ParseSpecName(tag_spec['mandatory_parent'])['tag_name'] in DOCUMENT_ELEMENTS - set(['body']):
+					continue
+				if self.CanContain(parent, tag_name) and not any(self.IsPlaceable(tag_name, other_rule_spec['tag_spec'], parent) for other_rule_spec in self.allowed_tags[tag_name]):
+					self.misplaceable_rule_specs[key].append((tag_name, rule_spec))
+		rule_specs = self.misplaceable_rule_specs[key]
+		if not rule_specs:
+			return False
+		(tag_name, rule_spec) = self.random.choice(rule_specs)
+		node = self.GenerateElement(tag_name, rule_spec, parent, depth)
+		if not node:
+			return False
+		self.AddViolation('wrong_ancestor', node)
+		return True
+
+	def SeedOversizedCss(self, parent, depth):
+		"""Adds a stylesheet over the size limit of the spec to the body, once per document.
+
+		Returns:
+			Whether the violation was seeded.
+		"""
+		if 'body' != parent.tag_name or not self.max_css_bytes or any('oversized_css' == violation['type'] for violation in self.violations):
+			return False
+		rules = []
+		size = 0
+		while size <= self.max_css_bytes:
+			rule = u'.%s-%d { color: #%06x; margin: %dpx %dpx; }\n' % (self.random.choice(WORDS), self.random.randint(1, 9999), self.random.randint(0, 0xffffff), self.random.randint(0, 40), self.random.randint(0, 40))
+			rules.append(rule)
+			size += len(rule)
+		node = Node('style')
+		node.children.append(u''.join(rules))
+		parent.AppendChild(node)
+		self.element_count += 1
+		self.AddViolation('oversized_css', node)
+		return True
+
+
+def GenerateCorpus(rules, out_dir, documents=100, elements=50, depth=3, error_rate=0.1, seed=0):
+	"""Generates the documents of a corpus, and writes them along with a manifest of them.
+
+	Args:
+		rules: tuple of the rules, as ParseRules() returns them.
+		out_dir: directory to write document-NNNNN.html and manifest.json to.
+		documents: number of documents to generate.
+		elements: number of elements to generate in each document, about.
+		depth: maximum depth to nest elements at, besides the children which elements require.
+		error_rate: fraction of the elements to seed a violation into.
+		seed: seed of the random numbers, so that the same seed gives the same corpus.
+	Returns:
+		The manifest written to manifest.json, with the file, bytes, number of elements and violations of
+		each document, and their totals.
+	"""
+	out_dir = os.path.realpath(out_dir)
+	if not os.path.exists(out_dir):
+		os.makedirs(out_dir)
+
+	generator = CorpusGenerator(rules, depth, error_rate)
+	entries = []
+	for index in range(documents):
+		# Each document has its own random numbers, so that it doesn't depend on the ones before it.
+		(html, element_count, violations) = generator.GenerateDocument(random.Random(seed * 1000003 + index), elements)
+		html = html.encode('utf-8')
+		name = 'document-%05d.html' % (index + 1)
+		with open(os.path.join(out_dir, name), 'wb') as document_file:
+			document_file.write(html)
+		entries.append({'file': name, 'bytes': len(html), 'elements': element_count, 'violations': violations})
+
+	manifest = {
+		'spec_file_revision': rules[4]['spec_file_revision'],
+		'seed': seed,
+		'elements': elements,
+		'depth': depth,
+		'error_rate': error_rate,
+		'documents': entries,
+		'totals': {
+			'documents': len(entries),
+			'bytes': sum(entry['bytes'] for entry in entries),
+			'elements': sum(entry['elements'] for entry in entries),
+			'violations': dict(collections.Counter(violation['type'] for entry in entries for violation in entry['violations'])),
+		},
+	}
+	amphtml_update.WriteFileAtomically(os.path.join(out_dir, 'manifest.json'), json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+	return manifest
+
+
+def Main(amphtml_location, out_dir, documents=100, elements=50, depth=3, error_rate=0.1, seed=0):
+	"""Generates a corpus from a spec and prints a summary of it.
+
+	Args:
+		amphtml_location: path to an amphtml checkout or archive.
+		out_dir: directory to write the documents and manifest to.
+		documents: number of documents to generate.
+		elements: number of elements to generate in each document, about.
+		depth: maximum depth to nest elements at.
+		error_rate: fraction of the elements to seed a violation into.
+		seed: seed of the random numbers.
+	"""
+	logging.basicConfig(level=logging.WARNING)
+
+	start = time.time()
+	manifest = GenerateCorpus(LoadRules(amphtml_location), out_dir, documents, elements, depth, error_rate, seed)
+	totals = manifest['totals']
+	print 'Generated %d documents with %d elements and %d bytes in %.2fs, into %s.' % (totals['documents'], totals['elements'], totals['bytes'], time.time() - start, os.path.realpath(out_dir))
+	for (violation, count) in sorted(totals['violations'].items()):
+		print '%8d  %s' % (count, violation)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Generate a synthetic corpus of post content from the AMPHTML validator spec, to load test the sanitizers.')
+	parser.add_argument('amphtml', help='Path to an amphtml checkout, or a .tar.gz, .tgz or .zip archive of one.')
+	parser.add_argument('--out-dir', '-o', required=True, help='Directory to write document-NNNNN.html for each document, and manifest.json, to.')
+	parser.add_argument('--documents', '-n', type=int, default=100, help='Number of documents to generate. Defaults to %(default)s.')
+	parser.add_argument('--elements', type=int, default=50, help='Number of elements to generate in each document, about. Defaults to %(default)s.')
+	parser.add_argument('--depth', type=int, default=3, help='Maximum depth to nest elements at, besides the children which elements require. Defaults to %(default)s.')
+	parser.add_argument('--error-rate', type=float, default=0.1, help='Fraction of the elements to seed a violation into, from 0 to 1. Defaults to %(default)s.')
+	parser.add_argument('--seed', type=int, default=0, help='Seed of the random numbers. The same spec, options and seed give the same corpus. Defaults to %(default)s.')
+	args = parser.parse_args()
+
+	if not 0 <= args.error_rate <= 1:
+		Die('Error: The error rate must be from 0 to 1.')
+	if args.documents < 1 or args.elements < 1 or args.depth < 0:
+		Die('Error: The numbers of documents and elements must be positive, and the depth must not be negative.')
+	Main(args.amphtml, args.out_dir, args.documents, args.elements, args.depth, args.error_rate, args.seed)
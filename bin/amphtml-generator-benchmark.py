@@ -0,0 +1,301 @@
+"""
+This script benchmarks the stages of amphtml-update.py against the spec fixture
+checked in at tests/benchmark/amphtml, scaled up synthetically, so that changes
+to the generator can be measured and protected without an amphtml checkout or
+network access.
+
+Run it from the root of the plugin with:
+
+`python bin/amphtml-generator-benchmark.py --save before.json`
+
+and after a change, compare with:
+
+`python bin/amphtml-generator-benchmark.py --baseline before.json`
+
+which fails when a stage got slower, or the peak memory grew, by more than the
+threshold. Baselines are only comparable on the machine they were saved on.
+
+The fixture is scaled by copying its tag specs, with renamed tag names, and its
+extensions, with renamed extension names, so a scale of 10 has ten times the
+tags, attribute specs and extensions. Each scale runs in a fresh process, so
+that the peak memory reported is that of the stages alone.
+"""
+
+import argparse
+import imp
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(os.path.dirname(os.path.realpath(__file__)), 'amphtml-update.py'))
+
+FIXTURE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'tests', 'benchmark', 'amphtml')
+
+# The stages which are timed, in the order they run.
+STAGES = ('ReadProtoascii', 'GetTagSpec', 'ParseRules', 'GeneratePHP')
+
+# Stages which get slower by less than this many seconds are not regressions, as such differences are noise.
+NOISE_SECONDS = 0.005
+
+TAG_NAME_FIELD = re.compile(r'(\btag_name:\s*")([^"]+)(")')
+
+
+def Die(msg):
+	print >> sys.stderr, msg
+	sys.exit(1)
+
+
+def GetTopLevelFields(text):
+	"""Splits protoascii text into its top-level fields.
+
+	Args:
+		text: protoascii text.
+	Returns:
+		List of tuples of the field name and the text of the field, from its name to the end of its value.
+	"""
+	fields = []
+	depth = 0
+	name = None
+	start = None
+	for match in amphtml_update.PROTOASCII_TOKEN.finditer(text):
+		(word, string, symbol) = match.groups()
+		if 0 == depth and name is None:
+			if word is not None:
+				(name, start) = (word, match.start())
+		elif 0 == depth:
+			if symbol and symbol in '{<[':
+				depth = 1
+			elif word is not None or string is not None:
+				fields.append((name, text[start:match.end()]))
+				name = None
+		elif symbol and symbol in '{<[':
+			depth += 1
+		elif symbol and symbol in '}>]':
+			depth -= 1
+			if 0 == depth:
+				fields.append((name, text[start:match.end()]))
+				name = None
+	return fields
+
+
+def ScaleMainProtoascii(text, scale):
+	"""Adds copies of the tag specs of validator-main.protoascii, with the tag names suffixed by the number of the copy.
+
+	Args:
+		text: contents of validator-main.protoascii.
+		scale: number of copies of each tag spec to end up with.
+	Returns:
+		The scaled contents.
+	"""
+	# Reference points are looked up by spec name, so copies of them would only replace each other.
+	tag_fields = [field_text for (field_name, field_text) in GetTopLevelFields(text) if 'tags' == field_name and not re.search(r'\btag_name:\s*"\$', field_text)]
+
+	out = [text]
+	for copy in range(2, scale + 1):
+		for field_text in tag_fields:
+			out.append(SuffixTagNames(field_text, '-S%d' % copy))
+	return '\n'.join(out) + '\n'
+
+
+def SuffixTagNames(text, suffix, keep=()):
+	"""Adds a suffix to the tag names of the tag specs in protoascii text.
+
+	Reference points, whose tag name is $REFERENCE_POINT, are left as they are.
+
+	Args:
+		text: protoascii text.
+		suffix: suffix to add.
+		keep: tag names to leave as they are.
+	Returns:
+		The text with the tag names suffixed.
+	"""
+	return TAG_NAME_FIELD.sub(lambda match: match.group(0) if match.group(2) in keep or match.group(2).startswith('$') else match.group(1) + match.group(2) + suffix + match.group(3), text)
+
+
+def RenameExtension(text, name, new_name):
+	"""Renames an extension in the text of its protoascii file, keeping the case of each mention.
+
+	Tag names which are not the extension name, like AMP-STATE of amp-bind, are
+	suffixed like the extension name is, so that the copy has its own tags.
+	The SCRIPT tags which load the extension are kept.
+
+	Args:
+		text: contents of the protoascii file of the extension.
+		name: name of the extension, like 'amp-bind'.
+		new_name: new name of the extension.
+	Returns:
+		The renamed contents.
+	"""
+	mention = re.compile(r'(?<![\w-])%s(?![\w-])' % re.escape(name), re.I)
+	text = SuffixTagNames(text, new_name[len(name):].upper(), keep=('SCRIPT', name.upper()))
+	return mention.sub(lambda match: new_name.upper() if match.group(0).isupper() else new_name, text)
+
+
+def WriteScaledFixture(amphtml_directory, out_directory, scale):
+	"""Writes an amphtml directory with the spec of another one scaled up.
+
+	Args:
+		amphtml_directory: path to the amphtml directory to scale, such as the checked-in fixture.
+		out_directory: path to write the scaled amphtml directory to. It must not exist yet.
+		scale: number of copies of each tag spec and extension to end up with.
+	"""
+	validator_directory = os.path.join(amphtml_directory, 'validator')
+	protoascii_files = amphtml_update.GetValidatorProtoasciiFiles(validator_directory)
+
+	os.makedirs(os.path.join(out_directory, 'validator'))
+	shutil.copy(os.path.join(validator_directory, 'validator.proto'), os.path.join(out_directory, 'validator', 'validator.proto'))
+	open(os.path.join(out_directory, 'validator', 'validator-main.protoascii'), 'w').write(ScaleMainProtoascii(open(protoascii_files[0]).read(), scale))
+
+	for protoascii_file in protoascii_files[1:]:
+		name = os.path.basename(os.path.dirname(protoascii_file))
+		text = open(protoascii_file).read()
+		for copy in range(1, scale + 1):
+			new_name = name if 1 == copy else '%s-s%d' % (name, copy)
+			os.makedirs(os.path.join(out_directory, 'extensions', new_name))
+			open(os.path.join(out_directory, 'extensions', new_name, 'validator-%s.protoascii' % new_name), 'w').write(RenameExtension(text, name, new_name))
+
+
+def TimeStages(amphtml_directory, repeat, results):
+	"""Runs the stages on a spec a number of times, and reports how it went.
+
+	This runs in its own process.
+
+	Args:
+		amphtml_directory: path to the amphtml directory of the spec.
+		repeat: number of times to run the stages.
+		results: queue to put the stage timings, counts and the peak memory added in kilobytes on.
+	"""
+	validator_directory = os.path.join(amphtml_directory, 'validator')
+	proto_file = os.path.join(validator_directory, 'validator.proto')
+	protoascii_files = amphtml_update.GetValidatorProtoasciiFiles(validator_directory)
+	message_types = amphtml_update.ParseProtoSchema(proto_file)
+	message_type = [message_types[name] for name in message_types if 'ValidatorRules' == name.split('.')[-1]][0]
+
+	start_memory = amphtml_update.GetPeakMemory()
+	timings = dict((stage, []) for stage in STAGES)
+	for i in range(repeat):
+		start = time.time()
+		fields = [list(amphtml_update.ReadProtoascii(protoascii_file, message_type)) for protoascii_file in protoascii_files]
+		timings['ReadProtoascii'].append(time.time() - start)
+
+		tag_specs = [field_val for (field_name, field_val) in itertools.chain.from_iterable(fields) if 'tags' == field_name]
+		start = time.time()
+		for tag_spec in tag_specs:
+			amphtml_update.GetTagSpec(tag_spec)
+		timings['GetTagSpec'].append(time.time() - start)
+
+		start = time.time()
+		rules = amphtml_update.CollectRules(amphtml_update.GetRuleEntries(itertools.chain.from_iterable(fields)))
+		timings['ParseRules'].append(time.time() - start)
+
+		start = time.time()
+		output = amphtml_update.GeneratePHP(rules)[0]
+		timings['GeneratePHP'].append(time.time() - start)
+
+	amphtml_update.CountRules(rules[0], rules[1])
+	results.put({
+		'timings': timings,
+		'tags': amphtml_update.PROFILER.counters['tag specs'],
+		'attr_specs': amphtml_update.PROFILER.counters['attr specs'],
+		'php_bytes': len(output),
+		'peak_memory_kb': amphtml_update.GetPeakMemory() - start_memory,
+	})
+
+
+def GetRegressions(results, baseline, threshold):
+	"""Compares the results of a run with those of a baseline.
+
+	Args:
+		results: results of this run, as saved with --save.
+		baseline: results of the baseline run.
+		threshold: fraction by which a timing or the peak memory may grow before it is a regression.
+	Returns:
+		List of messages describing the regressions.
+	"""
+	regressions = []
+	for scale in sorted(set(results['scales']) & set(baseline['scales']), key=int):
+		(result, base) = (results['scales'][scale], baseline['scales'][scale])
+		for stage in STAGES:
+			(best, base_best) = (result['stages'][stage]['best'], base['stages'][stage]['best'])
+			if best > base_best * (1 + threshold) and best - base_best > NOISE_SECONDS:
+				regressions.append('%sx %s: best %.3fs, was %.3fs (+%d%%)' % (scale, stage, best, base_best, 100 * (best - base_best) / base_best))
+		if result['peak_memory_kb'] > base['peak_memory_kb'] * (1 + threshold):
+			regressions.append('%sx peak memory: +%d KB, was +%d KB' % (scale, result['peak_memory_kb'], base['peak_memory_kb']))
+	return regressions
+
+
+def Main(scales, repeat, save_file=None, baseline_file=None, threshold=0.2, fixture_out_directory=None):
+	"""Benchmarks the stages at each scale, prints the results and checks them against a baseline.
+
+	Args:
+		scales: list of the numbers of copies of the fixture to benchmark with.
+		repeat: number of times to run the stages at each scale.
+		save_file: path to save the results to as JSON, or None.
+		baseline_file: path of results saved by an earlier run to check for regressions against, or None.
+		threshold: fraction by which a timing or the peak memory may grow before it is a regression.
+		fixture_out_directory: directory to keep the scaled fixtures in, or None to remove them afterwards.
+	"""
+	logging.basicConfig(level=logging.WARNING)
+
+	results = {'repeat': repeat, 'scales': {}}
+	fixtures_directory = fixture_out_directory or tempfile.mkdtemp()
+	try:
+		print '%5s  %-15s %9s %9s  %s' % ('Scale', 'Stage', 'Best', 'Median', 'Throughput')
+		for scale in scales:
+			amphtml_directory = os.path.join(fixtures_directory, 'amphtml-%dx' % scale)
+			if os.path.exists(amphtml_directory):
+				shutil.rmtree(amphtml_directory)
+			WriteScaledFixture(FIXTURE_DIRECTORY, amphtml_directory, scale)
+
+			queue = multiprocessing.Queue()
+			process = multiprocessing.Process(target=TimeStages, args=(amphtml_directory, repeat, queue))
+			process.start()
+			run = queue.get()
+			process.join()
+
+			result = {'tags': run['tags'], 'attr_specs': run['attr_specs'], 'php_bytes': run['php_bytes'], 'peak_memory_kb': run['peak_memory_kb'], 'stages': {}}
+			for stage in STAGES:
+				seconds = sorted(run['timings'][stage])
+				result['stages'][stage] = {'best': seconds[0], 'median': seconds[len(seconds) // 2]}
+				if 'GeneratePHP' == stage:
+					throughput = '%.0f KB/s' % (run['php_bytes'] / 1024.0 / max(seconds[0], 1e-9))
+				else:
+					throughput = '%.0f tag specs/s' % (run['tags'] / max(seconds[0], 1e-9))
+				print '%4dx  %-15s %8.3fs %8.3fs  %s' % (scale, stage, seconds[0], seconds[len(seconds) // 2], throughput)
+			print '%4dx  %d tag specs, %d attr specs, %d bytes of PHP, peak memory +%d KB' % (scale, run['tags'], run['attr_specs'], run['php_bytes'], run['peak_memory_kb'])
+			results['scales'][str(scale)] = result
+	finally:
+		if not fixture_out_directory:
+			shutil.rmtree(fixtures_directory)
+
+	if save_file:
+		amphtml_update.WriteFileAtomically(save_file, json.dumps(results, indent=2, sort_keys=True) + '\n')
+
+	if baseline_file:
+		regressions = GetRegressions(results, json.load(open(baseline_file)), threshold)
+		if regressions:
+			Die('Error: Regressions of more than %d%% against %s:\n%s' % (100 * threshold, baseline_file, '\n'.join(regressions)))
+		print 'No regressions of more than %d%% against %s.' % (100 * threshold, baseline_file)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Benchmark the stages of amphtml-update.py against a synthetically scaled spec fixture.')
+	parser.add_argument('--scale', type=int, action='append', help='Number of copies of the tags and extensions of the fixture to benchmark with, from 1 to 50. Can be given more than once. Defaults to 1, 10 and 50.')
+	parser.add_argument('--repeat', type=int, default=3, help='Number of times to run the stages at each scale. Defaults to %(default)s.')
+	parser.add_argument('--save', help='Save the results to this file as JSON, to compare later runs with.')
+	parser.add_argument('--baseline', help='Fail if a stage got slower, or the peak memory grew, by more than the threshold compared to the results saved in this file.')
+	parser.add_argument('--threshold', type=float, default=0.2, help='Fraction by which a timing or the peak memory may grow before it is a regression. Defaults to %(default)s.')
+	parser.add_argument('--fixture-out', help='Keep the scaled fixtures in this directory, for example to run amphtml-update.py against.')
+	args = parser.parse_args()
+
+	scales = args.scale or [1, 10, 50]
+	if not all(1 <= scale <= 50 for scale in scales):
+		Die('Error: The scale must be from 1 to 50.')
+	Main(scales, args.repeat, args.save, args.baseline, args.threshold, args.fixture_out)
@@ -0,0 +1,81 @@
+#!/usr/bin/env php
+<?php
+/**
+ * Benchmark loading the rules generated by amphtml-update.py in each of its output formats.
+ *
+ * Generate the JSON and serialized outputs, then run this with opcache enabled for the CLI:
+ *
+ * $ python bin/amphtml-update.py amphtml/ --json-out /tmp/rules.json --serialized-out /tmp/rules.ser > /dev/null
+ * $ php -d opcache.enable_cli=1 bin/amphtml-loader-benchmark.php /tmp/rules.json /tmp/rules.ser
+ *
+ * The rules are also written as a PHP file which returns them, so that including it can be compared
+ * with json_decode() and unserialize(). All three must give the same rules, which is checked.
+ *
+ * @codeCoverageIgnore
+ * @package AMP
+ */
+
+if ( 'cli' !== php_sapi_name() ) {
+	fwrite( STDERR, "Must run from CLI.\n" );
+	exit( 1 );
+}
+
+if ( $argc < 3 ) {
+	fwrite( STDERR, "Usage: php -d opcache.enable_cli=1 bin/amphtml-loader-benchmark.php rules.json rules.ser [iterations]\n" );
+	exit( 1 );
+}
+
+$json_file       = $argv[1];
+$serialized_file = $argv[2];
+$iterations      = isset( $argv[3] ) ? max( 1, intval( $argv[3] ) ) : 100;
+
+if ( ! function_exists( 'opcache_get_status' ) || ! ini_get( 'opcache.enable_cli' ) ) {
+	fwrite( STDERR, "Warning: opcache is not enabled for the CLI, so the include is compiled every time. Run with -d opcache.enable_cli=1.\n" );
+}
+
+$rules = unserialize( file_get_contents( $serialized_file ) );
+if ( ! is_array( $rules ) ) {
+	fwrite( STDERR, "Error: Could not unserialize $serialized_file.\n" );
+	exit( 1 );
+}
+
+// Rename the file which tempnam() creates, rather than leave it behind next to the .php file.
+$temp_file = tempnam( sys_get_temp_dir(), 'amp-rules-' );
+$php_file  = $temp_file . '.php';
+rename( $temp_file, $php_file );
+file_put_contents( $php_file, '<?php return ' . var_export( $rules, true ) . ";\n" );
+
+$loaders = array(
+	'include'     => function() use ( $php_file ) {
+		return include $php_file;
+	},
+	'json_decode' => function() use ( $json_file ) {
+		return json_decode( file_get_contents( $json_file ), true );
+	},
+	'unserialize' => function() use ( $serialized_file ) {
+		return unserialize( file_get_contents( $serialized_file ) );
+	},
+);
+
+$status = 0;
+foreach ( $loaders as $name => $loader ) {
+	// Load once up front, which also compiles the PHP file into the opcache.
+	if ( $loader() != $rules ) {
+		fwrite( STDERR, "Error: Loading with $name gave different rules.\n" );
+		$status = 1;
+	}
+
+	$times = array();
+	for ( $i = 0; $i < $iterations; $i++ ) {
+		$start   = microtime( true );
+		$loaded  = $loader();
+		$times[] = microtime( true ) - $start;
+		unset( $loaded );
+	}
+	sort( $times );
+
+	printf( "%-12s  best %.3fms  median %.3fms\n", $name, $times[0] * 1000, $times[ intval( count( $times ) / 2 ) ] * 1000 );
+}
+
+unlink( $php_file );
+exit( $status );
@@ -0,0 +1,250 @@
+"""
+This script compares two revisions of the AMPHTML validator spec, as the
+rules amphtml-update.py generates from them, and writes a manifest of the
+tag specs, attributes, reference points and descendant tag lists which were
+added, removed or changed.
+
+Each revision is either the JSON written by `amphtml-update.py --json-out`,
+an amphtml checkout or a .tar.gz, .tgz or .zip archive of one. Run it from the root of the plugin with:
+
+`python bin/amphtml-spec-diff.py old-rules.json path/to/amphtml --output manifest.json`
+
+The manifest's affected_tags lists the tags whose validation may give
+different results after upgrading, so only the URLs whose validation errors
+or markup involve those tags need to be validated again. If all_tags_affected
+is true, for example because a global attribute changed, every URL does.
+"""
+
+import argparse
+import imp
+import json
+import logging
+import os
+import sys
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(os.path.dirname(os.path.realpath(__file__)), 'amphtml-update.py'))
+
+# Keys which GetRulesData() adds to the attribute specs. Their IDs are assigned anew for each revision, so they are not compared.
+DERIVED_ATTR_SPEC_KEYS = ('value_set', 'value_casei_set')
+
+# Keys which GetRulesData() adds to the tag specs. They change along with the attribute specs and layouts they are derived
+# from, and the IDs of the layout tables are assigned anew for each revision.
+DERIVED_TAG_SPEC_KEYS = ('mandatory_attrs', 'layout_table')
+
+
+def Die(msg):
+	print >> sys.stderr, msg
+	sys.exit(1)
+
+
+def LoadRules(path):
+	"""Loads the rules of a spec revision.
+
+	Args:
+		path: path to the JSON written by `amphtml-update.py --json-out`, or to an amphtml checkout or archive.
+	Returns:
+		Dictionary of the names of the static properties of the generated class to their values, as decoded from JSON.
+	"""
+	if path.endswith(amphtml_update.ARCHIVE_EXTENSIONS) and os.path.isfile(path):
+		validator_directory = amphtml_update.ReadArchiveSpecFiles(path)
+	elif os.path.isdir(path):
+		validator_directory = os.path.join(path, 'validator')
+		if not os.path.exists(validator_directory):
+			Die('Error: The amphtml directory does not exist: %s' % validator_directory)
+	else:
+		return json.load(open(path))
+	rules = amphtml_update.ReadValidatorRules(os.path.join(validator_directory, 'validator.proto'), amphtml_update.GetValidatorProtoasciiFiles(validator_directory))
+
+	# Go through JSON, so that both kinds of revision are compared in the same form.
+	return json.loads(amphtml_update.GenerateRulesJSON(amphtml_update.GetRulesData(*rules)))
+
+
+def GetAttrSpecListDiff(old_attr_spec_list, new_attr_spec_list):
+	"""Compares two attribute spec lists.
+
+	Args:
+		old_attr_spec_list: dictionary of attribute names to their specs.
+		new_attr_spec_list: dictionary of attribute names to their specs.
+	Returns:
+		Dictionary with the sorted names of the added, removed and changed attributes, or None if there are none.
+	"""
+	def Strip(attr_spec):
+		return dict((key, value) for (key, value) in attr_spec.items() if key not in DERIVED_ATTR_SPEC_KEYS)
+
+	diff = GetKeyDiff(old_attr_spec_list, new_attr_spec_list, lambda old, new: Strip(old) != Strip(new))
+	return diff if any(diff.values()) else None
+
+
+def GetKeyDiff(old, new, is_changed=lambda old, new: old != new):
+	"""Compares two dictionaries by key.
+
+	Args:
+		old: dictionary.
+		new: dictionary.
+		is_changed: function telling whether the old and new value of a key differ.
+	Returns:
+		Dictionary with the sorted added, removed and changed keys.
+	"""
+	return {
+		'added': sorted(set(new) - set(old)),
+		'removed': sorted(set(old) - set(new)),
+		'changed': sorted(key for key in set(old) & set(new) if is_changed(old[key], new[key])),
+	}
+
+
+def GetSpecKeys(tag_name, rule_specs):
+	"""Gets keys to match the rule specs of a tag across revisions by.
+
+	Args:
+		tag_name: name of the tag.
+		rule_specs: list of the rule specs of the tag.
+	Returns:
+		Dictionary of the keys to the rule specs: the spec name when there is one, and the tag name
+		otherwise, numbered when a tag has more than one spec without a name.
+	"""
+	keyed = {}
+	unnamed = 0
+	for rule_spec in rule_specs:
+		if 'spec_name' in rule_spec['tag_spec']:
+			keyed[rule_spec['tag_spec']['spec_name']] = rule_spec
+		else:
+			unnamed += 1
+			keyed['%s #%d' % (tag_name, unnamed) if unnamed > 1 else tag_name] = rule_spec
+	return keyed
+
+
+def GetRuleSpecDiff(old_rule_spec, new_rule_spec):
+	"""Compares two rule specs.
+
+	Args:
+		old_rule_spec: rule spec, with a tag_spec, attr_spec_list and optional cdata.
+		new_rule_spec: rule spec.
+	Returns:
+		Dictionary of what changed: the sorted keys of the tag_spec which changed, the attribute
+		diff from GetAttrSpecListDiff() and whether the cdata changed. None if nothing did.
+	"""
+	def Strip(tag_spec):
+		return dict((key, value) for (key, value) in tag_spec.items() if key not in DERIVED_TAG_SPEC_KEYS)
+
+	diff = {}
+	tag_spec_keys = GetKeyDiff(Strip(old_rule_spec['tag_spec']), Strip(new_rule_spec['tag_spec']))
+	if any(tag_spec_keys.values()):
+		diff['tag_spec'] = sorted(sum(tag_spec_keys.values(), []))
+	attr_spec_list_diff = GetAttrSpecListDiff(old_rule_spec['attr_spec_list'], new_rule_spec['attr_spec_list'])
+	if attr_spec_list_diff:
+		diff['attr_spec_list'] = attr_spec_list_diff
+	if old_rule_spec.get('cdata') != new_rule_spec.get('cdata'):
+		diff['cdata'] = True
+	return diff or None
+
+
+def GetManifest(old_rules, new_rules):
+	"""Compares the rules of two spec revisions.
+
+	Args:
+		old_rules: rules of the old revision, from LoadRules().
+		new_rules: rules of the new revision, from LoadRules().
+	Returns:
+		The manifest of what was added, removed and changed, and of the tags affected.
+	"""
+	manifest = {
+		'spec_file_revision': {'old': old_rules['spec_file_revision'], 'new': new_rules['spec_file_revision']},
+		'tags': {'added': [], 'removed': [], 'changed': {}},
+	}
+
+	(old_tags, new_tags) = (old_rules['allowed_tags'], new_rules['allowed_tags'])
+	tag_diff = GetKeyDiff(old_tags, new_tags)
+	manifest['tags']['added'] = tag_diff['added']
+	manifest['tags']['removed'] = tag_diff['removed']
+	for tag_name in tag_diff['changed']:
+		(old_specs, new_specs) = (GetSpecKeys(tag_name, old_tags[tag_name]), GetSpecKeys(tag_name, new_tags[tag_name]))
+		spec_diff = GetKeyDiff(old_specs, new_specs, lambda old, new: GetRuleSpecDiff(old, new) is not None)
+		tag_changes = {'added': spec_diff['added'], 'removed': spec_diff['removed'], 'changed': {}}
+		for spec_key in spec_diff['changed']:
+			tag_changes['changed'][spec_key] = GetRuleSpecDiff(old_specs[spec_key], new_specs[spec_key])
+		if tag_changes['added'] or tag_changes['removed'] or tag_changes['changed']:
+			manifest['tags']['changed'][tag_name] = tag_changes
+
+	for key in ('globally_allowed_attrs', 'layout_allowed_attrs'):
+		manifest[key] = GetAttrSpecListDiff(old_rules[key], new_rules[key]) or GetKeyDiff({}, {})
+
+	(old_reference_points, new_reference_points) = (old_rules['reference_points'], new_rules['reference_points'])
+	reference_point_diff = GetKeyDiff(old_reference_points, new_reference_points, lambda old, new: GetRuleSpecDiff(old, new) is not None)
+	manifest['reference_points'] = {'added': reference_point_diff['added'], 'removed': reference_point_diff['removed'], 'changed': {}}
+	for spec_name in reference_point_diff['changed']:
+		manifest['reference_points']['changed'][spec_name] = GetRuleSpecDiff(old_reference_points[spec_name], new_reference_points[spec_name])
+
+	manifest['descendant_tag_lists'] = GetKeyDiff(old_rules['descendant_tag_lists'], new_rules['descendant_tag_lists'], lambda old, new: sorted(old) != sorted(new))
+
+	manifest['all_tags_affected'] = any(manifest['globally_allowed_attrs'].values())
+	manifest['affected_tags'] = GetAffectedTags(manifest, old_rules, new_rules)
+	return manifest
+
+
+def GetAffectedTags(manifest, old_rules, new_rules):
+	"""Gets the tags whose validation may give different results in the new revision.
+
+	These are the tags which were added, removed or changed, and the tags whose specs
+	use a changed descendant tag list or reference point, or the layout attributes when
+	those changed, in either revision.
+
+	Args:
+		manifest: the manifest from GetManifest(), without the affected tags.
+		old_rules: rules of the old revision.
+		new_rules: rules of the new revision.
+	Returns:
+		Sorted list of tag names.
+	"""
+	affected_tags = set(manifest['tags']['added'] + manifest['tags']['removed'] + manifest['tags']['changed'].keys())
+
+	changed_descendant_lists = set(sum(manifest['descendant_tag_lists'].values(), []))
+	reference_points = manifest['reference_points']
+	changed_reference_points = set(reference_points['added'] + reference_points['removed'] + reference_points['changed'].keys())
+	layout_changed = any(manifest['layout_allowed_attrs'].values())
+
+	for rules in (old_rules, new_rules):
+		for (tag_name, rule_specs) in rules['allowed_tags'].items():
+			for rule_spec in rule_specs:
+				tag_spec = rule_spec['tag_spec']
+				if (
+					tag_spec.get('descendant_tag_list') in changed_descendant_lists or
+					changed_reference_points & set(tag_spec.get('reference_points', {})) or
+					(layout_changed and 'amp_layout' in tag_spec)
+				):
+					affected_tags.add(tag_name)
+	return sorted(affected_tags)
+
+
+def Main(old_path, new_path, output=None):
+	"""Compares two spec revisions and writes the manifest.
+
+	Args:
+		old_path: path to the JSON rules or amphtml checkout of the old revision.
+		new_path: path to the JSON rules or amphtml checkout of the new revision.
+		output: path to write the manifest to, or None for STDOUT.
+	"""
+	logging.basicConfig(level=logging.WARNING)
+
+	manifest = GetManifest(LoadRules(old_path), LoadRules(new_path))
+	manifest_json = json.dumps(manifest, indent=2, separators=(',', ': '), sort_keys=True) + '\n'
+	if output:
+		amphtml_update.WriteFileAtomically(os.path.realpath(output), manifest_json)
+	else:
+		sys.stdout.write(manifest_json)
+
+	print >> sys.stderr, 'Tags added: %d, removed: %d, changed: %d. %s' % (
+		len(manifest['tags']['added']),
+		len(manifest['tags']['removed']),
+		len(manifest['tags']['changed']),
+		'All tags are affected.' if manifest['all_tags_affected'] else 'Tags affected: %d.' % len(manifest['affected_tags'])
+	)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Compare two revisions of the AMPHTML validator spec and write a manifest of the changed tag specs.')
+	parser.add_argument('old', help='JSON written by amphtml-update.py --json-out, or amphtml checkout or archive, of the old revision.')
+	parser.add_argument('new', help='JSON written by amphtml-update.py --json-out, or amphtml checkout or archive, of the new revision.')
+	parser.add_argument('--output', '-o', help='Write the manifest to this file instead of to STDOUT.')
+	args = parser.parse_args()
+
+	Main(args.old, args.new, args.output)
@@ -0,0 +1,231 @@
+"""
+This script generates the rules of several revisions of the AMPHTML validator
+spec in one run, for example to build and compare the specs of several
+runtime versions. Each source is an amphtml checkout, or a .tar.gz, .tgz or
+.zip archive of one, like GitHub serves for each release tag.
+
+Run it from the root of the plugin with:
+
+`python bin/amphtml-update-batch.py amphtml-1901181729470/ amphtml-1902191209570.tar.gz --out-dir /tmp/specs`
+
+For each source, named after its directory or archive, it writes NAME.php
+with the generated class and NAME.json with the rules, as written by
+`amphtml-update.py --json-out`, which amphtml-spec-diff.py compares. A
+summary.json lists the spec_file_revision, the numbers of tags, tag specs and
+attribute specs, and the time spent in each stage for every source.
+
+Only the spec files are read from the archives, into memory, without
+extracting them. The revisions are generated in parallel worker processes,
+which are forked with the spec files already read. validator.proto is
+parsed, or compiled with protoc for --parser protobuf, once for each version
+of it before the workers start, so the revisions which have the same one
+reuse it.
+
+Other scripts can import it and call GenerateRevisions(), which raises
+BatchError for a source it can't read.
+"""
+
+import argparse
+import imp
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(os.path.dirname(os.path.realpath(__file__)), 'amphtml-update.py'))
+
+
+class BatchError(Exception):
+	"""Raised by GenerateRevisions() for a source or parser it can't generate the revisions from."""
+
+
+def Die(msg):
+	print >> sys.stderr, msg
+	sys.exit(1)
+
+
+def GetSourceName(source):
+	"""Gets the name of the outputs of a source, from its directory or archive name.
+
+	Args:
+		source: path to an amphtml checkout or archive.
+	Returns:
+		The base name, without the archive extension.
+	"""
+	name = os.path.basename(os.path.normpath(source))
+	for extension in amphtml_update.ARCHIVE_EXTENSIONS:
+		if name.endswith(extension):
+			return name[:-len(extension)]
+	return name
+
+
+def PrepareSources(sources):
+	"""Finds the validator directory of each source, reading the spec files of the archives into memory.
+
+	Args:
+		sources: list of paths to amphtml checkouts and archives.
+	Returns:
+		List of dictionaries with the source, the name of its outputs and its validator directory.
+	Raises:
+		BatchError: A source does not exist.
+	"""
+	prepared = []
+	names = set()
+	for source in sources:
+		if source.endswith(amphtml_update.ARCHIVE_EXTENSIONS):
+			if not os.path.isfile(source):
+				raise BatchError('Error: The archive does not exist: %s' % source)
+			validator_directory = amphtml_update.ReadArchiveSpecFiles(source)
+		else:
+			validator_directory = os.path.realpath(os.path.join(source, 'validator'))
+			if not os.path.exists(os.path.join(validator_directory, 'validator.proto')):
+				raise BatchError('Error: The amphtml directory does not exist: %s' % validator_directory)
+
+		# Number the sources which would otherwise write to the same outputs.
+		name = GetSourceName(source)
+		number = 1
+		while name in names:
+			number += 1
+			name = '%s-%d' % (GetSourceName(source), number)
+		names.add(name)
+
+		prepared.append({'source': source, 'name': name, 'validator_directory': validator_directory})
+	return prepared
+
+
+def GenerateRevision(args):
+	"""Generates the outputs of one source, in a worker process of GenerateRevisions().
+
+	Args:
+		args: tuple of the source from PrepareSources(), the output directory, the parser and the
+			directory of the validator_pb2 modules compiled for --parser protobuf.
+	Returns:
+		Dictionary summarizing the revision, with its outputs, counts and the seconds spent in each stage.
+	"""
+	(source, out_dir, parser, pb2_directory) = args
+
+	amphtml_update.PROFILER = amphtml_update.Profiler()
+	start = time.time()
+
+	validator_directory = source['validator_directory']
+	proto_file = os.path.join(validator_directory, 'validator.proto')
+	protoascii_files = amphtml_update.GetValidatorProtoasciiFiles(validator_directory)
+	if 'protobuf' == parser:
+		digests = {proto_file: amphtml_update.HashFile(proto_file)}
+		validator_pb2 = amphtml_update.GenValidatorPb2Py(validator_directory, pb2_directory, pb2_directory, digests)
+		rules = amphtml_update.ParseRules(amphtml_update.GenValidatorRules(validator_pb2, protoascii_files))
+	else:
+		rules = amphtml_update.ReadValidatorRules(proto_file, protoascii_files)
+	amphtml_update.CountRules(rules[0], rules[1])
+	amphtml_update.CheckRegexes(rules[0], rules[1], rules[3], budget=0)
+
+	outputs = {
+		'php': os.path.join(out_dir, '%s.php' % source['name']),
+		'json': os.path.join(out_dir, '%s.json' % source['name']),
+	}
+	amphtml_update.WriteFileAtomically(outputs['php'], amphtml_update.GeneratePHP(rules)[0])
+	amphtml_update.WriteFileAtomically(outputs['json'], amphtml_update.GenerateRulesJSON(amphtml_update.GetRulesData(*rules)))
+
+	report = amphtml_update.PROFILER.GetReport()
+	return {
+		'source': source['source'],
+		'name': source['name'],
+		'spec_file_revision': rules[4]['spec_file_revision'],
+		'min_validator_revision_required': rules[4]['min_validator_revision_required'],
+		'tags': report['counters']['tags'],
+		'tag_specs': report['counters']['tag specs'],
+		'attr_specs': report['counters']['attr specs'],
+		'outputs': outputs,
+		'seconds': round(time.time() - start, 6),
+		'stages': dict((name, span['seconds']) for (name, span) in report['spans'].items()),
+	}
+
+
+def GenerateRevisions(sources, out_dir, jobs=1, parser='protoascii'):
+	"""Generates the outputs of several amphtml revisions in parallel, and writes a summary of them.
+
+	Args:
+		sources: list of paths to amphtml checkouts and .tar.gz, .tgz or .zip archives of them.
+		out_dir: directory to write NAME.php, NAME.json and summary.json to.
+		jobs: maximum number of worker processes.
+		parser: 'protoascii' to read the spec with the pure-Python parser, or 'protobuf' to parse it with protoc and google.protobuf.
+	Returns:
+		The summary written to summary.json: a dictionary with the seconds spent and, under revisions,
+		the dictionary from GenerateRevision() of each source, in order.
+	Raises:
+		BatchError: A source does not exist, or google.protobuf is not installed for the protobuf parser.
+	"""
+	start = time.time()
+	out_dir = os.path.realpath(out_dir)
+	if not os.path.exists(out_dir):
+		os.makedirs(out_dir)
+	if 'protobuf' == parser:
+		try:
+			import google.protobuf
+		except ImportError:
+			raise BatchError('Error: The google.protobuf Python module is not installed. Install it with `pip install --upgrade protobuf`, or leave out --parser protobuf.')
+
+	prepared = PrepareSources(sources)
+	pb2_directory = tempfile.mkdtemp()
+	try:
+		# Parse or compile each version of validator.proto once, for the workers to reuse.
+		for source in prepared:
+			proto_file = os.path.join(source['validator_directory'], 'validator.proto')
+			if 'protobuf' == parser:
+				amphtml_update.GenValidatorPb2Py(source['validator_directory'], pb2_directory, pb2_directory, {proto_file: amphtml_update.HashFile(proto_file)}, load=False)
+			else:
+				amphtml_update.GetProtoSchema(proto_file)
+
+		tasks = [(source, out_dir, parser, pb2_directory) for source in prepared]
+		if (jobs > 1 and len(tasks) > 1) or 'protobuf' == parser:
+			# The generated validator_pb2 modules can't be loaded into the same process one after another.
+			pool = multiprocessing.Pool(min(jobs, len(tasks)), maxtasksperchild=1 if 'protobuf' == parser else None)
+			try:
+				revisions = pool.map(GenerateRevision, tasks)
+			finally:
+				pool.close()
+				pool.join()
+		else:
+			revisions = map(GenerateRevision, tasks)
+	finally:
+		shutil.rmtree(pb2_directory)
+
+	summary = {'revisions': revisions, 'seconds': round(time.time() - start, 6)}
+	amphtml_update.WriteFileAtomically(os.path.join(out_dir, 'summary.json'), json.dumps(summary, indent=2, sort_keys=True) + '\n')
+	return summary
+
+
+def Main(sources, out_dir, jobs=1, parser='protoascii'):
+	"""Generates the outputs of the sources and prints the summary.
+
+	Args:
+		sources: list of paths to amphtml checkouts and archives.
+		out_dir: directory to write the outputs and summary to.
+		jobs: maximum number of worker processes.
+		parser: 'protoascii' or 'protobuf'.
+	"""
+	logging.basicConfig(level=logging.WARNING)
+
+	try:
+		summary = GenerateRevisions(sources, out_dir, jobs, parser)
+	except BatchError as e:
+		Die(str(e))
+	print '%-40s %10s %6s %9s %10s %9s' % ('Source', 'Revision', 'Tags', 'Tag specs', 'Attr specs', 'Seconds')
+	for revision in summary['revisions']:
+		print '%-40s %10d %6d %9d %10d %8.2fs' % (revision['name'], revision['spec_file_revision'], revision['tags'], revision['tag_specs'], revision['attr_specs'], revision['seconds'])
+	print 'Generated %d revisions in %.2fs. Wrote the summary to %s.' % (len(summary['revisions']), summary['seconds'], os.path.join(os.path.realpath(out_dir), 'summary.json'))
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Generate the rules of several revisions of the AMPHTML validator spec in parallel.')
+	parser.add_argument('sources', nargs='+', help='Paths to amphtml checkouts, or .tar.gz, .tgz or .zip archives of them.')
+	parser.add_argument('--out-dir', '-o', required=True, help='Directory to write NAME.php and NAME.json for each source, and summary.json, to.')
+	parser.add_argument('--jobs', '-j', type=int, default=multiprocessing.cpu_count(), help='Number of revisions to generate at once. Defaults to the number of CPUs (%(default)s).')
+	parser.add_argument('--parser', choices=['protoascii', 'protobuf'], default='protoascii', help='Read the spec with the pure-Python protoascii parser, or parse it with protoc and the google.protobuf module. Defaults to %(default)s.')
+	args = parser.parse_args()
+
+	Main(args.sources, args.out_dir, args.jobs, args.parser)
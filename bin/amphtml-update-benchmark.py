@@ -0,0 +1,111 @@
+"""
+This script benchmarks how amphtml-update.py reads the AMPHTML validator spec:
+with its pure-Python protoascii parser, and with protoc and the google.protobuf
+module (`--parser protobuf`). Both must give the same rules, which is checked.
+
+Run it from the root of the plugin with:
+
+`python bin/amphtml-update-benchmark.py path/to/amphtml`
+
+Each run happens in a fresh process, so that the peak memory use reported is
+that of the parser alone. The google.protobuf module and protoc are needed for
+the protobuf runs.
+"""
+
+import argparse
+import hashlib
+import imp
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(os.path.dirname(os.path.realpath(__file__)), 'amphtml-update.py'))
+
+
+def Die(msg):
+	print >> sys.stderr, msg
+	sys.exit(1)
+
+
+def ReadRules(parser, validator_directory, pb2_dir, results):
+	"""Reads the spec with one of the parsers, and reports how it went.
+
+	This runs in its own process.
+
+	Args:
+		parser: 'protoascii' or 'protobuf'.
+		validator_directory: directory for where the validator is located, inside the amphtml repo.
+		pb2_dir: directory of the validator_pb2.py generated by protoc, for the protobuf parser.
+		results: queue to put the seconds taken, the peak memory added in kilobytes and a hash of the rules on.
+	"""
+	proto_file = os.path.join(validator_directory, 'validator.proto')
+	protoascii_files = amphtml_update.GetValidatorProtoasciiFiles(validator_directory)
+	if 'protobuf' == parser:
+		# Load the modules up front, since the protoascii parser needs no modules to be loaded.
+		validator_pb2 = amphtml_update.GenValidatorPb2Py(validator_directory, pb2_dir)
+		from google.protobuf import text_format
+
+	start_memory = amphtml_update.GetPeakMemory()
+	start_time = time.time()
+	if 'protobuf' == parser:
+		rules = amphtml_update.ParseRules(amphtml_update.GenValidatorRules(validator_pb2, protoascii_files))
+	else:
+		rules = amphtml_update.ReadValidatorRules(proto_file, protoascii_files)
+	seconds = time.time() - start_time
+
+	results.put((seconds, amphtml_update.GetPeakMemory() - start_memory, hashlib.sha1(json.dumps(rules, sort_keys=True)).hexdigest()))
+
+
+def Main(amphtml_directory, parsers, repeat):
+	"""Benchmarks the parsers and prints the results.
+
+	Args:
+		amphtml_directory: path to the amphtml repo.
+		parsers: list of the parsers to benchmark.
+		repeat: number of times to read the spec with each parser.
+	"""
+	logging.basicConfig(level=logging.WARNING)
+
+	validator_directory = os.path.realpath(os.path.join(amphtml_directory, 'validator'))
+	if not os.path.exists(validator_directory):
+		Die('Error: The amphtml directory does not exist: %s' % validator_directory)
+
+	pb2_dir = tempfile.mkdtemp()
+	try:
+		if 'protobuf' in parsers:
+			# Run protoc once up front so that it doesn't count towards the first run.
+			amphtml_update.GenValidatorPb2Py(validator_directory, pb2_dir)
+
+		digests = set()
+		for parser in parsers:
+			runs = []
+			for i in range(repeat):
+				results = multiprocessing.Queue()
+				process = multiprocessing.Process(target=ReadRules, args=(parser, validator_directory, pb2_dir, results))
+				process.start()
+				runs.append(results.get())
+				process.join()
+			seconds = sorted(run[0] for run in runs)
+			print '%-10s  best %.3fs  median %.3fs  peak memory +%d KB' % (parser, seconds[0], seconds[len(seconds) // 2], max(run[1] for run in runs))
+			digests.update(run[2] for run in runs)
+	finally:
+		shutil.rmtree(pb2_dir)
+
+	if len(digests) > 1:
+		Die('Error: The parsers gave different rules.')
+	print 'The parsers gave the same rules.'
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Benchmark reading the AMPHTML validator spec with the parsers of amphtml-update.py.')
+	parser.add_argument('amphtml_directory', help='Path to the amphtml repo.')
+	parser.add_argument('--repeat', type=int, default=5, help='Number of times to read the spec with each parser. Defaults to %(default)s.')
+	parser.add_argument('--parser', action='append', choices=['protoascii', 'protobuf'], help='Parser to benchmark. Can be given more than once. Defaults to both.')
+	args = parser.parse_args()
+
+	Main(args.amphtml_directory, args.parser or ['protoascii', 'protobuf'], args.repeat)
@@ -8,32 +8,235 @@ A bash script, amphtml-update.sh, is provided to automatically run this script.
 
 from within a Linux environment such as VVV.
 
+The amphtml location can be a checkout or a .tar.gz, .tgz or .zip archive of
+one, such as amphtml-1902191209570.tar.gz from the amphtml releases. Only
+validator/validator.proto and the validator-*.protoascii files are read from
+an archive, in one pass and without extracting it, so keeping the archives of
+the revisions you build makes rebuilding them cheap and works offline.
+
+Run it with --help for its options. Every file is written to a temporary file
+first and then renamed, so a failed run never leaves a partial file behind.
+The regexes of the spec are translated to PCRE patterns, checked to compile
+(with PHP's preg_match() if php is installed, and Python's re module
+otherwise) and screened for catastrophic backtracking, see --regex-budget.
+Stages which run in worker processes are only timed as a whole by --profile,
+so use --jobs 1 for a breakdown per protoascii file.
+
 See the Updating Allowed Tags and Attributes section of the Contributing guide
 https://github.com/ampproject/amp-wp/blob/develop/contributing.md#updating-allowed-tags-and-attributes.
 
 Then have fun sanitizing your AMP posts!
 """
 
+import argparse
+import contextlib
+import cPickle
+import fnmatch
+import functools
 import glob
+import hashlib
 import logging
+import multiprocessing
 import os
 import platform
 import re
+import resource
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
 import collections
+import itertools
 import json
-import google
+import Queue
+import sre_constants
+import sre_parse
+import tarfile
+import zipfile
 from collections import defaultdict
+from distutils.spawn import find_executable
 import imp
 
+# The protobuf containers of repeated fields, which the rules may also come in when parsed with protoc. The
+# google.protobuf module is only needed for that, so this works without it.
+try:
+	from google.protobuf.internal import containers as protobuf_containers
+	REPEATED_SCALAR_CONTAINERS = (protobuf_containers.RepeatedScalarFieldContainer,)
+except ImportError:
+	REPEATED_SCALAR_CONTAINERS = ()
+try:
+	from google.protobuf.pyext import _message as protobuf_message
+	REPEATED_SCALAR_CONTAINERS += (protobuf_message.RepeatedScalarContainer,)
+	REPEATED_COMPOSITE_CONTAINERS = (protobuf_message.RepeatedCompositeContainer,)
+except ImportError:
+	REPEATED_COMPOSITE_CONTAINERS = ()
+
+# Spec names such as 'body', 'form [method=post]' or 'form > div [submit-error][template]', as matched by the sanitizer.
+SPEC_NAME_PATTERN = re.compile(r'^(?P<ancestors>.+? )?(?P<tag_name>[a-z0-9_-]+?)( (?P<raw_attrs>\[.+?\]))?$', re.I)
+
+# The message types read from validator.proto files by ParseProtoSchema(), by the hash of their contents.
+PROTO_SCHEMAS = {}
+
+# Extensions of the amphtml archives which the spec can be read from instead of a checkout.
+ARCHIVE_EXTENSIONS = ('.tar.gz', '.tgz', '.zip')
+
+# The contents of the spec files read from amphtml archives by ReadArchiveSpecFiles(), by their paths within the archives,
+# such as /path/to/amphtml.tar.gz/validator/validator.proto.
+ARCHIVE_SPEC_FILES = {}
+
+# Output formats which can be generated, and the extensions of their files in the build cache.
+OUTPUT_FORMATS = collections.OrderedDict([
+	('php', 'php'),
+	('json', 'json'),
+	('serialized', 'ser'),
+])
+
+# Vendor prefixes whose variants of the allowed CSS declarations are added to the CSS spec lookups, so that the style
+# sanitizer only has to strip other prefixes from property names itself.
+CSS_VENDOR_PREFIXES = ('-webkit-', '-moz-', '-ms-', '-o-')
+
+# Regex keys of the attribute specs, and whether their regexes must match the whole value and are case-insensitive.
+ATTR_SPEC_REGEX_KEYS = collections.OrderedDict([
+	('value_regex', {'anchored': True, 'casei': False}),
+	('value_regex_casei', {'anchored': True, 'casei': True}),
+	('blacklisted_value_regex', {'anchored': False, 'casei': False}),
+])
+
+# Numbers of times the repeated items of a regex are pumped in its attack strings by FuzzRegexes(), in increasing order.
+REGEX_FUZZ_SIZES = (8, 16, 24, 32, 64, 256, 1024, 4096)
+
+# Suffixes which make the attack strings fail to match, so that the regex engine backtracks through every way to match the rest.
+REGEX_FUZZ_SUFFIXES = (u'\x00', u'!', u' ')
+
+# Characters tried, in order, for a character class when rendering a string a regex matches.
+REGEX_FUZZ_CHARACTERS = u'a0 -._/:#=;,A'
+
+# Keys of the attribute specs whose checks AMP_Tag_And_Attribute_Sanitizer memoizes. The specs which have one get an attr_spec_id.
+MEMOIZED_ATTR_SPEC_KEYS = ('value_regex', 'value_regex_casei', 'value_url', 'disallowed_domain', 'blacklisted_value_regex', 'value_properties')
+
+# Attribute spec values which are hoisted into a shared table by --dedupe when several attribute specs have the same one.
+SHARED_ATTR_VALUE_KEYS = ('value_properties', 'value_url')
+
+# AMP_Rule_Spec::$layout_enum, the names of the supported_layouts of the amp_layout specs.
+LAYOUT_ENUM = {
+	1: 'nodisplay',
+	2: 'fixed',
+	3: 'fixed-height',
+	4: 'responsive',
+	5: 'container',
+	6: 'fill',
+	7: 'flex-item',
+	8: 'fluid',
+	9: 'intrinsic',
+}
+
+# Classes of the width and height of an element with a layout, numbered as AMP_Rule_Spec::LAYOUT_DIMENSION_*: not set,
+# a length in pixels or without a unit, a length in another unit, 'auto', 'fluid', or not a valid length.
+LAYOUT_DIMENSION_CLASSES = ('none', 'px', 'unit', 'auto', 'fluid', 'invalid')
+
 def Die(msg):
 	print >> sys.stderr, msg
 	sys.exit(1)
 
 
+def GetPeakMemory(who=resource.RUSAGE_SELF):
+	"""Helper function which gets the peak resident memory of this process or of its children.
+
+	Args:
+		who: resource.RUSAGE_SELF for this process, or resource.RUSAGE_CHILDREN for the largest of its children.
+	Returns:
+		Peak resident memory in kilobytes.
+	"""
+	peak_memory = resource.getrusage(who).ru_maxrss
+	if 'darwin' == sys.platform:
+		peak_memory /= 1024
+	return peak_memory
+
+
+class Profiler(object):
+	"""Collects the time spent in the named stages of a run and counters of what it handled, for --profile.
+
+	Spans nest, so the seconds of a span include those of the spans entered
+	within it. Only work done in this process is timed: stages which run in
+	worker processes are covered by the span around the pool.
+	"""
+
+	def __init__(self):
+		# Span names to their number of calls and seconds spent, in the order they were first entered.
+		self.spans = collections.OrderedDict()
+		self.counters = collections.OrderedDict()
+
+	@contextlib.contextmanager
+	def Span(self, name):
+		"""Times the block run within it under a span name."""
+		start = time.time()
+		try:
+			yield
+		finally:
+			span = self.spans.setdefault(name, [0, 0.0])
+			span[0] += 1
+			span[1] += time.time() - start
+
+	def Count(self, name, value=1):
+		"""Adds a value to a counter."""
+		self.counters[name] = self.counters.get(name, 0) + value
+
+	def GetReport(self):
+		"""Gets the spans, counters and peak memory as JSON-serializable data."""
+		return collections.OrderedDict([
+			('spans', collections.OrderedDict((name, collections.OrderedDict([('calls', calls), ('seconds', round(seconds, 6))])) for (name, (calls, seconds)) in self.spans.items())),
+			('counters', self.counters),
+			('peak_memory_kb', {'self': GetPeakMemory(), 'children': GetPeakMemory(resource.RUSAGE_CHILDREN)}),
+		])
+
+	def PrintReport(self, out):
+		"""Prints the spans, counters and peak memory as a table."""
+		report = self.GetReport()
+		print >> out, '%-40s %8s %10s' % ('Span', 'Calls', 'Seconds')
+		for (name, span) in report['spans'].items():
+			print >> out, '%-40s %8d %10.3f' % (name, span['calls'], span['seconds'])
+		print >> out, ''
+		for (name, value) in report['counters'].items():
+			print >> out, '%-40s %19d' % (name, value)
+		print >> out, ''
+		print >> out, '%-40s %16d KB' % ('Peak memory', report['peak_memory_kb']['self'])
+		print >> out, '%-40s %16d KB' % ('Peak memory of child processes', report['peak_memory_kb']['children'])
+
+
+# The profiler of this run, reported with --profile.
+PROFILER = Profiler()
+
+
+def Profiled(function):
+	"""Decorator which times each call of a build stage in a span named after it."""
+	@functools.wraps(function)
+	def ProfiledFunction(*args, **kwargs):
+		with PROFILER.Span(function.__name__):
+			return function(*args, **kwargs)
+	return ProfiledFunction
+
+
+def CountRules(allowed_tags, attr_lists):
+	"""Adds the numbers of tags, tag specs, attribute specs and regexes in the rules to the profiler counters.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+	"""
+	attr_spec_lists = list(attr_lists.values())
+	PROFILER.Count('tags', len(allowed_tags))
+	for rule_specs in allowed_tags.values():
+		PROFILER.Count('tag specs', len(rule_specs))
+		for rule_spec in rule_specs:
+			attr_spec_lists.append(rule_spec['attr_spec_list'])
+			PROFILER.Count('regexes', len([key for key in rule_spec.get('cdata', {}) if key.endswith('regex')]))
+	for attr_spec_list in attr_spec_lists:
+		PROFILER.Count('attr specs', len(attr_spec_list))
+		for attr_spec in attr_spec_list.values():
+			PROFILER.Count('regexes', len([key for key in attr_spec if key.endswith('regex') or key.endswith('regex_casei')]))
+
+
 def SetupOutDir(out_dir):
 	"""Sets up a clean output directory.
 
@@ -48,77 +251,866 @@ def SetupOutDir(out_dir):
 	logging.info('... done')
 
 
-def GenValidatorPb2Py(validator_directory, out_dir):
-	"""Calls the proto compiler to generate validator_pb2.py.
+def GetProtocVersion():
+	"""Gets the version of protoc, as `protoc --version` prints it."""
+	return subprocess.check_output(['protoc', '--version']).strip()
+
+
+def GetDefaultCacheDir():
+	"""Gets the default directory of the build cache, under the cache directory of the user."""
+	return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'amp-wp')
+
+
+def SetupCacheDir(cache_dir):
+	"""Creates the build cache directory, only readable by the current user, or checks that it is theirs.
+
+	The cache holds modules which are loaded and output which is copied into the plugin, so a
+	directory which another user owns or can write to could plant code in it.
+
+	Args:
+		cache_dir: directory name of the build cache.
+	"""
+	if not os.path.exists(cache_dir):
+		os.makedirs(cache_dir, 0700)
+	stat = os.stat(cache_dir)
+	if stat.st_uid != os.getuid() or stat.st_mode & 0022:
+		Die('Error: The cache directory must be owned by the current user and not writable by others: %s. Use --cache-dir or --no-cache.' % cache_dir)
+
+
+@Profiled
+def GenValidatorPb2Py(validator_directory, out_dir, cache_dir=None, digests=None, load=True):
+	"""Calls the proto compiler to generate validator_pb2.py and loads it.
+
+	When a cache directory is supplied, the generated module is stored there
+	keyed by the hash of validator.proto and the version of protoc so that
+	protoc only runs when either changes.
 
 	Args:
 		validator_directory: directory name of the validator.
 		out_dir: directory name of the output directory.
+		cache_dir: directory name of the build cache, or None.
+		digests: dictionary of source file paths to their content hashes.
+		load: whether to load the module, or only to generate it for processes forked later to load.
+	Returns:
+		The validator_pb2 module, or None when it is not loaded.
 	"""
 	logging.info('entering ...')
 
-	os.chdir( validator_directory )
-	subprocess.check_call(['protoc', 'validator.proto', '--python_out=%s' % out_dir])
-	os.chdir( out_dir )
-	open('__init__.py', 'w').close()
+	if cache_dir:
+		pb2_key = hashlib.sha1('%s\0%s' % (digests[os.path.join(validator_directory, 'validator.proto')], GetProtocVersion()))
+		pb2_dir = os.path.join(cache_dir, 'validator_pb2-%s' % pb2_key.hexdigest())
+	else:
+		pb2_dir = out_dir
+
+	pb2_file = os.path.join(pb2_dir, 'validator_pb2.py')
+	if not os.path.exists(pb2_file):
+		protoc_out_dir = tempfile.mkdtemp(dir=cache_dir) if cache_dir else out_dir
+		proto_directory = validator_directory
+		if os.path.join(validator_directory, 'validator.proto') in ARCHIVE_SPEC_FILES:
+			# validator.proto was read from an archive, and protoc only reads files.
+			proto_directory = tempfile.mkdtemp()
+			WriteFileAtomically(os.path.join(proto_directory, 'validator.proto'), ReadSpecFile(os.path.join(validator_directory, 'validator.proto')))
+		try:
+			with PROFILER.Span('protoc'):
+				subprocess.check_call(['protoc', 'validator.proto', '--python_out=%s' % protoc_out_dir], cwd=proto_directory)
+		finally:
+			if proto_directory != validator_directory:
+				shutil.rmtree(proto_directory)
+		open(os.path.join(protoc_out_dir, '__init__.py'), 'w').close()
+		if protoc_out_dir != pb2_dir:
+			try:
+				os.rename(protoc_out_dir, pb2_dir)
+			except OSError:
+				# Another run populated the cache first.
+				shutil.rmtree(protoc_out_dir)
+
 	logging.info('... done')
+	return imp.load_source('validator_pb2', pb2_file) if load else None
 
 
-def GenValidatorProtoascii(validator_directory, out_dir):
-	"""Assembles the validator protoascii file from the main and extensions.
+def GetValidatorProtoasciiFiles(validator_directory):
+	"""Gets the validator protoascii files for the main spec and the extensions.
 
 	Args:
-		validator_directory: directory for where the validator is located, inside the amphtml repo.
-		out_dir: directory name of the output directory.
+		validator_directory: directory for where the validator is located, inside the amphtml repo, or the
+			path from ReadArchiveSpecFiles().
+	Returns:
+		List of protoascii file paths, with validator-main first and the extensions sorted after it.
+	"""
+	if os.path.join(validator_directory, 'validator.proto') in ARCHIVE_SPEC_FILES:
+		extensions = fnmatch.filter(ARCHIVE_SPEC_FILES, os.path.join(os.path.dirname(validator_directory), 'extensions/*/validator-*.protoascii'))
+	else:
+		extensions = glob.glob(os.path.join(validator_directory, '../extensions/*/validator-*.protoascii'))
+	extensions.sort()
+	return [os.path.join(validator_directory, 'validator-main.protoascii')] + extensions
+
+
+def GetArchiveSpecPath(name):
+	"""Gets the path of a spec file within an amphtml archive, relative to the root of the checkout.
+
+	Args:
+		name: name of an archive member, such as 'amphtml-1902191209570/validator/validator.proto'.
+	Returns:
+		Tuple of the directory the checkout is in within the archive and the path of the spec file
+		within the checkout, or None if the member is not validator.proto or a protoascii file of the spec.
+	"""
+	parts = name.strip('/').split('/')
+	if parts[-2:] in (['validator', 'validator.proto'], ['validator', 'validator-main.protoascii']):
+		return ('/'.join(parts[:-2]), '/'.join(parts[-2:]))
+	if 3 <= len(parts) and 'extensions' == parts[-3] and parts[-1].startswith('validator-') and parts[-1].endswith('.protoascii'):
+		return ('/'.join(parts[:-3]), '/'.join(parts[-3:]))
+	return None
+
+
+@Profiled
+def ReadArchiveSpecFiles(archive):
+	"""Reads the spec files of an amphtml archive into memory, without extracting the rest of the checkout.
+
+	The archive is read in one sequential pass, and only validator.proto and the protoascii files are
+	kept, in ARCHIVE_SPEC_FILES, where ReadSpecFile() and GetValidatorProtoasciiFiles() find them.
+	Worker processes forked afterwards have them too.
+
+	Args:
+		archive: path to a .tar.gz, .tgz or .zip archive of an amphtml checkout, like GitHub serves for each release.
+	Returns:
+		Path standing in for the validator directory of the checkout, to pass on like one.
 	"""
 	logging.info('entering ...')
 
-	protoascii_segments = [open(os.path.join(validator_directory, 'validator-main.protoascii')).read()]
-	extensions = glob.glob(os.path.join(validator_directory, '../extensions/*/validator-*.protoascii'))
-	extensions.sort()
-	for extension in extensions:
-		protoascii_segments.append(open(extension).read())
-	f = open('%s/validator.protoascii' % out_dir, 'w')
-	f.write(''.join(protoascii_segments))
-	f.close()
+	archive = os.path.realpath(archive)
+	checkouts = defaultdict(dict)
+	if archive.endswith('.zip'):
+		with zipfile.ZipFile(archive) as zip_file:
+			for info in zip_file.infolist():
+				spec_path = GetArchiveSpecPath(info.filename)
+				if spec_path:
+					checkouts[spec_path[0]][spec_path[1]] = zip_file.read(info)
+	else:
+		# Stream the members, as the archive may not be seekable and most of it is skipped.
+		with tarfile.open(archive, 'r|gz') as tar_file:
+			for member in tar_file:
+				spec_path = GetArchiveSpecPath(member.name) if member.isfile() else None
+				if spec_path:
+					checkouts[spec_path[0]][spec_path[1]] = tar_file.extractfile(member).read()
+
+	# Archives of a checkout have it at the top level, or in a directory named after the revision.
+	roots = sorted((root for root in checkouts if 'validator/validator.proto' in checkouts[root]), key=lambda root: (root.count('/'), root))
+	if not roots:
+		Die('Error: The archive has no validator/validator.proto: %s' % archive)
+
+	for (path, contents) in checkouts[roots[0]].items():
+		ARCHIVE_SPEC_FILES[os.path.join(archive, path)] = contents
+	PROFILER.Count('archive spec bytes read', sum(len(contents) for contents in checkouts[roots[0]].values()))
+
+	logging.info('... done')
+	return os.path.join(archive, 'validator')
+
+
+def ReadSpecFile(path):
+	"""Reads a spec file from the disk, or from memory if it was read from an archive by ReadArchiveSpecFiles().
+
+	Args:
+		path: path of the spec file.
+	Returns:
+		The contents of the file.
+	"""
+	if path in ARCHIVE_SPEC_FILES:
+		return ARCHIVE_SPEC_FILES[path]
+	return open(path, 'rb').read()
+
+
+def ParseProtoasciiFile(args):
+	"""Parses a single protoascii file into a serialized ValidatorRules message.
+
+	This may run in a worker process, so it takes its arguments as one tuple
+	and returns the message in binary form.
+
+	Args:
+		args: tuple of the validator_pb2.py file path and the protoascii file path.
+	Returns:
+		Serialized ValidatorRules message.
+	"""
+	(pb2_file, protoascii_file) = args
+
+	# This import happens late because google.protobuf is only needed for parsing with protoc.
+	from google.protobuf import text_format
+
+	validator_pb2 = sys.modules.get('validator_pb2') or imp.load_source('validator_pb2', pb2_file)
+	fragment = validator_pb2.ValidatorRules()
+	text_format.Merge(ReadSpecFile(protoascii_file), fragment)
+	return fragment.SerializeToString()
+
+
+@Profiled
+def GenValidatorRules(validator_pb2, protoascii_files, cache_dir=None, digests=None, jobs=1):
+	"""Parses the validator protoascii files into a single ValidatorRules message.
+
+	Each file is parsed on its own, in a pool of worker processes when more
+	than one job is allowed, and the results are merged in the order of the
+	files. This is equivalent to parsing the files concatenated together.
+	When a cache directory is supplied, the parsed result of each file is
+	stored there in binary form keyed by the hashes of the file and of the
+	compiled proto descriptor, so only changed files are parsed again.
+
+	Args:
+		validator_pb2: the validator_pb2 module.
+		protoascii_files: list of protoascii file paths, in order.
+		cache_dir: directory name of the build cache, or None.
+		digests: dictionary of source file paths to their content hashes.
+		jobs: maximum number of worker processes to parse with.
+	Returns:
+		ValidatorRules message.
+	"""
+	logging.info('entering ...')
+
+	descriptor_digest = hashlib.sha1(validator_pb2.DESCRIPTOR.serialized_pb).hexdigest()
+	fragments = [None] * len(protoascii_files)
+	cache_files = [None] * len(protoascii_files)
+	if cache_dir:
+		for (i, protoascii_file) in enumerate(protoascii_files):
+			cache_key = hashlib.sha1(descriptor_digest + digests[protoascii_file]).hexdigest()
+			cache_files[i] = os.path.join(cache_dir, 'protoascii', '%s.pb' % cache_key)
+			if os.path.exists(cache_files[i]):
+				fragments[i] = open(cache_files[i], 'rb').read()
+
+	pending = [i for i in range(len(fragments)) if fragments[i] is None]
+	tasks = [(validator_pb2.__file__, protoascii_files[i]) for i in pending]
+	if jobs > 1 and len(tasks) > 1:
+		pool = multiprocessing.Pool(min(jobs, len(tasks)))
+		try:
+			parsed = pool.map(ParseProtoasciiFile, tasks)
+		finally:
+			pool.close()
+			pool.join()
+	else:
+		parsed = map(ParseProtoasciiFile, tasks)
+
+	for (i, fragment) in zip(pending, parsed):
+		fragments[i] = fragment
+		if cache_files[i]:
+			WriteFileAtomically(cache_files[i], fragment)
+
+	rules = validator_pb2.ValidatorRules()
+	with PROFILER.Span('Merge'):
+		for fragment in fragments:
+			rules.MergeFromString(fragment)
+
+	logging.info('... done')
+	return rules
+
+
+# Tokens of the .proto files, with groups for words, numbers, strings and symbols.
+PROTO_TOKEN = re.compile(r'\s+|//[^\n]*|/\*.*?\*/|([A-Za-z_][\w.]*|\.[A-Za-z_][\w.]*)|([-+]?[\d.][\w.+-]*)|("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')|(\S)', re.S)
+
+# Tokens of the protoascii files, with groups for words (identifiers and numbers), strings and symbols.
+PROTOASCII_TOKEN = re.compile(r'\s+|#[^\n]*|([\w.+-]+)|("(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\')|([{}<>\[\]:,;])')
+
+PROTO_SCALAR_DEFAULTS = {
+	'double': 0.0,
+	'float': 0.0,
+	'int32': 0,
+	'int64': 0,
+	'uint32': 0,
+	'uint64': 0,
+	'sint32': 0,
+	'sint64': 0,
+	'fixed32': 0,
+	'fixed64': 0,
+	'sfixed32': 0,
+	'sfixed64': 0,
+	'bool': False,
+	'string': u'',
+	'bytes': '',
+}
+
+
+class ProtoField(object):
+	"""A field of a message type read by ParseProtoSchema(), named like a protobuf field descriptor."""
+
+	def __init__(self, name, number, label, type_name, options):
+		self.name = name
+		self.number = number
+		self.label = label
+		self.type_name = type_name
+		self.options = options
+		self.message_type = None
+		self.enum_values = None
+		self.default_value = None
+
+
+class ProtoMessageType(object):
+	"""A message type read by ParseProtoSchema()."""
+
+	def __init__(self, full_name):
+		self.full_name = full_name
+		self.fields = {}
+
+
+class ProtoasciiRepeatedScalarField(list):
+	"""The items of a repeated field of scalars or enums in a ProtoasciiMessage."""
+
+
+class ProtoasciiRepeatedCompositeField(list):
+	"""The items of a repeated field of messages in a ProtoasciiMessage."""
+
+
+class ProtoasciiMessage(object):
+	"""A message read by ReadProtoascii().
+
+	This has the parts of the protobuf message API which the rules are converted with: fields
+	as attributes (with their defaults when not set), HasField() and ListFields().
+	"""
+
+	def __init__(self, message_type):
+		self._message_type = message_type
+		self._field_values = {}
+
+	def __getattr__(self, name):
+		if name.startswith('_') or name not in self._message_type.fields:
+			raise AttributeError(name)
+		if name in self._field_values:
+			return self._field_values[name]
+		field = self._message_type.fields[name]
+		if 'repeated' == field.label:
+			return ProtoasciiRepeatedCompositeField() if field.message_type else ProtoasciiRepeatedScalarField()
+		if field.message_type:
+			return ProtoasciiMessage(field.message_type)
+		return field.default_value
+
+	def HasField(self, name):
+		return name in self._field_values
+
+	def ListFields(self):
+		fields = [self._message_type.fields[name] for name in self._field_values if 'repeated' != self._message_type.fields[name].label or len(self._field_values[name]) > 0]
+		return [(field, self._field_values[field.name]) for field in sorted(fields, key=lambda field: field.number)]
+
+
+@Profiled
+def ParseProtoSchema(proto_file):
+	"""Reads the message types of a proto2 .proto file, such as validator.proto, without protoc.
+
+	Only what the validator rules need is kept: the fields with their labels, types and
+	defaults, and the enum values. Services, extensions and options other than field
+	defaults are skipped.
+
+	Args:
+		proto_file: path of the .proto file.
+	Returns:
+		Dictionary of the full names of the message types to the message types.
+	"""
+	logging.info('entering ...')
+
+	text = ReadSpecFile(proto_file)
+	tokens = []
+	pos = 0
+	while pos < len(text):
+		match = PROTO_TOKEN.match(text, pos)
+		if match.lastindex:
+			tokens.append(match.group(match.lastindex))
+		pos = match.end()
+	tokens.append(None)
+
+	message_types = {}
+	enums = {}
+	fields = []
+	state = {'pos': 0}
+
+	def Next():
+		token = tokens[state['pos']]
+		if token is None:
+			raise ValueError('%s: unexpected end of file' % proto_file)
+		state['pos'] += 1
+		return token
+
+	def Expect(expected):
+		token = Next()
+		if token != expected:
+			raise ValueError('%s: expected %r but got %r' % (proto_file, expected, token))
+
+	def SkipStatement():
+		depth = 0
+		while True:
+			token = Next()
+			if '{' == token:
+				depth += 1
+			elif '}' == token:
+				depth -= 1
+				if 0 == depth:
+					return
+			elif ';' == token and 0 == depth:
+				return
+
+	def ParseOptions():
+		options = {}
+		if '[' == tokens[state['pos']]:
+			Next()
+			while True:
+				name = Next()
+				Expect('=')
+				options[name] = Next()
+				if ']' == Next():
+					break
+		return options
+
+	def ParseEnum(scope):
+		name = Next()
+		values = collections.OrderedDict()
+		Expect('{')
+		while '}' != tokens[state['pos']]:
+			token = Next()
+			if token in ('option', 'reserved'):
+				SkipStatement()
+			elif ';' != token:
+				Expect('=')
+				values[token] = int(Next(), 0)
+				ParseOptions()
+				Expect(';')
+		Next()
+		enums[scope + name] = values
+
+	def ParseField(message_type, label, scope):
+		type_name = Next()
+		name = Next()
+		Expect('=')
+		number = int(Next(), 0)
+		field = ProtoField(name, number, label, type_name, ParseOptions())
+		Expect(';')
+		message_type.fields[name] = field
+		fields.append((field, scope))
+
+	def ParseMessage(scope):
+		full_name = scope + Next()
+		message_type = ProtoMessageType(full_name)
+		message_types[full_name] = message_type
+		Expect('{')
+		while '}' != tokens[state['pos']]:
+			token = tokens[state['pos']]
+			if 'message' == token:
+				Next()
+				ParseMessage(full_name + '.')
+			elif 'enum' == token:
+				Next()
+				ParseEnum(full_name + '.')
+			elif 'oneof' == token:
+				Next()
+				Next()
+				Expect('{')
+				while '}' != tokens[state['pos']]:
+					ParseField(message_type, 'optional', full_name)
+				Next()
+			elif token in ('option', 'reserved', 'extensions', 'extend'):
+				SkipStatement()
+			elif ';' == token:
+				Next()
+			elif token in ('optional', 'required', 'repeated'):
+				Next()
+				ParseField(message_type, token, full_name)
+			else:
+				ParseField(message_type, 'optional', full_name)
+		Next()
+
+	package = ''
+	while tokens[state['pos']] is not None:
+		token = Next()
+		if 'package' == token:
+			package = Next() + '.'
+			Expect(';')
+		elif 'message' == token:
+			ParseMessage(package)
+		elif 'enum' == token:
+			ParseEnum(package)
+		elif ';' != token:
+			SkipStatement()
+
+	# Resolve the field types, looking them up from the innermost scope outwards as protoc does.
+	for (field, scope) in fields:
+		if field.type_name in PROTO_SCALAR_DEFAULTS:
+			field.default_value = PROTO_SCALAR_DEFAULTS[field.type_name]
+		else:
+			candidates = [field.type_name[1:]] if field.type_name.startswith('.') else []
+			scope_parts = scope.split('.')
+			while not candidates:
+				candidates = [name for name in ['.'.join(scope_parts + [field.type_name]).lstrip('.')] if name in message_types or name in enums]
+				if not scope_parts:
+					break
+				scope_parts.pop()
+			if not candidates or (candidates[0] not in message_types and candidates[0] not in enums):
+				raise ValueError('%s: unknown type %s of field %s' % (proto_file, field.type_name, field.name))
+			if candidates[0] in message_types:
+				field.message_type = message_types[candidates[0]]
+			else:
+				field.enum_values = enums[candidates[0]]
+				field.default_value = enums[candidates[0]].values()[0]
+
+		if 'default' in field.options:
+			field.default_value = ParseProtoasciiScalar(field, field.options['default'])
+
+	logging.info('... done')
+	return message_types
+
+
+def ParseProtoasciiScalar(field, token):
+	"""Converts the text of a scalar or enum value into its value, as text_format does.
+
+	Args:
+		field: ProtoField of the value.
+		token: text of the value, with strings still quoted and escaped.
+	Returns:
+		The value. Strings are unicode, apart from bytes.
+	"""
+	if token[0] in '"\'':
+		# Adjacent strings are joined before this. Escapes are for bytes, so unescape before decoding UTF-8.
+		value = re.sub(r'(\\+)x([0-9a-fA-F])(?![0-9a-fA-F])', lambda match: match.group(1) + 'x0' + match.group(2) if len(match.group(1)) & 1 else match.group(0), token[1:-1]).decode('string_escape')
+		if 'string' == field.type_name:
+			value = value.decode('utf-8')
+		return value
+	if field.enum_values is not None:
+		if token in field.enum_values:
+			return field.enum_values[token]
+		return int(token, 0)
+	if 'bool' == field.type_name:
+		if token in ('true', 't', 'True', '1'):
+			return True
+		if token in ('false', 'f', 'False', '0'):
+			return False
+		raise ValueError('Invalid boolean value %s of field %s' % (token, field.name))
+	if field.type_name in ('double', 'float'):
+		lowered = token.lower()
+		if lowered in ('inf', 'infinity', '-inf', '-infinity', 'nan'):
+			return float(lowered.replace('infinity', 'inf'))
+		return float(token.rstrip('fF'))
+	return int(token, 0)
+
+
+def TokenizeProtoascii(text, path):
+	"""Splits the text of a protoascii file into tokens.
+
+	Args:
+		text: contents of the file.
+		path: file path, for error messages.
+	Yields:
+		Tuples of the token and whether it is a string.
+	"""
+	pos = 0
+	end = len(text)
+	while pos < end:
+		match = PROTOASCII_TOKEN.match(text, pos)
+		if not match:
+			raise ValueError('%s:%d: unexpected %r' % (path, text.count('\n', 0, pos) + 1, text[pos:pos + 20]))
+		pos = match.end()
+		if match.lastindex:
+			yield (match.group(match.lastindex), 2 == match.lastindex)
+
+
+def ReadProtoascii(protoascii_file, message_type):
+	"""Reads a protoascii file with a pure-Python parser of the text format, without protoc.
+
+	The top-level fields are yielded one at a time as they are read instead of being merged
+	into one message, so the whole spec needn't be held in memory.
+
+	Args:
+		protoascii_file: path of the protoascii file.
+		message_type: ProtoMessageType of the message in the file, from ParseProtoSchema().
+	Yields:
+		Tuples of the name and value of each top-level field, one for each item of a repeated field.
+	"""
+	tokens = TokenizeProtoascii(ReadSpecFile(protoascii_file), protoascii_file)
+	lookahead = []
+
+	def Peek():
+		if not lookahead:
+			lookahead.append(next(tokens, (None, False)))
+		return lookahead[0]
+
+	def Next():
+		token = Peek()
+		del lookahead[0]
+		if token[0] is None:
+			raise ValueError('%s: unexpected end of file' % protoascii_file)
+		return token
+
+	def ReadValue(field):
+		(token, is_string) = Next()
+		if field.message_type:
+			if token not in ('{', '<'):
+				raise ValueError('%s: expected a message for %s but got %r' % (protoascii_file, field.name, token))
+			return ReadMessage(ProtoasciiMessage(field.message_type), '}' if '{' == token else '>')
+		if is_string:
+			# Adjacent strings are concatenated.
+			while Peek()[1]:
+				token = token[:-1] + Next()[0][1:]
+		return ParseProtoasciiScalar(field, token)
+
+	def ReadField(message_type):
+		name = Next()[0]
+		if name not in message_type.fields:
+			raise ValueError('%s: unknown field %s in %s' % (protoascii_file, name, message_type.full_name))
+		field = message_type.fields[name]
+		if ':' == Peek()[0]:
+			Next()
+		if '[' == Peek()[0]:
+			Next()
+			values = []
+			while ']' != Peek()[0]:
+				values.append(ReadValue(field))
+				if ',' == Peek()[0]:
+					Next()
+			Next()
+		else:
+			values = [ReadValue(field)]
+		if Peek()[0] in (',', ';'):
+			Next()
+		return (field, values)
+
+	def ReadMessage(message, end):
+		while end != Peek()[0]:
+			(field, values) = ReadField(message._message_type)
+			if 'repeated' == field.label:
+				message._field_values.setdefault(field.name, ProtoasciiRepeatedCompositeField() if field.message_type else ProtoasciiRepeatedScalarField()).extend(values)
+			elif field.message_type and field.name in message._field_values:
+				# As in text_format.Merge(), a message field that is given again is merged.
+				for value in values:
+					for (name, field_value) in value._field_values.items():
+						existing = message._field_values[field.name]
+						if 'repeated' == value._message_type.fields[name].label and name in existing._field_values:
+							existing._field_values[name].extend(field_value)
+						else:
+							existing._field_values[name] = field_value
+			else:
+				message._field_values[field.name] = values[-1]
+		Next()
+		return message
+
+	while Peek()[0] is not None:
+		(field, values) = ReadField(message_type)
+		for value in values:
+			yield (field.name, value)
+
+
+def GetProtoSchema(proto_file):
+	"""Gets the message types of a validator.proto file, parsing each version of it once per process.
+
+	Checkouts of different amphtml revisions often have the same validator.proto, so it is
+	looked up by the hash of its contents. Worker processes forked after it was parsed reuse it.
+
+	Args:
+		proto_file: path of the .proto file.
+	Returns:
+		Dictionary of the full names of the message types to the message types, from ParseProtoSchema().
+	"""
+	digest = HashFile(proto_file)
+	if digest not in PROTO_SCHEMAS:
+		PROTO_SCHEMAS[digest] = ParseProtoSchema(proto_file)
+	return PROTO_SCHEMAS[digest]
+
+
+@Profiled
+def ReadProtoasciiRuleEntries(args):
+	"""Reads a single protoascii file into entries for CollectRules().
+
+	This may run in a worker process, so it takes its arguments as one tuple
+	and gets validator.proto from GetProtoSchema().
+
+	Args:
+		args: tuple of the validator.proto file path and the protoascii file path.
+	Returns:
+		List of entries from GetRuleEntries().
+	"""
+	(proto_file, protoascii_file) = args
+
+	message_types = GetProtoSchema(proto_file)
+	message_type = [message_types[name] for name in message_types if 'ValidatorRules' == name.split('.')[-1]][0]
+
+	return list(GetRuleEntries(ReadProtoascii(protoascii_file, message_type)))
+
+
+@Profiled
+def ReadValidatorRules(proto_file, protoascii_files, jobs=1, cache_dir=None, digests=None):
+	"""Reads the validator protoascii files with the pure-Python parser into the dictionaries the PHP is generated from.
+
+	This gives the same result as ParseRules() of the message from GenValidatorRules(),
+	without protoc or the google.protobuf module. Each file is read on its own, in a pool
+	of worker processes when more than one job is allowed. When a cache directory is
+	supplied, the entries read from each file are stored there, keyed by the hashes of the
+	file, of validator.proto and of this script, so only changed files are read again.
+
+	Args:
+		proto_file: path of validator.proto.
+		protoascii_files: list of protoascii file paths, in order.
+		jobs: maximum number of worker processes to read with.
+		cache_dir: directory name of the build cache, or None.
+		digests: dictionary of source file paths to their content hashes.
+	Returns:
+		Tuple of the allowed tags, attribute lists, descendant tag lists, reference points and versions.
+	"""
+	logging.info('entering ...')
+
+	entries = [None] * len(protoascii_files)
+	cache_files = [None] * len(protoascii_files)
+	if cache_dir:
+		schema_digest = HashFile(os.path.realpath(__file__)) + digests[proto_file]
+		for (i, protoascii_file) in enumerate(protoascii_files):
+			cache_key = hashlib.sha1(schema_digest + digests[protoascii_file]).hexdigest()
+			cache_files[i] = os.path.join(cache_dir, 'protoascii-entries', '%s.pickle' % cache_key)
+			if os.path.exists(cache_files[i]):
+				entries[i] = cPickle.loads(open(cache_files[i], 'rb').read())
+
+	pending = [i for i in range(len(entries)) if entries[i] is None]
+	tasks = [(proto_file, protoascii_files[i]) for i in pending]
+	if jobs > 1 and len(tasks) > 1:
+		pool = multiprocessing.Pool(min(jobs, len(tasks)))
+		try:
+			read = pool.map(ReadProtoasciiRuleEntries, tasks)
+		finally:
+			pool.close()
+			pool.join()
+	else:
+		read = map(ReadProtoasciiRuleEntries, tasks)
+
+	for (i, file_entries) in zip(pending, read):
+		entries[i] = file_entries
+		if cache_files[i]:
+			WriteFileAtomically(cache_files[i], cPickle.dumps(file_entries, cPickle.HIGHEST_PROTOCOL))
+	parsed_rules = CollectRules(itertools.chain.from_iterable(entries))
 
 	logging.info('... done')
+	return parsed_rules
 
 
-def GeneratePHP(out_dir):
+@Profiled
+def GeneratePHP(rules, shard_by=None, shard_dir_name=None, dedupe=False):
 	"""Generates PHP for WordPress AMP plugin to consume.
 
 	Args:
-		validator_directory: directory for where the validator is located, inside the amphtml repo.
-		out_dir: directory name of the output directory
+		rules: tuple of the allowed tags, attribute lists, descendant tag lists, reference points and versions,
+			as returned by ParseRules() or ReadValidatorRules().
+		shard_by: 'tag' or 'extension' to split the allowed tags and reference points into shard files, or None.
+		shard_dir_name: name of the directory next to the class file which the shard files are written to.
+		dedupe: whether to reference the named attribute lists and shared attribute values instead of inlining copies.
+	Returns:
+		The PHP class file contents, and a dictionary of shard file names to their contents.
 	"""
 	logging.info('entering ...')
 
-	allowed_tags, attr_lists, descendant_lists, reference_points, versions = ParseRules(out_dir)
+	allowed_tags, attr_lists, descendant_lists, reference_points, versions = rules
+	output, shard_files = GenerateRulesPHP(allowed_tags, attr_lists, descendant_lists, reference_points, versions, shard_by, shard_dir_name, dedupe)
+
+	logging.info('... done')
+	return output, shard_files
+
+
+def GenerateRulesPHP(allowed_tags, attr_lists, descendant_lists, reference_points, versions, shard_by=None, shard_dir_name=None, dedupe=False):
+	"""Generates the AMP_Allowed_Tags_Generated class, and any shard files, from the parsed rules.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		descendant_lists: dictionary of descendant tag list names to their tag names.
+		reference_points: dictionary of reference point spec names to their specs.
+		versions: dictionary of the spec file and validator revisions.
+		shard_by: 'tag' or 'extension' to split the allowed tags and reference points into shard files, or None.
+		shard_dir_name: name of the directory next to the class file which the shard files are written to.
+		dedupe: whether to reference the named attribute lists and shared attribute values instead of inlining copies.
+	Returns:
+		The PHP class file contents, and a dictionary of shard file names to their contents.
+	"""
+	attr_list_names = PopAttrListNames(allowed_tags, reference_points)
+	rules_data = GetRulesData(allowed_tags, attr_lists, descendant_lists, reference_points, versions)
+	allowed_tags = GetExtensionSpecReferences(allowed_tags)
+
+	deduped = None
+	if dedupe:
+		deduped = GetDedupedRules(allowed_tags, attr_lists, reference_points, attr_list_names)
+		PrintDedupeReport(allowed_tags, attr_lists, reference_points, deduped)
+		allowed_tags = deduped['allowed_tags']
+		attr_lists = deduped['attr_lists']
+		reference_points = deduped['reference_points']
+
+	shards = None
+	shard_files = {}
+	if shard_by:
+		shards = GetShards(allowed_tags, reference_points, shard_by)
+		for (shard_name, shard) in shards['shards'].items():
+			shard_files['%s.php' % shard_name] = GenerateShardPHP(shard)
+		shards['dir_name'] = shard_dir_name
 
 	#Generate the output
 	out = []
 	GenerateHeaderPHP(out)
 	GenerateSpecVersionPHP(out, versions)
 	GenerateDescendantListsPHP(out, descendant_lists)
-	GenerateAllowedTagsPHP(out, allowed_tags)
+	GenerateDescendantTagSetsPHP(out, rules_data['descendant_tag_sets'])
+	if shards:
+		GenerateShardIndexPHP(out, shards)
+	else:
+		GenerateAllowedTagsPHP(out, allowed_tags)
 	GenerateLayoutAttributesPHP(out, attr_lists)
 	GenerateGlobalAttributesPHP(out, attr_lists)
-	GenerateReferencePointsPHP(out, reference_points)
-	GenerateFooterPHP(out)
+	if not shards:
+		GenerateReferencePointsPHP(out, reference_points)
+	if deduped:
+		GenerateDedupeTablesPHP(out, deduped)
+	GenerateAlternativeAttrNamesPHP(out, rules_data['alternative_attr_names'])
+	GenerateAttrValueSetsPHP(out, rules_data['attr_value_sets'])
+	GenerateLayoutTablesPHP(out, rules_data['layout_tables'])
+	GenerateTagSpecDispatchIndexPHP(out, rules_data['tag_spec_dispatch_index'])
+	GenerateSpecNameComponentsPHP(out, rules_data['spec_name_components'])
+	GenerateCssSpecsPHP(out, rules_data['css_specs'])
+	GenerateExtensionIndexPHP(out, rules_data['extension_index'], rules_data['extension_specs'])
+	GenerateFooterPHP(out, shards, dedupe)
+
+	return '\n'.join(out) + '\n', shard_files
+
+
+@Profiled
+def GetRulesData(allowed_tags, attr_lists, descendant_lists, reference_points, versions):
+	"""Gets the rules along with the lookup tables derived from them, as the generated class has them.
+
+	The derived keys are added to the tag specs, reference points and attribute lists in place, and
+	the names of the attribute lists from CollectRules() are removed, since the attributes of the lists
+	are inlined. Doing so again gives the same result, so this can be called for every output format.
 
-	# join out array into a single string and remove unneeded whitespace
-	output = re.sub("\\(\\s*\\)", "()", '\n'.join(out))
-
-	# replace 'True' with true and 'False' with false
-	output = re.sub("'True'", "true", output)
-	output = re.sub("'False'", "false", output)
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		descendant_lists: dictionary of descendant tag list names to their tag names.
+		reference_points: dictionary of reference point spec names to their specs.
+		versions: dictionary of the spec file and validator revisions.
+	Returns:
+		Dictionary of the names of the static properties of the generated class to their values.
+	"""
+	logging.info('entering ...')
 
-	# Write the php file to STDOUT.
-	print output
+	PopAttrListNames(allowed_tags, reference_points)
+	rules_data = {
+		'spec_file_revision': versions['spec_file_revision'],
+		'minimum_validator_revision_required': versions['min_validator_revision_required'],
+		'descendant_tag_lists': descendant_lists,
+		'descendant_tag_sets': GetDescendantTagSets(descendant_lists),
+		'allowed_tags': allowed_tags,
+		'layout_allowed_attrs': attr_lists['$AMP_LAYOUT_ATTRS'],
+		'globally_allowed_attrs': attr_lists['$GLOBAL_ATTRS'],
+		'reference_points': reference_points,
+	}
+	rules_data['attr_value_sets'] = AddAttrValueSets(allowed_tags, attr_lists, reference_points)
+	rules_data['layout_tables'] = AddLayoutTables(allowed_tags)
+	rules_data['tag_spec_dispatch_index'] = GetTagSpecDispatchIndex(allowed_tags)
+	rules_data['spec_name_components'] = GetSpecNameComponents(allowed_tags, reference_points)
+	AddChildTagSets(allowed_tags, reference_points)
+	AddDisallowedAncestorSets(allowed_tags, reference_points)
+	AddMandatoryAttrs(allowed_tags)
+	rules_data['alternative_attr_names'] = GetAlternativeAttrNames(allowed_tags, attr_lists)
+	rules_data['css_specs'] = GetCssSpecs(allowed_tags)
+	rules_data['extension_index'] = GetExtensionIndex(allowed_tags, attr_lists, reference_points)
+	rules_data['extension_specs'] = GetExtensionSpecs(allowed_tags)
+	AddRegexPatterns(allowed_tags, attr_lists, reference_points)
+	AddAttrSpecIds(allowed_tags, attr_lists, reference_points)
 
 	logging.info('... done')
+	return rules_data
 
+
+@Profiled
 def GenerateHeaderPHP(out):
 	logging.info('entering ...')
 
@@ -141,6 +1133,7 @@ def GenerateHeaderPHP(out):
 	logging.info('... done')
 
 
+@Profiled
 def GenerateSpecVersionPHP(out, versions):
 	logging.info('entering ...')
 
@@ -151,6 +1144,7 @@ def GenerateSpecVersionPHP(out, versions):
 		out.append('\tprivate static $minimum_validator_revision_required = %d;' % versions['min_validator_revision_required'])
 	logging.info('... done')
 
+@Profiled
 def GenerateDescendantListsPHP(out, descendant_lists):
 	logging.info('entering ...')
 
@@ -159,6 +1153,31 @@ def GenerateDescendantListsPHP(out, descendant_lists):
 	logging.info('... done')
 
 
+@Profiled
+def GenerateDescendantTagSetsPHP(out, descendant_tag_sets):
+	logging.info('entering ...')
+
+	# Output the descendant tag lists again with the tag names as keys, for lookups by tag name.
+	out.append('')
+	out.append('\tprivate static $descendant_tag_sets = %s;' % Phpize( descendant_tag_sets, 1 ).lstrip() )
+	logging.info('... done')
+
+
+def GetDescendantTagSets(descendant_lists):
+	"""Gets the descendant tag lists with the tag names as keys.
+
+	Args:
+		descendant_lists: dictionary of descendant tag list names to their tag names.
+	Returns:
+		Dictionary of descendant tag list names to sets of their tag names, as dictionaries with True values.
+	"""
+	descendant_tag_sets = {}
+	for (list_name, tag_names) in descendant_lists.items():
+		descendant_tag_sets[list_name] = dict((tag_name, True) for tag_name in tag_names)
+	return descendant_tag_sets
+
+
+@Profiled
 def GenerateAllowedTagsPHP(out, allowed_tags):
 	logging.info('entering ...')
 
@@ -168,6 +1187,7 @@ def GenerateAllowedTagsPHP(out, allowed_tags):
 	logging.info('... done')
 
 
+@Profiled
 def GenerateLayoutAttributesPHP(out, attr_lists):
 	logging.info('entering ...')
 
@@ -178,6 +1198,7 @@ def GenerateLayoutAttributesPHP(out, attr_lists):
 	logging.info('... done')
 
 
+@Profiled
 def GenerateGlobalAttributesPHP(out, attr_lists):
 	logging.info('entering ...')
 
@@ -187,6 +1208,7 @@ def GenerateGlobalAttributesPHP(out, attr_lists):
 	out.append('')
 	logging.info('... done')
 
+@Profiled
 def GenerateReferencePointsPHP(out, reference_points):
 	logging.info('entering ...')
 
@@ -196,11 +1218,1559 @@ def GenerateReferencePointsPHP(out, reference_points):
 	out.append('')
 	logging.info('... done')
 
-def GenerateFooterPHP(out):
+@Profiled
+def GenerateShardIndexPHP(out, shards):
 	logging.info('entering ...')
 
-	# Output the footer.
-	out.append('''
+	# Output the index of which shard file each tag and reference point is in, to be loaded on demand.
+	out.append('')
+	out.append('\tprivate static $allowed_tags = array();')
+	out.append('')
+	out.append('\tprivate static $allowed_tag_shards = %s;' % Phpize( shards['tags'], 1 ).lstrip() )
+	out.append('')
+	out.append('\tprivate static $reference_points = array();')
+	out.append('')
+	out.append('\tprivate static $reference_point_shards = %s;' % Phpize( shards['reference_points'], 1 ).lstrip() )
+	out.append('')
+	out.append('\tprivate static $loaded_shards = array();')
+	logging.info('... done')
+
+
+@Profiled
+def GenerateDedupeTablesPHP(out, deduped):
+	logging.info('entering ...')
+
+	# Output the attribute lists and attribute values which the rule specs reference instead of inlining.
+	out.append('')
+	out.append('\tprivate static $attr_lists = %s;' % Phpize( deduped['named_attr_lists'], 1 ).lstrip() )
+	out.append('')
+	out.append('\tprivate static $shared_attr_values = %s;' % Phpize( deduped['shared_attr_values'], 1 ).lstrip() )
+	out.append('')
+	out.append('\tprivate static $resolved_allowed_tags = array();')
+	out.append('')
+	out.append('\tprivate static $resolved_reference_points = array();')
+	out.append('')
+	logging.info('... done')
+
+
+@Profiled
+def GenerateAlternativeAttrNamesPHP(out, alternative_attr_names):
+	logging.info('entering ...')
+
+	# Output the lookup of alternative attribute names to their primary names, so that it
+	# is available without going through the specs of every tag.
+	out.append('\tprivate static $alternative_attr_names = %s;' % Phpize( alternative_attr_names, 1 ).lstrip() )
+	out.append('')
+	logging.info('... done')
+
+
+@Profiled
+def GenerateCssSpecsPHP(out, css_specs):
+	logging.info('entering ...')
+
+	# Output the allowed at-rules and declarations of each CSS context as keys, so that the style
+	# sanitizer can look them up instead of searching the lists in the style tag specs.
+	out.append('\tprivate static $css_specs = %s;' % Phpize( css_specs, 1 ).lstrip() )
+	out.append('')
+	logging.info('... done')
+
+
+def GetCssSpecs(allowed_tags):
+	"""Builds the lookups of the CSS specs of the style tags, keyed by their spec names.
+
+	The allowed at-rules and declarations are lowercased and become keys. The declarations
+	also get their variants with the CSS_VENDOR_PREFIXES. Inline style attributes are
+	checked against the declarations of style amp-custom, without any at-rules, so they
+	get a 'style attribute' context of their own.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+	Returns:
+		Dictionary of CSS contexts, like 'style amp-custom' and 'style[amp-keyframes]', to their
+		allowed_at_rules and declarations as keys and whether they validate_keyframes.
+	"""
+	css_specs = {}
+	for rule_spec in allowed_tags['style'] if 'style' in allowed_tags else []:
+		if 'spec_name' not in rule_spec['tag_spec'] or 'css_spec' not in rule_spec.get('cdata', {}):
+			continue
+		css_spec = rule_spec['cdata']['css_spec']
+
+		declarations = {}
+		for declaration in list(css_spec.get('declaration', [])) + list(css_spec.get('allowed_declarations', [])):
+			declaration = declaration.lower()
+
+			# The sanitizer strips the vendor prefix from a property name before looking it up, so a
+			# declaration with a vendor prefix never matches anything.
+			if re.match(r'-\w+-', declaration):
+				continue
+			declarations[declaration] = True
+			for prefix in CSS_VENDOR_PREFIXES:
+				declarations[prefix + declaration] = True
+
+		css_specs[rule_spec['tag_spec']['spec_name']] = {
+			'allowed_at_rules': dict((at_rule.lower(), True) for at_rule in css_spec.get('allowed_at_rules', [])),
+			'declarations': declarations,
+			'validate_keyframes': css_spec.get('validate_keyframes', False),
+		}
+
+	if 'style amp-custom' in css_specs:
+		css_specs['style attribute'] = {
+			'allowed_at_rules': {},
+			'declarations': css_specs['style amp-custom']['declarations'],
+			'validate_keyframes': False,
+		}
+	return css_specs
+
+
+@Profiled
+def GenerateExtensionIndexPHP(out, extension_index, extension_specs):
+	logging.info('entering ...')
+
+	# Output the extensions which tags and attributes require, and the extension specs keyed by
+	# name, so that neither has to be found by going through the specs of every tag.
+	out.append('\tprivate static $extension_index = %s;' % Phpize( extension_index, 1 ).lstrip() )
+	out.append('')
+	out.append('\tprivate static $extension_specs = %s;' % Phpize( extension_specs, 1 ).lstrip() )
+	out.append('')
+	logging.info('... done')
+
+
+def GetExtensionIndex(allowed_tags, attr_lists, reference_points):
+	"""Builds the inverted index of tag and attribute names to the extensions which they require.
+
+	A tag requires the requires_extension of its specs, and the extension named by the first
+	word of their also_requires_tag_warning. It is only indexed when all of its specs require
+	the same extensions, since otherwise which ones are required depends on the spec which the
+	element matches. Likewise an attribute is only indexed when it requires the same extensions
+	in every attribute spec list that has it.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	Returns:
+		Dictionary with the tags and attributes, each a dictionary of names to their sorted extensions.
+	"""
+	def GetUniformExtensions(extension_sets):
+		indexed = {}
+		for (name, extensions) in extension_sets.items():
+			extensions = set(extensions)
+			if 1 == len(extensions) and extensions != set([()]):
+				indexed[name] = list(extensions.pop())
+		return indexed
+
+	tag_extensions = {}
+	attr_extensions = {}
+	attr_spec_lists = [attr_lists['$GLOBAL_ATTRS'], attr_lists['$AMP_LAYOUT_ATTRS']]
+	attr_spec_lists.extend(rule_spec['attr_spec_list'] for rule_spec in reference_points.values())
+	for (tag_name, rule_specs) in allowed_tags.items():
+		for rule_spec in rule_specs:
+			tag_extensions.setdefault(tag_name, []).append(tuple(sorted(GetRequiredExtensions(rule_spec['tag_spec']))))
+			attr_spec_lists.append(rule_spec['attr_spec_list'])
+
+	for attr_spec_list in attr_spec_lists:
+		for (attr_name, attr_spec) in attr_spec_list.items():
+			attr_extensions.setdefault(attr_name, []).append(tuple(sorted(attr_spec.get('requires_extension', []))))
+
+	return {
+		'tags': GetUniformExtensions(tag_extensions),
+		'attributes': GetUniformExtensions(attr_extensions),
+	}
+
+
+def GetRequiredExtensions(tag_spec):
+	"""Gets the extensions which a tag spec requires.
+
+	These are its requires_extension, and the extension named by the first word of its also_requires_tag_warning.
+
+	Args:
+		tag_spec: tag spec.
+	Returns:
+		Set of extension names.
+	"""
+	extensions = set(tag_spec.get('requires_extension', []))
+	if tag_spec.get('also_requires_tag_warning'):
+		extensions.add(tag_spec['also_requires_tag_warning'][0].split(' ')[0])
+	return extensions
+
+
+def GetExtensionSpecs(allowed_tags):
+	"""Gets the extension specs of the script tags, keyed by extension name.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+	Returns:
+		Dictionary of extension names to their extension specs, with their versions and requires_usage.
+	"""
+	extension_specs = {}
+	for rule_spec in allowed_tags['script'] if 'script' in allowed_tags else []:
+		if 'extension_spec' in rule_spec['tag_spec']:
+			extension_spec = rule_spec['tag_spec']['extension_spec']
+			extension_specs[extension_spec['name']] = extension_spec
+	return extension_specs
+
+
+def GetExtensionSpecReferences(allowed_tags):
+	"""Gets the allowed tags with only the name left in the extension spec of each script tag spec.
+
+	The class has the extension specs in $extension_specs, so the script tag specs only refer to them
+	by name instead of having copies of them. The rule specs are copied rather than changed in place.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+	Returns:
+		Dictionary of tag names to their rule specs, with the extension specs reduced to their names.
+	"""
+	if 'script' not in allowed_tags:
+		return allowed_tags
+
+	script_rule_specs = []
+	for rule_spec in allowed_tags['script']:
+		if 'extension_spec' in rule_spec['tag_spec']:
+			rule_spec = dict(rule_spec)
+			rule_spec['tag_spec'] = dict(rule_spec['tag_spec'])
+			rule_spec['tag_spec']['extension_spec'] = {'name': rule_spec['tag_spec']['extension_spec']['name']}
+		script_rule_specs.append(rule_spec)
+	allowed_tags = dict(allowed_tags)
+	allowed_tags['script'] = script_rule_specs
+	return allowed_tags
+
+
+def GetAlternativeAttrNames(allowed_tags, attr_lists):
+	"""Builds the lookup of alternative attribute names to their primary names.
+
+	Later tags take precedence, and the global and layout attributes over them, as when
+	the sanitizer used to build this lookup itself.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+	Returns:
+		Dictionary of alternative attribute names to attribute names.
+	"""
+	attr_spec_lists = [rule_spec['attr_spec_list'] for tag_name in sorted(allowed_tags) for rule_spec in allowed_tags[tag_name]]
+	attr_spec_lists.extend((attr_lists['$GLOBAL_ATTRS'], attr_lists['$AMP_LAYOUT_ATTRS']))
+
+	alternative_attr_names = {}
+	for attr_spec_list in attr_spec_lists:
+		for attr_name in sorted(attr_spec_list):
+			if 'alternative_names' in attr_spec_list[attr_name]:
+				for alternative_name in attr_spec_list[attr_name]['alternative_names']:
+					alternative_attr_names[alternative_name] = attr_name
+	return alternative_attr_names
+
+
+@Profiled
+def PopAttrListNames(allowed_tags, reference_points):
+	"""Removes the names of the attribute lists which CollectRules() keeps on the rule specs.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	Returns:
+		Dictionary with the lists of the attribute list names of the rule specs of each tag under
+		allowed_tags, and of each reference point under reference_points. They are empty once removed.
+	"""
+	return {
+		'allowed_tags': dict((tag_name, [rule_spec.pop('attr_lists', []) for rule_spec in rule_specs]) for (tag_name, rule_specs) in allowed_tags.items()),
+		'reference_points': dict((spec_name, rule_spec.pop('attr_lists', [])) for (spec_name, rule_spec) in reference_points.items()),
+	}
+
+
+def GetDedupedRules(allowed_tags, attr_lists, reference_points, attr_list_names):
+	"""Rewrites the rule specs to reference shared parts instead of inlining copies of them.
+
+	The attributes of the named attribute lists which the spec adds to a rule spec are removed from
+	it, with the list names added to the rule spec's attr_lists instead. A list is left inlined when
+	the rule spec no longer has all of its attributes, as after PruneRules(). Then every
+	value_properties or value_url which appears in more than one attribute spec is moved into a
+	shared table, and the attribute specs get its ID in its place. The input is not modified.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		reference_points: dictionary of reference point spec names to their specs.
+		attr_list_names: dictionary of the attribute list names of the rule specs, from PopAttrListNames().
+	Returns:
+		Dictionary with the rewritten allowed_tags, reference_points and attr_lists (the global and
+		layout lists), the referenced named_attr_lists and the shared_attr_values table.
+	"""
+	logging.info('entering ...')
+
+	named_attr_lists = {}
+
+	def DedupeRuleSpec(rule_spec, names):
+		# The lists are merged in the order of the spec, so a later list still overrides the attributes of an earlier one.
+		referenced_lists = [
+			name for name in names
+			if attr_lists[name] and all(attr_name in rule_spec['attr_spec_list'] and rule_spec['attr_spec_list'][attr_name] == attr_spec for (attr_name, attr_spec) in attr_lists[name].items())
+		]
+		attr_spec_list = dict(rule_spec['attr_spec_list'])
+		for name in referenced_lists:
+			for attr_name in attr_lists[name]:
+				attr_spec_list.pop(attr_name, None)
+			named_attr_lists[name] = attr_lists[name]
+		deduped_rule_spec = dict(rule_spec)
+		deduped_rule_spec['attr_spec_list'] = attr_spec_list
+		if referenced_lists:
+			deduped_rule_spec['attr_lists'] = referenced_lists
+		return deduped_rule_spec
+
+	deduped = {
+		'allowed_tags': dict(
+			(tag_name, [DedupeRuleSpec(rule_spec, names) for (rule_spec, names) in zip(rule_specs, attr_list_names['allowed_tags'][tag_name])])
+			for (tag_name, rule_specs) in allowed_tags.items()
+		),
+		'reference_points': dict((name, DedupeRuleSpec(rule_spec, attr_list_names['reference_points'][name])) for (name, rule_spec) in reference_points.items()),
+		'attr_lists': dict((name, attr_lists[name]) for name in ('$GLOBAL_ATTRS', '$AMP_LAYOUT_ATTRS') if name in attr_lists),
+	}
+	deduped['named_attr_lists'] = named_attr_lists
+
+	# Every attribute spec list which remains in the output.
+	attr_spec_lists = []
+	for tag_name in sorted(deduped['allowed_tags']):
+		for rule_spec in deduped['allowed_tags'][tag_name]:
+			attr_spec_lists.append(rule_spec['attr_spec_list'])
+	for name in sorted(deduped['reference_points']):
+		attr_spec_lists.append(deduped['reference_points'][name]['attr_spec_list'])
+	for name in sorted(deduped['attr_lists']):
+		attr_spec_lists.append(deduped['attr_lists'][name])
+	for name in sorted(named_attr_lists):
+		attr_spec_lists.append(named_attr_lists[name])
+
+	counts = defaultdict(int)
+	values = {}
+	for attr_spec_list in attr_spec_lists:
+		for attr_spec in attr_spec_list.values():
+			for key in SHARED_ATTR_VALUE_KEYS:
+				if key in attr_spec:
+					value_key = json.dumps(attr_spec[key], sort_keys=True)
+					counts[value_key] += 1
+					values[value_key] = attr_spec[key]
+	shared_keys = sorted(value_key for value_key in counts if counts[value_key] > 1)
+	shared_ids = dict((value_key, shared_id) for (shared_id, value_key) in enumerate(shared_keys))
+	deduped['shared_attr_values'] = [values[value_key] for value_key in shared_keys]
+
+	def ShareAttrValues(attr_spec_list):
+		for attr_name in attr_spec_list:
+			attr_spec = attr_spec_list[attr_name]
+			for key in SHARED_ATTR_VALUE_KEYS:
+				if key in attr_spec and json.dumps(attr_spec[key], sort_keys=True) in shared_ids:
+					attr_spec = dict(attr_spec)
+					attr_spec[key] = shared_ids[json.dumps(attr_spec[key], sort_keys=True)]
+			attr_spec_list[attr_name] = attr_spec
+		return attr_spec_list
+
+	for tag_name in deduped['allowed_tags']:
+		for rule_spec in deduped['allowed_tags'][tag_name]:
+			ShareAttrValues(rule_spec['attr_spec_list'])
+	for name in deduped['reference_points']:
+		ShareAttrValues(deduped['reference_points'][name]['attr_spec_list'])
+	for attr_list_group in (deduped['attr_lists'], named_attr_lists):
+		for name in attr_list_group:
+			attr_list_group[name] = ShareAttrValues(dict(attr_list_group[name]))
+
+	logging.info('... done')
+	return deduped
+
+
+def PrintDedupeReport(allowed_tags, attr_lists, reference_points, deduped):
+	"""Prints to stderr how many bytes of PHP the deduplicated output saves.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs, as inlined.
+		attr_lists: dictionary of attribute list names to their attribute specs, as inlined.
+		reference_points: dictionary of reference point spec names to their specs, as inlined.
+		deduped: the dictionary returned by GetDedupedRules().
+	"""
+	inlined_size = sum(len(Phpize(data, 1)) for data in (
+		allowed_tags,
+		reference_points,
+		attr_lists.get('$GLOBAL_ATTRS', {}),
+		attr_lists.get('$AMP_LAYOUT_ATTRS', {}),
+	))
+	deduped_size = sum(len(Phpize(data, 1)) for data in (
+		deduped['allowed_tags'],
+		deduped['reference_points'],
+		deduped['attr_lists'].get('$GLOBAL_ATTRS', {}),
+		deduped['attr_lists'].get('$AMP_LAYOUT_ATTRS', {}),
+		deduped['named_attr_lists'],
+		deduped['shared_attr_values'],
+	))
+	attr_list_references = 0
+	for rule_specs in deduped['allowed_tags'].values() + [[rule_spec] for rule_spec in deduped['reference_points'].values()]:
+		for rule_spec in rule_specs:
+			attr_list_references += len(rule_spec.get('attr_lists', []))
+
+	print >> sys.stderr, 'Dedupe: %d references to %d attribute lists, %d shared attribute values.' % (
+		attr_list_references, len(deduped['named_attr_lists']), len(deduped['shared_attr_values'])
+	)
+	print >> sys.stderr, 'Dedupe: %d bytes of rules instead of %d, saving %d bytes (%.1f%%).' % (
+		deduped_size, inlined_size, inlined_size - deduped_size, 100.0 * (inlined_size - deduped_size) / max(1, inlined_size)
+	)
+
+
+@Profiled
+def GenerateAttrValueSetsPHP(out, attr_value_sets):
+	logging.info('entering ...')
+
+	# Output the sets of allowed attribute values referenced by the attribute specs.
+	out.append('\tprivate static $attr_value_sets = %s;' % Phpize( attr_value_sets, 1 ).lstrip() )
+	out.append('')
+	logging.info('... done')
+
+
+def AddAttrValueSets(allowed_tags, attr_lists, reference_points):
+	"""Adds lookup sets of the allowed values to the attribute specs which have a value list.
+
+	An attribute spec with a value list gets a value_set key, and one with a value_casei
+	list gets a value_casei_set key, with the ID of a set which has the (lowercased)
+	values as keys. Identical sets share an ID.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	Returns:
+		List of the value sets, indexed by ID.
+	"""
+	logging.info('entering ...')
+
+	attr_value_sets = []
+	attr_value_set_ids = {}
+	def AddAttrValueSet(attr_spec, key, values):
+		value_set = dict((value, True) for value in values)
+		value_set_key = tuple(sorted(value_set))
+		if value_set_key not in attr_value_set_ids:
+			attr_value_set_ids[value_set_key] = len(attr_value_sets)
+			attr_value_sets.append(value_set)
+		attr_spec['%s_set' % key] = attr_value_set_ids[value_set_key]
+
+	attr_spec_lists = []
+	for tag_name in sorted(allowed_tags):
+		for rule_spec in allowed_tags[tag_name]:
+			attr_spec_lists.append(rule_spec['attr_spec_list'])
+	for reference_point_name in sorted(reference_points):
+		attr_spec_lists.append(reference_points[reference_point_name]['attr_spec_list'])
+	for attr_list_name in sorted(attr_lists):
+		attr_spec_lists.append(attr_lists[attr_list_name])
+
+	for attr_spec_list in attr_spec_lists:
+		for attr_name in sorted(attr_spec_list):
+			attr_spec = attr_spec_list[attr_name]
+			if 'value' in attr_spec:
+				AddAttrValueSet(attr_spec, 'value', attr_spec['value'])
+			if 'value_casei' in attr_spec:
+				# Lowercase ASCII only, like strtolower() in PHP.
+				AddAttrValueSet(attr_spec, 'value_casei', [re.sub('[A-Z]+', lambda match: match.group(0).lower(), value) for value in attr_spec['value_casei']])
+
+	logging.info('... done')
+	return attr_value_sets
+
+
+@Profiled
+def GenerateLayoutTablesPHP(out, layout_tables):
+	logging.info('entering ...')
+
+	# Output the tables of which layouts the amp_layout tag specs allow with each class of width and height.
+	out.append('\tprivate static $layout_tables = %s;' % Phpize( layout_tables, 1 ).lstrip() )
+	out.append('')
+	logging.info('... done')
+
+
+def IsLayoutAllowed(layout, width_class, height_class):
+	"""Whether an element can have a layout attribute with a width and height of the given classes, as the AMP validator checks them.
+
+	A width or height which is not a valid length counts as missing for the layouts which need
+	it, since nothing else checks its value. 'fluid' is only a valid length with the fluid layout.
+
+	Args:
+		layout: name of the layout.
+		width_class: class of the width, from LAYOUT_DIMENSION_CLASSES.
+		height_class: class of the height, from LAYOUT_DIMENSION_CLASSES.
+	Returns:
+		Whether the layout is allowed.
+	"""
+	lengths = ('px', 'unit')
+	if 'fixed-height' == layout:
+		return height_class in lengths and width_class in ('none', 'auto')
+	if layout in ('fixed', 'responsive', 'intrinsic'):
+		if height_class not in lengths or width_class not in lengths:
+			return False
+		# Responsive and intrinsic layouts keep the aspect ratio of the width and height, so their units must match.
+		return 'fixed' == layout or ('px' == width_class) == ('px' == height_class)
+	return True
+
+
+def GetLayoutTable(supported_layouts):
+	"""Compiles the layout table of the supported layouts of an amp_layout spec.
+
+	Args:
+		supported_layouts: list of the AMP_Rule_Spec::$layout_enum values of the supported layouts.
+	Returns:
+		List of bitmasks, indexed by the class of the width times len(LAYOUT_DIMENSION_CLASSES) plus
+		the class of the height, with the bit 1 << layout set for each layout which is allowed then.
+	"""
+	layout_table = []
+	for width_class in LAYOUT_DIMENSION_CLASSES:
+		for height_class in LAYOUT_DIMENSION_CLASSES:
+			layouts = 0
+			for layout in sorted(set(supported_layouts)):
+				if layout in LAYOUT_ENUM and IsLayoutAllowed(LAYOUT_ENUM[layout], width_class, height_class):
+					layouts |= 1 << layout
+			layout_table.append(layouts)
+	return layout_table
+
+
+def AddLayoutTables(allowed_tags):
+	"""Adds the IDs of their layout tables to the tag specs which have supported layouts.
+
+	The sanitizer checks the layout attribute of an element by looking up the classes of its
+	width and height in the layout table of its tag spec, see GetLayoutTable(), instead of
+	matching it against the supported layouts and then checking the width and height for
+	that layout. The tag specs with the same supported layouts share a table.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+	Returns:
+		List of the layout tables, indexed by ID.
+	"""
+	logging.info('entering ...')
+
+	layout_tables = []
+	layout_table_ids = {}
+	for tag_name in sorted(allowed_tags):
+		for rule_spec in allowed_tags[tag_name]:
+			supported_layouts = rule_spec['tag_spec'].get('amp_layout', {}).get('supported_layouts')
+			if not supported_layouts:
+				continue
+			layout_table = tuple(GetLayoutTable(supported_layouts))
+			if layout_table not in layout_table_ids:
+				layout_table_ids[layout_table] = len(layout_tables)
+				layout_tables.append(list(layout_table))
+			rule_spec['tag_spec']['layout_table'] = layout_table_ids[layout_table]
+
+	logging.info('... done')
+	return layout_tables
+
+
+@Profiled
+def GenerateTagSpecDispatchIndexPHP(out, tag_spec_dispatch_index):
+	logging.info('entering ...')
+
+	# Output the index of which rule specs a node can match, for tags with several rule specs.
+	out.append('\tprivate static $tag_spec_dispatch_index = %s;' % Phpize( tag_spec_dispatch_index, 1 ).lstrip() )
+	out.append('')
+	logging.info('... done')
+
+
+def GetTagSpecDispatchIndex(allowed_tags):
+	"""Builds an index of which rule specs a node can match, for each tag with several rule specs.
+
+	As in the AMP validator, the dispatch keys of a tag map an attribute name
+	(NAME_DISPATCH), or an attribute name and value joined by '=' (NAME_VALUE_DISPATCH
+	and NAME_VALUE_PARENT_DISPATCH), to the indexes of the rule specs which have that
+	dispatch key. Extension scripts are dispatched by their custom-element or
+	custom-template attribute. Values from value_casei lists are lowercased.
+
+	The candidates which lack a mandatory attribute are then skipped by way of the
+	mandatory_attrs of their tag specs, see AddMandatoryAttrs().
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+	Returns:
+		Dictionary of tag names to their 'dispatch_keys'.
+	"""
+	logging.info('entering ...')
+
+	tag_spec_dispatch_index = {}
+	for tag_name in allowed_tags:
+		if len(allowed_tags[tag_name]) < 2:
+			continue
+
+		dispatch_keys = defaultdict(list)
+		for (spec_index, rule_spec) in enumerate(allowed_tags[tag_name]):
+			keys = []
+			if 'extension_spec' in rule_spec['tag_spec']:
+				extension_name = rule_spec['tag_spec']['extension_spec']['name']
+				keys.append('%s=%s' % ('custom-template' if 'amp-mustache' == extension_name else 'custom-element', extension_name))
+
+			for attr_name in sorted(rule_spec['attr_spec_list']):
+				attr_spec = rule_spec['attr_spec_list'][attr_name]
+				if 'dispatch_key' in attr_spec:
+					if 1 == attr_spec['dispatch_key']:
+						keys.append(attr_name)
+					else:
+						for value in attr_spec['value'] if 'value' in attr_spec else []:
+							keys.append('%s=%s' % (attr_name, value))
+						for value in attr_spec['value_casei'] if 'value_casei' in attr_spec else []:
+							keys.append('%s=%s' % (attr_name, re.sub('[A-Z]+', lambda match: match.group(0).lower(), value)))
+
+			for key in keys:
+				if spec_index not in dispatch_keys[key]:
+					dispatch_keys[key].append(spec_index)
+
+		tag_spec_dispatch_index[tag_name] = {
+			'dispatch_keys': dict(dispatch_keys),
+		}
+
+	logging.info('... done')
+	return tag_spec_dispatch_index
+
+
+@Profiled
+def GenerateSpecNameComponentsPHP(out, spec_name_components):
+	logging.info('entering ...')
+
+	# Output the tag names and attributes of the spec names which tags must or must not be placed in.
+	out.append('\tprivate static $spec_name_components = %s;' % Phpize( spec_name_components, 1 ).lstrip() )
+	out.append('')
+	logging.info('... done')
+
+
+def ParseSpecName(spec_name):
+	"""Splits a spec name like 'form [method=post]' into its tag name and attributes.
+
+	Attributes without a value, as in 'div [submit-error]', are True.
+
+	Args:
+		spec_name: spec name of a parent or ancestor.
+	Returns:
+		Dictionary with the 'tag_name' and the 'attributes'.
+	"""
+	attributes = {}
+	match = SPEC_NAME_PATTERN.match(spec_name)
+	if match:
+		tag_name = match.group('tag_name')
+		if match.group('raw_attrs'):
+			for raw_attr_pair in match.group('raw_attrs').strip('[]').split(']['):
+				raw_attr_pair = raw_attr_pair.split('=')
+				attributes[raw_attr_pair[0]] = raw_attr_pair[1] if len(raw_attr_pair) > 1 else True
+	else:
+		tag_name = spec_name.split(' ')[0]
+	return {'tag_name': tag_name, 'attributes': attributes}
+
+
+def GetSpecNameComponents(allowed_tags, reference_points):
+	"""Parses the spec names of the mandatory parents and the mandatory and disallowed ancestors.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	Returns:
+		Dictionary of spec names to their parsed tag name and attributes.
+	"""
+	logging.info('entering ...')
+
+	spec_name_components = {}
+	rule_specs = [rule_spec for rule_specs in allowed_tags.values() for rule_spec in rule_specs] + reference_points.values()
+	for rule_spec in rule_specs:
+		tag_spec = rule_spec['tag_spec'] if 'tag_spec' in rule_spec else {}
+		spec_names = list(tag_spec['disallowed_ancestor'] if 'disallowed_ancestor' in tag_spec else [])
+		for key in ('mandatory_parent', 'mandatory_ancestor'):
+			if key in tag_spec:
+				spec_names.append(tag_spec[key])
+		for spec_name in spec_names:
+			spec_name_components[spec_name] = ParseSpecName(spec_name)
+
+	logging.info('... done')
+	return spec_name_components
+
+
+def AddChildTagSets(allowed_tags, reference_points):
+	"""Adds the child tag name lists of the tag specs again as sets, for lookups by tag name.
+
+	The first_child_tag_name_oneof and child_tag_name_oneof lists of a child_tags spec
+	get first_child_tag_name_set and child_tag_name_set counterparts with the tag names as keys.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	"""
+	logging.info('entering ...')
+
+	rule_specs = [rule_spec for rule_specs in allowed_tags.values() for rule_spec in rule_specs] + reference_points.values()
+	for rule_spec in rule_specs:
+		tag_spec = rule_spec['tag_spec'] if 'tag_spec' in rule_spec else {}
+		if 'child_tags' not in tag_spec:
+			continue
+		for key in ('first_child_tag_name_oneof', 'child_tag_name_oneof'):
+			if key in tag_spec['child_tags']:
+				tag_spec['child_tags'][key.replace('_oneof', '_set')] = dict((tag_name, True) for tag_name in tag_spec['child_tags'][key])
+
+	logging.info('... done')
+
+
+def AddDisallowedAncestorSets(allowed_tags, reference_points):
+	"""Adds the disallowed ancestors of the tag specs again as sets, for one lookup among the ancestor tag names.
+
+	The disallowed_ancestor_set of a tag spec has the tag name of each disallowed ancestor as
+	a key and its spec name as the value, for the attributes of the spec name to be checked.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	"""
+	logging.info('entering ...')
+
+	rule_specs = [rule_spec for rule_specs in allowed_tags.values() for rule_spec in rule_specs] + reference_points.values()
+	for rule_spec in rule_specs:
+		tag_spec = rule_spec['tag_spec'] if 'tag_spec' in rule_spec else {}
+		if 'disallowed_ancestor' in tag_spec:
+			tag_spec['disallowed_ancestor_set'] = dict((ParseSpecName(spec_name)['tag_name'], spec_name) for spec_name in tag_spec['disallowed_ancestor'])
+
+	logging.info('... done')
+
+
+def AddMandatoryAttrs(allowed_tags):
+	"""Adds the mandatory attributes of each rule spec to its tag spec, so that they need not be searched for.
+
+	Each item of the mandatory_attrs of a tag spec lists a mandatory attribute name followed by
+	its alternative names, of which an element needs to have one. The custom-element, or
+	custom-template, attribute of an extension script is mandatory as well, as in
+	AMP_Tag_And_Attribute_Sanitizer::get_rule_spec_list_to_validate(). Tag specs without
+	mandatory attributes do not get the key.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+	"""
+	logging.info('entering ...')
+
+	for rule_specs in allowed_tags.values():
+		for rule_spec in rule_specs:
+			mandatory_attrs = []
+			if 'extension_spec' in rule_spec['tag_spec']:
+				extension_name = rule_spec['tag_spec']['extension_spec']['name']
+				mandatory_attrs.append(['custom-template' if 'amp-mustache' == extension_name else 'custom-element'])
+
+			for attr_name in sorted(rule_spec['attr_spec_list']):
+				attr_spec = rule_spec['attr_spec_list'][attr_name]
+				if 'mandatory' in attr_spec and attr_spec['mandatory'] is True:
+					# The name of the amp attribute in its emoji form is escaped in the spec.
+					if attr_name.startswith('\\u'):
+						attr_name = unichr(int(attr_name[2:], 16))
+					mandatory_attrs.append([attr_name] + list(attr_spec['alternative_names'] if 'alternative_names' in attr_spec else []))
+
+			if mandatory_attrs:
+				rule_spec['tag_spec']['mandatory_attrs'] = mandatory_attrs
+			elif 'mandatory_attrs' in rule_spec['tag_spec']:
+				del rule_spec['tag_spec']['mandatory_attrs']
+
+	logging.info('... done')
+
+
+def GetRegexes(allowed_tags, attr_lists, reference_points):
+	"""Gets every regex of the rules.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	Returns:
+		List of tuples of the dictionary with the regex, its key in it, whether it must match the whole
+		value, whether it is case-insensitive, and where it is in the spec, for reports.
+	"""
+	rule_specs = [(tag_name, rule_spec) for tag_name in sorted(allowed_tags) for rule_spec in allowed_tags[tag_name]]
+	rule_specs.extend((spec_name, reference_points[spec_name]) for spec_name in sorted(reference_points))
+	attr_spec_lists = [(name, attr_lists[name]) for name in ('$GLOBAL_ATTRS', '$AMP_LAYOUT_ATTRS')]
+
+	regexes = []
+	for (name, rule_spec) in rule_specs:
+		name = rule_spec['tag_spec'].get('spec_name', name)
+		attr_spec_lists.append((name, rule_spec['attr_spec_list']))
+
+		cdata = rule_spec.get('cdata') or {}
+		if 'cdata_regex' in cdata:
+			regexes.append((cdata, 'cdata_regex', True, False, '%s cdata_regex' % name))
+		if 'blacklisted_cdata_regex' in cdata:
+			regexes.append((cdata['blacklisted_cdata_regex'], 'regex', False, False, '%s blacklisted_cdata_regex' % name))
+
+	for (name, attr_spec_list) in attr_spec_lists:
+		for attr_name in sorted(attr_spec_list):
+			attr_spec = attr_spec_list[attr_name]
+			for (key, options) in ATTR_SPEC_REGEX_KEYS.items():
+				if key in attr_spec:
+					regexes.append((attr_spec, key, options['anchored'], options['casei'], '%s [%s] %s' % (name, attr_name, key)))
+	return regexes
+
+
+def JsRegexToPcre(pattern, anchored=False, casei=False):
+	"""Translates a JavaScript regex of the spec to a delimited PCRE pattern, ready to pass to preg_match().
+
+	The / delimiters in it are escaped, \\uXXXX escapes become \\x{XXXX}, and the [^] and [] classes,
+	which PCRE does not have, become [\\s\\S] and (?!). The u modifier matches UTF-8 by code point, and
+	D makes $ only match at the very end, as in JavaScript.
+
+	Args:
+		pattern: JavaScript regex source.
+		anchored: whether the regex must match the whole value.
+		casei: whether the regex is case-insensitive.
+	Returns:
+		Delimited PCRE pattern, with its modifiers.
+	"""
+	out = []
+	in_class = False
+	i = 0
+	while i < len(pattern):
+		char = pattern[i]
+		if '\\' == char:
+			if re.match(r'u[0-9a-fA-F]{4}', pattern[i + 1:i + 6]):
+				out.append('\\x{%s}' % pattern[i + 2:i + 6])
+				i += 6
+			else:
+				out.append(pattern[i:i + 2])
+				i += 2
+			continue
+		if in_class:
+			in_class = ']' != char
+		elif pattern.startswith('[^]', i):
+			out.append('[\\s\\S]')
+			i += 3
+			continue
+		elif pattern.startswith('[]', i):
+			out.append('(?!)')
+			i += 2
+			continue
+		elif '[' == char:
+			in_class = True
+			if pattern.startswith('[^', i):
+				out.append('[^')
+				i += 2
+				continue
+		out.append('\\/' if '/' == char else char)
+		i += 1
+
+	pattern = ''.join(out)
+	if anchored:
+		pattern = '^(?:%s)$' % pattern
+	return '/%s/%s' % (pattern, 'uiD' if casei else 'uD')
+
+
+def CompilePcre(pcre_pattern):
+	"""Compiles a pattern from JsRegexToPcre() with Python's re module, whose regexes backtrack like PCRE's.
+
+	Args:
+		pcre_pattern: delimited PCRE pattern.
+	Returns:
+		Compiled regex.
+	Raises:
+		re.error: if the pattern does not compile.
+	"""
+	(pattern, modifiers) = pcre_pattern[1:].rsplit('/', 1)
+	pattern = re.sub(r'\\x\{([0-9a-fA-F]{4})\}', lambda match: re.escape(unichr(int(match.group(1), 16))), pattern)
+	if 'D' in modifiers:
+		pattern = re.sub(r'((?:^|[^\\])(?:\\\\)*)\$', r'\1\\Z', pattern)
+	return re.compile(pattern, re.UNICODE | (re.IGNORECASE if 'i' in modifiers else 0))
+
+
+@Profiled
+def AddRegexPatterns(allowed_tags, attr_lists, reference_points):
+	"""Adds the PCRE pattern of each regex of the rules next to it, under its key suffixed with _pcre.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	"""
+	logging.info('entering ...')
+
+	for (container, key, anchored, casei, location) in GetRegexes(allowed_tags, attr_lists, reference_points):
+		container[key + '_pcre'] = JsRegexToPcre(container[key], anchored, casei)
+
+	logging.info('... done')
+
+
+@Profiled
+def AddAttrSpecIds(allowed_tags, attr_lists, reference_points):
+	"""Adds an attr_spec_id key to the attribute specs which have a check the sanitizer memoizes.
+
+	The ID is derived from the spec's own keys, so it is the same in every revision of the spec
+	where the spec is, and identical specs share it. The sanitizer keys the results of the checks
+	by it, along with the attribute name and values. The value set IDs are left out, as they are
+	assigned anew for each revision.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		reference_points: dictionary of reference point spec names to their specs.
+	"""
+	logging.info('entering ...')
+
+	attr_spec_lists = [rule_spec['attr_spec_list'] for rule_specs in allowed_tags.values() for rule_spec in rule_specs]
+	attr_spec_lists += [reference_point['attr_spec_list'] for reference_point in reference_points.values()]
+	attr_spec_lists += attr_lists.values()
+
+	specs_by_id = {}
+	for attr_spec_list in attr_spec_lists:
+		for attr_name in attr_spec_list:
+			attr_spec = attr_spec_list[attr_name]
+			if not any(key in attr_spec for key in MEMOIZED_ATTR_SPEC_KEYS):
+				continue
+			spec_json = json.dumps(dict((key, value) for (key, value) in attr_spec.items() if key not in ('value_set', 'value_casei_set', 'attr_spec_id')), sort_keys=True)
+			attr_spec_id = hashlib.sha1(spec_json).hexdigest()[:8]
+			if specs_by_id.setdefault(attr_spec_id, spec_json) != spec_json:
+				# The sanitizer would share the results of the two specs.
+				Die('Error: Two attribute specs have the same ID %s:\n%s\n%s' % (attr_spec_id, specs_by_id[attr_spec_id], spec_json))
+			attr_spec['attr_spec_id'] = attr_spec_id
+	PROFILER.Count('attr spec ids', len(specs_by_id))
+
+	logging.info('... done')
+
+
+def GetPhpRegexErrors(pcre_patterns):
+	"""Compiles PCRE patterns with PHP's preg_match(), when PHP is installed.
+
+	Args:
+		pcre_patterns: list of delimited PCRE patterns.
+	Returns:
+		Dictionary of the patterns which do not compile to their errors, or None if PHP is not installed.
+	"""
+	php = find_executable('php')
+	if not php:
+		return None
+	script = (
+		'$errors = array();'
+		'foreach ( json_decode( stream_get_contents( STDIN ) ) as $pattern ) {'
+		'	if ( false === @preg_match( $pattern, "" ) ) {'
+		'		$error = error_get_last();'
+		'		$errors[ $pattern ] = $error ? $error["message"] : "preg_match() failed";'
+		'	}'
+		'}'
+		'echo json_encode( (object) $errors );'
+	)
+	process = subprocess.Popen([php, '-r', script], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+	output = process.communicate(json.dumps(pcre_patterns))[0]
+	if process.returncode:
+		Die('Error: PHP failed to compile the regexes of the spec.')
+	return json.loads(output)
+
+
+def GetRegexAttackTemplates(pattern):
+	"""Gets templates of strings which make a regex backtrack as much as it can, to find catastrophic backtracking.
+
+	For each repeat of the regex, there are templates which match what comes before it, pump its
+	repeated item and then fail, with and without a rendering of the rest of the regex in between.
+	A regex which can match the pumped items in many ways then tries them all before failing.
+
+	Args:
+		pattern: regex, as compiled by Python's re module.
+	Returns:
+		List of tuples of the unicode strings before the pumped item, of the item, and after it. The
+		attack string of a size is the string before it, the item repeated that many times and the string after it.
+	"""
+	repeat_ops = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+	category_regexes = dict(
+		(category, re.compile(regex, re.UNICODE)) for (category, regex) in (
+			(sre_constants.CATEGORY_DIGIT, r'\d'),
+			(sre_constants.CATEGORY_NOT_DIGIT, r'\D'),
+			(sre_constants.CATEGORY_SPACE, r'\s'),
+			(sre_constants.CATEGORY_NOT_SPACE, r'\S'),
+			(sre_constants.CATEGORY_WORD, r'\w'),
+			(sre_constants.CATEGORY_NOT_WORD, r'\W'),
+		)
+	)
+
+	# Marks where the pumped item goes in the rendered string. A noncharacter, which no regex of the spec has.
+	pump_marker = u'\ufffe'
+
+	def GetChildren(op, value):
+		if op in repeat_ops:
+			return [value[2]]
+		if sre_constants.SUBPATTERN == op:
+			return [value[-1]]
+		if sre_constants.BRANCH == op:
+			return value[1]
+		return []
+
+	def GetRepeats(items):
+		repeats = []
+		for (op, value) in items:
+			if op in repeat_ops and value[1] > 1:
+				repeats.append(value)
+			for children in GetChildren(op, value):
+				repeats.extend(GetRepeats(children))
+		return repeats
+
+	def Contains(items, target):
+		if id(items) not in contained_repeats:
+			contained_repeats[id(items)] = set(id(value) for value in GetRepeats(items))
+		return id(target) in contained_repeats[id(items)]
+
+	def IsInClass(char, class_items):
+		matches = False
+		for (op, value) in class_items:
+			if sre_constants.LITERAL == op:
+				matches = matches or ord(char) == value
+			elif sre_constants.RANGE == op:
+				matches = matches or value[0] <= ord(char) <= value[1]
+			elif sre_constants.CATEGORY == op and value in category_regexes:
+				matches = matches or bool(category_regexes[value].match(char))
+		if class_items and sre_constants.NEGATE == class_items[0][0]:
+			return not matches
+		return matches
+
+	def RenderChar(op, value):
+		if sre_constants.LITERAL == op:
+			return unichr(value)
+		if sre_constants.NOT_LITERAL == op:
+			return u'b' if ord(u'a') == value else u'a'
+		if sre_constants.ANY == op:
+			return u'a'
+		if sre_constants.IN == op:
+			return next((char for char in REGEX_FUZZ_CHARACTERS if IsInClass(char, value)), u'')
+		return u''
+
+	def Render(items, target=None, stop=False):
+		"""Renders a minimal match of the items, with the pump marker after the target repeat. Returns it, and whether it stopped there."""
+		if target is None and id(items) in minimal_matches:
+			return (minimal_matches[id(items)], False)
+		out = []
+		for (op, value) in items:
+			if op in repeat_ops:
+				(minimum, children) = (value[0], value[2])
+				if value is target:
+					out.append(Render(children)[0] * minimum + pump_marker)
+					if stop:
+						return (u''.join(out), True)
+				elif Contains(children, target):
+					(rendered, stopped) = Render(children, target, stop)
+					out.append(rendered)
+					if stopped:
+						return (u''.join(out), True)
+					out.append(Render(children)[0] * max(minimum - 1, 0))
+				else:
+					out.append(Render(children)[0] * minimum)
+			elif sre_constants.SUBPATTERN == op or sre_constants.BRANCH == op:
+				branches = GetChildren(op, value)
+				(rendered, stopped) = Render(next((children for children in branches if Contains(children, target)), branches[0]), target, stop)
+				out.append(rendered)
+				if stopped:
+					return (u''.join(out), True)
+			else:
+				out.append(RenderChar(op, value))
+		if target is None:
+			minimal_matches[id(items)] = u''.join(out)
+		return (u''.join(out), False)
+
+	items = list(sre_parse.parse(pattern, re.UNICODE))
+	contained_repeats = {}
+	minimal_matches = {}
+	templates = []
+	for repeat in GetRepeats(items):
+		item = Render(repeat[2])[0]
+		for stop in (True, False):
+			(before, after) = Render(items, repeat, stop)[0].split(pump_marker)
+			templates.extend((before, item, after + suffix) for suffix in REGEX_FUZZ_SUFFIXES)
+	return templates
+
+
+def FuzzRegexes(pcre_patterns, budget, queue):
+	"""Times each regex on its attack strings, in a child process of CheckRegexes().
+
+	Puts a tuple of the index of each regex, the longest time a match took so far, in seconds, and
+	whether it is done on the queue after each size. It stops pumping a regex as soon as a match takes
+	longer than the budget.
+
+	Args:
+		pcre_patterns: list of tuples of the index and delimited PCRE pattern of the regexes to fuzz.
+		budget: time in seconds which a match may take.
+		queue: multiprocessing.Queue to put the results on.
+	"""
+	for (index, pcre_pattern) in pcre_patterns:
+		regex = CompilePcre(pcre_pattern)
+		templates = GetRegexAttackTemplates(regex.pattern)
+		longest = 0
+		for size in REGEX_FUZZ_SIZES:
+			for (before, item, after) in templates:
+				attack_string = before + item * size + after
+				start = time.time()
+				regex.search(attack_string)
+				longest = max(longest, time.time() - start)
+			if longest > budget:
+				break
+			queue.put((index, longest, False))
+		queue.put((index, longest, True))
+
+
+@Profiled
+def CheckRegexes(allowed_tags, attr_lists, reference_points, budget=0.1, strict=False):
+	"""Checks that the regexes of the rules compile as PCRE, and screens them for catastrophic backtracking.
+
+	The patterns are compiled with PHP's preg_match() when PHP is installed, and with Python's re
+	module otherwise. Each one is then matched against attack strings from GetRegexAttackTemplates()
+	of increasing sizes, and flagged when a match takes longer than the budget, on the grounds that
+	user content could stall a PHP worker the same way. Python's backtracking engine stands in for
+	PCRE there. A pattern whose attack strings of a size take over 20 times the budget is stopped and flagged.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		reference_points: dictionary of reference point spec names to their specs.
+		budget: time in seconds which a match may take, or 0 to not screen for catastrophic backtracking.
+		strict: whether to fail the build when a regex is flagged, instead of warning.
+	Returns:
+		List of the locations of the flagged regexes.
+	"""
+	logging.info('entering ...')
+
+	regexes = [(JsRegexToPcre(container[key], anchored, casei), location) for (container, key, anchored, casei, location) in GetRegexes(allowed_tags, attr_lists, reference_points)]
+
+	errors = GetPhpRegexErrors(sorted(set(pcre_pattern for (pcre_pattern, location) in regexes)))
+	if errors is None:
+		errors = {}
+		for (pcre_pattern, location) in regexes:
+			try:
+				CompilePcre(pcre_pattern)
+			except re.error as error:
+				errors[pcre_pattern] = str(error)
+	if errors:
+		Die('Error: Regexes of the spec do not compile:\n' + '\n'.join('%s: %s (%s)' % (location, pcre_pattern, errors[pcre_pattern]) for (pcre_pattern, location) in regexes if pcre_pattern in errors))
+
+	flagged = []
+	if budget:
+		pcre_patterns = sorted(set(pcre_pattern for (pcre_pattern, location) in regexes))
+		timings = {}
+		while len(timings) < len(pcre_patterns):
+			queue = multiprocessing.Queue()
+			pending = [(index, pcre_pattern) for (index, pcre_pattern) in enumerate(pcre_patterns) if index not in timings]
+			process = multiprocessing.Process(target=FuzzRegexes, args=(pending, budget, queue))
+			process.daemon = True
+			process.start()
+			try:
+				while len(timings) < len(pcre_patterns):
+					(index, longest, done) = queue.get(timeout=budget * 20)
+					if done:
+						timings[index] = longest
+			except Queue.Empty:
+				# The first pending pattern without a result is still being matched.
+				process.terminate()
+				timings[next(index for (index, pcre_pattern) in pending if index not in timings)] = None
+			process.join()
+
+		for (pcre_pattern, location) in regexes:
+			longest = timings[pcre_patterns.index(pcre_pattern)]
+			if longest is None or longest > budget:
+				flagged.append(location)
+				print >> sys.stderr, 'Warning: Regex may backtrack catastrophically, %s: %s (%s)' % (
+					location,
+					pcre_pattern,
+					'matching did not finish in %.2fs' % (budget * 20) if longest is None else 'a match took %.2fs' % longest
+				)
+		PROFILER.Count('regexes flagged', len(flagged))
+		if flagged and strict:
+			Die('Error: %d regexes of the spec may backtrack catastrophically.' % len(flagged))
+
+	logging.info('... done')
+	return flagged
+
+
+def LoadSpecProfile(path, allowed_tags, attr_lists):
+	"""Loads a spec profile, which lists the AMP components that a site uses, for PruneRules().
+
+	The profile is a JSON object with the names of the extensions to keep under "extensions", and
+	optionally the names of the built-in amp-* elements to keep, such as amp-img, under "tags".
+	Without "tags", all of the built-in amp-* elements are kept.
+
+	Args:
+		path: path to the JSON file.
+		allowed_tags: dictionary of tag names to their rule specs, to check the names in the profile against.
+		attr_lists: dictionary of attribute list names to their attribute specs, to check the extensions in the profile against.
+	Returns:
+		Dictionary with the set of extensions, and the set of tags or None.
+	"""
+	try:
+		profile = json.load(open(path))
+	except (IOError, ValueError) as error:
+		Die('Error: The spec profile could not be read: %s' % error)
+	if not isinstance(profile, dict) or not isinstance(profile.get('extensions'), list) or not isinstance(profile.get('tags', []), list):
+		Die('Error: The spec profile must be a JSON object with a list of "extensions", and optionally of "tags": %s' % path)
+
+	known_extensions = set()
+	attr_spec_lists = list(attr_lists.values())
+	for (tag_name, rule_specs) in allowed_tags.items():
+		for rule_spec in rule_specs:
+			known_extensions.update(GetRuleSpecExtensions(tag_name, rule_spec))
+			attr_spec_lists.append(rule_spec['attr_spec_list'])
+	for attr_spec_list in attr_spec_lists:
+		for attr_spec in attr_spec_list.values():
+			known_extensions.update(attr_spec.get('requires_extension', []))
+	unknown_extensions = set(profile['extensions']) - known_extensions
+	unknown_tags = set(profile.get('tags', [])) - set(allowed_tags)
+	if unknown_extensions or unknown_tags:
+		Die('Error: The spec profile names extensions or tags which are not in the spec: %s' % ', '.join(sorted(unknown_extensions | unknown_tags)))
+
+	return {
+		'extensions': set(profile['extensions']),
+		'tags': set(profile['tags']) if 'tags' in profile else None,
+	}
+
+
+def GetRuleSpecExtensions(tag_name, rule_spec):
+	"""Gets the extensions which a rule spec belongs to, for pruning it and reporting its size.
+
+	These are the extensions it requires, or the one it loads in the case of an extension script.
+
+	Args:
+		tag_name: name of the tag.
+		rule_spec: rule spec.
+	Returns:
+		Set of extension names, empty for the rule specs of the core spec.
+	"""
+	tag_spec = rule_spec['tag_spec']
+	extensions = GetRequiredExtensions(tag_spec)
+	if 'extension_spec' in tag_spec:
+		extensions.add(tag_spec['extension_spec']['name'])
+	return extensions
+
+
+@Profiled
+def PruneRules(allowed_tags, attr_lists, descendant_lists, reference_points, spec_profile):
+	"""Removes the rules of the AMP components which are not in a spec profile, in place.
+
+	A rule spec is removed when it belongs to an extension which is not in the profile, and so is
+	an attribute spec which requires one. When the profile lists tags, the rule specs of the
+	built-in amp-* elements which it does not list are removed as well. Tags left without rule
+	specs are removed from the descendant tag lists, and the reference points and descendant tag
+	lists which the remaining tag specs no longer use are removed, so that every reference which
+	is left resolves. Since the sanitizer only allows the tags and attributes which have specs,
+	the pruned ones are then removed from the content like any other invalid markup.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		descendant_lists: dictionary of descendant tag list names to their tag names.
+		reference_points: dictionary of reference point spec names to their specs.
+		spec_profile: profile from LoadSpecProfile().
+	"""
+	logging.info('entering ...')
+
+	extensions = spec_profile['extensions']
+	tags = spec_profile['tags']
+
+	def IsKept(tag_name, rule_spec):
+		rule_spec_extensions = GetRuleSpecExtensions(tag_name, rule_spec)
+		if not rule_spec_extensions <= extensions:
+			return False
+		return tags is None or bool(rule_spec_extensions) or not tag_name.startswith('amp-') or tag_name in tags
+
+	def PruneAttrSpecList(attr_spec_list):
+		for attr_name in list(attr_spec_list):
+			if not set(attr_spec_list[attr_name].get('requires_extension', [])) <= extensions:
+				del attr_spec_list[attr_name]
+
+	for tag_name in list(allowed_tags):
+		allowed_tags[tag_name] = [rule_spec for rule_spec in allowed_tags[tag_name] if IsKept(tag_name, rule_spec)]
+		if not allowed_tags[tag_name]:
+			del allowed_tags[tag_name]
+			PROFILER.Count('tags pruned')
+
+	used_reference_points = set()
+	used_descendant_lists = set()
+	for rule_spec in itertools.chain.from_iterable(allowed_tags.values()):
+		used_reference_points.update(rule_spec['tag_spec'].get('reference_points', {}))
+		if 'descendant_tag_list' in rule_spec['tag_spec']:
+			used_descendant_lists.add(rule_spec['tag_spec']['descendant_tag_list'])
+		PruneAttrSpecList(rule_spec['attr_spec_list'])
+	for spec_name in list(reference_points):
+		if spec_name in used_reference_points:
+			PruneAttrSpecList(reference_points[spec_name]['attr_spec_list'])
+		else:
+			del reference_points[spec_name]
+	for list_name in list(descendant_lists):
+		if list_name in used_descendant_lists:
+			descendant_lists[list_name] = [tag_name for tag_name in descendant_lists[list_name] if tag_name in allowed_tags]
+		else:
+			del descendant_lists[list_name]
+	for attr_spec_list in attr_lists.values():
+		PruneAttrSpecList(attr_spec_list)
+
+	logging.info('... done')
+
+
+def LoadSpecHits(path):
+	"""Loads the spec hits which AMP_Tag_And_Attribute_Sanitizer records, for OrderRulesBySpecHits().
+
+	The sanitizer adds the hits of each document it sanitizes to the JSON file which its spec_hits_file
+	arg names. The hits of the tag specs are under "tag_specs", by spec name, or by tag name for the
+	tag specs without one.
+
+	Args:
+		path: path to the JSON file.
+	Returns:
+		Dictionary of the spec names to their numbers of hits.
+	"""
+	try:
+		spec_hits = json.load(open(path))
+	except (IOError, ValueError) as error:
+		Die('Error: The spec hits could not be read: %s' % error)
+	if not isinstance(spec_hits, dict) or not isinstance(spec_hits.get('tag_specs'), dict):
+		Die('Error: The spec hits must be a JSON object with the hits of the "tag_specs", as written by the sanitizer: %s' % path)
+
+	return dict((spec_name, counts.get('hits', 0)) for (spec_name, counts) in spec_hits['tag_specs'].items() if isinstance(counts, dict))
+
+
+@Profiled
+def OrderRulesBySpecHits(allowed_tags, spec_hits):
+	"""Orders the rule specs of each tag by their hits, the most hit first, in place.
+
+	The sanitizer checks the tag specs of a tag in this order, and when several of them match a node
+	equally well, it prefers the first, so the spec which is most likely to match in real traffic is
+	put first. The rule specs with the same number of hits, such as those which were never hit, keep
+	their order in the spec.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		spec_hits: dictionary of spec names to their numbers of hits, from LoadSpecHits().
+	"""
+	logging.info('entering ...')
+
+	for (tag_name, rule_specs) in allowed_tags.items():
+		if len(rule_specs) < 2:
+			continue
+		ordered = sorted(rule_specs, key=lambda rule_spec: -spec_hits.get(rule_spec['tag_spec'].get('spec_name', tag_name), 0))
+		if ordered != rule_specs:
+			allowed_tags[tag_name] = ordered
+			PROFILER.Count('tags reordered')
+
+	logging.info('... done')
+
+
+def GetExtensionSizes(allowed_tags, attr_lists, descendant_lists, reference_points):
+	"""Measures how many bytes of PHP and array entries of the rules each extension contributes.
+
+	A rule spec counts toward the extensions it belongs to (see GetRuleSpecExtensions()), except for
+	its attribute specs which require other extensions, which count toward those. A reference point
+	or descendant tag list counts toward the extensions of the tag specs using it when they all
+	belong to the same ones. The rest counts toward the core spec.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		attr_lists: dictionary of attribute list names to their attribute specs.
+		descendant_lists: dictionary of descendant tag list names to their tag names.
+		reference_points: dictionary of reference point spec names to their specs.
+	Returns:
+		Dictionary of the extensions, joined with ' + ' when a spec belongs to several and '' for
+		the core spec, to dictionaries with their bytes and entries.
+	"""
+	sizes = defaultdict(lambda: {'bytes': 0, 'entries': 0})
+
+	def CountEntries(data):
+		if isinstance(data, dict):
+			return len(data) + sum(CountEntries(value) for value in data.values())
+		if isinstance(data, list):
+			return len(data) + sum(CountEntries(value) for value in data)
+		return 0
+
+	def Add(extensions, data):
+		size = sizes[' + '.join(sorted(extensions))]
+		size['bytes'] += len(Phpize(data, 2))
+		size['entries'] += CountEntries(data)
+
+	def AddAttrSpecList(extensions, attr_spec_list):
+		own_attr_spec_list = {}
+		for (attr_name, attr_spec) in attr_spec_list.items():
+			attr_extensions = set(attr_spec.get('requires_extension', []))
+			if attr_extensions - extensions:
+				Add(attr_extensions, {attr_name: attr_spec})
+			else:
+				own_attr_spec_list[attr_name] = attr_spec
+		return own_attr_spec_list
+
+	users = defaultdict(set)
+	for (tag_name, rule_specs) in allowed_tags.items():
+		for rule_spec in rule_specs:
+			extensions = GetRuleSpecExtensions(tag_name, rule_spec)
+			tag_spec = rule_spec['tag_spec']
+			for spec_name in tag_spec.get('reference_points', {}):
+				users[('reference_point', spec_name)].add(tuple(sorted(extensions)))
+			if 'descendant_tag_list' in tag_spec:
+				users[('descendant_tag_list', tag_spec['descendant_tag_list'])].add(tuple(sorted(extensions)))
+			own_rule_spec = dict(rule_spec)
+			own_rule_spec.pop('attr_lists', None)
+			own_rule_spec['attr_spec_list'] = AddAttrSpecList(extensions, rule_spec['attr_spec_list'])
+			Add(extensions, own_rule_spec)
+
+	def GetUserExtensions(key):
+		return set(users[key].pop()) if 1 == len(users[key]) else set()
+
+	for (spec_name, rule_spec) in reference_points.items():
+		extensions = GetUserExtensions(('reference_point', spec_name))
+		own_rule_spec = dict(rule_spec)
+		own_rule_spec.pop('attr_lists', None)
+		own_rule_spec['attr_spec_list'] = AddAttrSpecList(extensions, rule_spec['attr_spec_list'])
+		Add(extensions, {spec_name: own_rule_spec})
+	for (list_name, tag_names) in descendant_lists.items():
+		Add(GetUserExtensions(('descendant_tag_list', list_name)), {list_name: tag_names})
+	for attr_spec_list in attr_lists.values():
+		Add(set(), AddAttrSpecList(set(), attr_spec_list))
+
+	return dict(sizes)
+
+
+def PrintSizeReport(sizes, pruned_sizes=None):
+	"""Prints to stderr how many bytes of PHP and array entries of the rules each extension contributes.
+
+	Args:
+		sizes: dictionary from GetExtensionSizes() of the whole spec.
+		pruned_sizes: dictionary from GetExtensionSizes() of the rules pruned with a spec profile, or None.
+	"""
+	print >> sys.stderr, '%-40s %10s %10s%s' % ('Extension', 'Bytes', 'Entries', '       Kept bytes' if pruned_sizes is not None else '')
+	for name in sorted(sizes, key=lambda name: (-sizes[name]['bytes'], name)):
+		kept = ''
+		if pruned_sizes is not None:
+			kept = ' %16d' % pruned_sizes.get(name, {'bytes': 0})['bytes']
+		print >> sys.stderr, '%-40s %10d %10d%s' % (name or '(core)', sizes[name]['bytes'], sizes[name]['entries'], kept)
+	total = sum(size['bytes'] for size in sizes.values())
+	if pruned_sizes is None:
+		print >> sys.stderr, 'Total: %d bytes, %d entries.' % (total, sum(size['entries'] for size in sizes.values()))
+	else:
+		pruned_total = sum(size['bytes'] for size in pruned_sizes.values())
+		print >> sys.stderr, 'Total: %d bytes, %d entries; %d bytes and %d entries after pruning, saving %.1f%%.' % (
+			total,
+			sum(size['entries'] for size in sizes.values()),
+			pruned_total,
+			sum(size['entries'] for size in pruned_sizes.values()),
+			100.0 * (total - pruned_total) / max(1, total)
+		)
+
+
+@Profiled
+def GetShards(allowed_tags, reference_points, shard_by):
+	"""Splits the allowed tags and reference points into shards which are loaded on demand.
+
+	Reference points go in the shard of the first tag that references them, since
+	they are only looked up when validating the children of such a tag.
+
+	Args:
+		allowed_tags: dictionary of tag names to their rule specs.
+		reference_points: dictionary of reference point spec names to their specs.
+		shard_by: 'tag' for a shard per tag name, or 'extension' for a shard per extension
+			the tags require, with all tags not requiring an extension in the 'html' shard.
+	Returns:
+		Dictionary with the shard names by tag name ('tags'), the shard names by reference
+		point spec name ('reference_points'), and the shard contents by shard name ('shards').
+	"""
+	logging.info('entering ...')
+
+	shard_names = {}
+	def GetShardName(group):
+		# Shard names are used as file names, so they are limited to safe characters.
+		shard_name = re.sub(r'[^a-z0-9_-]', '_', group.lower())
+		while shard_names.get(shard_name, group) != group:
+			shard_name += '_'
+		shard_names[shard_name] = group
+		return shard_name
+
+	tag_shards = {}
+	reference_point_shards = {}
+	shards = defaultdict( lambda: {'allowed_tags': {}, 'reference_points': {}} )
+	for tag_name in sorted(allowed_tags):
+		if 'extension' == shard_by:
+			extensions = sorted(set(
+				extension
+				for rule_spec in allowed_tags[tag_name]
+				for extension in rule_spec['tag_spec'].get('requires_extension', [])
+			))
+			shard_name = GetShardName(extensions[0] if extensions else 'html')
+		else:
+			shard_name = GetShardName(tag_name)
+		tag_shards[tag_name] = shard_name
+		shards[shard_name]['allowed_tags'][tag_name] = allowed_tags[tag_name]
+
+		for rule_spec in allowed_tags[tag_name]:
+			for reference_point_name in sorted(rule_spec['tag_spec'].get('reference_points', {})):
+				if reference_point_name in reference_points and reference_point_name not in reference_point_shards:
+					reference_point_shards[reference_point_name] = shard_name
+					shards[shard_name]['reference_points'][reference_point_name] = reference_points[reference_point_name]
+
+	for reference_point_name in sorted(reference_points):
+		if reference_point_name not in reference_point_shards:
+			shard_name = GetShardName('$REFERENCE_POINT')
+			reference_point_shards[reference_point_name] = shard_name
+			shards[shard_name]['reference_points'][reference_point_name] = reference_points[reference_point_name]
+
+	logging.info('... done')
+	return {'tags': tag_shards, 'reference_points': reference_point_shards, 'shards': dict(shards)}
+
+
+@Profiled
+def GenerateShardPHP(shard):
+	"""Generates a shard file, which returns the allowed tags and reference points in it.
+
+	Args:
+		shard: dictionary with the 'allowed_tags' and 'reference_points' of the shard.
+	Returns:
+		The PHP file contents.
+	"""
+	out = []
+	out.append('<?php')
+	out.append('/**')
+	out.append(' * Generated by %s - do not edit.' % os.path.basename(__file__))
+	out.append(' *')
+	out.append(' * Allowed tags and reference points loaded on demand by AMP_Allowed_Tags_Generated.')
+	out.append(' *')
+	out.append(' * phpcs:ignoreFile')
+	out.append(' */')
+	out.append('return %s;' % Phpize( shard ))
+	return '\n'.join(out) + '\n'
+
+
+@Profiled
+def GenerateFooterPHP(out, shards=None, dedupe=False):
+	logging.info('entering ...')
+
+	# Output the footer.
+	if shards or dedupe:
+		# The allowed tags are loaded from their shards and/or have their shared parts resolved on demand.
+		tag_index = 'allowed_tag_shards' if shards else 'allowed_tags'
+		out.append('''
+	/**
+	 * Get allowed tags.
+	 *
+	 * This prepares every tag, so prefer get_allowed_tag() where possible.
+	 *
+	 * @since 0.5
+	 * @return array Allowed tags.
+	 */
+	public static function get_allowed_tags() {
+		$allowed_tags = array();
+		foreach ( array_keys( self::$%(tag_index)s ) as $node_name ) {
+			$allowed_tags[ $node_name ] = self::get_allowed_tag( $node_name );
+		}
+		return $allowed_tags;
+	}
+
+	/**
+	 * Get allowed tag.
+	 *
+	 * Get the rules for a single tag so that the entire data structure needn't be prepared.
+	 *
+	 * @since 0.7
+	 * @param string $node_name Tag name.
+	 * @return array|null Allowed tag, or null if the tag does not exist.
+	 */
+	public static function get_allowed_tag( $node_name ) {
+		if ( ! isset( self::$%(tag_index)s[ $node_name ] ) ) {
+			return null;
+		}%(load)s%(resolve)s
+		return self::$allowed_tags[ $node_name ];
+	}''' % {
+			'tag_index': tag_index,
+			'load': '''
+		self::load_shard( self::$allowed_tag_shards[ $node_name ] );''' if shards else '',
+			'resolve': '''
+		if ( ! isset( self::$resolved_allowed_tags[ $node_name ] ) ) {
+			self::$resolved_allowed_tags[ $node_name ] = true;
+
+			$rule_specs = array();
+			foreach ( self::$allowed_tags[ $node_name ] as $rule_spec ) {
+				$rule_specs[] = self::resolve_rule_spec( $rule_spec );
+			}
+			self::$allowed_tags[ $node_name ] = $rule_specs;
+		}''' if dedupe else '',
+		})
+	else:
+		out.append('''
 	/**
 	 * Get allowed tags.
 	 *
@@ -225,8 +2795,9 @@ def GenerateFooterPHP(out):
 			return self::$allowed_tags[ $node_name ];
 		}
 		return null;
-	}
+	}''')
 
+	out.append('''
 	/**
 	 * Get descendant tag lists.
 	 *
@@ -254,6 +2825,47 @@ def GenerateFooterPHP(out):
 	}
 
 	/**
+	 * Get allowed descendant tag set for a tag.
+	 *
+	 * Like get_descendant_tag_list(), but with the tag names as keys so that they can be looked up directly.
+	 *
+	 * @since 1.1
+	 * @param string $name Name for the descendants list.
+	 * @return array|bool Allowed tags set, or false if there are no restrictions.
+	 */
+	public static function get_descendant_tag_set( $name ) {
+		if ( isset( self::$descendant_tag_sets[ $name ] ) ) {
+			return self::$descendant_tag_sets[ $name ];
+		}
+		return false;
+	}
+''')
+
+	if shards or dedupe:
+		out.append('''	/**
+	 * Get reference point spec.
+	 *
+	 * @since 1.0
+	 * @param string $tag_spec_name Tag spec name.
+	 * @return array|null Reference point spec, or null if does not exist.
+	 */
+	public static function get_reference_point_spec( $tag_spec_name ) {
+		if ( ! isset( self::$%(reference_point_index)s[ $tag_spec_name ] ) ) {
+			return null;
+		}%(load)s%(resolve)s
+		return self::$reference_points[ $tag_spec_name ];
+	}''' % {
+			'reference_point_index': 'reference_point_shards' if shards else 'reference_points',
+			'load': '''
+		self::load_shard( self::$reference_point_shards[ $tag_spec_name ] );''' if shards else '',
+			'resolve': '''
+		if ( ! isset( self::$resolved_reference_points[ $tag_spec_name ] ) ) {
+			self::$resolved_reference_points[ $tag_spec_name ] = true;
+			self::$reference_points[ $tag_spec_name ]          = self::resolve_rule_spec( self::$reference_points[ $tag_spec_name ] );
+		}''' if dedupe else '',
+		})
+	else:
+		out.append('''	/**
 	 * Get reference point spec.
 	 *
 	 * @since 1.0
@@ -265,8 +2877,9 @@ def GenerateFooterPHP(out):
 			return self::$reference_points[ $tag_spec_name ];
 		}
 		return null;
-	}
+	}''')
 
+	out.append('''
 	/**
 	 * Get list of globally-allowed attributes.
 	 *
@@ -274,7 +2887,7 @@ def GenerateFooterPHP(out):
 	 * @return array Allowed tag.
 	 */
 	public static function get_allowed_attributes() {
-		return self::$globally_allowed_attrs;
+		return %s;
 	}
 
 	/**
@@ -284,58 +2897,243 @@ def GenerateFooterPHP(out):
 	 * @return array Allowed tag.
 	 */
 	public static function get_layout_attributes() {
-		return self::$layout_allowed_attrs;
-	}''')
+		return %s;
+	}
 
-	out.append('')
+	/**
+	 * Get the mapping of alternative attribute names to their primary names, across all tags.
+	 *
+	 * @since 1.1
+	 * @return array Primary attribute names keyed by alternative name.
+	 */
+	public static function get_alternative_attribute_names() {
+		return self::$alternative_attr_names;
+	}
 
-	out.append('}')
-	out.append('')
+	/**
+	 * Get a set of allowed attribute values.
+	 *
+	 * The value_set and value_casei_set of an attribute spec are the IDs of the sets of its value and
+	 * (lowercased) value_casei lists, which have the values as keys so that they can be looked up directly.
+	 *
+	 * @since 1.1
+	 * @param int $id Value set ID.
+	 * @return array Allowed values as keys.
+	 */
+	public static function get_attr_value_set( $id ) {
+		return self::$attr_value_sets[ $id ];
+	}
 
-	logging.info('... done')
+	/**
+	 * Get a layout table.
+	 *
+	 * The layout_table of a tag spec with supported layouts is the ID of a list of bitmasks, indexed by the
+	 * AMP_Rule_Spec::LAYOUT_DIMENSION_* class of the width times AMP_Rule_Spec::LAYOUT_DIMENSION_CLASSES plus
+	 * that of the height, with the bit 1 << layout set for each layout of AMP_Rule_Spec::$layout_enum allowed then.
+	 *
+	 * @since 1.1
+	 * @param int $id Layout table ID.
+	 * @return int[] Bitmasks of the allowed layouts.
+	 */
+	public static function get_layout_table( $id ) {
+		return self::$layout_tables[ $id ];
+	}
 
+	/**
+	 * Get the tag spec dispatch index for a tag.
+	 *
+	 * The dispatch keys map an attribute name, or an attribute name and value joined by '=', to the
+	 * indexes of the rule specs which a node with that attribute is dispatched to.
+	 *
+	 * @since 1.1
+	 * @param string $node_name Tag name.
+	 * @return array|null Dispatch keys, or null if the tag has less than two rule specs.
+	 */
+	public static function get_tag_spec_dispatch_index( $node_name ) {
+		if ( isset( self::$tag_spec_dispatch_index[ $node_name ] ) ) {
+			return self::$tag_spec_dispatch_index[ $node_name ];
+		}
+		return null;
+	}
 
-def ParseRules(out_dir):
-	logging.info('entering ...')
+	/**
+	 * Get the tag name and attributes of a mandatory parent or ancestor spec name, or of a disallowed ancestor.
+	 *
+	 * @since 1.1
+	 * @param string $spec_name Spec name, for example 'body' or 'form [method=post]'.
+	 * @return array|null Tag name and attributes, or null if no tag spec references the spec name.
+	 */
+	public static function get_spec_name_components( $spec_name ) {
+		if ( isset( self::$spec_name_components[ $spec_name ] ) ) {
+			return self::$spec_name_components[ $spec_name ];
+		}
+		return null;
+	}
 
-	# These imports happen late, within this method because they don't necessarily
-	# exist when the module starts running, and the ones that probably do
-	# are checked by CheckPrereqs.
+	/**
+	 * Get the CSS spec of a context in which styles are allowed.
+	 *
+	 * The allowed at-rules and declarations are keys, so that they can be looked up directly. The declarations
+	 * also include their -webkit-, -moz-, -ms- and -o- prefixed variants.
+	 *
+	 * @since 1.1
+	 * @param string $context CSS context: 'style amp-custom', 'style[amp-keyframes]' or 'style attribute'.
+	 * @return array|null Allowed at-rules and declarations as keys and whether keyframes are validated, or null if the context is unknown.
+	 */
+	public static function get_css_spec( $context ) {
+		if ( isset( self::$css_specs[ $context ] ) ) {
+			return self::$css_specs[ $context ];
+		}
+		return null;
+	}
 
-	from google.protobuf import text_format
-	validator_pb2 = imp.load_source('validator_pb2', os.path.join( out_dir, 'validator_pb2.py' ))
+	/**
+	 * Get the index of tag and attribute names to the extensions which they require.
+	 *
+	 * A tag or attribute is only in the index when it requires the same extensions in every spec that has it.
+	 * The others have to be looked up in the requires_extension of the spec which the element matches.
+	 *
+	 * @since 1.1
+	 * @return array Tag names and attribute names, under 'tags' and 'attributes', to their extension names.
+	 */
+	public static function get_extension_index() {
+		return self::$extension_index;
+	}
 
-	allowed_tags = {}
-	attr_lists = {}
-	descendant_lists = {}
-	reference_points = {}
-	versions = {}
+	/**
+	 * Get the extension spec of an AMP component.
+	 *
+	 * The extension_spec of a script tag spec only has the name, to look the rest of it up here.
+	 *
+	 * @since 1.1
+	 * @param string $extension_name Extension name, for example 'amp-bind'.
+	 * @return array|null Extension spec, with the name, versions and requires_usage, or null if there is no such extension.
+	 */
+	public static function get_extension_spec( $extension_name ) {
+		if ( isset( self::$extension_specs[ $extension_name ] ) ) {
+			return self::$extension_specs[ $extension_name ];
+		}
+		return null;
+	}
+
+	/**
+	 * Get the extension specs of all AMP components.
+	 *
+	 * @since 1.1
+	 * @return array Extension names to their extension specs.
+	 */
+	public static function get_extension_specs() {
+		return self::$extension_specs;
+	}''' % (
+		'self::resolve_attr_spec_list( self::$globally_allowed_attrs )' if dedupe else 'self::$globally_allowed_attrs',
+		'self::resolve_attr_spec_list( self::$layout_allowed_attrs )' if dedupe else 'self::$layout_allowed_attrs',
+	))
+
+	if shards:
+		out.append('''
+	/**
+	 * Load a shard of the allowed tags and reference points, if not already loaded.
+	 *
+	 * @since 1.1
+	 * @param string $shard Shard name.
+	 */
+	private static function load_shard( $shard ) {
+		if ( isset( self::$loaded_shards[ $shard ] ) ) {
+			return;
+		}
+		self::$loaded_shards[ $shard ] = true;
 
-	specfile='%s/validator.protoascii' % out_dir
+		$data = require dirname( __FILE__ ) . '/%s/' . $shard . '.php';
 
-	validator_pb2=validator_pb2
-	text_format=text_format
+		self::$allowed_tags     += $data['allowed_tags'];
+		self::$reference_points += $data['reference_points'];
+	}''' % shards['dir_name'])
 
-	# Merge specfile with message buffers.
-	rules = validator_pb2.ValidatorRules()
-	text_format.Merge(open(specfile).read(), rules)
+	if dedupe:
+		out.append('''
+	/**
+	 * Resolve the attribute lists and shared values referenced by a rule spec.
+	 *
+	 * @since 1.1
+	 * @param array $rule_spec Rule spec, with the names of the attribute lists it includes under attr_lists.
+	 * @return array Rule spec as if the attribute lists and shared values were inlined.
+	 */
+	private static function resolve_rule_spec( $rule_spec ) {
+		if ( isset( $rule_spec['attr_lists'] ) ) {
+			foreach ( $rule_spec['attr_lists'] as $attr_list_name ) {
+				$rule_spec['attr_spec_list'] = array_merge( $rule_spec['attr_spec_list'], self::$attr_lists[ $attr_list_name ] );
+			}
+			unset( $rule_spec['attr_lists'] );
+			ksort( $rule_spec['attr_spec_list'], SORT_STRING );
+		}
+		$rule_spec['attr_spec_list'] = self::resolve_attr_spec_list( $rule_spec['attr_spec_list'] );
+		return $rule_spec;
+	}
 
-	# Record the version of this specfile and the corresponding validator version.
-	if rules.HasField('spec_file_revision'):
-		versions['spec_file_revision'] = rules.spec_file_revision
+	/**
+	 * Resolve the shared values referenced by the attribute specs in a list.
+	 *
+	 * @since 1.1
+	 * @param array $attr_spec_list Attribute spec list, with the IDs of shared values in place of %s.
+	 * @return array Attribute spec list with the shared values inlined.
+	 */
+	private static function resolve_attr_spec_list( $attr_spec_list ) {
+		foreach ( $attr_spec_list as $attr_name => $attr_spec ) {
+			foreach ( array( %s ) as $key ) {
+				if ( isset( $attr_spec[ $key ] ) && is_int( $attr_spec[ $key ] ) ) {
+					$attr_spec_list[ $attr_name ][ $key ] = self::$shared_attr_values[ $attr_spec[ $key ] ];
+				}
+			}
+		}
+		return $attr_spec_list;
+	}''' % (
+			' and '.join(SHARED_ATTR_VALUE_KEYS),
+			', '.join("'%s'" % key for key in SHARED_ATTR_VALUE_KEYS),
+		))
+
+	out.append('')
 
-	if rules.HasField('min_validator_revision_required'):
-		versions['min_validator_revision_required'] = rules.min_validator_revision_required
+	out.append('}')
+	out.append('')
+
+	logging.info('... done')
+
+
+@Profiled
+def ParseRules(rules):
+	"""Converts a ValidatorRules message into the dictionaries the PHP is generated from.
+
+	Args:
+		rules: ValidatorRules message.
+	Returns:
+		Tuple of the allowed tags, attribute lists, descendant tag lists, reference points and versions.
+	"""
+	logging.info('entering ...')
 
-	# Build a dictionary of the named attribute lists that are used by multiple tags.
+	fields = []
 	for (field_desc, field_val) in rules.ListFields():
-		if 'attr_lists' == field_desc.name:
-			for attr_spec in field_val:
-				attr_lists[UnicodeEscape(attr_spec.name)] = GetAttrs(attr_spec.attrs)
+		if field_desc.name in ('attr_lists', 'tags', 'descendant_tag_list'):
+			fields.extend((field_desc.name, value) for value in field_val)
+		else:
+			fields.append((field_desc.name, field_val))
+	parsed_rules = CollectRules(GetRuleEntries(fields))
+
+	logging.info('... done')
+	return parsed_rules
+
 
-	# Build a dictionary of allowed tags and an associated list of their allowed
-	# attributes, values and other criteria.
+def GetRuleEntries(fields):
+	"""Converts the top-level fields of the validator rules into entries for CollectRules().
 
+	This only needs one field at a time, so the fields can be streamed from the spec.
+
+	Args:
+		fields: iterable of field names and values of a ValidatorRules message, one value per repeated field item.
+	Yields:
+		Tuples of the entry type and its data: ('version', name, revision), ('attr_list', name, attr specs),
+		('tag', tag name, rule spec, attribute list names), ('reference_point', spec name, rule spec,
+		attribute list names) and ('descendant_tag_list', name, tag names).
+	"""
 	# Don't include tags that have a mandatory parent with one of these tag names
 	# since we're only concerned with using this tag list to validate the HTML
 	# of the DOM
@@ -344,66 +3142,114 @@ def ParseRules(out_dir):
 		'!DOCTYPE',
 	]
 
-	for (field_desc, field_val) in rules.ListFields():
-		if 'tags' == field_desc.name:
-			for tag_spec in field_val:
+	for (field_name, field_val) in fields:
+		# Record the version of this specfile and the corresponding validator version.
+		if field_name in ('spec_file_revision', 'min_validator_revision_required'):
+			yield ('version', field_name, field_val)
 
-				# Ignore tags that are outside of the body
-				if tag_spec.HasField('mandatory_parent') and tag_spec.mandatory_parent in mandatory_parent_blacklist and tag_spec.tag_name != 'HTML':
-					continue
+		# Build a dictionary of the named attribute lists that are used by multiple tags.
+		elif 'attr_lists' == field_name:
+			yield ('attr_list', UnicodeEscape(field_val.name), GetAttrs(field_val.attrs))
 
-				# Ignore deprecated tags
-				if tag_spec.HasField('deprecation'):
-					continue
+		# Build a dictionary of allowed tags and an associated list of their allowed
+		# attributes, values and other criteria.
+		elif 'tags' == field_name:
+			tag_spec = field_val
 
-				# Handle the special $REFERENCE_POINT tag
-				if '$REFERENCE_POINT' == tag_spec.tag_name:
-					reference_points[ tag_spec.spec_name ] = GetTagSpec(tag_spec, attr_lists)
-					continue
+			# Ignore tags that are outside of the body
+			if tag_spec.HasField('mandatory_parent') and tag_spec.mandatory_parent in mandatory_parent_blacklist and tag_spec.tag_name != 'HTML':
+				continue
 
-				# If we made it here, then start adding the tag_spec
-				if tag_spec.tag_name.lower() not in allowed_tags:
-					tag_list = []
-				else:
-					tag_list = allowed_tags[UnicodeEscape(tag_spec.tag_name).lower()]
-				# AddTag(allowed_tags, tag_spec, attr_lists)
+			# Ignore deprecated tags
+			if tag_spec.HasField('deprecation'):
+				continue
+
+			(gotten_tag_spec, attr_list_names) = GetTagSpec(tag_spec)
+
+			# Handle the special $REFERENCE_POINT tag
+			if '$REFERENCE_POINT' == tag_spec.tag_name:
+				yield ('reference_point', tag_spec.spec_name, gotten_tag_spec, attr_list_names)
+			elif gotten_tag_spec is not None:
+				yield ('tag', UnicodeEscape(tag_spec.tag_name).lower(), gotten_tag_spec, attr_list_names)
+
+		elif 'descendant_tag_list' == field_name:
+			yield ('descendant_tag_list', field_val.name, [val.lower() for val in field_val.tag])
+
+
+@Profiled
+def CollectRules(entries):
+	"""Collects the entries from GetRuleEntries() into the dictionaries the PHP is generated from.
 
-				gotten_tag_spec = GetTagSpec(tag_spec, attr_lists)
-				if gotten_tag_spec is not None:
-					tag_list.append(gotten_tag_spec)
-					allowed_tags[UnicodeEscape(tag_spec.tag_name).lower()] = tag_list
-		elif 'descendant_tag_list' == field_desc.name:
-			for list in field_val:
-				descendant_lists[list.name] = []
-				for val in list.tag:
-					descendant_lists[list.name].append( val.lower() )
+	The attribute lists are only added to the tags at the end, since the spec may define them after the tags.
+	Their names are kept under the attr_lists key of the rule specs, for GetDedupedRules() to reference
+	them, until GetRulesData() removes them.
+
+	Args:
+		entries: iterable of entries from GetRuleEntries(), in the order of the spec.
+	Returns:
+		Tuple of the allowed tags, attribute lists, descendant tag lists, reference points and versions.
+	"""
+	logging.info('entering ...')
+
+	allowed_tags = {}
+	attr_lists = {}
+	descendant_lists = {}
+	reference_points = {}
+	versions = {}
+	attr_list_references = []
+
+	for entry in entries:
+		if 'version' == entry[0]:
+			versions[entry[1]] = entry[2]
+		elif 'attr_list' == entry[0]:
+			attr_lists[entry[1]] = entry[2]
+		elif 'reference_point' == entry[0]:
+			reference_points[entry[1]] = entry[2]
+			attr_list_references.append((entry[2], entry[3]))
+		elif 'tag' == entry[0]:
+			allowed_tags.setdefault(entry[1], []).append(entry[2])
+			attr_list_references.append((entry[2], entry[3]))
+		elif 'descendant_tag_list' == entry[0]:
+			descendant_lists[entry[1]] = entry[2]
+
+	# Now add attributes from any attribute lists to the tags.
+	for (tag_spec_dict, attr_list_names) in attr_list_references:
+		for attr_list_name in attr_list_names:
+			tag_spec_dict['attr_spec_list'].update(attr_lists[attr_list_name])
+		if attr_list_names:
+			tag_spec_dict['attr_lists'] = attr_list_names
 
 	logging.info('... done')
 	return allowed_tags, attr_lists, descendant_lists, reference_points, versions
 
 
-def GetTagSpec(tag_spec, attr_lists):
-	logging.info('entering ...')
+def GetTagSpec(tag_spec):
+	"""Converts a TagSpec message into a rule spec.
 
+	Args:
+		tag_spec: TagSpec message.
+	Returns:
+		The rule spec, or None if the tag is not for AMP, and the names of the attribute
+		lists whose attributes CollectRules() adds to its attr_spec_list.
+	"""
 	tag_dict = GetTagRules(tag_spec)
 	if tag_dict is None:
-		return None
+		return None, []
 	attr_dict = GetAttrs(tag_spec.attrs)
 
-	# Now add attributes from any attribute lists to this tag.
+	attr_list_names = []
 	for (tag_field_desc, tag_field_val) in tag_spec.ListFields():
 		if 'attr_lists' == tag_field_desc.name:
 			for attr_list in tag_field_val:
-				attr_dict.update(attr_lists[UnicodeEscape(attr_list)])
+				attr_list_names.append(UnicodeEscape(attr_list))
 
-	logging.info('... done')
 	tag_spec_dict = {'tag_spec':tag_dict, 'attr_spec_list':attr_dict}
 	if tag_spec.HasField('cdata'):
 		cdata_dict = {}
 		for (field_descriptor, field_value) in tag_spec.cdata.ListFields():
 			if isinstance(field_value, (unicode, str, bool, int)):
 				cdata_dict[ field_descriptor.name ] = field_value
-			elif isinstance( field_value, google.protobuf.pyext._message.RepeatedCompositeContainer ):
+			elif isinstance( field_value, REPEATED_COMPOSITE_CONTAINERS + (ProtoasciiRepeatedCompositeField,) ):
 				cdata_dict[ field_descriptor.name ] = {}
 				for value in field_value:
 					for (key,val) in value.ListFields():
@@ -426,12 +3272,12 @@ def GetTagSpec(tag_spec, attr_lists):
 					if not hasattr( field_value, css_spec_field_name ):
 						continue
 					css_spec_field_value = getattr( field_value, css_spec_field_name )
-					if isinstance(css_spec_field_value, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+					if isinstance(css_spec_field_value, (list, collections.Sequence) + REPEATED_SCALAR_CONTAINERS):
 						css_spec[ css_spec_field_name ] = [ val for val in css_spec_field_value ]
 					elif hasattr( css_spec_field_value, 'ListFields' ):
 						css_spec[ css_spec_field_name ] = {}
 						for (css_spec_field_item_descriptor, css_spec_field_item_value) in getattr( field_value, css_spec_field_name ).ListFields():
-							if isinstance(css_spec_field_item_value, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+							if isinstance(css_spec_field_item_value, (list, collections.Sequence) + REPEATED_SCALAR_CONTAINERS):
 								css_spec[ css_spec_field_name ][ css_spec_field_item_descriptor.name ] = [ val for val in css_spec_field_item_value ]
 							else:
 								css_spec[ css_spec_field_name ][ css_spec_field_item_descriptor.name ] = css_spec_field_item_value
@@ -442,12 +3288,10 @@ def GetTagSpec(tag_spec, attr_lists):
 		if len( cdata_dict ) > 0:
 			tag_spec_dict['cdata'] = cdata_dict
 
-	return tag_spec_dict
+	return tag_spec_dict, attr_list_names
 
 
 def GetTagRules(tag_spec):
-	logging.info('entering ...')
-
 	tag_rules = {}
 
 	if hasattr(tag_spec, 'also_requires_tag') and tag_spec.also_requires_tag:
@@ -500,7 +3344,7 @@ def GetTagRules(tag_spec):
 	if tag_spec.HasField('extension_spec'):
 		extension_spec = {}
 		for field in tag_spec.extension_spec.ListFields():
-			if isinstance(field[1], (list, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+			if isinstance(field[1], (list,) + REPEATED_SCALAR_CONTAINERS):
 				extension_spec[ field[0].name ] = []
 				for val in field[1]:
 					extension_spec[ field[0].name ].append( val )
@@ -536,11 +3380,11 @@ def GetTagRules(tag_spec):
 		tag_rules['unique_warning'] = tag_spec.unique_warning
 
 	if tag_spec.HasField('child_tags'):
-		child_tags = defaultdict( lambda: [] )
+		child_tags = defaultdict( list )
 		for field in tag_spec.child_tags.ListFields():
 			if isinstance(field[1], (int)):
 				child_tags[ field[0].name ] = field[1]
-			elif isinstance(field[1], (list, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+			elif isinstance(field[1], (list,) + REPEATED_SCALAR_CONTAINERS):
 				for val in field[1]:
 					child_tags[ field[0].name ].append( val.lower() )
 		tag_rules['child_tags'] = child_tags
@@ -557,13 +3401,10 @@ def GetTagRules(tag_spec):
 				amp_layout[ field[0].name ] = field[1]
 		tag_rules['amp_layout'] = amp_layout
 
-	logging.info('... done')
 	return tag_rules
 
 
 def GetAttrs(attrs):
-	logging.info('entering ...')
-
 	attr_dict = {}
 	for attr_spec in attrs:
 
@@ -573,13 +3414,10 @@ def GetAttrs(attrs):
 			# Add attribute name and alternative_names
 			attr_dict[UnicodeEscape(attr_spec.name)] = value_dict
 
-	logging.info('... done')
 	return attr_dict
 
 
 def GetValues(attr_spec):
-	logging.info('entering ...')
-
 	value_dict = {}
 
 	# Ignore transformed AMP for now.
@@ -640,7 +3478,7 @@ def GetValues(attr_spec):
 	if attr_spec.HasField('value_url'):
 		value_url_dict = {}
 		for (value_url_key, value_url_val) in attr_spec.value_url.ListFields():
-			if isinstance(value_url_val, (list, collections.Sequence, google.protobuf.internal.containers.RepeatedScalarFieldContainer, google.protobuf.pyext._message.RepeatedScalarContainer)):
+			if isinstance(value_url_val, (list, collections.Sequence) + REPEATED_SCALAR_CONTAINERS):
 				value_url_val_val = []
 				for val in value_url_val:
 					value_url_val_val.append(UnicodeEscape(val))
@@ -655,7 +3493,6 @@ def GetValues(attr_spec):
 			requires_extension_list.append(requires_extension)
 		value_dict['requires_extension'] = requires_extension_list
 
-	logging.info('... done')
 	return value_dict
 
 
@@ -669,51 +3506,465 @@ def UnicodeEscape(string):
 	"""
 	return ('' + string).encode('unicode-escape')
 
+@Profiled
 def Phpize(data, indent=0):
 	"""Helper function to convert JSON-serializable data into PHP literals.
 
+	The output matches what `var_export()` of the JSON-decoded data used to
+	produce after clean-up: tab indentation, `array(` without a space, keys
+	omitted for lists (and for integer keys) and `array()` for empty arrays.
+	Dictionary keys are sorted.
+
+	Args:
+		data: Any JSON-serializable.
+		indent: Number of tabs to indent every line by.
+	Returns:
+		String formatted as PHP literal.
+	"""
+	out = ['\t' * indent]
+	PhpizeValue(data, indent, out)
+	return ''.join(out)
+
+
+def PhpizeValue(data, level, out):
+	"""Appends the PHP literal for a value onto a list of string chunks.
+
 	Args:
 		data: Any JSON-serializable.
+		level: Indentation level of the line on which the value starts.
+		out: List of string chunks to append to.
+	"""
+	if isinstance(data, dict):
+		items = sorted(data.items())
+	elif isinstance(data, (list, tuple)):
+		items = [(None, value) for value in data]
+	else:
+		out.append(PhpizeScalar(data))
+		return
+
+	if len(items) == 0:
+		out.append('array()')
+		return
+
+	item_indent = '\t' * (level + 1)
+	out.append('array(\n')
+	next_index = 0
+	for (key, value) in items:
+		out.append(item_indent)
+		(key, next_index) = PhpizeKey(key, next_index)
+		if key is not None:
+			out.append(key)
+			out.append(' => ')
+		PhpizeValue(value, level + 1, out)
+		out.append(',\n')
+	out.append('\t' * level)
+	out.append(')')
+
+
+def PhpizeKey(key, next_index):
+	"""Formats an array key, or returns None when the key is omitted.
+
+	PHP turns numeric string keys into integers, and integer keys which PHP
+	would assign anyway are left out of the output like list indexes.
+
+	Args:
+		key: Dictionary key, or None for a list item.
+		next_index: Integer key PHP would assign to an item without a key.
+	Returns:
+		String formatted as PHP array key, or None, and the next index after the item.
+	"""
+	if key is None:
+		return (None, next_index + 1)
+	if isinstance(key, (int, long)) and not isinstance(key, bool):
+		key = str(key)
+	if re.match(r'^(0|-?[1-9][0-9]*)$', key):
+		if key.startswith('-'):
+			return (key, next_index)
+		if int(key) == next_index:
+			return (None, next_index + 1)
+		return (key, max(next_index, int(key) + 1))
+	return (PhpizeScalar(key), next_index)
+
+
+def PhpizeScalar(value):
+	"""Formats a scalar value as PHP literal.
+
+	Args:
+		value: String, number, boolean or None.
 	Returns:
 		String formatted as PHP literal.
 	"""
-	json_string = json.dumps(data, sort_keys=True, ensure_ascii=False)
+	if value is True or value == 'True':
+		return 'true'
+	if value is False or value == 'False':
+		return 'false'
+	if value is None:
+		return 'NULL'
+	if isinstance(value, (int, long)):
+		return str(value)
+	if isinstance(value, float):
+		return repr(value)
+	if isinstance(value, unicode):
+		value = value.encode('utf-8')
+	return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+@Profiled
+def GenerateRulesJSON(rules_data):
+	"""Generates canonical JSON of the rules, for tooling which doesn't run PHP.
+
+	Keys are sorted, there is no whitespace between tokens and non-ASCII
+	characters are escaped, so the same rules always give the same bytes.
+
+	Args:
+		rules_data: dictionary of the rules and their lookup tables, as returned by GetRulesData().
+	Returns:
+		String of JSON.
+	"""
+	logging.info('entering ...')
+
+	output = json.dumps(JsonizeValue(rules_data), sort_keys=True, separators=(',', ':')) + '\n'
+
+	logging.info('... done')
+	return output
+
+
+def JsonizeValue(data):
+	"""Helper function which converts data into what json_decode() of it should give in PHP.
+
+	Values are converted like Phpize() does, and integer keys become strings
+	so that they are sorted together with the other keys.
+
+	Args:
+		data: Any JSON-serializable.
+	Returns:
+		The converted data.
+	"""
+	if isinstance(data, dict):
+		return dict((str(key) if isinstance(key, (int, long)) else key, JsonizeValue(value)) for (key, value) in data.items())
+	if isinstance(data, (list, tuple)):
+		return [JsonizeValue(value) for value in data]
+	if data is True or data == 'True':
+		return True
+	if data is False or data == 'False':
+		return False
+	return data
+
+
+@Profiled
+def GenerateRulesSerialized(rules_data):
+	"""Generates the rules in the format of PHP's serialize(), for loading with unserialize().
+
+	Args:
+		rules_data: dictionary of the rules and their lookup tables, as returned by GetRulesData().
+	Returns:
+		String of serialized PHP.
+	"""
+	logging.info('entering ...')
+
+	out = []
+	PhpSerializeValue(rules_data, out)
+
+	logging.info('... done')
+	return ''.join(out)
+
+
+def PhpSerializeValue(data, out):
+	"""Appends the serialize() format of a value onto a list of string chunks.
+
+	Arrays have the same keys in the same order as the PHP literals of Phpize().
+
+	Args:
+		data: Any JSON-serializable.
+		out: List of string chunks to append to.
+	"""
+	if isinstance(data, dict):
+		items = sorted(data.items())
+	elif isinstance(data, (list, tuple)):
+		items = list(enumerate(data))
+	else:
+		out.append(PhpSerializeScalar(data))
+		return
+
+	out.append('a:%d:{' % len(items))
+	for (key, value) in items:
+		if isinstance(key, (int, long)) or re.match(r'^(0|-?[1-9][0-9]*)$', key):
+			out.append('i:%d;' % int(key))
+		else:
+			out.append(PhpSerializeString(key))
+		PhpSerializeValue(value, out)
+	out.append('}')
+
+
+def PhpSerializeScalar(value):
+	"""Formats a scalar value in the format of serialize().
+
+	Args:
+		value: String, number, boolean or None.
+	Returns:
+		String of serialized PHP.
+	"""
+	if value is True or value == 'True':
+		return 'b:1;'
+	if value is False or value == 'False':
+		return 'b:0;'
+	if value is None:
+		return 'N;'
+	if isinstance(value, (int, long)):
+		return 'i:%d;' % value
+	if isinstance(value, float):
+		return 'd:%r;' % value
+	return PhpSerializeString(value)
+
+
+def PhpSerializeString(value):
+	"""Formats a string in the format of serialize(), which counts the bytes of its UTF-8 encoding.
+
+	Args:
+		value: String.
+	Returns:
+		String of serialized PHP.
+	"""
+	if isinstance(value, unicode):
+		value = value.encode('utf-8')
+	return 's:%d:"%s";' % (len(value), value)
+
+def HashFile(path):
+	"""Helper function which hashes the contents of a file, which may be a spec file read from an archive.
+
+	Args:
+		path: File path.
+	Returns:
+		Hex digest of the SHA-1 hash of the file contents.
+	"""
+	return hashlib.sha1(ReadSpecFile(path)).hexdigest()
+
+
+def GetOutputCacheKey(digests, source_files, options=()):
+	"""Helper function which computes the cache key for the generated PHP.
+
+	The key covers this script as well as the validator sources, so changes
+	to the generator also invalidate the cached output.
+
+	Args:
+		digests: dictionary of source file paths to their content hashes.
+		source_files: list of source file paths, in order.
+		options: list of names of the options which change the output.
+	Returns:
+		Hex digest identifying the output.
+	"""
+	key = hashlib.sha1(HashFile(os.path.realpath(__file__)))
+	for source_file in source_files:
+		key.update('\0%s\0%s' % (os.path.basename(source_file), digests[source_file]))
+	for option in options:
+		key.update('\0--%s' % option)
+	return key.hexdigest()
+
+
+def WriteFileAtomically(path, contents):
+	"""Helper function which writes a file via a temporary file and a rename.
+
+	Args:
+		path: File path.
+		contents: String to write.
+	"""
+	directory = os.path.dirname(path)
+	if not os.path.exists(directory):
+		try:
+			os.makedirs(directory)
+		except OSError:
+			if not os.path.isdir(directory):
+				raise
+	(fd, temp_path) = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+	with os.fdopen(fd, 'wb') as f:
+		f.write(contents)
+
+	# Give the file the permissions it would get when written directly, rather than the private ones of mkstemp().
+	umask = os.umask(0)
+	os.umask(umask)
+	os.chmod(temp_path, 0666 & ~umask)
+	os.rename(temp_path, path)
+
+
+def WriteOutputs(outputs, output_files):
+	"""Helper function which writes each generated output to its file, or to STDOUT.
 
-	pipe = subprocess.Popen(['php', '-r', 'var_export( json_decode( file_get_contents( "php://stdin" ), true ) );'], stdout=subprocess.PIPE, stdin=subprocess.PIPE, stderr=subprocess.STDOUT)
-	php_stdout = pipe.communicate(input=json_string)[0]
-	php_exported = php_stdout.decode()
+	Args:
+		outputs: dictionary of output formats to their contents.
+		output_files: dictionary of output formats to the paths to write them to, or None for STDOUT.
+	"""
+	for output_format in OUTPUT_FORMATS:
+		if output_format not in outputs:
+			continue
+		if output_files.get(output_format):
+			WriteFileAtomically(output_files[output_format], outputs[output_format])
+			logging.info('Wrote %s output to %s' % (output_format, output_files[output_format]))
+		else:
+			sys.stdout.write(outputs[output_format])
+
+
+def Main( validator_directory, out_dir, cache_dir=None, jobs=1, check_jobs=False, shard_dir=None, shard_by='tag', dedupe=False, parser='protoascii', output_files=None, profile=None, verbose=False, regex_budget=0.1, strict_regexes=False, spec_profile=None, size_report=False, spec_hits=None ):
+	"""The main method, which executes all build steps and runs the tests.
+
+	Args:
+		validator_directory: directory for where the validator is located, inside the amphtml repo, or the path from
+			ReadArchiveSpecFiles() to read the spec from an archive.
+		out_dir: directory name of the output directory.
+		cache_dir: directory name of the build cache, or None to disable caching.
+		jobs: maximum number of worker processes to parse the spec with.
+		check_jobs: whether to first check that parsing serially and in parallel give the same rules.
+		shard_dir: directory next to the generated class file to write the shard files to, or None to inline all tags.
+		shard_by: whether to write a shard file per 'tag' or per 'extension'.
+		dedupe: whether to reference the named attribute lists and shared attribute values instead of inlining copies.
+		parser: 'protoascii' to read the spec with the pure-Python parser, or 'protobuf' to parse it with protoc and google.protobuf.
+		output_files: dictionary of the output formats to generate to the paths to write them to. The PHP class is always
+			generated, and written to STDOUT when it has no path.
+		profile: path to write the timings of the build stages, their counters and the peak memory to as JSON, '-' to
+			print them to STDERR, or None.
+		verbose: whether to log each build stage as it runs.
+		regex_budget: time in seconds which matching a regex against an attack string may take before it is flagged
+			as backtracking catastrophically, or 0 to not screen the regexes.
+		strict_regexes: whether to fail the build when a regex is flagged, instead of warning.
+		spec_profile: path to a spec profile listing the extensions and built-in amp-* elements to keep, see
+			LoadSpecProfile(), or None to keep the whole spec.
+		size_report: whether to print how many bytes and array entries of the rules each extension contributes.
+		spec_hits: path to the spec hits recorded by the sanitizer, to order the tag specs of each tag by, see
+			OrderRulesBySpecHits(), or None to keep the order of the spec.
+	"""
+	logging.basicConfig(format='[[%(filename)s %(funcName)s]] - %(message)s', level=logging.INFO if verbose else logging.WARNING)
 
-	# Clean up formatting.
-	# TODO: Just use PHPCBF for this.
-	php_exported = re.sub( r'^ +', lambda match: ( len(match.group(0))/2 ) * '\t', php_exported, flags=re.MULTILINE )
-	php_exported = php_exported.replace( 'array (', 'array(' )
-	php_exported = re.sub( r' => \n\s+', ' => ', php_exported, flags=re.MULTILINE )
-	php_exported = re.sub( r'^(\s+)\d+ =>\s*', r'\1', php_exported, flags=re.MULTILINE )
+	try:
+		Build(validator_directory, out_dir, cache_dir, jobs, check_jobs, shard_dir, shard_by, dedupe, parser, output_files, regex_budget, strict_regexes, spec_profile, size_report, spec_hits)
+	finally:
+		if '-' == profile:
+			PROFILER.PrintReport(sys.stderr)
+		elif profile:
+			WriteFileAtomically(os.path.realpath(profile), json.dumps(PROFILER.GetReport(), indent=2) + '\n')
 
-	# Add additional indents.
-	if indent > 0:
-		php_exported = re.sub( r'^', '\t' * indent, php_exported, flags=re.MULTILINE )
-	return php_exported
 
-def Main( validator_directory, out_dir ):
-	"""The main method, which executes all build steps and runs the tests."""
-	logging.basicConfig(format='[[%(filename)s %(funcName)s]] - %(message)s', level=logging.INFO)
+def Build(validator_directory, out_dir, cache_dir, jobs, check_jobs, shard_dir, shard_by, dedupe, parser, output_files, regex_budget, strict_regexes, spec_profile, size_report, spec_hits):
+	"""Executes all build steps, with the arguments of Main()."""
 
 	validator_directory = os.path.realpath(validator_directory)
 	out_dir = os.path.realpath(out_dir)
 
-	SetupOutDir(out_dir)
-	GenValidatorProtoascii(validator_directory, out_dir)
-	GenValidatorPb2Py(validator_directory, out_dir)
-	GenValidatorProtoascii(validator_directory,out_dir)
-	GeneratePHP(out_dir)
+	proto_file = os.path.join(validator_directory, 'validator.proto')
+	protoascii_files = GetValidatorProtoasciiFiles(validator_directory)
+
+	output_files = dict((output_format, os.path.realpath(path)) for (output_format, path) in (output_files or {}).items() if path)
+	output_files.setdefault('php', None)
+
+	digests = None
+	cached_output_files = None
+	if cache_dir:
+		cache_dir = os.path.realpath(cache_dir)
+		SetupCacheDir(cache_dir)
+		digests = dict((source_file, HashFile(source_file)) for source_file in [proto_file] + protoascii_files)
+		if not shard_dir:
+			options = ['dedupe'] if dedupe else []
+			if spec_profile:
+				options.append('spec-profile=%s' % HashFile(spec_profile))
+			if spec_hits:
+				options.append('spec-hits=%s' % HashFile(spec_hits))
+			cache_key = GetOutputCacheKey(digests, [proto_file] + protoascii_files, options)
+			cached_output_files = dict((output_format, os.path.join(cache_dir, 'output', '%s.%s' % (cache_key, OUTPUT_FORMATS[output_format]))) for output_format in output_files)
+		# The cached output was screened with its own regex budget, and only warned about the flagged regexes, so strict builds screen them again.
+		if cached_output_files and all(os.path.exists(path) for path in cached_output_files.values()) and not check_jobs and not size_report and not strict_regexes:
+			logging.info('Using cached output: %s' % ', '.join(sorted(cached_output_files.values())))
+			WriteOutputs(dict((output_format, open(path, 'rb').read()) for (output_format, path) in cached_output_files.items()), output_files)
+			return
+	else:
+		SetupOutDir(out_dir)
+
+	if 'protobuf' == parser:
+		try:
+			import google.protobuf
+		except ImportError:
+			Die( "Error: The google.protobuf Python module is not installed. Install it with `pip install --upgrade protobuf`, or leave out --parser protobuf." )
+		validator_pb2 = GenValidatorPb2Py(validator_directory, out_dir, cache_dir, digests)
+		if check_jobs:
+			serial_rules = GenValidatorRules(validator_pb2, protoascii_files, jobs=1)
+			parallel_rules = GenValidatorRules(validator_pb2, protoascii_files, jobs=max(2, jobs))
+			if serial_rules != parallel_rules:
+				Die( "Error: Parsing the spec with %d jobs gave different rules than parsing it serially." % max(2, jobs) )
+			logging.info('Serial and parallel parsing gave the same rules.')
+		rules = ParseRules(GenValidatorRules(validator_pb2, protoascii_files, cache_dir, digests, jobs))
+	else:
+		if check_jobs:
+			if ReadValidatorRules(proto_file, protoascii_files, jobs=1) != ReadValidatorRules(proto_file, protoascii_files, jobs=max(2, jobs)):
+				Die( "Error: Reading the spec with %d jobs gave different rules than reading it serially." % max(2, jobs) )
+			logging.info('Serial and parallel reading gave the same rules.')
+		rules = ReadValidatorRules(proto_file, protoascii_files, jobs, cache_dir, digests)
+	sizes = GetExtensionSizes(*rules[:4]) if size_report else None
+	if spec_profile:
+		PruneRules(*rules[:4], spec_profile=LoadSpecProfile(spec_profile, rules[0], rules[1]))
+	if size_report:
+		PrintSizeReport(sizes, GetExtensionSizes(*rules[:4]) if spec_profile else None)
+	if spec_hits:
+		OrderRulesBySpecHits(rules[0], LoadSpecHits(spec_hits))
+	CountRules(rules[0], rules[1])
+	CheckRegexes(rules[0], rules[1], rules[3], regex_budget, strict_regexes)
+	output, shard_files = GeneratePHP(rules, shard_by if shard_dir else None, os.path.basename(os.path.normpath(shard_dir)) if shard_dir else None, dedupe)
+
+	outputs = {'php': output}
+	if 'json' in output_files or 'serialized' in output_files:
+		rules_data = GetRulesData(*rules)
+		if 'json' in output_files:
+			outputs['json'] = GenerateRulesJSON(rules_data)
+		if 'serialized' in output_files:
+			outputs['serialized'] = GenerateRulesSerialized(rules_data)
+
+	for (output_format, contents) in outputs.items():
+		PROFILER.Count('bytes emitted (%s)' % output_format, len(contents))
+	for shard_file_contents in shard_files.values():
+		PROFILER.Count('bytes emitted (shards)', len(shard_file_contents))
+
+	if cached_output_files:
+		for (output_format, cached_output_file) in cached_output_files.items():
+			WriteFileAtomically(cached_output_file, outputs[output_format])
+
+	if shard_dir:
+		for shard_file in shard_files:
+			WriteFileAtomically(os.path.join(shard_dir, shard_file), shard_files[shard_file])
+
+		# Remove shards left over from a previous run.
+		for shard_file in glob.glob(os.path.join(shard_dir, '*.php')):
+			if os.path.basename(shard_file) not in shard_files:
+				os.remove(shard_file)
+		logging.info('Wrote %d shards to %s' % (len(shard_files), shard_dir))
+
+	# Write the php file to STDOUT, unless it has a path.
+	WriteOutputs(outputs, output_files)
 
 if __name__ == '__main__':
-	if len( sys.argv ) == 0:
-		Die( "Error: Must supply amphtml directory as first argument" )
-	validator_directory = os.path.join( sys.argv[1], 'validator' )
-	if not os.path.exists( validator_directory ):
-		Die( "Error: The amphtml directory does not exist: %s" % validator_directory )
-	validator_directory = os.path.realpath( validator_directory )
+	parser = argparse.ArgumentParser(description='Generate class-amp-allowed-tags-generated.php from the AMPHTML validator spec.')
+	parser.add_argument('amphtml_directory', help='Path to the amphtml repo, or to a .tar.gz, .tgz or .zip archive of it to read the spec files from without extracting it.')
+	parser.add_argument('--cache-dir', default=GetDefaultCacheDir(), help='Directory for the build cache, which must be owned by the current user and not writable by others. It is created with only the current user allowed in. Defaults to %(default)s.')
+	parser.add_argument('--no-cache', action='store_true', help='Neither read from nor write to the build cache.')
+	parser.add_argument('--jobs', '-j', type=int, default=multiprocessing.cpu_count(), help='Number of processes to parse the protoascii files with. Defaults to the number of CPUs (%(default)s).')
+	parser.add_argument('--check-jobs', action='store_true', help='Check that parsing serially and with --jobs processes give the same rules before generating.')
+	parser.add_argument('--shard-dir', help='Write the tag specs to shard files in this directory, to be loaded on demand. It must be next to the generated class file.')
+	parser.add_argument('--shard-by', choices=['tag', 'extension'], default='tag', help='Whether to write a shard per tag name or per extension with --shard-dir. Defaults to %(default)s.')
+	parser.add_argument('--parser', choices=['protoascii', 'protobuf'], default='protoascii', help='Read the spec with the pure-Python protoascii parser, or parse it with protoc and the google.protobuf module. Both give the same output. Defaults to %(default)s.')
+	parser.add_argument('--dedupe', action='store_true', help='Reference the named attribute lists and repeated attribute values instead of inlining copies, and report the bytes saved.')
+	parser.add_argument('--php-out', help='Write the PHP class to this file instead of to STDOUT.')
+	parser.add_argument('--json-out', help='Also write the rules and their lookup tables to this file as canonical JSON.')
+	parser.add_argument('--serialized-out', help='Also write the rules and their lookup tables to this file in the format of PHP\'s serialize().')
+	parser.add_argument('--profile', nargs='?', const='-', metavar='JSON_FILE', help='Report the time spent in each build stage, counts of the tags, attribute specs, regexes and bytes emitted, and the peak memory. Printed to STDERR, or written to JSON_FILE as JSON.')
+	parser.add_argument('--regex-budget', type=float, default=0.1, metavar='SECONDS', help='Flag the regexes of the spec which take longer than this to match a string built to make them backtrack. 0 skips the check. Defaults to %(default)s.')
+	parser.add_argument('--strict-regexes', action='store_true', help='Fail instead of warning when a regex of the spec is flagged by --regex-budget. Cached output is not used then, so that the regexes are screened.')
+	parser.add_argument('--spec-profile', metavar='JSON_FILE', help='Only keep the rules of the extensions and built-in amp-* elements listed in this JSON file, as {"extensions": [...], "tags": [...]}. The rest are rejected like any other invalid markup.')
+	parser.add_argument('--size-report', action='store_true', help='Report the bytes of PHP and array entries which each extension contributes to the rules, and how many are kept with --spec-profile.')
+	parser.add_argument('--spec-hits', metavar='JSON_FILE', help='Order the tag specs of each tag by their hits in this JSON file, as recorded by the spec_hits_file arg of AMP_Tag_And_Attribute_Sanitizer, the most hit first.')
+	parser.add_argument('--verbose', '-v', action='store_true', help='Log each build stage as it runs.')
+	args = parser.parse_args()
+
+	if args.amphtml_directory.endswith( ARCHIVE_EXTENSIONS ) and os.path.isfile( args.amphtml_directory ):
+		validator_directory = ReadArchiveSpecFiles( args.amphtml_directory )
+	else:
+		validator_directory = os.path.join( args.amphtml_directory, 'validator' )
+		if not os.path.exists( validator_directory ):
+			Die( "Error: The amphtml directory does not exist: %s" % validator_directory )
+		validator_directory = os.path.realpath( validator_directory )
 	out_dir = os.path.join( tempfile.gettempdir(), 'amp_wp' )
-	Main( validator_directory, out_dir )
+	Main( validator_directory, out_dir, None if args.no_cache else args.cache_dir, args.jobs, args.check_jobs, args.shard_dir, args.shard_by, args.dedupe, args.parser, {'php': args.php_out, 'json': args.json_out, 'serialized': args.serialized_out}, args.profile, args.verbose, args.regex_budget, args.strict_regexes, args.spec_profile, args.size_report, args.spec_hits )
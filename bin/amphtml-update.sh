@@ -10,6 +10,14 @@
 # $ git clone git@github.com:ampproject/amphtml.git amphtml
 # $ cd amphtml; git checkout ec5fd60; cd -
 # $ ./amphtml-update.sh amphtml/
+#
+# Or to a release archive of AMPHTML, whose spec files are read without extracting it
+#
+# $ ./amphtml-update.sh amphtml-1902191209570.tar.gz
+#
+# Any further arguments are passed to amphtml-update.py, for example to write sharded output:
+#
+# $ ./amphtml-update.sh amphtml/ --shard-dir includes/sanitizers/allowed-tags-generated
 
 set -e
 
@@ -17,14 +25,12 @@ BIN_PATH="$(dirname "$0")"
 PROJECT_PATH=$(dirname $BIN_PATH)
 AMPHTML_LOCATION="$1"
 
-if ! command -v python >/dev/null 2>&1 || ! python -c "import google.protobuf" 2>/dev/null; then
-	echo "Error: The google.protobuf Python module is not installed."
-	echo
-	echo "On Linux, you can install the required dependencies via:"
-	echo "# apt-get install python protobuf-compiler python-protobuf"
+# The spec is read with a pure-Python parser, so protoc and the google.protobuf module are only needed with --parser protobuf.
+if ! command -v python >/dev/null 2>&1; then
+	echo "Error: Python is not installed."
 	echo
-	echo "On MacOS, Python is already installed but you may install via:"
-	echo "$ pip install --upgrade protobuf"
+	echo "On Linux, you can install it via:"
+	echo "# apt-get install python"
 	exit 1
 fi
 
@@ -39,23 +45,24 @@ if [[ -z "$AMPHTML_LOCATION" ]]; then
 		exit 2
 	fi
 
-	AMPHTML_LOCATION=$( mktemp -d )
+	AMPHTML_LOCATION="$( mktemp -d )/amphtml-$AMPHTML_VERSION.tar.gz"
 
-	curl -L "https://github.com/ampproject/amphtml/archive/$AMPHTML_VERSION.tar.gz" | tar -xzf - --strip-components=1 -C "$AMPHTML_LOCATION"
+	# Only the spec files are read from the archive, so it isn't extracted.
+	curl -L -o "$AMPHTML_LOCATION" "https://github.com/ampproject/amphtml/archive/$AMPHTML_VERSION.tar.gz"
 else
 	CLEANUP=0
 	echo "Using amphtml as located in: $AMPHTML_LOCATION"
-	if [[ ! -d "$AMPHTML_LOCATION" ]]; then
-		echo "Error: Directory does not exist."
+	if [[ ! -d "$AMPHTML_LOCATION" && ! -f "$AMPHTML_LOCATION" ]]; then
+		echo "Error: Directory or archive does not exist."
 		exit 3
 	fi
 fi
 
 # Run script.
-python "$BIN_PATH/amphtml-update.py" "$AMPHTML_LOCATION" > "$PROJECT_PATH/includes/sanitizers/class-amp-allowed-tags-generated.php"
+python "$BIN_PATH/amphtml-update.py" "$AMPHTML_LOCATION" "${@:2}" > "$PROJECT_PATH/includes/sanitizers/class-amp-allowed-tags-generated.php"
 
 if [[ $CLEANUP == 1 ]]; then
-	rm -r "$AMPHTML_LOCATION"
+	rm -r "$( dirname "$AMPHTML_LOCATION" )"
 fi
 
 if [[ ! -z "$AMPHTML_VERSION" ]]; then
@@ -0,0 +1,1041 @@
+"""
+This script validates post HTML offline against the rules generated from the
+AMPHTML validator spec, the way AMP_Tag_And_Attribute_Sanitizer does. This is
+for auditing many posts, for example before a spec upgrade, without booting
+WordPress and requesting each URL.
+
+First write the rules as JSON, then validate directories of .html files and
+WordPress export (WXR) files with them:
+
+`python bin/amphtml-update.py amphtml/ --json-out /tmp/rules.json > /dev/null`
+`python bin/amphtml-validate.py /tmp/rules.json posts/ export.xml`
+
+A JSON record is written per line for each document with validation errors,
+and a summary of the errors is printed at the end. The errors have the shape
+of the plugin's validation errors for removed elements and attributes. Each
+document is taken to be post content, so it is validated as the contents of
+the body. Only the tag and attribute rules are checked; the other sanitizers,
+such as for styles, are not run.
+"""
+
+import argparse
+import collections
+import HTMLParser
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sys
+import urllib
+import urlparse
+from xml.etree import cElementTree
+
+
+# Values of AMP_Rule_Spec::PASS, FAIL and NOT_APPLICABLE.
+PASS = 1
+FAIL = 0
+NOT_APPLICABLE = -1
+
+# AMP_Rule_Spec::$layout_enum.
+LAYOUT_ENUM = {
+	1: 'nodisplay',
+	2: 'fixed',
+	3: 'fixed-height',
+	4: 'responsive',
+	5: 'container',
+	6: 'fill',
+	7: 'flex-item',
+	8: 'fluid',
+	9: 'intrinsic',
+}
+
+# AMP_Rule_Spec::LAYOUT_DIMENSION_*, the classes of the width and height of an element which index the layout tables.
+(LAYOUT_DIMENSION_NONE, LAYOUT_DIMENSION_PX, LAYOUT_DIMENSION_UNIT, LAYOUT_DIMENSION_AUTO, LAYOUT_DIMENSION_FLUID, LAYOUT_DIMENSION_INVALID) = range(6)
+LAYOUT_DIMENSION_CLASSES = 6
+
+# A valid width or height, as get_layout_dimension_class() matches it.
+LENGTH_PATTERN = re.compile(r'^\d+(?:\.\d+)?(px|em|rem|vh|vw|vmin|vmax)?\Z')
+
+# AMP_Rule_Spec::$boolean_attributes.
+BOOLEAN_ATTRIBUTES = frozenset([
+	'allowfullscreen', 'async', 'autofocus', 'autoplay', 'checked', 'compact', 'controls', 'declare', 'default',
+	'defaultchecked', 'defaultmuted', 'defaultselected', 'defer', 'disabled', 'draggable', 'enabled', 'formnovalidate',
+	'hidden', 'indeterminate', 'inert', 'ismap', 'itemscope', 'loop', 'multiple', 'muted', 'nohref', 'noresize',
+	'noshade', 'novalidate', 'nowrap', 'open', 'pauseonexit', 'readonly', 'required', 'reversed', 'scoped', 'seamless',
+	'selected', 'sortable', 'spellcheck', 'translate', 'truespeed', 'typemustmatch', 'visible',
+])
+
+# AMP_Rule_Spec::$additional_allowed_tags.
+ADDITIONAL_ALLOWED_TAGS = {
+	'amp-share-tracking': [{'attr_spec_list': {}, 'tag_spec': {}}],
+}
+
+# Elements which have no end tag.
+VOID_ELEMENTS = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'meta', 'param', 'source', 'track', 'wbr'])
+
+# Same pattern as in AMP_Tag_And_Attribute_Sanitizer::parse_tag_and_attributes_from_spec_name().
+SPEC_NAME_PATTERN = re.compile(r'^(?P<ancestors>.+? )?(?P<tag_name>[a-z0-9_-]+?)( (?P<raw_attrs>\[.+?\]))?$', re.I)
+
+# The validator of each worker process, set up by InitWorker().
+WORKER_VALIDATOR = None
+
+
+def Die(msg):
+	print >> sys.stderr, msg
+	sys.exit(1)
+
+
+class Element(object):
+	"""An element of a parsed document, with just what the validation needs of the DOM."""
+
+	def __init__(self, name, attrs=None):
+		self.name = name
+		self.attrs = attrs if attrs is not None else collections.OrderedDict()
+		self.children = []
+		self.parent = None
+
+	def AppendChild(self, child):
+		if child.parent:
+			child.parent.RemoveChild(child)
+		child.parent = self
+		self.children.append(child)
+
+	def RemoveChild(self, child):
+		self.children.remove(child)
+		child.parent = None
+
+	def GetElementChildren(self):
+		return [child for child in self.children if isinstance(child, Element)]
+
+	def GetTextContent(self):
+		return u''.join(child.data if isinstance(child, Text) else child.GetTextContent() for child in self.children)
+
+
+class Text(object):
+	"""A text node of a parsed document."""
+
+	def __init__(self, data):
+		self.data = data
+		self.parent = None
+
+
+class DocumentBuilder(HTMLParser.HTMLParser):
+	"""Parses post content into a tree of Element and Text nodes, in an html element with a head and a body.
+
+	Tag and attribute names are lowercased, and only the first of repeated attributes is kept, as in the DOM.
+	Attribute names like `[src]` for amp-bind are kept as they are.
+	"""
+
+	def __init__(self):
+		HTMLParser.HTMLParser.__init__(self)
+		self.html = Element('html')
+		self.html.AppendChild(Element('head'))
+		self.body = Element('body')
+		self.html.AppendChild(self.body)
+		self.open_elements = [self.body]
+
+	def handle_starttag(self, tag, attrs):
+		element = Element(tag)
+		for (attr_name, attr_value) in attrs:
+			if attr_name not in element.attrs:
+				element.attrs[attr_name] = attr_value if attr_value is not None else u''
+		self.open_elements[-1].AppendChild(element)
+		if tag not in VOID_ELEMENTS:
+			self.open_elements.append(element)
+
+	def handle_startendtag(self, tag, attrs):
+		self.handle_starttag(tag, attrs)
+		if tag not in VOID_ELEMENTS:
+			self.open_elements.pop()
+
+	def handle_endtag(self, tag):
+		# Close the innermost open element with the tag name, and any opened within it. Stray end tags are ignored.
+		for i in range(len(self.open_elements) - 1, 0, -1):
+			if self.open_elements[i].name == tag:
+				del self.open_elements[i:]
+				break
+
+	def handle_data(self, data):
+		parent = self.open_elements[-1]
+		if parent.children and isinstance(parent.children[-1], Text):
+			parent.children[-1].data += data
+		else:
+			parent.AppendChild(Text(data))
+
+	def handle_entityref(self, name):
+		self.handle_data(self.unescape('&%s;' % name))
+
+	def handle_charref(self, name):
+		self.handle_data(self.unescape('&#%s;' % name))
+
+
+def ParseContent(content):
+	"""Parses post content.
+
+	Args:
+		content: HTML string.
+	Returns:
+		The body element, with the content in it.
+	"""
+	if isinstance(content, str):
+		content = content.decode('utf-8', 'replace')
+	builder = DocumentBuilder()
+	builder.feed(content)
+	builder.close()
+	return builder.body
+
+
+def LoadRules(rules_file):
+	"""Loads the rules written by `amphtml-update.py --json-out`.
+
+	Args:
+		rules_file: path to the JSON file.
+	Returns:
+		Dictionary of the rules and their lookup tables.
+	"""
+	return json.load(open(rules_file))
+
+
+class Validator(object):
+	"""Validates documents with the rules, as AMP_Tag_And_Attribute_Sanitizer sanitizes them.
+
+	Invalid elements and attributes are removed from the document, as they are by the sanitizer,
+	so that the nodes validated after them see the same document as in the plugin.
+	"""
+
+	def __init__(self, rules):
+		"""
+		Args:
+			rules: dictionary of the rules and their lookup tables, as returned by LoadRules() or
+				amphtml-update.py's GetRulesData().
+		"""
+		self.rules = rules
+		self.globally_allowed_attributes = rules['globally_allowed_attrs']
+		self.layout_allowed_attributes = rules['layout_allowed_attrs']
+		self.rev_alternate_attr_name_lookup = rules['alternative_attr_names']
+		self.tag_spec_dispatch_index = rules['tag_spec_dispatch_index']
+		self.rule_spec_lists = {}
+		self.regexes = {}
+		self.errors = None
+
+	def Validate(self, content):
+		"""Validates post content.
+
+		Args:
+			content: HTML string.
+		Returns:
+			List of validation errors.
+		"""
+		self.errors = []
+
+		# Traverse the document breadth first, as the sanitizer does.
+		queue = collections.deque([ParseContent(content)])
+		while queue:
+			node = queue.popleft()
+			self.ProcessNode(node, queue)
+			if node.parent and isinstance(node, Element):
+				queue.extend(node.children)
+
+		errors = self.errors
+		self.errors = None
+		return errors
+
+	def AddError(self, node, error=None):
+		"""Records the validation error for removing a node, as AMP_Base_Sanitizer::prepare_validation_error() shapes it.
+
+		Args:
+			node: the element, or a tuple of the element and the name of its attribute.
+			error: dictionary of details of the error.
+		"""
+		error = dict(error or {})
+		if isinstance(node, Element):
+			error['node_name'] = node.name
+			if node.parent:
+				error['parent_name'] = node.parent.name
+			error.setdefault('code', 'invalid_element')
+			error.setdefault('type', 'js_error' if 'script' == node.name else 'html_element_error')
+			if 'node_attributes' not in error:
+				error['node_attributes'] = collections.OrderedDict(node.attrs)
+			if 'script' == node.name and 'src' not in node.attrs:
+				error['text'] = node.GetTextContent()
+
+			# Suppress the 'ver' param of enqueued scripts and styles.
+			for (tag_name, attr_name) in (('script', 'src'), ('link', 'href')):
+				if tag_name == node.name and 'ver=' in error['node_attributes'].get(attr_name, ''):
+					error['node_attributes'][attr_name] = re.sub(r'([?&])ver=[^&#]*', r'\1ver=__normalized__', error['node_attributes'][attr_name])
+		else:
+			(element, attr_name) = node
+			error['node_name'] = attr_name
+			error['parent_name'] = element.name
+			error.setdefault('code', 'invalid_attribute')
+			error.setdefault('type', 'js_error' if re.match(r'^on\w+', attr_name) else 'html_attribute_error')
+			if 'element_attributes' not in error:
+				error['element_attributes'] = collections.OrderedDict(element.attrs)
+		self.errors.append(error)
+
+	def GetRuleSpecList(self, tag_name):
+		if tag_name not in self.rule_spec_lists:
+			self.rule_spec_lists[tag_name] = self.rules['allowed_tags'].get(tag_name, []) + ADDITIONAL_ALLOWED_TAGS.get(tag_name, [])
+		return self.rule_spec_lists[tag_name]
+
+	def ProcessNode(self, node, queue):
+		"""Validates an element and its attributes, removing them when invalid, like process_node()."""
+		if not isinstance(node, Element):
+			return
+
+		rule_spec_list = self.GetRuleSpecList(node.name)
+		if not rule_spec_list:
+			self.ReplaceNodeWithChildren(node, queue)
+			return
+
+		rule_spec_list_to_validate = collections.OrderedDict()
+		candidate_rule_spec_ids = self.GetCandidateRuleSpecIds(node, rule_spec_list)
+		other_rule_spec_ids = [spec_id for spec_id in range(len(rule_spec_list)) if spec_id not in candidate_rule_spec_ids]
+		for rule_spec_ids in (candidate_rule_spec_ids, other_rule_spec_ids):
+			for spec_id in rule_spec_ids:
+				if self.ValidateTagSpecForNode(node, rule_spec_list[spec_id]['tag_spec']):
+					rule_spec_list_to_validate[spec_id] = self.GetRuleSpecToValidate(node, rule_spec_list[spec_id])
+			if rule_spec_list_to_validate:
+				break
+
+		if not rule_spec_list_to_validate:
+			self.RemoveNode(node)
+			return
+
+		attr_spec_list = {}
+		tag_spec = {}
+		cdata = {}
+		mandatory_attrs = []
+		if 1 == len(rule_spec_list_to_validate):
+			rule_spec = rule_spec_list_to_validate.values()[0]
+			attr_spec_list = rule_spec['attr_spec_list']
+			tag_spec = rule_spec['tag_spec']
+			cdata = rule_spec.get('cdata') or {}
+			mandatory_attrs = tag_spec.get('mandatory_attrs') or []
+		else:
+			attr_spec_scores = collections.OrderedDict()
+			for (spec_id, rule_spec) in rule_spec_list_to_validate.items():
+				score = self.ValidateAttrSpecListForNode(node, rule_spec['attr_spec_list'])
+				if score:
+					attr_spec_scores[spec_id] = score
+			if not attr_spec_scores:
+				self.RemoveNode(node)
+				return
+
+			max_score = max(attr_spec_scores.values())
+			spec_ids_sorted = [spec_id for (spec_id, score) in attr_spec_scores.items() if score == max_score]
+			if 1 == len(spec_ids_sorted):
+				rule_spec = rule_spec_list_to_validate[spec_ids_sorted[0]]
+				attr_spec_list = rule_spec['attr_spec_list']
+				tag_spec = rule_spec['tag_spec']
+				cdata = rule_spec.get('cdata') or {}
+				mandatory_attrs = tag_spec.get('mandatory_attrs') or []
+			else:
+				for spec_id in spec_ids_sorted:
+					rule_spec = rule_spec_list_to_validate[spec_id]
+					if not self.IsMissingMandatoryAttrs(rule_spec['tag_spec'].get('mandatory_attrs') or [], node):
+						attr_spec_list = MergeSpecs(attr_spec_list, rule_spec['attr_spec_list'])
+						tag_spec = MergeSpecs(tag_spec, rule_spec['tag_spec'])
+						cdata = MergeSpecs(cdata, rule_spec.get('cdata') or {})
+						mandatory_attrs += rule_spec['tag_spec'].get('mandatory_attrs') or []
+				if not attr_spec_list:
+					attr_spec_list = rule_spec_list_to_validate.values()[0]['attr_spec_list']
+					mandatory_attrs = rule_spec_list_to_validate.values()[0]['tag_spec'].get('mandatory_attrs') or []
+
+		if attr_spec_list and self.IsMissingMandatoryAttrs(mandatory_attrs, node):
+			self.RemoveNode(node)
+			return
+
+		if cdata and not self.ValidateCdataForNode(node, cdata):
+			self.RemoveNode(node)
+			return
+
+		merged_attr_spec_list = MergeSpecs(self.globally_allowed_attributes, attr_spec_list)
+		layout_table = None
+		if 'amp_layout' in tag_spec:
+			merged_attr_spec_list.update(self.layout_allowed_attributes)
+			if 'layout_table' in tag_spec:
+				layout_table = self.rules['layout_tables'][tag_spec['layout_table']]
+			elif 'supported_layouts' in tag_spec['amp_layout']:
+				layouts = [LAYOUT_ENUM[layout] for layout in tag_spec['amp_layout']['supported_layouts'] if layout in LAYOUT_ENUM]
+				merged_attr_spec_list['layout'] = MergeSpecs(merged_attr_spec_list.get('layout') or {}, {'value_regex_casei': '(' + '|'.join(layouts) + ')'})
+
+		disallowed_attributes = [attr_name for attr_name in node.attrs if not self.IsAmpAllowedAttribute(node, attr_name, merged_attr_spec_list)]
+		if layout_table is not None and 'layout' in node.attrs and 'layout' not in disallowed_attributes and not self.IsLayoutAllowed(node, layout_table):
+			disallowed_attributes.append('layout')
+		disallowed_attributes = self.SanitizeDisallowedAttributeValuesInNode(node, merged_attr_spec_list, disallowed_attributes)
+		if disallowed_attributes is None:
+			self.RemoveNode(node)
+			return
+
+		if disallowed_attributes:
+			# The attributes of the element are captured before removing any, as in the sanitizer.
+			error = {'element_attributes': collections.OrderedDict(node.attrs)}
+			for attr_name in disallowed_attributes:
+				self.AddError((node, attr_name), error)
+				del node.attrs[attr_name]
+
+	def GetCandidateRuleSpecIds(self, node, rule_spec_list):
+		"""Gets the IDs of the rule specs which the element is dispatched to, like get_candidate_rule_spec_ids()."""
+		additional_count = len(ADDITIONAL_ALLOWED_TAGS.get(node.name, []))
+		rule_spec_ids = range(len(rule_spec_list))
+		dispatch_index = self.tag_spec_dispatch_index.get(node.name)
+		if len(rule_spec_ids) < 2 or not dispatch_index:
+			return rule_spec_ids
+
+		generated_rule_spec_ids = rule_spec_ids[:len(rule_spec_ids) - additional_count]
+		additional_rule_spec_ids = rule_spec_ids[len(rule_spec_ids) - additional_count:]
+
+		dispatched_rule_spec_ids = set()
+		for (attr_name, attr_value) in node.attrs.items():
+			for dispatch_key in (attr_name, u'%s=%s' % (attr_name, attr_value), u'%s=%s' % (attr_name, attr_value.lower())):
+				dispatched_rule_spec_ids.update(dispatch_index['dispatch_keys'].get(dispatch_key, []))
+		if dispatched_rule_spec_ids:
+			generated_rule_spec_ids = sorted(dispatched_rule_spec_ids)
+
+		candidate_rule_spec_ids = []
+		for spec_id in generated_rule_spec_ids:
+			if not self.IsMissingMandatoryAttrs(rule_spec_list[spec_id]['tag_spec'].get('mandatory_attrs') or [], node):
+				candidate_rule_spec_ids.append(spec_id)
+		if not candidate_rule_spec_ids:
+			candidate_rule_spec_ids = generated_rule_spec_ids
+
+		return candidate_rule_spec_ids + additional_rule_spec_ids
+
+	def GetRuleSpecToValidate(self, node, rule_spec):
+		"""Augments a rule spec with its extension script and its parent's reference points, like get_rule_spec_list_to_validate()."""
+		attr_spec_list = dict(rule_spec['attr_spec_list'])
+
+		if 'extension_spec' in rule_spec['tag_spec']:
+			extension_spec = rule_spec['tag_spec']['extension_spec']
+			custom_attr = 'custom-template' if 'amp-mustache' == extension_spec['name'] else 'custom-element'
+			attr_spec_list[custom_attr] = {'value': [extension_spec['name']], 'mandatory': True}
+			versions = []
+			for version in extension_spec.get('allowed_versions', []) + extension_spec.get('version', []):
+				if version not in versions:
+					versions.append(version)
+			attr_spec_list['src'] = {
+				'value_regex': '^' + re.escape('https://cdn.ampproject.org/v0/%s-' % extension_spec['name']) + '(' + '|'.join(versions) + ')' + r'\.js$',
+			}
+
+		if node.parent:
+			for parent_rule_spec in self.GetRuleSpecList(node.parent.name):
+				for (reference_point_name, instance_attrs) in (parent_rule_spec['tag_spec'].get('reference_points') or {}).items():
+					reference_point = self.rules['reference_points'].get(reference_point_name) or {}
+					for (attr_name, reference_point_attr) in (reference_point.get('attr_spec_list') or {}).items():
+						reference_point_attr = MergeSpecs(reference_point_attr, instance_attrs or {})
+						reference_point_attr.pop('mandatory', None)
+						attr_spec_list[attr_name] = reference_point_attr
+
+		return MergeSpecs(rule_spec, {'attr_spec_list': attr_spec_list})
+
+	def ValidateTagSpecForNode(self, node, tag_spec):
+		"""Checks the placement of the element, like validate_tag_spec_for_node(). This can remove descendants."""
+		if tag_spec.get('mandatory_parent') and not self.HasParent(node, tag_spec['mandatory_parent']):
+			return False
+		if 'extension_spec' in tag_spec and not self.HasParent(node, 'head'):
+			return False
+		for disallowed_ancestor in tag_spec.get('disallowed_ancestor') or []:
+			if self.GetAncestorWithMatchingSpecName(node, disallowed_ancestor):
+				return False
+		if tag_spec.get('mandatory_ancestor') and not self.GetAncestorWithMatchingSpecName(node, tag_spec['mandatory_ancestor']):
+			return False
+		if tag_spec.get('descendant_tag_list'):
+			allowed_descendants = self.rules['descendant_tag_sets'].get(tag_spec['descendant_tag_list'])
+			if allowed_descendants:
+				self.RemoveDisallowedDescendants(node, allowed_descendants)
+		if tag_spec.get('child_tags') and not self.CheckValidChildren(node, tag_spec['child_tags']):
+			return False
+		return True
+
+	def ValidateAttrSpecListForNode(self, node, attr_spec_list):
+		"""Scores how well the attributes of the element match an attribute spec list, like validate_attr_spec_list_for_node().
+
+		Returns:
+			Number of matches, 0 for a mismatch or 0.5 for an implicit match.
+		"""
+		if not node.attrs:
+			for attr_spec_rule in attr_spec_list.values():
+				if 'mandatory' in attr_spec_rule:
+					return 0
+			return 0.5
+
+		attr_spec_list = dict(attr_spec_list)
+		for attr_name in node.attrs:
+			if attr_name in attr_spec_list and 'alternative_names' in attr_spec_list[attr_name]:
+				for alternative_name in attr_spec_list[attr_name]['alternative_names']:
+					attr_spec_list[alternative_name] = attr_spec_list[attr_name]
+
+		score = 0
+		mandatory_count = 0
+		for (attr_name, attr_spec_rule) in attr_spec_list.items():
+			if not attr_spec_rule and attr_name in node.attrs:
+				score += 1
+				continue
+
+			checks = []
+			if 'mandatory' in attr_spec_rule:
+				mandatory_count += 1
+				checks.append(self.CheckAttrSpecRuleMandatory)
+			if 'value' in attr_spec_rule:
+				checks.append(self.CheckAttrSpecRuleValue)
+			if 'value_regex' in attr_spec_rule:
+				checks.append(self.CheckAttrSpecRuleValueRegex)
+			if 'value_casei' in attr_spec_rule:
+				checks.append(self.CheckAttrSpecRuleValueCasei)
+			if 'value_regex_casei' in attr_spec_rule:
+				checks.append(self.CheckAttrSpecRuleValueRegexCasei)
+			if 'protocol' in (attr_spec_rule.get('value_url') or {}):
+				checks.append(self.CheckAttrSpecRuleAllowedProtocol)
+			if 'value_url' in attr_spec_rule:
+				checks.append(self.CheckAttrSpecRuleValidUrl)
+			if 'allow_relative' in (attr_spec_rule.get('value_url') or {}):
+				checks.append(self.CheckAttrSpecRuleDisallowedRelative)
+			if 'allow_empty' in (attr_spec_rule.get('value_url') or {}):
+				checks.append(self.CheckAttrSpecRuleDisallowedEmpty)
+			if 'disallowed_domain' in attr_spec_rule:
+				checks.append(self.CheckAttrSpecRuleDisallowedDomain)
+			if 'blacklisted_value_regex' in attr_spec_rule:
+				checks.append(self.CheckAttrSpecRuleBlacklistedValueRegex)
+			if 'value_properties' in attr_spec_rule and attr_name in node.attrs:
+				checks.append(self.CheckAttrSpecRuleValueProperties)
+
+			for check in checks:
+				result = check(node, attr_name, attr_spec_rule)
+				if PASS == result:
+					score += 1
+				elif FAIL == result:
+					return 0
+
+		if 0 == mandatory_count and 0 == score:
+			score = 0.5
+		return score
+
+	def SanitizeDisallowedAttributeValuesInNode(self, node, attr_spec_list, attributes_pending_removal):
+		"""Finds the attributes with invalid values, like delegated_sanitize_disallowed_attribute_values_in_node().
+
+		Returns:
+			List of the names of the attributes to remove, or None if the element should be removed.
+		"""
+		attr_spec_list = MergeSpecs(self.globally_allowed_attributes, attr_spec_list)
+		for (attr_name, attr_spec_rule) in attr_spec_list.items():
+			for alternative_name in attr_spec_rule.get('alternative_names') or []:
+				attr_spec_list[alternative_name] = attr_spec_rule
+
+		checks = (
+			('value', self.CheckAttrSpecRuleValue),
+			('value_casei', self.CheckAttrSpecRuleValueCasei),
+			('value_regex', self.CheckAttrSpecRuleValueRegex),
+			('value_regex_casei', self.CheckAttrSpecRuleValueRegexCasei),
+			('protocol', self.CheckAttrSpecRuleAllowedProtocol),
+			('value_url', self.CheckAttrSpecRuleValidUrl),
+			('allow_relative', self.CheckAttrSpecRuleDisallowedRelative),
+			('allow_empty', self.CheckAttrSpecRuleDisallowedEmpty),
+			('disallowed_domain', self.CheckAttrSpecRuleDisallowedDomain),
+			('blacklisted_value_regex', self.CheckAttrSpecRuleBlacklistedValueRegex),
+		)
+
+		attrs_to_remove = []
+		for attr_name in node.attrs:
+			if attr_name not in attr_spec_list or attr_name in attributes_pending_removal:
+				continue
+			attr_spec_rule = attr_spec_list[attr_name]
+			rule_keys = set(attr_spec_rule) | set(attr_spec_rule.get('value_url') or {})
+			if any(key in rule_keys and FAIL == check(node, attr_name, attr_spec_rule) for (key, check) in checks):
+				if attr_spec_rule.get('mandatory'):
+					return None
+				attrs_to_remove.append(attr_name)
+
+		for attr_name in attrs_to_remove:
+			if True is (attr_spec_list[attr_name].get('value_url') or {}).get('allow_empty'):
+				node.attrs[attr_name] = u''
+			else:
+				attributes_pending_removal.append(attr_name)
+		return attributes_pending_removal
+
+	def IsMissingMandatoryAttrs(self, mandatory_attrs, node):
+		"""Whether the element lacks a mandatory attribute from the mandatory_attrs of a tag spec, like is_missing_mandatory_attrs()."""
+		return not all(any(attr_name in node.attrs for attr_name in attr_names) for attr_names in mandatory_attrs)
+
+	def ValidateCdataForNode(self, node, cdata):
+		if 'blacklisted_cdata_regex' in cdata:
+			return not self.Search(cdata['blacklisted_cdata_regex']['regex'], node.GetTextContent())
+		if 'cdata_regex' in cdata:
+			# The prepared PCRE pattern of a generated spec must match the whole text, as in the AMP validator.
+			pattern = u'^(?:%s)$' % cdata['cdata_regex'] if 'cdata_regex_pcre' in cdata else cdata['cdata_regex']
+			return bool(self.Search(pattern, node.GetTextContent()))
+		return True
+
+	def Search(self, pattern, value, flags=0):
+		"""Searches a value for a regex from the spec.
+
+		Returns:
+			The match, or None if there is none or if the regex is not supported by Python,
+			just as preg_match() returns false for a regex which PCRE can't compile.
+		"""
+		key = (pattern, flags)
+		if key not in self.regexes:
+			try:
+				self.regexes[key] = re.compile(pattern, flags | re.UNICODE)
+			except re.error:
+				self.regexes[key] = None
+		if self.regexes[key] is None:
+			return None
+		return self.regexes[key].search(value)
+
+	def GetAttributeValues(self, node, attr_name, attr_spec_rule):
+		"""Gets the value of the attribute, or else of its first alternative name which the element has.
+
+		Returns:
+			The name of the attribute found and its value, or None.
+		"""
+		for name in [attr_name] + list(attr_spec_rule.get('alternative_names') or []):
+			if name in node.attrs:
+				return (name, node.attrs[name])
+		return None
+
+	def CheckAttrSpecRuleMandatory(self, node, attr_name, attr_spec_rule):
+		if not attr_spec_rule.get('mandatory'):
+			return NOT_APPLICABLE
+		return PASS if self.GetAttributeValues(node, attr_name, attr_spec_rule) else FAIL
+
+	def IsLayoutAllowed(self, node, layout_table):
+		"""Whether the layout attribute of an element is allowed with its width and height, like is_layout_allowed()."""
+		layouts = [layout for (layout, name) in LAYOUT_ENUM.items() if name == node.attrs['layout'].lower()]
+		if not layouts:
+			return False
+		key = self.GetLayoutDimensionClass(node, 'width') * LAYOUT_DIMENSION_CLASSES + self.GetLayoutDimensionClass(node, 'height')
+		return 0 != layout_table[key] & (1 << layouts[0])
+
+	def GetLayoutDimensionClass(self, node, attr_name):
+		if attr_name not in node.attrs:
+			return LAYOUT_DIMENSION_NONE
+		value = node.attrs[attr_name]
+		if 'auto' == value:
+			return LAYOUT_DIMENSION_AUTO
+		if 'fluid' == value:
+			return LAYOUT_DIMENSION_FLUID
+		match = LENGTH_PATTERN.match(value)
+		if match:
+			return LAYOUT_DIMENSION_PX if match.group(1) in (None, 'px') else LAYOUT_DIMENSION_UNIT
+		return LAYOUT_DIMENSION_INVALID
+
+	def GetAttrSpecValueSet(self, attr_spec_rule, key):
+		if '%s_set' % key in attr_spec_rule:
+			return self.rules['attr_value_sets'][attr_spec_rule['%s_set' % key]]
+		values = attr_spec_rule[key] if isinstance(attr_spec_rule[key], list) else [attr_spec_rule[key]]
+		if 'value_casei' == key:
+			values = [value.lower() for value in values]
+		return dict((value, True) for value in values)
+
+	def CheckAttrSpecRuleValue(self, node, attr_name, attr_spec_rule):
+		found = self.GetAttributeValues(node, attr_name, attr_spec_rule)
+		if not found:
+			return NOT_APPLICABLE
+		value_set = self.GetAttrSpecValueSet(attr_spec_rule, 'value')
+		if found[1] in value_set:
+			return PASS
+		if '' in value_set and attr_name in BOOLEAN_ATTRIBUTES and found[1].lower() == attr_name.lower():
+			return PASS
+		return FAIL
+
+	def CheckAttrSpecRuleValueCasei(self, node, attr_name, attr_spec_rule):
+		value_set = self.GetAttrSpecValueSet(attr_spec_rule, 'value_casei')
+		if not value_set:
+			return NOT_APPLICABLE
+		result = NOT_APPLICABLE
+		for name in [attr_name] + list(attr_spec_rule.get('alternative_names') or []):
+			if name in node.attrs:
+				if node.attrs[name].lower() in value_set:
+					return PASS
+				if name == attr_name:
+					return FAIL
+				result = FAIL
+		return result
+
+	def CheckAttrSpecRuleValueRegex(self, node, attr_name, attr_spec_rule, flags=0):
+		key = 'value_regex_casei' if flags else 'value_regex'
+		if attr_name not in node.attrs:
+			return NOT_APPLICABLE
+		return PASS if self.Search(u'^(%s)$' % attr_spec_rule[key], node.attrs[attr_name], flags) else FAIL
+
+	def CheckAttrSpecRuleValueRegexCasei(self, node, attr_name, attr_spec_rule):
+		return self.CheckAttrSpecRuleValueRegex(node, attr_name, attr_spec_rule, re.I)
+
+	def ExtractAttributeUrls(self, attr_name, attr_value, spec_attr_name=None):
+		if 'srcset' == attr_name or 'srcset' == spec_attr_name:
+			return [url for url in (re.sub(r'\s.*$', '', part.strip()) for part in re.split(r'\s*,\s*', attr_value)) if url]
+		return [attr_value]
+
+	def ParseProtocol(self, url):
+		match = re.match(r'^[^/]+(?=:)', url)
+		return match.group(0) if match else None
+
+	def ParseUrl(self, url):
+		"""Splits a URL like wp_parse_url().
+
+		Returns:
+			The scheme and the host, which are empty when missing or when the URL can't be parsed.
+		"""
+		try:
+			parts = urlparse.urlsplit(url)
+		except ValueError:
+			return ('', '')
+		host = re.sub(r':\d*$', '', parts.netloc.rpartition('@')[2])
+		return (parts.scheme, host)
+
+	def CheckAttrSpecRuleValidUrl(self, node, attr_name, attr_spec_rule):
+		if attr_name not in node.attrs:
+			return NOT_APPLICABLE
+		for url in self.ExtractAttributeUrls(attr_name, node.attrs[attr_name]):
+			if isinstance(url, unicode):
+				url = url.encode('utf-8')
+			url = urllib.unquote_plus(url).decode('utf-8', 'replace')
+			protocol = self.ParseProtocol(url)
+			if protocol is not None:
+				if not re.match(r'^[a-zA-Z0-9\+-]+', protocol):
+					return FAIL
+				url = url[len(protocol) + 1:]
+			host = self.ParseUrl(url)[1]
+			if host and re.search(r'[!"#$%&\'()*+,\/:;<=>?@[\]^`{|}~\s]', host, re.UNICODE):
+				return FAIL
+		return PASS
+
+	def CheckAttrSpecRuleAllowedProtocol(self, node, attr_name, attr_spec_rule):
+		found = self.GetAttributeValues(node, attr_name, attr_spec_rule)
+		if not found:
+			return NOT_APPLICABLE
+		for url in self.ExtractAttributeUrls(found[0], found[1], attr_name):
+			protocol = self.ParseProtocol(url)
+			if protocol is not None and protocol.lower() not in attr_spec_rule['value_url']['protocol']:
+				return FAIL
+		return PASS
+
+	def CheckAttrSpecRuleDisallowedRelative(self, node, attr_name, attr_spec_rule):
+		if attr_spec_rule['value_url']['allow_relative']:
+			return NOT_APPLICABLE
+		found = self.GetAttributeValues(node, attr_name, attr_spec_rule)
+		if not found:
+			# The sanitizer passes an attribute with alternative names when the element has none of them.
+			return PASS if attr_spec_rule.get('alternative_names') else NOT_APPLICABLE
+		for url in self.ExtractAttributeUrls(found[0], found[1], attr_name):
+			if not self.ParseUrl(url)[0]:
+				return FAIL
+		return PASS
+
+	def CheckAttrSpecRuleDisallowedEmpty(self, node, attr_name, attr_spec_rule):
+		if attr_spec_rule['value_url']['allow_empty'] or attr_name not in node.attrs:
+			return NOT_APPLICABLE
+		# Like empty() in PHP, '0' is empty too.
+		return FAIL if node.attrs[attr_name] in (u'', u'0') else PASS
+
+	def CheckAttrSpecRuleDisallowedDomain(self, node, attr_name, attr_spec_rule):
+		if attr_name not in node.attrs:
+			return NOT_APPLICABLE
+		host = self.ParseUrl(node.attrs[attr_name])[1]
+		if not host:
+			return NOT_APPLICABLE
+		for disallowed_domain in attr_spec_rule['disallowed_domain']:
+			if host.lower() == disallowed_domain.lower():
+				return FAIL
+		return PASS
+
+	def CheckAttrSpecRuleBlacklistedValueRegex(self, node, attr_name, attr_spec_rule):
+		found = self.GetAttributeValues(node, attr_name, attr_spec_rule)
+		if not found:
+			return NOT_APPLICABLE
+		return FAIL if self.Search(attr_spec_rule['blacklisted_value_regex'], found[1]) else PASS
+
+	def CheckAttrSpecRuleValueProperties(self, node, attr_name, attr_spec_rule):
+		properties = {}
+		for pair in node.attrs[attr_name].split(','):
+			pair_parts = pair.split('=', 1)
+			if 2 != len(pair_parts):
+				return FAIL
+			properties[pair_parts[0].lower().strip()] = pair_parts[1].strip()
+
+		if set(properties) - set(attr_spec_rule['value_properties']):
+			return FAIL
+		for (prop_name, property_spec) in attr_spec_rule['value_properties'].items():
+			if property_spec.get('mandatory') and prop_name not in properties:
+				return FAIL
+			if prop_name not in properties:
+				continue
+			prop_value = properties[prop_name]
+			if 'value' in property_spec:
+				if prop_value != property_spec['value']:
+					return FAIL
+			elif 'value_double' in property_spec:
+				try:
+					prop_value = float(prop_value)
+				except ValueError:
+					prop_value = 0.0
+				if prop_value != property_spec['value_double']:
+					return FAIL
+		return PASS
+
+	def IsAmpAllowedAttribute(self, node, attr_name, attr_spec_list):
+		if attr_name in attr_spec_list or attr_name.startswith('data-'):
+			return True
+		if 'html' == node.name and attr_name in (u'amp', u'\u26a1'):
+			return True
+		if attr_spec_list.get(self.rev_alternate_attr_name_lookup.get(attr_name)) is not None:
+			return True
+
+		# The attributes of amp-selector's reference point apply to all of its descendants.
+		reference_point = self.rules['reference_points'].get('AMP-SELECTOR option') or {}
+		if attr_name in (reference_point.get('attr_spec_list') or {}):
+			parent = node.parent
+			while parent:
+				if 'amp-selector' == parent.name:
+					return True
+				parent = parent.parent
+		return False
+
+	def ParseSpecName(self, spec_name):
+		if spec_name in self.rules['spec_name_components']:
+			return self.rules['spec_name_components'][spec_name]
+		attributes = {}
+		match = SPEC_NAME_PATTERN.match(spec_name)
+		if not match:
+			return {'tag_name': spec_name.split(' ')[0], 'attributes': attributes}
+		if match.group('raw_attrs'):
+			for raw_attr_pair in match.group('raw_attrs').strip('[]').split(']['):
+				raw_attr_pair = raw_attr_pair.split('=')
+				attributes[raw_attr_pair[0]] = raw_attr_pair[1] if len(raw_attr_pair) > 1 else True
+		return {'tag_name': match.group('tag_name'), 'attributes': attributes}
+
+	def HasParent(self, node, parent_spec_name):
+		parsed_spec_name = self.ParseSpecName(parent_spec_name)
+		if not node.parent or node.parent.name != parsed_spec_name['tag_name']:
+			return False
+		for (attr_name, attr_value) in parsed_spec_name['attributes'].items():
+			if node.attrs.get(attr_name, u'').lower() != attr_value:
+				return False
+		return True
+
+	def GetAncestorWithMatchingSpecName(self, node, ancestor_spec_name):
+		parsed_spec_name = self.ParseSpecName(ancestor_spec_name)
+		node = node.parent
+		while node:
+			if node.name == parsed_spec_name['tag_name']:
+				matches = True
+				for (attr_name, attr_value) in parsed_spec_name['attributes'].items():
+					if True is attr_value:
+						matches = attr_name in node.attrs
+					else:
+						matches = node.attrs.get(attr_name, u'').lower() == attr_value
+					if not matches:
+						break
+				if matches:
+					return node
+			node = node.parent
+		return None
+
+	def RemoveDisallowedDescendants(self, node, allowed_descendants):
+		for child in node.GetElementChildren():
+			if child.name not in allowed_descendants:
+				self.AddError(child)
+				node.RemoveChild(child)
+			else:
+				self.RemoveDisallowedDescendants(child, allowed_descendants)
+
+	def CheckValidChildren(self, node, child_tags):
+		child_elements = node.GetElementChildren()
+		sets = {}
+		for key in ('first_child_tag_name', 'child_tag_name'):
+			if '%s_set' % key in child_tags:
+				sets[key] = child_tags['%s_set' % key]
+			elif '%s_oneof' % key in child_tags:
+				sets[key] = dict((tag_name, True) for tag_name in child_tags['%s_oneof' % key])
+
+		if 'first_child_tag_name' in sets and (not child_elements or child_elements[0].name not in sets['first_child_tag_name']):
+			return False
+
+		removed_count = 0
+		if 'child_tag_name' in sets:
+			for child in child_elements:
+				if child.name not in sets['child_tag_name']:
+					removed_count += 1
+					self.AddError(child)
+					node.RemoveChild(child)
+
+		if 'mandatory_num_child_tags' in child_tags:
+			return len(child_elements) - removed_count == child_tags['mandatory_num_child_tags']
+		if 'mandatory_min_num_child_tags' in child_tags:
+			return len(child_elements) - removed_count >= child_tags['mandatory_min_num_child_tags']
+		return True
+
+	def ReplaceNodeWithChildren(self, node, queue):
+		if not node.children or not node.parent:
+			self.RemoveNode(node)
+			return
+		self.AddError(node)
+		parent = node.parent
+		index = parent.children.index(node)
+		children = list(node.children)
+		for child in children:
+			child.parent = parent
+		parent.children[index:index + 1] = children
+		node.children = []
+		node.parent = None
+		queue.extend(children)
+
+	def RemoveNode(self, node):
+		parent = node.parent
+		if not parent:
+			return
+		self.AddError(node)
+		parent.RemoveChild(node)
+
+		# Remove the parents which are left empty, up to the body.
+		while parent and not parent.children and 'body' != parent.name:
+			node = parent
+			parent = parent.parent
+			if parent:
+				parent.RemoveChild(node)
+
+
+def MergeSpecs(*specs):
+	"""Helper function which merges dictionaries like array_merge() does for string keys.
+
+	Args:
+		specs: dictionaries, the later of which take precedence.
+	Returns:
+		The merged dictionary.
+	"""
+	merged = {}
+	for spec in specs:
+		merged.update(spec)
+	return merged
+
+
+def GetDocuments(paths):
+	"""Streams the documents to validate.
+
+	Args:
+		paths: list of paths of directories, which are searched for .html and .htm files, of WordPress
+			export (WXR) files ending in .xml, and of HTML files.
+	Yields:
+		Tuples of the source of each document and its HTML.
+	"""
+	for path in paths:
+		if os.path.isdir(path):
+			for (dir_path, dir_names, file_names) in os.walk(path):
+				dir_names.sort()
+				for file_name in sorted(file_names):
+					if os.path.splitext(file_name)[1].lower() in ('.html', '.htm'):
+						file_path = os.path.join(dir_path, file_name)
+						yield (file_path, open(file_path, 'rb').read())
+		elif path.lower().endswith('.xml'):
+			for document in GetWxrDocuments(path):
+				yield document
+		else:
+			yield (path, open(path, 'rb').read())
+
+
+def GetWxrDocuments(wxr_file):
+	"""Streams the post content from a WordPress export, without reading the whole file into memory.
+
+	Args:
+		wxr_file: path of the WXR file.
+	Yields:
+		Tuples of the file path and post ID of each item, like 'export.xml#123', and its content.
+	"""
+	for (event, element) in cElementTree.iterparse(wxr_file):
+		if 'item' != element.tag:
+			continue
+		post_id = None
+		content = None
+		for child in element:
+			# The namespace URIs of WXR differ between versions, so only the local names are matched.
+			(namespace, separator, local_name) = child.tag.rpartition('}')
+			if 'post_id' == local_name and namespace.startswith('{http://wordpress.org/export/'):
+				post_id = child.text
+			elif 'encoded' == local_name and namespace == '{http://purl.org/rss/1.0/modules/content/':
+				content = child.text
+		if content:
+			yield ('%s#%s' % (wxr_file, post_id), content)
+		element.clear()
+
+
+def InitWorker(rules_file):
+	"""Loads the rules in a worker process.
+
+	Args:
+		rules_file: path to the JSON file of the rules.
+	"""
+	global WORKER_VALIDATOR
+	WORKER_VALIDATOR = Validator(LoadRules(rules_file))
+
+
+def ValidateDocument(document):
+	"""Validates a document in a worker process.
+
+	Args:
+		document: tuple of the source of the document and its HTML.
+	Returns:
+		Tuple of the source and the list of validation errors.
+	"""
+	(source, content) = document
+	return (source, WORKER_VALIDATOR.Validate(content))
+
+
+def Main(rules_file, paths, jobs=1, output=sys.stdout):
+	"""Validates the documents and writes a JSON record for each with validation errors.
+
+	Args:
+		rules_file: path to the JSON file written by `amphtml-update.py --json-out`.
+		paths: list of paths of the documents, as accepted by GetDocuments().
+		jobs: number of processes to validate the documents with.
+		output: file to write the records to.
+	Returns:
+		Counter of the validation errors by code and node name.
+	"""
+	documents = GetDocuments(paths)
+	pool = None
+	if jobs > 1:
+		pool = multiprocessing.Pool(jobs, InitWorker, (rules_file,))
+		results = pool.imap(ValidateDocument, documents, chunksize=16)
+	else:
+		InitWorker(rules_file)
+		results = itertools.imap(ValidateDocument, documents)
+
+	document_count = 0
+	invalid_count = 0
+	error_counts = collections.Counter()
+	try:
+		for (source, errors) in results:
+			document_count += 1
+			if not errors:
+				continue
+			invalid_count += 1
+			error_counts.update((error['code'], error['node_name']) for error in errors)
+			output.write(json.dumps(collections.OrderedDict([('source', source), ('errors', errors)])) + '\n')
+	finally:
+		if pool:
+			pool.close()
+			pool.join()
+
+	print >> sys.stderr, 'Validated %d documents, of which %d have validation errors.' % (document_count, invalid_count)
+	for ((code, node_name), count) in error_counts.most_common():
+		print >> sys.stderr, '%8d  %s  %s' % (count, code, node_name)
+	return error_counts
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='Validate post HTML offline with the rules generated by amphtml-update.py.')
+	parser.add_argument('rules_file', help='Path to the rules written by `amphtml-update.py --json-out`.')
+	parser.add_argument('paths', nargs='+', help='Directories of .html files, WordPress export (WXR) .xml files or HTML files.')
+	parser.add_argument('--jobs', '-j', type=int, default=multiprocessing.cpu_count(), help='Number of processes to validate with. Defaults to the number of CPUs (%(default)s).')
+	parser.add_argument('--output', '-o', help='Write the records to this file instead of to STDOUT.')
+	args = parser.parse_args()
+
+	if not os.path.exists(args.rules_file):
+		Die('Error: The rules file does not exist: %s' % args.rules_file)
+	for path in args.paths:
+		if not os.path.exists(path):
+			Die('Error: The path does not exist: %s' % path)
+
+	Main(args.rules_file, args.paths, args.jobs, open(args.output, 'wb') if args.output else sys.stdout)
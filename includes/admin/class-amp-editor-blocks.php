@@ -105,7 +105,7 @@ class AMP_Editor_Blocks {
 				$tags[ $amp_block ]
 			);
 
-			$amp_tag_specs = AMP_Allowed_Tags_Generated::get_allowed_tag( $amp_block );
+			$amp_tag_specs = (array) AMP_Allowed_Tags_Generated::get_allowed_tag( $amp_block );
 			foreach ( $amp_tag_specs as $amp_tag_spec ) {
 				if ( ! isset( $amp_tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
 					continue;
@@ -425,11 +425,11 @@ function amp_register_default_scripts( $wp_scripts ) {
 
 	// Get all AMP components as defined in the spec.
 	$extensions = array();
-	foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'script' ) as $script_spec ) {
-		if ( isset( $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'], $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['version'] ) ) {
-			$versions = $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['version'];
+	foreach ( AMP_Allowed_Tags_Generated::get_extension_specs() as $extension_name => $extension_spec ) {
+		if ( isset( $extension_spec['version'] ) ) {
+			$versions = $extension_spec['version'];
 			array_pop( $versions );
-			$extensions[ $script_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'] ] = array_pop( $versions );
+			$extensions[ $extension_name ] = array_pop( $versions );
 		}
 	}
 
@@ -584,7 +584,7 @@ function amp_filter_font_style_loader_tag_with_crossorigin_anonymous( $tag, $han
 		$spec_name = 'link rel=stylesheet for fonts'; // phpcs:ignore WordPress.WP.EnqueuedResources.NonEnqueuedStylesheet
 		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'link' ) as $spec_rule ) {
 			if ( isset( $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) && $spec_name === $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) {
-				$allowed_font_src_regex = '@^(' . $spec_rule[ AMP_Rule_Spec::ATTR_SPEC_LIST ]['href']['value_regex'] . ')$@';
+				$allowed_font_src_regex = $spec_rule[ AMP_Rule_Spec::ATTR_SPEC_LIST ]['href'][ AMP_Rule_Spec::VALUE_REGEX_PCRE ];
 				break;
 			}
 		}
@@ -321,6 +321,306 @@ class AMP_Allowed_Tags_Generated {
 		),
 	);
 
+	private static $descendant_tag_sets = array(
+		'amp-story-bookend-allowed-descendants' => array(
+			'script' => true,
+		),
+		'amp-story-cta-layer-allowed-descendants' => array(
+			'a' => true,
+			'abbr' => true,
+			'address' => true,
+			'amp-call-tracking' => true,
+			'amp-date-countdown' => true,
+			'amp-fit-text' => true,
+			'amp-font' => true,
+			'amp-img' => true,
+			'amp-timeago' => true,
+			'b' => true,
+			'bdi' => true,
+			'bdo' => true,
+			'blockquote' => true,
+			'br' => true,
+			'button' => true,
+			'caption' => true,
+			'cite' => true,
+			'code' => true,
+			'data' => true,
+			'del' => true,
+			'dfn' => true,
+			'div' => true,
+			'em' => true,
+			'figcaption' => true,
+			'figure' => true,
+			'footer' => true,
+			'h1' => true,
+			'h2' => true,
+			'h3' => true,
+			'h4' => true,
+			'h5' => true,
+			'h6' => true,
+			'header' => true,
+			'hgroup' => true,
+			'hr' => true,
+			'i' => true,
+			'ins' => true,
+			'kbd' => true,
+			'li' => true,
+			'main' => true,
+			'mark' => true,
+			'nav' => true,
+			'noscript' => true,
+			'ol' => true,
+			'p' => true,
+			'pre' => true,
+			'q' => true,
+			'rp' => true,
+			'rt' => true,
+			'rtc' => true,
+			'ruby' => true,
+			's' => true,
+			'samp' => true,
+			'section' => true,
+			'small' => true,
+			'span' => true,
+			'strong' => true,
+			'sub' => true,
+			'sup' => true,
+			'time' => true,
+			'tr' => true,
+			'u' => true,
+			'ul' => true,
+			'var' => true,
+			'wbr' => true,
+		),
+		'amp-story-grid-layer-allowed-descendants' => array(
+			'a' => true,
+			'abbr' => true,
+			'address' => true,
+			'amp-analytics' => true,
+			'amp-audio' => true,
+			'amp-date-countdown' => true,
+			'amp-experiment' => true,
+			'amp-fit-text' => true,
+			'amp-font' => true,
+			'amp-gfycat' => true,
+			'amp-gist' => true,
+			'amp-google-vrview-image' => true,
+			'amp-img' => true,
+			'amp-install-serviceworker' => true,
+			'amp-list' => true,
+			'amp-live-list' => true,
+			'amp-pixel' => true,
+			'amp-timeago' => true,
+			'amp-video' => true,
+			'article' => true,
+			'aside' => true,
+			'b' => true,
+			'bdi' => true,
+			'bdo' => true,
+			'blockquote' => true,
+			'br' => true,
+			'caption' => true,
+			'cite' => true,
+			'code' => true,
+			'col' => true,
+			'colgroup' => true,
+			'data' => true,
+			'dd' => true,
+			'del' => true,
+			'dfn' => true,
+			'div' => true,
+			'dl' => true,
+			'dt' => true,
+			'em' => true,
+			'figcaption' => true,
+			'figure' => true,
+			'footer' => true,
+			'h1' => true,
+			'h2' => true,
+			'h3' => true,
+			'h4' => true,
+			'h5' => true,
+			'h6' => true,
+			'header' => true,
+			'hgroup' => true,
+			'hr' => true,
+			'i' => true,
+			'ins' => true,
+			'kbd' => true,
+			'li' => true,
+			'main' => true,
+			'mark' => true,
+			'nav' => true,
+			'noscript' => true,
+			'ol' => true,
+			'p' => true,
+			'pre' => true,
+			'q' => true,
+			'rp' => true,
+			'rt' => true,
+			'rtc' => true,
+			'ruby' => true,
+			's' => true,
+			'samp' => true,
+			'section' => true,
+			'small' => true,
+			'source' => true,
+			'span' => true,
+			'strong' => true,
+			'sub' => true,
+			'sup' => true,
+			'table' => true,
+			'tbody' => true,
+			'td' => true,
+			'tfoot' => true,
+			'th' => true,
+			'thead' => true,
+			'time' => true,
+			'tr' => true,
+			'track' => true,
+			'u' => true,
+			'ul' => true,
+			'var' => true,
+			'wbr' => true,
+		),
+		'amp-story-page-attachment-allowed-descendants' => array(
+			'a' => true,
+			'abbr' => true,
+			'address' => true,
+			'amp-3d-gltf' => true,
+			'amp-3q-player' => true,
+			'amp-accordion' => true,
+			'amp-audio' => true,
+			'amp-beopinion' => true,
+			'amp-bodymovin-animation' => true,
+			'amp-brid-player' => true,
+			'amp-brightcove' => true,
+			'amp-byside-content' => true,
+			'amp-call-tracking' => true,
+			'amp-carousel' => true,
+			'amp-dailymotion' => true,
+			'amp-date-countdown' => true,
+			'amp-embedly-card' => true,
+			'amp-facebook' => true,
+			'amp-facebook-comments' => true,
+			'amp-facebook-like' => true,
+			'amp-facebook-page' => true,
+			'amp-fit-text' => true,
+			'amp-fx-collection' => true,
+			'amp-fx-flying-carpet' => true,
+			'amp-gfycat' => true,
+			'amp-gist' => true,
+			'amp-google-document-embed' => true,
+			'amp-google-vrview-image' => true,
+			'amp-hulu' => true,
+			'amp-ima-video' => true,
+			'amp-image-slider' => true,
+			'amp-img' => true,
+			'amp-imgur' => true,
+			'amp-instagram' => true,
+			'amp-izlesene' => true,
+			'amp-jwplayer' => true,
+			'amp-kaltura-player' => true,
+			'amp-list' => true,
+			'amp-live-list' => true,
+			'amp-mathml' => true,
+			'amp-mowplayer' => true,
+			'amp-nexxtv-player' => true,
+			'amp-o2-player' => true,
+			'amp-ooyala-player' => true,
+			'amp-pan-zoom' => true,
+			'amp-pinterest' => true,
+			'amp-playbuzz' => true,
+			'amp-powr-player' => true,
+			'amp-reach-player' => true,
+			'amp-reddit' => true,
+			'amp-riddle-quiz' => true,
+			'amp-soundcloud' => true,
+			'amp-springboard-player' => true,
+			'amp-timeago' => true,
+			'amp-twitter' => true,
+			'amp-video' => true,
+			'amp-video-iframe' => true,
+			'amp-vimeo' => true,
+			'amp-vine' => true,
+			'amp-viqeo-player' => true,
+			'amp-vk' => true,
+			'amp-wistia-player' => true,
+			'amp-yotpo' => true,
+			'amp-youtube' => true,
+			'article' => true,
+			'aside' => true,
+			'b' => true,
+			'bdi' => true,
+			'bdo' => true,
+			'blockquote' => true,
+			'br' => true,
+			'button' => true,
+			'caption' => true,
+			'cite' => true,
+			'code' => true,
+			'col' => true,
+			'colgroup' => true,
+			'data' => true,
+			'dd' => true,
+			'del' => true,
+			'dfn' => true,
+			'div' => true,
+			'dl' => true,
+			'dt' => true,
+			'em' => true,
+			'figcaption' => true,
+			'figure' => true,
+			'footer' => true,
+			'h1' => true,
+			'h2' => true,
+			'h3' => true,
+			'h4' => true,
+			'h5' => true,
+			'h6' => true,
+			'header' => true,
+			'hgroup' => true,
+			'hr' => true,
+			'i' => true,
+			'ins' => true,
+			'kbd' => true,
+			'li' => true,
+			'main' => true,
+			'mark' => true,
+			'nav' => true,
+			'ol' => true,
+			'p' => true,
+			'pre' => true,
+			'q' => true,
+			'rp' => true,
+			'rt' => true,
+			'rtc' => true,
+			'ruby' => true,
+			's' => true,
+			'samp' => true,
+			'section' => true,
+			'small' => true,
+			'source' => true,
+			'span' => true,
+			'strong' => true,
+			'sub' => true,
+			'sup' => true,
+			'table' => true,
+			'tbody' => true,
+			'td' => true,
+			'tfoot' => true,
+			'th' => true,
+			'thead' => true,
+			'time' => true,
+			'tr' => true,
+			'track' => true,
+			'u' => true,
+			'ul' => true,
+			'var' => true,
+			'wbr' => true,
+		),
+	);
+
 	private static $allowed_tags = array(
 		'a' => array(
 			array(
@@ -329,7 +629,9 @@ class AMP_Allowed_Tags_Generated {
 					'border' => array(),
 					'download' => array(),
 					'href' => array(
+						'attr_spec_id' => '4316809b',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -363,11 +665,15 @@ class AMP_Allowed_Tags_Generated {
 					'hreflang' => array(),
 					'media' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'referrerpolicy' => array(),
 					'rel' => array(
+						'attr_spec_id' => '0bb5bea5',
 						'blacklisted_value_regex' => '(^|\\s)(components|dns-prefetch|import|manifest|preconnect|prefetch|preload|prerender|serviceworker|stylesheet|subresource|)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(components|dns-prefetch|import|manifest|preconnect|prefetch|preload|prerender|serviceworker|stylesheet|subresource|)(\\s|$)/uD',
 					),
 					'role' => array(),
 					'tabindex' => array(),
@@ -377,11 +683,13 @@ class AMP_Allowed_Tags_Generated {
 							'_self',
 							'_top',
 						),
+						'value_set' => 0,
 					),
 					'type' => array(
 						'value_casei' => array(
 							'text/html',
 						),
+						'value_casei_set' => 1,
 					),
 				),
 				'tag_spec' => array(
@@ -415,18 +723,21 @@ class AMP_Allowed_Tags_Generated {
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'antialiasing' => array(
 						'value' => array(
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'autorotate' => array(
 						'value' => array(
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'clearcolor' => array(),
 					'enablezoom' => array(
@@ -434,17 +745,22 @@ class AMP_Allowed_Tags_Generated {
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'maxpixelratio' => array(
+						'attr_spec_id' => '2213767f',
 						'value_regex' => '[+-]?(\\d*\\.)?\\d+',
+						'value_regex_pcre' => '/^(?:[+-]?(\\d*\\.)?\\d+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '73b5eaaa',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -463,6 +779,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'requires_extension' => array(
 						'amp-3d-gltf',
 					),
@@ -476,6 +798,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'data-id' => array(
 						'mandatory' => true,
@@ -485,6 +808,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -496,6 +820,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 1,
+					'mandatory_attrs' => array(
+						array(
+							'data-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-3q-player',
 					),
@@ -509,22 +839,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'disable-session-states' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'expand-single-section' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -537,7 +871,11 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'section',
 						),
+						'child_tag_name_set' => array(
+							'section' => true,
+						),
 					),
+					'layout_table' => 2,
 					'requires_extension' => array(
 						'amp-accordion',
 					),
@@ -553,11 +891,21 @@ class AMP_Allowed_Tags_Generated {
 						'mandatory' => true,
 					),
 					'id' => array(
+						'attr_spec_id' => '8df4b967',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'execute',
+						),
+						array(
+							'id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-action-macro',
 					),
@@ -575,10 +923,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'rtc-config' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -610,6 +961,15 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-app-banner',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-app-banner' => 'amp-app-banner',
+					),
+					'layout_table' => 3,
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-ad',
 					),
@@ -625,6 +985,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'json' => array(),
 					'media' => array(),
@@ -632,10 +993,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'rtc-config' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -670,6 +1034,22 @@ class AMP_Allowed_Tags_Generated {
 						'amp-lightbox',
 						'amp-sticky-ad',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-app-banner' => 'amp-app-banner',
+						'amp-carousel' => 'amp-carousel',
+						'amp-fx-flying-carpet' => 'amp-fx-flying-carpet',
+						'amp-lightbox' => 'amp-lightbox',
+						'amp-sticky-ad' => 'amp-sticky-ad',
+					),
+					'layout_table' => 3,
+					'mandatory_attrs' => array(
+						array(
+							'data-multi-size',
+						),
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-ad',
 					),
@@ -686,6 +1066,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'json' => array(),
 					'media' => array(),
@@ -693,9 +1074,12 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -728,6 +1112,20 @@ class AMP_Allowed_Tags_Generated {
 						'amp-fx-flying-carpet',
 						'amp-lightbox',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-app-banner' => 'amp-app-banner',
+						'amp-fx-flying-carpet' => 'amp-fx-flying-carpet',
+						'amp-lightbox' => 'amp-lightbox',
+					),
+					'layout_table' => 3,
+					'mandatory_attrs' => array(
+						array(
+							'data-enable-refresh',
+						),
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-ad',
 					),
@@ -747,6 +1145,7 @@ class AMP_Allowed_Tags_Generated {
 						'mandatory' => true,
 					),
 					'data-share-media' => array(
+						'attr_spec_id' => '914b960e',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -756,6 +1155,7 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'data-share-url' => array(
+						'attr_spec_id' => '914b960e',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -770,6 +1170,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -783,6 +1184,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-pub-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-addthis',
 					),
@@ -793,7 +1200,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'config' => array(
+						'attr_spec_id' => 'a4da1693',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_empty' => true,
 							'allow_relative' => true,
@@ -822,12 +1231,15 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
 						'alternative_names' => array(
 							'srcset',
 						),
+						'attr_spec_id' => 'e94e3ca1',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -850,6 +1262,13 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
+					'mandatory_attrs' => array(
+						array(
+							'src',
+							'srcset',
+						),
+					),
 					'requires_extension' => array(
 						'amp-anim',
 					),
@@ -865,11 +1284,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'trigger' => array(
 						'value' => array(
 							'visibility',
 						),
+						'value_set' => 4,
 					),
 				),
 				'tag_spec' => array(
@@ -882,8 +1303,12 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'script',
 						),
+						'child_tag_name_set' => array(
+							'script' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-animation',
 					),
@@ -894,16 +1319,21 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-apester-channel-token' => array(
+						'attr_spec_id' => '4d52c3a6',
 						'value_regex' => '[0-9a-zA-Z]+',
+						'value_regex_pcre' => '/^(?:[0-9a-zA-Z]+)$/uD',
 					),
 					'data-apester-media-id' => array(
+						'attr_spec_id' => '4d52c3a6',
 						'value_regex' => '[0-9a-zA-Z]+',
+						'value_regex_pcre' => '/^(?:[0-9a-zA-Z]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -917,6 +1347,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
 					'requires_extension' => array(
 						'amp-apester-media',
 					),
@@ -928,7 +1359,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'id' => array(
+						'attr_spec_id' => '8df4b967',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 					'media' => array(),
@@ -936,6 +1369,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -944,6 +1378,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
+					'mandatory_attrs' => array(
+						array(
+							'id',
+						),
+					),
 					'mandatory_parent' => 'body',
 					'requires_extension' => array(
 						'amp-app-banner',
@@ -963,6 +1403,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'controls' => array(),
 					'controlslist' => array(),
@@ -970,17 +1411,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'muted' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'preload' => array(
 						'value_casei' => array(
@@ -988,9 +1432,12 @@ class AMP_Allowed_Tags_Generated {
 							'metadata',
 							'none',
 						),
+						'value_casei_set' => 5,
 					),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -1012,6 +1459,10 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-story',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-story' => 'amp-story',
+					),
+					'layout_table' => 7,
 					'requires_extension' => array(
 						'amp-audio',
 					),
@@ -1028,6 +1479,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'controls' => array(),
 					'controlslist' => array(),
@@ -1035,20 +1487,25 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'muted' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -1063,7 +1520,13 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'mandatory_ancestor' => 'amp-story',
+					'mandatory_attrs' => array(
+						array(
+							'autoplay',
+						),
+					),
 					'requires_extension' => array(
 						'amp-audio',
 					),
@@ -1080,6 +1543,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'mandatory' => true,
@@ -1089,6 +1553,14 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-auto-ads',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-auto-ads' => 'amp-auto-ads',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-auto-ads',
 					),
@@ -1100,17 +1572,22 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-account' => array(
+						'attr_spec_id' => '9a23e829',
 						'mandatory' => true,
 						'value_regex_casei' => '[0-9a-f]{24}',
+						'value_regex_casei_pcre' => '/^(?:[0-9a-f]{24})$/uiD',
 					),
 					'data-content' => array(
+						'attr_spec_id' => '6ccc8acc',
 						'value_regex_casei' => '[0-9a-f]{24}',
+						'value_regex_casei_pcre' => '/^(?:[0-9a-f]{24})$/uiD',
 					),
 					'data-my-content' => array(
 						'value' => array(
 							'0',
 							'1',
 						),
+						'value_set' => 6,
 					),
 					'data-name' => array(),
 					'media' => array(),
@@ -1118,6 +1595,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -1132,6 +1610,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
+					'mandatory_attrs' => array(
+						array(
+							'data-account',
+						),
+					),
 					'requires_extension' => array(
 						'amp-beopinion',
 					),
@@ -1146,11 +1630,21 @@ class AMP_Allowed_Tags_Generated {
 						'mandatory' => true,
 					),
 					'id' => array(
+						'attr_spec_id' => '8df4b967',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'expression',
+						),
+						array(
+							'id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-bind',
 					),
@@ -1167,19 +1661,23 @@ class AMP_Allowed_Tags_Generated {
 							'number',
 							'true',
 						),
+						'value_casei_set' => 7,
 					),
 					'noautoplay' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'renderer' => array(
 						'value_casei' => array(
 							'svg',
 							'html',
 						),
+						'value_casei_set' => 8,
 					),
 					'src' => array(
+						'attr_spec_id' => 'e7b0b716',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -1200,6 +1698,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'requires_extension' => array(
 						'amp-bodymovin-animation',
 					),
@@ -1212,27 +1716,38 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'autoplay' => array(),
 					'data-outstream' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'data-partner' => array(
+						'attr_spec_id' => 'af5fe7aa',
 						'mandatory' => true,
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'data-player' => array(
+						'attr_spec_id' => 'af5fe7aa',
 						'mandatory' => true,
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'data-playlist' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'data-video' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -1246,6 +1761,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-partner',
+						),
+						array(
+							'data-player',
+						),
+					),
 					'requires_extension' => array(
 						'amp-brid-player',
 					),
@@ -1267,6 +1791,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'data-account' => array(
 						'mandatory' => true,
@@ -1281,6 +1806,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -1294,6 +1820,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-account',
+						),
+					),
 					'requires_extension' => array(
 						'amp-brightcove',
 					),
@@ -1315,6 +1847,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -1328,6 +1861,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-label',
+						),
+						array(
+							'data-webcare-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-byside-content',
 					),
@@ -1338,7 +1880,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'config' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -1352,6 +1896,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -1369,8 +1914,17 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'a',
 						),
+						'child_tag_name_set' => array(
+							'a' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
+					'layout_table' => 8,
+					'mandatory_attrs' => array(
+						array(
+							'config',
+						),
+					),
 					'requires_extension' => array(
 						'amp-call-tracking',
 					),
@@ -1386,34 +1940,43 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'autoplay' => array(
+						'attr_spec_id' => '190eee75',
 						'value_regex' => '(|[0-9]+)',
+						'value_regex_pcre' => '/^(?:(|[0-9]+))$/uD',
 					),
 					'controls' => array(),
 					'delay' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'dots' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'loop' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'value' => array(
 							'slides',
 						),
+						'value_set' => 9,
 					),
 				),
 				'tag_spec' => array(
@@ -1428,6 +1991,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
 					'requires_extension' => array(
 						'amp-carousel',
 					),
@@ -1442,35 +2006,44 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'autoplay' => array(
+						'attr_spec_id' => '190eee75',
 						'value_regex' => '(|[0-9]+)',
+						'value_regex_pcre' => '/^(?:(|[0-9]+))$/uD',
 					),
 					'controls' => array(),
 					'delay' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'dots' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'loop' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'mandatory' => true,
 						'value' => array(
 							'carousel',
 						),
+						'value_set' => 10,
 					),
 				),
 				'tag_spec' => array(
@@ -1481,6 +2054,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 7,
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-carousel',
 					),
@@ -1495,18 +2074,24 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'autoplay' => array(
+						'attr_spec_id' => '190eee75',
 						'value_regex' => '(|[0-9]+)',
+						'value_regex_pcre' => '/^(?:(|[0-9]+))$/uD',
 					),
 					'controls' => array(),
 					'delay' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'dots' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'lightbox' => array(
 						'mandatory' => true,
@@ -1515,17 +2100,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'value' => array(
 							'slides',
 						),
+						'value_set' => 9,
 					),
 				),
 				'tag_spec' => array(
@@ -1540,6 +2128,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
+					'mandatory_attrs' => array(
+						array(
+							'lightbox',
+						),
+					),
 					'reference_points' => array(
 						'AMP-CAROUSEL lightbox [child]' => array(
 							'mandatory' => false,
@@ -1565,18 +2159,24 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'autoplay' => array(
+						'attr_spec_id' => '190eee75',
 						'value_regex' => '(|[0-9]+)',
+						'value_regex_pcre' => '/^(?:(|[0-9]+))$/uD',
 					),
 					'controls' => array(),
 					'delay' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'dots' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'lightbox' => array(
 						'mandatory' => true,
@@ -1585,18 +2185,21 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'mandatory' => true,
 						'value' => array(
 							'carousel',
 						),
+						'value_set' => 10,
 					),
 				),
 				'tag_spec' => array(
@@ -1607,6 +2210,15 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 7,
+					'mandatory_attrs' => array(
+						array(
+							'lightbox',
+						),
+						array(
+							'type',
+						),
+					),
 					'reference_points' => array(
 						'AMP-CAROUSEL lightbox [child]' => array(
 							'mandatory' => false,
@@ -1634,6 +2246,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -1642,6 +2255,7 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-consent',
 					),
@@ -1655,6 +2269,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'mandatory' => true,
@@ -1666,6 +2281,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-consent',
 					),
@@ -1683,40 +2304,51 @@ class AMP_Allowed_Tags_Generated {
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'data-info' => array(
 						'value' => array(
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'data-mute' => array(
 						'value' => array(
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'data-sharing-enable' => array(
 						'value' => array(
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'data-start' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'data-ui-highlight' => array(
+						'attr_spec_id' => '0ef11dc2',
 						'value_regex_casei' => '([0-9a-f]{3}){1,2}',
+						'value_regex_casei_pcre' => '/^(?:([0-9a-f]{3}){1,2})$/uiD',
 					),
 					'data-ui-logo' => array(
 						'value' => array(
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 					'data-videoid' => array(
+						'attr_spec_id' => 'e19bc831',
 						'mandatory' => true,
 						'value_regex_casei' => '[a-z0-9]+',
+						'value_regex_casei_pcre' => '/^(?:[a-z0-9]+)$/uiD',
 					),
 					'dock' => array(
 						'requires_extension' => array(
@@ -1728,6 +2360,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -1740,6 +2373,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'data-videoid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-dailymotion',
 					),
@@ -1757,9 +2396,12 @@ class AMP_Allowed_Tags_Generated {
 							'minutes',
 							'seconds',
 						),
+						'value_casei_set' => 11,
 					),
 					'end-date' => array(
+						'attr_spec_id' => '4adebf93',
 						'value_regex' => '\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d(:[0-5]\\d(\\.\\d+)?)?(Z|[+-][0-1][0-9]:[0-5][0-9])',
+						'value_regex_pcre' => '/^(?:\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d(:[0-5]\\d(\\.\\d+)?)?(Z|[+-][0-1][0-9]:[0-5][0-9]))$/uD',
 					),
 					'locale' => array(
 						'value_casei' => array(
@@ -1780,31 +2422,42 @@ class AMP_Allowed_Tags_Generated {
 							'zh-cn',
 							'zh-tw',
 						),
+						'value_casei_set' => 12,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'offset-seconds' => array(
+						'attr_spec_id' => '5b57f54b',
 						'value_regex' => '-?\\d+',
+						'value_regex_pcre' => '/^(?:-?\\d+)$/uD',
 					),
 					'template' => array(),
 					'timeleft-ms' => array(
+						'attr_spec_id' => 'c12c134b',
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(?:\\d+)$/uD',
 					),
 					'timestamp-ms' => array(
+						'attr_spec_id' => 'ca96f616',
 						'value_regex' => '\\d{13}',
+						'value_regex_pcre' => '/^(?:\\d{13})$/uD',
 					),
 					'timestamp-seconds' => array(
+						'attr_spec_id' => '03987e72',
 						'value_regex' => '\\d{10}',
+						'value_regex_pcre' => '/^(?:\\d{10})$/uD',
 					),
 					'when-ended' => array(
 						'value_casei' => array(
 							'continue',
 							'stop',
 						),
+						'value_casei_set' => 13,
 					),
 				),
 				'tag_spec' => array(
@@ -1818,6 +2471,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
 					'requires_extension' => array(
 						'amp-date-countdown',
 					),
@@ -1828,12 +2482,15 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'datetime' => array(
+						'attr_spec_id' => 'cb7b1ad5',
 						'value_regex' => 'now|(\\d{4}-[01]\\d-[0-3]\\d(T[0-2]\\d:[0-5]\\d(:[0-6]\\d(\\.\\d\\d?\\d?)?)?(Z|[+-][0-1]\\d:[0-5]\\d)?)?)',
+						'value_regex_pcre' => '/^(?:now|(\\d{4}-[01]\\d-[0-3]\\d(T[0-2]\\d:[0-5]\\d(:[0-6]\\d(\\.\\d\\d?\\d?)?)?(Z|[+-][0-1]\\d:[0-5]\\d)?)?))$/uD',
 					),
 					'display-in' => array(
 						'value_casei' => array(
 							'utc',
 						),
+						'value_casei_set' => 14,
 					),
 					'locale' => array(),
 					'media' => array(),
@@ -1841,15 +2498,22 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'offset-seconds' => array(
+						'attr_spec_id' => '5b57f54b',
 						'value_regex' => '-?\\d+',
+						'value_regex_pcre' => '/^(?:-?\\d+)$/uD',
 					),
 					'timestamp-ms' => array(
+						'attr_spec_id' => 'c12c134b',
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(?:\\d+)$/uD',
 					),
 					'timestamp-seconds' => array(
+						'attr_spec_id' => 'c12c134b',
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(?:\\d+)$/uD',
 					),
 				),
 				'tag_spec' => array(
@@ -1863,6 +2527,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
 					'requires_extension' => array(
 						'amp-date-display',
 					),
@@ -1879,20 +2544,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'blocked' => array(),
 					'date' => array(),
 					'day-size' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'first-day-of-week' => array(
+						'attr_spec_id' => '8ccf5f55',
 						'value_regex' => '[0-6]',
+						'value_regex_pcre' => '/^(?:[0-6])$/uD',
 					),
 					'format' => array(),
 					'fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'highlighted' => array(),
 					'input-selector' => array(),
@@ -1904,28 +2575,36 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'static',
 						),
+						'value_casei_set' => 15,
 					),
 					'month-format' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'number-of-months' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'open-after-clear' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'open-after-select' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '58c904d8',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -1937,6 +2616,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'single',
 						),
+						'value_casei_set' => 16,
 					),
 					'week-day-format' => array(),
 				),
@@ -1952,6 +2632,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
 					'requires_extension' => array(
 						'amp-date-picker',
 					),
@@ -1967,14 +2648,19 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'blocked' => array(),
 					'date' => array(),
 					'day-size' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'first-day-of-week' => array(
+						'attr_spec_id' => '8ccf5f55',
 						'value_regex' => '[0-6]',
+						'value_regex_pcre' => '/^(?:[0-6])$/uD',
 					),
 					'format' => array(),
 					'highlighted' => array(),
@@ -1988,28 +2674,36 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'overlay',
 						),
+						'value_casei_set' => 17,
 					),
 					'month-format' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'number-of-months' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'open-after-clear' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'open-after-select' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '58c904d8',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -2021,11 +2715,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'value_casei' => array(
 							'single',
 						),
+						'value_casei_set' => 16,
 					),
 					'week-day-format' => array(),
 				),
@@ -2036,6 +2732,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 9,
+					'mandatory_attrs' => array(
+						array(
+							'mode',
+						),
+					),
 					'requires_extension' => array(
 						'amp-date-picker',
 					),
@@ -2051,59 +2753,77 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'blocked' => array(),
 					'day-size' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'end-date' => array(),
 					'end-input-selector' => array(),
 					'first-day-of-week' => array(
+						'attr_spec_id' => '8ccf5f55',
 						'value_regex' => '[0-6]',
+						'value_regex_pcre' => '/^(?:[0-6])$/uD',
 					),
 					'format' => array(),
 					'fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'highlighted' => array(),
 					'locale' => array(),
 					'max' => array(),
 					'maximum-nights' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'media' => array(),
 					'min' => array(),
 					'minimum-nights' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'mode' => array(
 						'value_casei' => array(
 							'static',
 						),
+						'value_casei_set' => 15,
 					),
 					'month-format' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'number-of-months' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'open-after-clear' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'open-after-select' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '58c904d8',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -2118,6 +2838,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'range',
 						),
+						'value_casei_set' => 18,
 					),
 					'week-day-format' => array(),
 				),
@@ -2133,6 +2854,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-date-picker',
 					),
@@ -2148,55 +2875,72 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'blocked' => array(),
 					'day-size' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'end-date' => array(),
 					'end-input-selector' => array(),
 					'first-day-of-week' => array(
+						'attr_spec_id' => '8ccf5f55',
 						'value_regex' => '[0-6]',
+						'value_regex_pcre' => '/^(?:[0-6])$/uD',
 					),
 					'format' => array(),
 					'highlighted' => array(),
 					'locale' => array(),
 					'max' => array(),
 					'maximum-nights' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'media' => array(),
 					'min' => array(),
 					'minimum-nights' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'mode' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'overlay',
 						),
+						'value_casei_set' => 17,
 					),
 					'month-format' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'number-of-months' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'open-after-clear' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'open-after-select' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '58c904d8',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -2210,12 +2954,14 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'range',
 						),
+						'value_casei_set' => 18,
 					),
 					'week-day-format' => array(),
 				),
@@ -2226,6 +2972,15 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 9,
+					'mandatory_attrs' => array(
+						array(
+							'mode',
+						),
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-date-picker',
 					),
@@ -2249,6 +3004,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2262,6 +3018,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-content-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-delight-player',
 					),
@@ -2278,10 +3040,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'rtc-config' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -2313,6 +3078,15 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-app-banner',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-app-banner' => 'amp-app-banner',
+					),
+					'layout_table' => 3,
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-ad',
 					),
@@ -2328,6 +3102,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'json' => array(),
 					'media' => array(),
@@ -2335,10 +3110,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'rtc-config' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -2373,6 +3151,22 @@ class AMP_Allowed_Tags_Generated {
 						'amp-lightbox',
 						'amp-sticky-ad',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-app-banner' => 'amp-app-banner',
+						'amp-carousel' => 'amp-carousel',
+						'amp-fx-flying-carpet' => 'amp-fx-flying-carpet',
+						'amp-lightbox' => 'amp-lightbox',
+						'amp-sticky-ad' => 'amp-sticky-ad',
+					),
+					'layout_table' => 3,
+					'mandatory_attrs' => array(
+						array(
+							'data-multi-size',
+						),
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-ad',
 					),
@@ -2385,6 +3179,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-url' => array(
+						'attr_spec_id' => 'e7b0b716',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -2398,6 +3193,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2406,6 +3202,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 10,
+					'mandatory_attrs' => array(
+						array(
+							'data-url',
+						),
+					),
 					'requires_extension' => array(
 						'amp-embedly-card',
 					),
@@ -2426,6 +3228,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
+					'mandatory_attrs' => array(
+						array(
+							'value',
+						),
+					),
 					'requires_extension' => array(
 						'amp-embedly-card',
 					),
@@ -2456,6 +3264,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2469,6 +3278,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-href',
+						),
+					),
 					'requires_extension' => array(
 						'amp-facebook',
 					),
@@ -2486,6 +3301,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2499,6 +3315,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-href',
+						),
+					),
 					'requires_extension' => array(
 						'amp-facebook-comments',
 					),
@@ -2509,6 +3331,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-href' => array(
+						'attr_spec_id' => '5a5a1c43',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -2523,6 +3346,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2536,6 +3360,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-href',
+						),
+					),
 					'requires_extension' => array(
 						'amp-facebook-like',
 					),
@@ -2546,6 +3376,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-href' => array(
+						'attr_spec_id' => '5a5a1c43',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -2560,6 +3391,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2573,6 +3405,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-href',
+						),
+					),
 					'requires_extension' => array(
 						'amp-facebook-page',
 					),
@@ -2589,6 +3427,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2603,6 +3442,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
 					'requires_extension' => array(
 						'amp-fit-text',
 					),
@@ -2623,13 +3463,16 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'on-error-add-class' => array(),
 					'on-error-remove-class' => array(),
 					'on-load-add-class' => array(),
 					'on-load-remove-class' => array(),
 					'timeout' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 				),
 				'tag_spec' => array(
@@ -2638,6 +3481,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
+					'mandatory_attrs' => array(
+						array(
+							'font-family',
+						),
+					),
 					'requires_extension' => array(
 						'amp-font',
 					),
@@ -2655,9 +3504,15 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'height',
+						),
+					),
 					'requires_extension' => array(
 						'amp-fx-flying-carpet',
 					),
@@ -2672,6 +3527,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2684,7 +3540,11 @@ class AMP_Allowed_Tags_Generated {
 						'first_child_tag_name_oneof' => array(
 							'script',
 						),
+						'first_child_tag_name_set' => array(
+							'script' => true,
+						),
 					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-geo',
 					),
@@ -2703,11 +3563,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2720,6 +3582,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'data-gfyid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-gfycat',
 					),
@@ -2738,6 +3606,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2746,6 +3615,12 @@ class AMP_Allowed_Tags_Generated {
 							3,
 						),
 					),
+					'layout_table' => 11,
+					'mandatory_attrs' => array(
+						array(
+							'data-gistid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-gist',
 					),
@@ -2763,9 +3638,12 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -2787,6 +3665,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'requires_extension' => array(
 						'amp-google-document-embed',
 					),
@@ -2805,6 +3689,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2817,6 +3702,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'data-eid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-hulu',
 					),
@@ -2833,34 +3724,40 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'allowpaymentrequest' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'allowtransparency' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'frameborder' => array(
 						'value' => array(
 							'0',
 							'1',
 						),
+						'value_set' => 6,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'referrerpolicy' => array(),
 					'resizable' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'sandbox' => array(),
 					'scrolling' => array(
@@ -2869,9 +3766,12 @@ class AMP_Allowed_Tags_Generated {
 							'no',
 							'yes',
 						),
+						'value_set' => 19,
 					),
 					'src' => array(
+						'attr_spec_id' => '0610b819',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -2894,6 +3794,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
 					'requires_extension' => array(
 						'amp-iframe',
 					),
@@ -2907,9 +3808,12 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'data-src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -2918,6 +3822,7 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'data-tag' => array(
+						'attr_spec_id' => '5f427a3a',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => true,
@@ -2936,11 +3841,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'rotate-to-fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2953,6 +3860,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 12,
+					'mandatory_attrs' => array(
+						array(
+							'data-tag',
+						),
+					),
 					'requires_extension' => array(
 						'amp-ima-video',
 					),
@@ -2969,6 +3882,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -2977,6 +3891,7 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-image-lightbox',
 					),
@@ -2988,16 +3903,21 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'disable-hint-reappear' => array(),
 					'initial-slider-position' => array(
+						'attr_spec_id' => '2f895734',
 						'value_regex' => '0(\\.[0-9]+)?|1(\\.0+)?',
+						'value_regex_pcre' => '/^(?:0(\\.[0-9]+)?|1(\\.0+)?)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'step-size' => array(
+						'attr_spec_id' => '2f895734',
 						'value_regex' => '0(\\.[0-9]+)?|1(\\.0+)?',
+						'value_regex_pcre' => '/^(?:0(\\.[0-9]+)?|1(\\.0+)?)$/uD',
 					),
 				),
 				'tag_spec' => array(
@@ -3014,8 +3934,13 @@ class AMP_Allowed_Tags_Generated {
 							'amp-img',
 							'div',
 						),
+						'child_tag_name_set' => array(
+							'amp-img' => true,
+							'div' => true,
+						),
 						'mandatory_min_num_child_tags' => 2,
 					),
+					'layout_table' => 13,
 					'requires_extension' => array(
 						'amp-image-slider',
 					),
@@ -3034,20 +3959,25 @@ class AMP_Allowed_Tags_Generated {
 					'attribution' => array(),
 					'lightbox' => array(),
 					'lightbox-thumbnail-id' => array(
+						'attr_spec_id' => 'f8b423aa',
 						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+						'value_regex_casei_pcre' => '/^(?:^[a-z][a-z\\d_-]*)$/uiD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'placeholder' => array(),
 					'src' => array(
 						'alternative_names' => array(
 							'srcset',
 						),
+						'attr_spec_id' => 'e94e3ca1',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -3070,6 +4000,13 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
+					'mandatory_attrs' => array(
+						array(
+							'src',
+							'srcset',
+						),
+					),
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-img',
 				),
 			),
@@ -3085,6 +4022,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3098,6 +4036,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-imgur-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-imgur',
 					),
@@ -3116,6 +4060,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3129,6 +4074,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-shortcode',
+						),
+					),
 					'requires_extension' => array(
 						'amp-instagram',
 					),
@@ -3139,7 +4090,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-iframe-src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -3148,7 +4101,9 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'src' => array(
+						'attr_spec_id' => 'f12eba14',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => true,
@@ -3164,6 +4119,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'requires_extension' => array(
 						'amp-install-serviceworker',
 					),
@@ -3174,14 +4135,17 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-videoid' => array(
+						'attr_spec_id' => 'af5fe7aa',
 						'mandatory' => true,
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3194,6 +4158,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'data-videoid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-izlesene',
 					),
@@ -3204,14 +4174,20 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-media-id' => array(
+						'attr_spec_id' => '21858768',
 						'value_regex_casei' => '[0-9a-z]{8}',
+						'value_regex_casei_pcre' => '/^(?:[0-9a-z]{8})$/uiD',
 					),
 					'data-player-id' => array(
+						'attr_spec_id' => '01207328',
 						'mandatory' => true,
 						'value_regex_casei' => '[0-9a-z]{8}',
+						'value_regex_casei_pcre' => '/^(?:[0-9a-z]{8})$/uiD',
 					),
 					'data-playlist-id' => array(
+						'attr_spec_id' => '21858768',
 						'value_regex_casei' => '[0-9a-z]{8}',
+						'value_regex_casei_pcre' => '/^(?:[0-9a-z]{8})$/uiD',
 					),
 				),
 				'tag_spec' => array(
@@ -3225,6 +4201,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-player-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-jwplayer',
 					),
@@ -3242,6 +4224,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3255,6 +4238,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-partner',
+						),
+					),
 					'requires_extension' => array(
 						'amp-kaltura-player',
 					),
@@ -3269,6 +4258,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3284,6 +4274,7 @@ class AMP_Allowed_Tags_Generated {
 							5,
 						),
 					),
+					'layout_table' => 14,
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-layout',
 				),
 			),
@@ -3298,6 +4289,7 @@ class AMP_Allowed_Tags_Generated {
 							'fly-in-bottom',
 							'fly-in-top',
 						),
+						'value_casei_set' => 20,
 					),
 					'controls' => array(),
 					'from' => array(),
@@ -3306,6 +4298,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'scrollable' => array(),
 				),
@@ -3315,6 +4308,7 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-lightbox',
 					),
@@ -3331,6 +4325,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'binding' => array(
 						'value' => array(
@@ -3338,6 +4333,7 @@ class AMP_Allowed_Tags_Generated {
 							'no',
 							'refresh',
 						),
+						'value_set' => 21,
 					),
 					'credentials' => array(),
 					'items' => array(),
@@ -3346,6 +4342,7 @@ class AMP_Allowed_Tags_Generated {
 							'auto',
 							'manual',
 						),
+						'value_set' => 22,
 					),
 					'load-more-bookmark' => array(),
 					'max-items' => array(),
@@ -3354,6 +4351,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'reset-on-refresh' => array(
 						'value' => array(
@@ -3361,10 +4359,13 @@ class AMP_Allowed_Tags_Generated {
 							'always',
 							'fetch',
 						),
+						'value_set' => 23,
 					),
 					'single-item' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -3385,6 +4386,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
 					'requires_extension' => array(
 						'amp-list',
 					),
@@ -3398,21 +4400,25 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'load-more-end' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'load-more-failed' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'load-more-loading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3427,25 +4433,33 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-max-items-per-page' => array(
+						'attr_spec_id' => 'a748f410',
 						'mandatory' => true,
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(?:\\d+)$/uD',
 					),
 					'data-poll-interval' => array(
+						'attr_spec_id' => '89fdec66',
 						'value_regex' => '\\d{5,}',
+						'value_regex_pcre' => '/^(?:\\d{5,})$/uD',
 					),
 					'disabled' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'id' => array(
+						'attr_spec_id' => '8df4b967',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 					'sort' => array(
 						'value' => array(
 							'ascending',
 						),
+						'value_set' => 24,
 					),
 				),
 				'tag_spec' => array(
@@ -3455,6 +4469,15 @@ class AMP_Allowed_Tags_Generated {
 							3,
 						),
 					),
+					'layout_table' => 15,
+					'mandatory_attrs' => array(
+						array(
+							'data-max-items-per-page',
+						),
+						array(
+							'id',
+						),
+					),
 					'reference_points' => array(
 						'AMP-LIVE-LIST [items]' => array(
 							'mandatory' => true,
@@ -3487,6 +4510,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3495,6 +4519,12 @@ class AMP_Allowed_Tags_Generated {
 							5,
 						),
 					),
+					'layout_table' => 2,
+					'mandatory_attrs' => array(
+						array(
+							'data-formula',
+						),
+					),
 					'requires_extension' => array(
 						'amp-mathml',
 					),
@@ -3513,6 +4543,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3526,6 +4557,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-mediaid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-mowplayer',
 					),
@@ -3557,7 +4594,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -3568,6 +4607,11 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'reference_points' => array(
 						'AMP-NEXT-PAGE > [separator]' => array(
 							'mandatory' => false,
@@ -3595,9 +4639,21 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'adsense',
 						),
+						'value_set' => 25,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'data-client',
+						),
+						array(
+							'data-slot',
+						),
+						array(
+							'type',
+						),
+					),
 					'reference_points' => array(
 						'AMP-NEXT-PAGE > [separator]' => array(
 							'mandatory' => false,
@@ -3620,16 +4676,20 @@ class AMP_Allowed_Tags_Generated {
 						'mandatory' => true,
 					),
 					'data-mediaid' => array(
+						'attr_spec_id' => '164eeb38',
 						'mandatory' => true,
 						'value_regex' => '[^=/?:]+',
+						'value_regex_pcre' => '/^(?:[^=\\/?:]+)$/uD',
 					),
 					'data-mode' => array(
 						'value' => array(
 							'api',
 							'static',
 						),
+						'value_set' => 26,
 					),
 					'data-origin' => array(
+						'attr_spec_id' => 'f3148bd2',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -3647,12 +4707,14 @@ class AMP_Allowed_Tags_Generated {
 							'playlist-marked',
 							'video',
 						),
+						'value_set' => 27,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3666,6 +4728,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-client',
+						),
+						array(
+							'data-mediaid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-nexxtv-player',
 					),
@@ -3686,6 +4757,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3699,6 +4771,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-bcid',
+						),
+						array(
+							'data-pid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-o2-player',
 					),
@@ -3722,6 +4803,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3733,6 +4815,18 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 1,
+					'mandatory_attrs' => array(
+						array(
+							'data-embedcode',
+						),
+						array(
+							'data-pcode',
+						),
+						array(
+							'data-playerid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-ooyala-player',
 					),
@@ -3743,19 +4837,26 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'alpha-range' => array(
+						'attr_spec_id' => '17782009',
 						'value_regex' => '(\\d+)\\s{1}(\\d+)',
+						'value_regex_pcre' => '/^(?:(\\d+)\\s{1}(\\d+))$/uD',
 					),
 					'beta-range' => array(
+						'attr_spec_id' => '17782009',
 						'value_regex' => '(\\d+)\\s{1}(\\d+)',
+						'value_regex_pcre' => '/^(?:(\\d+)\\s{1}(\\d+))$/uD',
 					),
 					'gamma-range' => array(
+						'attr_spec_id' => '17782009',
 						'value_regex' => '(\\d+)\\s{1}(\\d+)',
+						'value_regex_pcre' => '/^(?:(\\d+)\\s{1}(\\d+))$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3764,6 +4865,7 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-orientation-observer',
 					),
@@ -3777,29 +4879,40 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'initial-scale' => array(
+						'attr_spec_id' => '797c4e44',
 						'value_regex' => '[0-9]+(\\.[0-9]+)?',
+						'value_regex_pcre' => '/^(?:[0-9]+(\\.[0-9]+)?)$/uD',
 					),
 					'initial-x' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'initial-y' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'max-scale' => array(
+						'attr_spec_id' => '797c4e44',
 						'value_regex' => '[0-9]+(\\.[0-9]+)?',
+						'value_regex_pcre' => '/^(?:[0-9]+(\\.[0-9]+)?)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'reset-on-resize' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3811,6 +4924,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 16,
 					'requires_extension' => array(
 						'amp-pan-zoom',
 					),
@@ -3829,6 +4943,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -3842,6 +4957,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-do',
+						),
+					),
 					'requires_extension' => array(
 						'amp-pinterest',
 					),
@@ -3858,14 +4979,18 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'referrerpolicy' => array(
 						'value' => array(
 							'no-referrer',
 						),
+						'value_set' => 28,
 					),
 					'src' => array(
+						'attr_spec_id' => 'ea15711b',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_empty' => true,
@@ -3885,6 +5010,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 17,
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-pixel',
 				),
 			),
@@ -3897,6 +5028,7 @@ class AMP_Allowed_Tags_Generated {
 							'false',
 							'true',
 						),
+						'value_casei_set' => 2,
 					),
 					'data-item' => array(),
 					'data-item-info' => array(
@@ -3904,18 +5036,21 @@ class AMP_Allowed_Tags_Generated {
 							'false',
 							'true',
 						),
+						'value_casei_set' => 2,
 					),
 					'data-share-buttons' => array(
 						'value_casei' => array(
 							'false',
 							'true',
 						),
+						'value_casei_set' => 2,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(),
 				),
@@ -3926,6 +5061,7 @@ class AMP_Allowed_Tags_Generated {
 							3,
 						),
 					),
+					'layout_table' => 18,
 					'requires_extension' => array(
 						'amp-playbuzz',
 					),
@@ -3936,22 +5072,28 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'intersection-ratios' => array(
+						'attr_spec_id' => '725d5668',
 						'value_regex' => '^([0]*?\\.\\d*$|1$|0$)|([0]*?\\.\\d*|1|0)\\s{1}([0]*?\\.\\d*$|1$|0$)',
+						'value_regex_pcre' => '/^(?:^([0]*?\\.\\d*$|1$|0$)|([0]*?\\.\\d*|1|0)\\s{1}([0]*?\\.\\d*$|1$|0$))$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'once' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'target' => array(),
 					'viewport-margins' => array(
+						'attr_spec_id' => 'c567e624',
 						'value_regex' => '^(\\d+$|\\d+px$|\\d+vh$)|((\\d+|\\d+px|\\d+vh)\\s{1}(\\d+$|\\d+px$|\\d+vh$))',
+						'value_regex_pcre' => '/^(?:^(\\d+$|\\d+px$|\\d+vh$)|((\\d+|\\d+px|\\d+vh)\\s{1}(\\d+$|\\d+px$|\\d+vh$)))$/uD',
 					),
 				),
 				'tag_spec' => array(
@@ -3960,6 +5102,7 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-position-observer',
 					),
@@ -3972,22 +5115,29 @@ class AMP_Allowed_Tags_Generated {
 					'[data-referrer]' => array(),
 					'autoplay' => array(),
 					'data-account' => array(
+						'attr_spec_id' => '105717d8',
 						'mandatory' => true,
 						'value_regex' => '[0-9a-zA-Z-]+',
+						'value_regex_pcre' => '/^(?:[0-9a-zA-Z-]+)$/uD',
 					),
 					'data-player' => array(
+						'attr_spec_id' => '105717d8',
 						'mandatory' => true,
 						'value_regex' => '[0-9a-zA-Z-]+',
+						'value_regex_pcre' => '/^(?:[0-9a-zA-Z-]+)$/uD',
 					),
 					'data-terms' => array(),
 					'data-video' => array(
+						'attr_spec_id' => '9e61c2aa',
 						'value_regex' => '[0-9a-zA-Z-]+',
+						'value_regex_pcre' => '/^(?:[0-9a-zA-Z-]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4001,6 +5151,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-account',
+						),
+						array(
+							'data-player',
+						),
+					),
 					'requires_extension' => array(
 						'amp-powr-player',
 					),
@@ -4012,14 +5171,17 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-embed-id' => array(
+						'attr_spec_id' => '48982bfb',
 						'mandatory' => true,
 						'value_regex' => '[0-9a-z-]+',
+						'value_regex_pcre' => '/^(?:[0-9a-z-]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4032,6 +5194,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'data-embed-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-reach-player',
 					),
@@ -4048,7 +5216,9 @@ class AMP_Allowed_Tags_Generated {
 						'mandatory' => true,
 					),
 					'name' => array(
+						'attr_spec_id' => 'a925029b',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 				),
@@ -4058,7 +5228,19 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'data-action',
+						),
+						array(
+							'data-sitekey',
+						),
+						array(
+							'name',
+						),
+					),
 					'requires_extension' => array(
 						'amp-form',
 						'amp-recaptcha-input',
@@ -4074,12 +5256,14 @@ class AMP_Allowed_Tags_Generated {
 							'false',
 							'true',
 						),
+						'value_casei_set' => 2,
 					),
 					'data-embedparent' => array(
 						'value_casei' => array(
 							'false',
 							'true',
 						),
+						'value_casei_set' => 2,
 					),
 					'data-embedtype' => array(
 						'mandatory' => true,
@@ -4087,6 +5271,7 @@ class AMP_Allowed_Tags_Generated {
 							'comment',
 							'post',
 						),
+						'value_casei_set' => 29,
 					),
 					'data-src' => array(
 						'mandatory' => true,
@@ -4096,6 +5281,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4109,6 +5295,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-embedtype',
+						),
+						array(
+							'data-src',
+						),
+					),
 					'requires_extension' => array(
 						'amp-reddit',
 					),
@@ -4119,14 +5314,17 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-riddle-id' => array(
+						'attr_spec_id' => 'af5fe7aa',
 						'mandatory' => true,
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4135,6 +5333,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 10,
+					'mandatory_attrs' => array(
+						array(
+							'data-riddle-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-riddle-quiz',
 					),
@@ -4151,6 +5355,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'form' => array(),
 					'keyboard-select-mode' => array(
@@ -4159,20 +5364,25 @@ class AMP_Allowed_Tags_Generated {
 							'none',
 							'select',
 						),
+						'value_casei_set' => 30,
 					),
 					'media' => array(),
 					'multiple' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4189,6 +5399,10 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-selector',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-selector' => 'amp-selector',
+					),
+					'layout_table' => 19,
 					'reference_points' => array(
 						'AMP-SELECTOR child' => array(
 							'mandatory' => false,
@@ -4213,12 +5427,14 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'side' => array(
 						'value' => array(
 							'left',
 							'right',
 						),
+						'value_set' => 31,
 					),
 				),
 				'tag_spec' => array(
@@ -4230,6 +5446,10 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-story',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-story' => 'amp-story',
+					),
+					'layout_table' => 6,
 					'mandatory_parent' => 'body',
 					'requires_extension' => array(
 						'amp-sidebar',
@@ -4245,6 +5465,7 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'mandatory_parent' => 'amp-story',
 					'requires_extension' => array(
 						'amp-sidebar',
@@ -4259,7 +5480,9 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'custom-redirect-domain' => array(),
 					'custom-tracking-id' => array(
+						'attr_spec_id' => 'ad41d410',
 						'value_regex_casei' => '^.{0,50}$',
+						'value_regex_casei_pcre' => '/^(?:^.{0,50}$)$/uiD',
 					),
 					'excluded-domains' => array(),
 					'link-selector' => array(),
@@ -4268,16 +5491,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'publisher-code' => array(
+						'attr_spec_id' => '9c4e5fce',
 						'mandatory' => true,
 						'value_regex_casei' => '^[0-9]+X[0-9]+$',
+						'value_regex_casei_pcre' => '/^(?:^[0-9]+X[0-9]+$)$/uiD',
 					),
 					'tracking' => array(
 						'value' => array(
 							'false',
 							'true',
 						),
+						'value_set' => 2,
 					),
 				),
 				'tag_spec' => array(
@@ -4286,6 +5513,12 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
+					'mandatory_attrs' => array(
+						array(
+							'publisher-code',
+						),
+					),
 					'requires_extension' => array(
 						'amp-skimlinks',
 					),
@@ -4296,7 +5529,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-share-endpoint' => array(
+						'attr_spec_id' => 'b4b1583d',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -4326,6 +5561,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'mandatory' => true,
@@ -4343,6 +5579,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 20,
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-social-share',
 					),
@@ -4353,28 +5595,38 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-color' => array(
+						'attr_spec_id' => '0ef11dc2',
 						'value_regex_casei' => '([0-9a-f]{3}){1,2}',
+						'value_regex_casei_pcre' => '/^(?:([0-9a-f]{3}){1,2})$/uiD',
 					),
 					'data-playlistid' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'data-secret-token' => array(
+						'attr_spec_id' => '2529dbb6',
 						'value_regex' => '[A-Za-z0-9_-]+',
+						'value_regex_pcre' => '/^(?:[A-Za-z0-9_-]+)$/uD',
 					),
 					'data-trackid' => array(
+						'attr_spec_id' => 'ebccf4eb',
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'data-visual' => array(
 						'value_casei' => array(
 							'false',
 							'true',
 						),
+						'value_casei_set' => 2,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4383,6 +5635,7 @@ class AMP_Allowed_Tags_Generated {
 							3,
 						),
 					),
+					'layout_table' => 11,
 					'requires_extension' => array(
 						'amp-soundcloud',
 					),
@@ -4407,20 +5660,26 @@ class AMP_Allowed_Tags_Generated {
 							'playlist',
 							'video',
 						),
+						'value_casei_set' => 32,
 					),
 					'data-player-id' => array(
+						'attr_spec_id' => 'e19bc831',
 						'mandatory' => true,
 						'value_regex_casei' => '[a-z0-9]+',
+						'value_regex_casei_pcre' => '/^(?:[a-z0-9]+)$/uiD',
 					),
 					'data-site-id' => array(
+						'attr_spec_id' => 'af5fe7aa',
 						'mandatory' => true,
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4432,6 +5691,27 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 1,
+					'mandatory_attrs' => array(
+						array(
+							'data-content-id',
+						),
+						array(
+							'data-domain',
+						),
+						array(
+							'data-items',
+						),
+						array(
+							'data-mode',
+						),
+						array(
+							'data-player-id',
+						),
+						array(
+							'data-site-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-springboard-player',
 					),
@@ -4444,12 +5724,16 @@ class AMP_Allowed_Tags_Generated {
 					'[src]' => array(),
 					'credentials' => array(),
 					'id' => array(
+						'attr_spec_id' => '8df4b967',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 					'overridable' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -4463,6 +5747,14 @@ class AMP_Allowed_Tags_Generated {
 						'first_child_tag_name_oneof' => array(
 							'script',
 						),
+						'first_child_tag_name_set' => array(
+							'script' => true,
+						),
+					),
+					'mandatory_attrs' => array(
+						array(
+							'id',
+						),
 					),
 					'requires_extension' => array(
 						'amp-bind',
@@ -4480,6 +5772,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4492,11 +5785,18 @@ class AMP_Allowed_Tags_Generated {
 						'first_child_tag_name_oneof' => array(
 							'amp-ad',
 						),
+						'first_child_tag_name_set' => array(
+							'amp-ad' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
 					'disallowed_ancestor' => array(
 						'amp-app-banner',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-app-banner' => 'amp-app-banner',
+					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-sticky-ad',
 					),
@@ -4508,6 +5808,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'background-audio' => array(
+						'attr_spec_id' => 'c50d3096',
 						'value_url' => array(
 							'protocol' => array(
 								'http',
@@ -4516,6 +5817,7 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'bookend-config-src' => array(
+						'attr_spec_id' => 'c50d3096',
 						'value_url' => array(
 							'protocol' => array(
 								'http',
@@ -4524,6 +5826,7 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'poster-landscape-src' => array(
+						'attr_spec_id' => 'c50d3096',
 						'value_url' => array(
 							'protocol' => array(
 								'http',
@@ -4532,6 +5835,7 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'poster-portrait-src' => array(
+						'attr_spec_id' => 'e937a28e',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -4541,6 +5845,7 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'poster-square-src' => array(
+						'attr_spec_id' => 'c50d3096',
 						'value_url' => array(
 							'protocol' => array(
 								'http',
@@ -4552,6 +5857,7 @@ class AMP_Allowed_Tags_Generated {
 						'mandatory' => true,
 					),
 					'publisher-logo-src' => array(
+						'attr_spec_id' => 'e937a28e',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -4565,11 +5871,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'supports-landscape' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'title' => array(
 						'mandatory' => true,
@@ -4588,8 +5896,36 @@ class AMP_Allowed_Tags_Generated {
 							'amp-story-bookend',
 							'amp-story-page',
 						),
+						'child_tag_name_set' => array(
+							'amp-analytics' => true,
+							'amp-consent' => true,
+							'amp-geo' => true,
+							'amp-pixel' => true,
+							'amp-sidebar' => true,
+							'amp-story-access' => true,
+							'amp-story-auto-ads' => true,
+							'amp-story-bookend' => true,
+							'amp-story-page' => true,
+						),
 						'mandatory_min_num_child_tags' => 1,
 					),
+					'mandatory_attrs' => array(
+						array(
+							'poster-portrait-src',
+						),
+						array(
+							'publisher',
+						),
+						array(
+							'publisher-logo-src',
+						),
+						array(
+							'standalone',
+						),
+						array(
+							'title',
+						),
+					),
 					'mandatory_parent' => 'body',
 					'requires_extension' => array(
 						'amp-story',
@@ -4605,12 +5941,14 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'type' => array(
 						'value' => array(
 							'blocking',
 							'notification',
 						),
+						'value_set' => 33,
 					),
 				),
 				'tag_spec' => array(
@@ -4642,8 +5980,10 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'nodisplay',
 						),
+						'value_set' => 34,
 					),
 					'src' => array(
+						'attr_spec_id' => 'c50d3096',
 						'value_url' => array(
 							'protocol' => array(
 								'http',
@@ -4655,6 +5995,11 @@ class AMP_Allowed_Tags_Generated {
 				'tag_spec' => array(
 					'descendant_tag_list' => 'amp-story-bookend-allowed-descendants',
 					'mandatory_ancestor' => 'amp-story',
+					'mandatory_attrs' => array(
+						array(
+							'layout',
+						),
+					),
 				),
 			),
 		),
@@ -4662,7 +6007,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'id' => array(
+						'attr_spec_id' => '8df4b967',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 				),
@@ -4676,8 +6023,17 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'script',
 						),
+						'child_tag_name_set' => array(
+							'script' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
+					'layout_table' => 6,
+					'mandatory_attrs' => array(
+						array(
+							'id',
+						),
+					),
 					'mandatory_parent' => 'amp-consent',
 					'requires_extension' => array(
 						'amp-consent',
@@ -4712,11 +6068,17 @@ class AMP_Allowed_Tags_Generated {
 							'thirds',
 							'vertical',
 						),
+						'value_set' => 35,
 					),
 				),
 				'tag_spec' => array(
 					'descendant_tag_list' => 'amp-story-grid-layer-allowed-descendants',
 					'mandatory_ancestor' => 'amp-story-page',
+					'mandatory_attrs' => array(
+						array(
+							'template',
+						),
+					),
 					'reference_points' => array(
 						'AMP-STORY-GRID-LAYER animate-in' => array(
 							'mandatory' => false,
@@ -4735,6 +6097,7 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'auto-advance-after' => array(),
 					'background-audio' => array(
+						'attr_spec_id' => 'c50d3096',
 						'value_url' => array(
 							'protocol' => array(
 								'http',
@@ -4743,7 +6106,9 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'id' => array(
+						'attr_spec_id' => '8df4b967',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 				),
@@ -4756,8 +6121,20 @@ class AMP_Allowed_Tags_Generated {
 							'amp-story-grid-layer',
 							'amp-story-page-attachment',
 						),
+						'child_tag_name_set' => array(
+							'amp-analytics' => true,
+							'amp-pixel' => true,
+							'amp-story-cta-layer' => true,
+							'amp-story-grid-layer' => true,
+							'amp-story-page-attachment' => true,
+						),
 						'mandatory_min_num_child_tags' => 1,
 					),
+					'mandatory_attrs' => array(
+						array(
+							'id',
+						),
+					),
 					'mandatory_parent' => 'amp-story',
 					'requires_extension' => array(
 						'amp-story',
@@ -4773,11 +6150,17 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'nodisplay',
 						),
+						'value_set' => 34,
 					),
 				),
 				'tag_spec' => array(
 					'descendant_tag_list' => 'amp-story-page-attachment-allowed-descendants',
 					'mandatory_ancestor' => 'amp-story-page',
+					'mandatory_attrs' => array(
+						array(
+							'layout',
+						),
+					),
 				),
 			),
 		),
@@ -4787,11 +6170,15 @@ class AMP_Allowed_Tags_Generated {
 					'[datetime]' => array(),
 					'[title]' => array(),
 					'cutoff' => array(
+						'attr_spec_id' => 'c12c134b',
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(?:\\d+)$/uD',
 					),
 					'datetime' => array(
+						'attr_spec_id' => 'f2f24a29',
 						'mandatory' => true,
 						'value_regex' => '\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d(:[0-5]\\d(\\.\\d+)?)?(Z|[+-][0-1][0-9]:[0-5][0-9])',
+						'value_regex_pcre' => '/^(?:\\d{4}-[01]\\d-[0-3]\\dT[0-2]\\d:[0-5]\\d(:[0-5]\\d(\\.\\d+)?)?(Z|[+-][0-1][0-9]:[0-5][0-9]))$/uD',
 					),
 					'locale' => array(),
 					'media' => array(),
@@ -4799,6 +6186,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4809,6 +6197,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 21,
+					'mandatory_attrs' => array(
+						array(
+							'datetime',
+						),
+					),
 					'requires_extension' => array(
 						'amp-timeago',
 					),
@@ -4824,17 +6218,22 @@ class AMP_Allowed_Tags_Generated {
 					'data-limit' => array(),
 					'data-link-color' => array(),
 					'data-momentid' => array(
+						'attr_spec_id' => 'c12c134b',
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(?:\\d+)$/uD',
 					),
 					'data-theme' => array(),
 					'data-timeline-id' => array(
+						'attr_spec_id' => 'c12c134b',
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(?:\\d+)$/uD',
 					),
 					'data-timeline-owner-screen-name' => array(),
 					'data-timeline-screen-name' => array(),
 					'data-timeline-slug' => array(),
 					'data-timeline-source-type' => array(),
 					'data-timeline-url' => array(
+						'attr_spec_id' => '52e435b2',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -4844,7 +6243,9 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'data-timeline-user-id' => array(
+						'attr_spec_id' => 'c12c134b',
 						'value_regex' => '\\d+',
+						'value_regex_pcre' => '/^(?:\\d+)$/uD',
 					),
 					'data-tweetid' => array(),
 					'media' => array(),
@@ -4852,6 +6253,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4866,6 +6268,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
 					'requires_extension' => array(
 						'amp-twitter',
 					),
@@ -4876,6 +6279,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-dismiss-href' => array(
+						'attr_spec_id' => 'c1102f08',
 						'value_url' => array(
 							'allow_empty' => false,
 							'allow_relative' => false,
@@ -4885,6 +6289,7 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'data-show-if-href' => array(
+						'attr_spec_id' => 'c1102f08',
 						'value_url' => array(
 							'allow_empty' => false,
 							'allow_relative' => false,
@@ -4897,12 +6302,14 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'application/x-www-form-urlencoded',
 						),
+						'value_set' => 36,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -4911,6 +6318,7 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
 					'requires_extension' => array(
 						'amp-user-notification',
 					),
@@ -4941,11 +6349,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'controls' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'controlslist' => array(),
 					'crossorigin' => array(),
@@ -4953,6 +6363,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'dock' => array(
 						'requires_extension' => array(
@@ -4961,28 +6372,34 @@ class AMP_Allowed_Tags_Generated {
 					),
 					'lightbox' => array(),
 					'lightbox-thumbnail-id' => array(
+						'attr_spec_id' => 'f8b423aa',
 						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+						'value_regex_casei_pcre' => '/^(?:^[a-z][a-z\\d_-]*)$/uiD',
 					),
 					'loop' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'muted' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'noaudio' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'placeholder' => array(),
 					'poster' => array(),
@@ -4993,14 +6410,18 @@ class AMP_Allowed_Tags_Generated {
 							'none',
 							'',
 						),
+						'value_set' => 37,
 					),
 					'rotate-to-fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -5026,6 +6447,10 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-story',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-story' => 'amp-story',
+					),
+					'layout_table' => 4,
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-video',
 				),
 			),
@@ -5052,11 +6477,13 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'controls' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'controlslist' => array(),
 					'crossorigin' => array(),
@@ -5064,6 +6491,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'dock' => array(
 						'requires_extension' => array(
@@ -5074,22 +6502,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'media' => array(),
 					'muted' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'noaudio' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'placeholder' => array(),
 					'poster' => array(
@@ -5102,14 +6534,18 @@ class AMP_Allowed_Tags_Generated {
 							'none',
 							'',
 						),
+						'value_set' => 37,
 					),
 					'rotate-to-fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -5129,7 +6565,13 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
 					'mandatory_ancestor' => 'amp-story',
+					'mandatory_attrs' => array(
+						array(
+							'poster',
+						),
+					),
 					'requires_extension' => array(
 						'amp-video',
 					),
@@ -5151,6 +6593,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'dock' => array(
 						'requires_extension' => array(
@@ -5161,21 +6604,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'implements-rotate-to-fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'lightbox' => array(),
 					'lightbox-thumbnail-id' => array(
+						'attr_spec_id' => 'f8b423aa',
 						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+						'value_regex_casei_pcre' => '/^(?:^[a-z][a-z\\d_-]*)$/uiD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'poster' => array(
 						'mandatory' => true,
@@ -5185,9 +6633,12 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => 'da64dcca',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -5208,6 +6659,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
+					'mandatory_attrs' => array(
+						array(
+							'poster',
+						),
+						array(
+							'src',
+						),
+					),
 					'requires_extension' => array(
 						'amp-video-iframe',
 					),
@@ -5227,6 +6687,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'dock' => array(
 						'requires_extension' => array(
@@ -5237,30 +6698,38 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'implements-rotate-to-fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'lightbox' => array(),
 					'lightbox-thumbnail-id' => array(
+						'attr_spec_id' => 'f8b423aa',
 						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+						'value_regex_casei_pcre' => '/^(?:^[a-z][a-z\\d_-]*)$/uiD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'referrerpolicy' => array(),
 					'rotate-to-fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'src' => array(
+						'attr_spec_id' => 'da64dcca',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -5281,6 +6750,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 5,
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'reference_points' => array(
 						'AMP-VIDEO-IFRAME > [placeholder]' => array(
 							'mandatory' => true,
@@ -5302,16 +6777,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'data-videoid' => array(
+						'attr_spec_id' => 'af5fe7aa',
 						'mandatory' => true,
 						'value_regex' => '[0-9]+',
+						'value_regex_pcre' => '/^(?:[0-9]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -5324,6 +6803,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'data-videoid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-vimeo',
 					),
@@ -5341,6 +6826,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -5354,6 +6840,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-vineid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-vine',
 					),
@@ -5365,8 +6857,10 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'autoplay' => array(),
 					'data-profileid' => array(
+						'attr_spec_id' => 'a9deaa1a',
 						'mandatory' => true,
 						'value_regex' => '[0-9a-f]*',
+						'value_regex_pcre' => '/^(?:[0-9a-f]*)$/uD',
 					),
 					'data-videoid' => array(
 						'mandatory' => true,
@@ -5376,6 +6870,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -5388,6 +6883,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'data-profileid',
+						),
+						array(
+							'data-videoid',
+						),
+					),
 					'requires_extension' => array(
 						'amp-viqeo-player',
 					),
@@ -5405,6 +6909,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -5415,6 +6920,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 22,
+					'mandatory_attrs' => array(
+						array(
+							'data-embedtype',
+						),
+					),
 					'requires_extension' => array(
 						'amp-vk',
 					),
@@ -5425,6 +6936,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'helper-iframe-url' => array(
+						'attr_spec_id' => 'e7b0b716',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -5438,14 +6950,17 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-web-push',
 						),
+						'value_set' => 38,
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'permission-dialog-url' => array(
+						'attr_spec_id' => 'e7b0b716',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -5455,6 +6970,7 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'service-worker-url' => array(
+						'attr_spec_id' => 'e7b0b716',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -5470,6 +6986,21 @@ class AMP_Allowed_Tags_Generated {
 							1,
 						),
 					),
+					'layout_table' => 6,
+					'mandatory_attrs' => array(
+						array(
+							'helper-iframe-url',
+						),
+						array(
+							'id',
+						),
+						array(
+							'permission-dialog-url',
+						),
+						array(
+							'service-worker-url',
+						),
+					),
 					'requires_extension' => array(
 						'amp-web-push',
 					),
@@ -5485,6 +7016,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'visibility' => array(
 						'mandatory' => true,
@@ -5493,6 +7025,7 @@ class AMP_Allowed_Tags_Generated {
 							'subscribed',
 							'unsubscribed',
 						),
+						'value_set' => 39,
 					),
 				),
 				'tag_spec' => array(
@@ -5501,6 +7034,12 @@ class AMP_Allowed_Tags_Generated {
 							2,
 						),
 					),
+					'layout_table' => 23,
+					'mandatory_attrs' => array(
+						array(
+							'visibility',
+						),
+					),
 					'requires_extension' => array(
 						'amp-web-push',
 					),
@@ -5512,19 +7051,23 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'data-media-hashed-id' => array(
+						'attr_spec_id' => 'd93cd76d',
 						'mandatory' => true,
 						'value_regex' => '[0-9a-zA-Z]+',
+						'value_regex_pcre' => '/^(?:[0-9a-zA-Z]+)$/uD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'rotate-to-fullscreen' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -5537,6 +7080,12 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 0,
+					'mandatory_attrs' => array(
+						array(
+							'data-media-hashed-id',
+						),
+					),
 					'requires_extension' => array(
 						'amp-wistia-player',
 					),
@@ -5557,6 +7106,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -5570,6 +7120,15 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
+					'mandatory_attrs' => array(
+						array(
+							'data-app-key',
+						),
+						array(
+							'data-widget-type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-yotpo',
 					),
@@ -5587,12 +7146,17 @@ class AMP_Allowed_Tags_Generated {
 							'include',
 							'omit',
 						),
+						'value_casei_set' => 40,
 					),
 					'data-live-channelid' => array(
+						'attr_spec_id' => '008818a9',
 						'value_regex' => '[^=/?:]+',
+						'value_regex_pcre' => '/^(?:[^=\\/?:]+)$/uD',
 					),
 					'data-videoid' => array(
+						'attr_spec_id' => '008818a9',
 						'value_regex' => '[^=/?:]+',
+						'value_regex_pcre' => '/^(?:[^=\\/?:]+)$/uD',
 					),
 					'dock' => array(
 						'requires_extension' => array(
@@ -5601,13 +7165,16 @@ class AMP_Allowed_Tags_Generated {
 					),
 					'lightbox' => array(),
 					'lightbox-thumbnail-id' => array(
+						'attr_spec_id' => 'f8b423aa',
 						'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+						'value_regex_casei_pcre' => '/^(?:^[a-z][a-z\\d_-]*)$/uiD',
 					),
 					'media' => array(),
 					'noloading' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -5621,6 +7188,7 @@ class AMP_Allowed_Tags_Generated {
 							4,
 						),
 					),
+					'layout_table' => 4,
 					'requires_extension' => array(
 						'amp-youtube',
 					),
@@ -5648,7 +7216,9 @@ class AMP_Allowed_Tags_Generated {
 					'muted' => array(),
 					'preload' => array(),
 					'src' => array(
+						'attr_spec_id' => '0601509a',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -5678,6 +7248,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'/',
 						),
+						'value_set' => 41,
 					),
 					'target' => array(
 						'value_casei' => array(
@@ -5685,6 +7256,7 @@ class AMP_Allowed_Tags_Generated {
 							'_self',
 							'_top',
 						),
+						'value_casei_set' => 0,
 					),
 				),
 				'tag_spec' => array(
@@ -5718,7 +7290,9 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'align' => array(),
 					'cite' => array(
+						'attr_spec_id' => '5d48c103',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -5758,9 +7332,12 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'role' => array(),
 					'tabindex' => array(),
@@ -5772,12 +7349,15 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'open-button' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'role' => array(),
 					'tabindex' => array(),
@@ -5866,7 +7446,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -5956,7 +7538,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -6081,7 +7665,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -6108,7 +7694,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'cite' => array(
+						'attr_spec_id' => '5d48c103',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -6126,7 +7714,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'xml:lang' => array(),
 					'xml:space' => array(),
@@ -6147,6 +7737,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(),
@@ -6180,6 +7771,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'verify-error',
+						),
+					),
 					'spec_name' => 'FORM DIV [verify-error]',
 				),
 			),
@@ -6195,6 +7791,14 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'template',
+						),
+						array(
+							'verify-error',
+						),
+					),
 					'spec_name' => 'FORM DIV [verify-error][template]',
 				),
 			),
@@ -6207,6 +7811,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'submitting',
+						),
+					),
 					'spec_name' => 'FORM DIV [submitting]',
 				),
 			),
@@ -6222,6 +7831,14 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'submitting',
+						),
+						array(
+							'template',
+						),
+					),
 					'spec_name' => 'FORM DIV [submitting][template]',
 				),
 			),
@@ -6234,6 +7851,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'submit-success',
+						),
+					),
 					'spec_name' => 'FORM DIV [submit-success]',
 				),
 			),
@@ -6249,6 +7871,14 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'submit-success',
+						),
+						array(
+							'template',
+						),
+					),
 					'spec_name' => 'FORM DIV [submit-success][template]',
 				),
 			),
@@ -6261,6 +7891,11 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'submit-error',
+						),
+					),
 					'spec_name' => 'FORM DIV [submit-error]',
 				),
 			),
@@ -6276,6 +7911,14 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form',
+					'mandatory_attrs' => array(
+						array(
+							'submit-error',
+						),
+						array(
+							'template',
+						),
+					),
 					'spec_name' => 'FORM DIV [submit-error][template]',
 				),
 			),
@@ -6286,6 +7929,11 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'first',
+						),
+					),
 					'mandatory_parent' => 'amp-image-slider',
 					'spec_name' => 'AMP-IMAGE-SLIDER > DIV [first]',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-image-slider',
@@ -6298,6 +7946,11 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'second',
+						),
+					),
 					'mandatory_parent' => 'amp-image-slider',
 					'spec_name' => 'AMP-IMAGE-SLIDER > DIV [second]',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-image-slider',
@@ -6381,7 +8034,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -6470,7 +8125,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -6562,7 +8219,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -6645,7 +8304,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -6731,7 +8392,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -6814,7 +8477,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -6843,7 +8508,9 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'in' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'xml:lang' => array(),
 					'xml:space' => array(),
@@ -6918,7 +8585,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -6948,7 +8617,9 @@ class AMP_Allowed_Tags_Generated {
 					'[disabled]' => array(),
 					'disabled' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 				),
 				'tag_spec' => array(),
@@ -7028,7 +8699,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -7046,6 +8719,7 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => '68aed127',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -7082,7 +8756,9 @@ class AMP_Allowed_Tags_Generated {
 					'accept' => array(),
 					'accept-charset' => array(),
 					'action' => array(
+						'attr_spec_id' => 'da64dcca',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -7091,7 +8767,9 @@ class AMP_Allowed_Tags_Generated {
 						),
 					),
 					'action-xhr' => array(
+						'attr_spec_id' => '93d9430a',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'protocol' => array(
 								'https',
@@ -7106,15 +8784,19 @@ class AMP_Allowed_Tags_Generated {
 							'show-all-on-submit',
 							'show-first-on-submit',
 						),
+						'value_set' => 42,
 					),
 					'enctype' => array(),
 					'method' => array(
 						'value_casei' => array(
 							'get',
 						),
+						'value_casei_set' => 43,
 					),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'novalidate' => array(),
 					'target' => array(
@@ -7123,9 +8805,12 @@ class AMP_Allowed_Tags_Generated {
 							'_blank',
 							'_top',
 						),
+						'value_casei_set' => 44,
 					),
 					'verify-xhr' => array(
+						'attr_spec_id' => '93d9430a',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'protocol' => array(
 								'https',
@@ -7137,6 +8822,17 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-app-banner',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-app-banner' => 'amp-app-banner',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'action',
+						),
+						array(
+							'target',
+						),
+					),
 					'requires_extension' => array(
 						'amp-form',
 					),
@@ -7148,7 +8844,9 @@ class AMP_Allowed_Tags_Generated {
 					'accept' => array(),
 					'accept-charset' => array(),
 					'action-xhr' => array(
+						'attr_spec_id' => 'da64dcca',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -7164,6 +8862,7 @@ class AMP_Allowed_Tags_Generated {
 							'show-all-on-submit',
 							'show-first-on-submit',
 						),
+						'value_set' => 42,
 					),
 					'enctype' => array(),
 					'method' => array(
@@ -7172,9 +8871,12 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'post',
 						),
+						'value_casei_set' => 45,
 					),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'novalidate' => array(),
 					'target' => array(
@@ -7182,9 +8884,12 @@ class AMP_Allowed_Tags_Generated {
 							'_blank',
 							'_top',
 						),
+						'value_casei_set' => 44,
 					),
 					'verify-xhr' => array(
+						'attr_spec_id' => '93d9430a',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'protocol' => array(
 								'https',
@@ -7196,6 +8901,17 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-app-banner',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-app-banner' => 'amp-app-banner',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'action-xhr',
+						),
+						array(
+							'method',
+						),
+					),
 					'requires_extension' => array(
 						'amp-form',
 					),
@@ -7263,7 +8979,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -7348,7 +9066,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -7434,7 +9154,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -7451,6 +9173,7 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => '68aed127',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -7553,7 +9276,9 @@ class AMP_Allowed_Tags_Generated {
 					'g2' => array(),
 					'k' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'u1' => array(),
 					'u2' => array(),
@@ -7599,16 +9324,20 @@ class AMP_Allowed_Tags_Generated {
 							'0',
 							'1',
 						),
+						'value_set' => 6,
 					),
 					'height' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'referrerpolicy' => array(),
 					'resizable' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'sandbox' => array(),
 					'scrolling' => array(
@@ -7617,9 +9346,12 @@ class AMP_Allowed_Tags_Generated {
 							'yes',
 							'no',
 						),
+						'value_set' => 19,
 					),
 					'src' => array(
+						'attr_spec_id' => '0601509a',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -7700,7 +9432,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -7720,7 +9454,9 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => 'fe615095',
 						'blacklisted_value_regex' => '(^|\\s)data:image\\/svg\\+xml',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)data:image\\/svg\\+xml/uD',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -7758,11 +9494,14 @@ class AMP_Allowed_Tags_Generated {
 							'auto',
 							'sync',
 						),
+						'value_set' => 46,
 					),
 					'height' => array(),
 					'ismap' => array(),
 					'longdesc' => array(
+						'attr_spec_id' => '7a61d54c',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'protocol' => array(
 								'http',
@@ -7775,7 +9514,9 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'srcset',
 						),
+						'attr_spec_id' => '285b86b7',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => true,
@@ -7790,6 +9531,12 @@ class AMP_Allowed_Tags_Generated {
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'noscript',
 					'mandatory_ancestor_suggested_alternative' => 'amp-img',
+					'mandatory_attrs' => array(
+						array(
+							'src',
+							'srcset',
+						),
+					),
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-img',
 				),
 			),
@@ -7835,12 +9582,15 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'no-verify' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -7852,7 +9602,9 @@ class AMP_Allowed_Tags_Generated {
 					'step' => array(),
 					'tabindex' => array(),
 					'type' => array(
+						'attr_spec_id' => '77d2e7a6',
 						'blacklisted_value_regex' => '(^|\\s)(button|file|image|password|)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(button|file|image|password|)(\\s|$)/uD',
 					),
 					'value' => array(),
 					'width' => array(),
@@ -7900,12 +9652,15 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'no-verify' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -7922,12 +9677,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'file',
 						),
+						'value_casei_set' => 47,
 					),
 					'value' => array(),
 					'width' => array(),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form [method=post]',
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'spec_name' => 'INPUT [type=file]',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-form',
 				),
@@ -7971,7 +9732,9 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -7988,12 +9751,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'password',
 						),
+						'value_casei_set' => 48,
 					),
 					'value' => array(),
 					'width' => array(),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'form [method=post]',
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'spec_name' => 'INPUT [type=password]',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-form',
 				),
@@ -8033,7 +9802,9 @@ class AMP_Allowed_Tags_Generated {
 					'inputmode' => array(),
 					'list' => array(),
 					'mask' => array(
+						'attr_spec_id' => '43357b06',
 						'blacklisted_value_regex' => '(payment-card|date-dd-mm-yyyy|date-mm-dd-yyyy|date-mm-yy|date-yyyy-mm-dd)',
+						'blacklisted_value_regex_pcre' => '/(payment-card|date-dd-mm-yyyy|date-mm-dd-yyyy|date-mm-yy|date-yyyy-mm-dd)/uD',
 						'dispatch_key' => 1,
 						'mandatory' => true,
 					),
@@ -8044,7 +9815,9 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -8061,11 +9834,17 @@ class AMP_Allowed_Tags_Generated {
 							'tel',
 							'search',
 						),
+						'value_set' => 49,
 					),
 					'value' => array(),
 					'width' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'mask',
+						),
+					),
 					'requires_extension' => array(
 						'amp-inputmask',
 					),
@@ -8113,6 +9892,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'payment-card',
 						),
+						'value_set' => 50,
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8121,7 +9901,9 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -8138,11 +9920,17 @@ class AMP_Allowed_Tags_Generated {
 							'tel',
 							'search',
 						),
+						'value_set' => 49,
 					),
 					'value' => array(),
 					'width' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'mask',
+						),
+					),
 					'requires_extension' => array(
 						'amp-inputmask',
 					),
@@ -8190,6 +9978,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'date-dd-mm-yyyy',
 						),
+						'value_set' => 51,
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8198,7 +9987,9 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -8215,11 +10006,17 @@ class AMP_Allowed_Tags_Generated {
 							'tel',
 							'search',
 						),
+						'value_set' => 49,
 					),
 					'value' => array(),
 					'width' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'mask',
+						),
+					),
 					'requires_extension' => array(
 						'amp-inputmask',
 					),
@@ -8267,6 +10064,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'date-mm-dd-yyyy',
 						),
+						'value_set' => 52,
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8275,7 +10073,9 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -8292,11 +10092,17 @@ class AMP_Allowed_Tags_Generated {
 							'tel',
 							'search',
 						),
+						'value_set' => 49,
 					),
 					'value' => array(),
 					'width' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'mask',
+						),
+					),
 					'requires_extension' => array(
 						'amp-inputmask',
 					),
@@ -8344,6 +10150,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'date-mm-yy',
 						),
+						'value_set' => 53,
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8352,7 +10159,9 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -8369,11 +10178,17 @@ class AMP_Allowed_Tags_Generated {
 							'tel',
 							'search',
 						),
+						'value_set' => 49,
 					),
 					'value' => array(),
 					'width' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'mask',
+						),
+					),
 					'requires_extension' => array(
 						'amp-inputmask',
 					),
@@ -8421,6 +10236,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'date-yyyy-mm-dd',
 						),
+						'value_set' => 54,
 					),
 					'mask-output' => array(),
 					'max' => array(),
@@ -8429,7 +10245,9 @@ class AMP_Allowed_Tags_Generated {
 					'minlength' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -8446,11 +10264,17 @@ class AMP_Allowed_Tags_Generated {
 							'tel',
 							'search',
 						),
+						'value_set' => 49,
 					),
 					'value' => array(),
 					'width' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'mask',
+						),
+					),
 					'requires_extension' => array(
 						'amp-inputmask',
 					),
@@ -8463,7 +10287,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'cite' => array(
+						'attr_spec_id' => '5d48c103',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -8503,7 +10329,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'value' => array(
+						'attr_spec_id' => '11972dcc',
 						'value_regex' => '[0-9]*',
+						'value_regex_pcre' => '/^(?:[0-9]*)$/uD',
 					),
 				),
 				'tag_spec' => array(),
@@ -8570,7 +10398,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -8658,7 +10488,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -8676,6 +10508,7 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => '68aed127',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -8708,6 +10541,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => 55,
 					),
 					'color' => array(),
 					'crossorigin' => array(),
@@ -8715,7 +10549,9 @@ class AMP_Allowed_Tags_Generated {
 					'hreflang' => array(),
 					'media' => array(),
 					'rel' => array(
+						'attr_spec_id' => '61cc1e7b',
 						'blacklisted_value_regex' => '(^|\\s)(canonical|components|import|manifest|preload|serviceworker|stylesheet|subresource|)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(canonical|components|import|manifest|preload|serviceworker|stylesheet|subresource|)(\\s|$)/uD',
 						'mandatory' => true,
 					),
 					'sizes' => array(),
@@ -8726,6 +10562,14 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'template',
 					),
+					'disallowed_ancestor_set' => array(
+						'template' => 'template',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'rel',
+						),
+					),
 					'spec_name' => 'link rel=',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -8736,11 +10580,14 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => 55,
 					),
 					'color' => array(),
 					'crossorigin' => array(),
 					'href' => array(
+						'attr_spec_id' => '2cadd4d2',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -8757,6 +10604,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'canonical',
 						),
+						'value_casei_set' => 56,
 					),
 					'sizes' => array(),
 					'target' => array(),
@@ -8764,6 +10612,14 @@ class AMP_Allowed_Tags_Generated {
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
+					'mandatory_attrs' => array(
+						array(
+							'href',
+						),
+						array(
+							'rel',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'link rel=canonical',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#required-markup',
@@ -8776,11 +10632,14 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => 55,
 					),
 					'color' => array(),
 					'crossorigin' => array(),
 					'href' => array(
+						'attr_spec_id' => 'da64dcca',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -8796,12 +10655,21 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'manifest',
 						),
+						'value_casei_set' => 57,
 					),
 					'sizes' => array(),
 					'target' => array(),
 					'type' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'href',
+						),
+						array(
+							'rel',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'link rel=manifest',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
@@ -8814,6 +10682,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => 55,
 					),
 					'color' => array(),
 					'crossorigin' => array(),
@@ -8826,6 +10695,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'preload',
 						),
+						'value_casei_set' => 58,
 					),
 					'sizes' => array(),
 					'target' => array(),
@@ -8835,6 +10705,14 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'template',
 					),
+					'disallowed_ancestor_set' => array(
+						'template' => 'template',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'rel',
+						),
+					),
 					'spec_name' => 'link rel=preload',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -8844,8 +10722,10 @@ class AMP_Allowed_Tags_Generated {
 					'async' => array(),
 					'crossorigin' => array(),
 					'href' => array(
+						'attr_spec_id' => 'd8a5b66d',
 						'mandatory' => true,
 						'value_regex' => 'https://cdn\\.materialdesignicons\\.com/([0-9]+\\.?)+/css/materialdesignicons\\.min\\.css|https://cloud\\.typography\\.com/[0-9]*/[0-9]*/css/fonts\\.css|https://fast\\.fonts\\.net/.*|https://fonts\\.googleapis\\.com/css\\?.*|https://fonts\\.googleapis\\.com/icon\\?.*|https://fonts\\.googleapis\\.com/earlyaccess/.*\\.css|https://maxcdn\\.bootstrapcdn\\.com/font-awesome/([0-9]+\\.?)+/css/font-awesome\\.min\\.css(\\?.*)?|https://(use|pro)\\.fontawesome\\.com/releases/v([0-9]+\\.?)+/css/(all|brands|solid|regular|light|fontawesome)\\.css|https://(use|pro)\\.fontawesome\\.com/[0-9a-zA-Z]+\\.css|https://use\\.typekit\\.net/[\\w\\p{L}\\p{N}_]+\\.css',
+						'value_regex_pcre' => '/^(?:https:\\/\\/cdn\\.materialdesignicons\\.com\\/([0-9]+\\.?)+\\/css\\/materialdesignicons\\.min\\.css|https:\\/\\/cloud\\.typography\\.com\\/[0-9]*\\/[0-9]*\\/css\\/fonts\\.css|https:\\/\\/fast\\.fonts\\.net\\/.*|https:\\/\\/fonts\\.googleapis\\.com\\/css\\?.*|https:\\/\\/fonts\\.googleapis\\.com\\/icon\\?.*|https:\\/\\/fonts\\.googleapis\\.com\\/earlyaccess\\/.*\\.css|https:\\/\\/maxcdn\\.bootstrapcdn\\.com\\/font-awesome\\/([0-9]+\\.?)+\\/css\\/font-awesome\\.min\\.css(\\?.*)?|https:\\/\\/(use|pro)\\.fontawesome\\.com\\/releases\\/v([0-9]+\\.?)+\\/css\\/(all|brands|solid|regular|light|fontawesome)\\.css|https:\\/\\/(use|pro)\\.fontawesome\\.com\\/[0-9a-zA-Z]+\\.css|https:\\/\\/use\\.typekit\\.net\\/[\\w\\p{L}\\p{N}_]+\\.css)$/uD',
 					),
 					'integrity' => array(),
 					'media' => array(),
@@ -8855,14 +10735,24 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'stylesheet',
 						),
+						'value_casei_set' => 59,
 					),
 					'type' => array(
 						'value_casei' => array(
 							'text/css',
 						),
+						'value_casei_set' => 60,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'href',
+						),
+						array(
+							'rel',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'link rel=stylesheet for fonts',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#custom-fonts',
@@ -8874,6 +10764,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => 55,
 					),
 					'color' => array(),
 					'crossorigin' => array(),
@@ -8887,6 +10778,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'sameas',
 						),
+						'value_casei_set' => 61,
 					),
 					'media' => array(),
 					'sizes' => array(),
@@ -8894,6 +10786,14 @@ class AMP_Allowed_Tags_Generated {
 					'type' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'href',
+						),
+						array(
+							'itemprop',
+						),
+					),
 					'spec_name' => 'link itemprop=sameAs',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -8904,6 +10804,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => 55,
 					),
 					'color' => array(),
 					'crossorigin' => array(),
@@ -8920,6 +10821,14 @@ class AMP_Allowed_Tags_Generated {
 					'type' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'href',
+						),
+						array(
+							'itemprop',
+						),
+					),
 					'spec_name' => 'link itemprop=',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -8930,6 +10839,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => 55,
 					),
 					'color' => array(),
 					'crossorigin' => array(),
@@ -8946,6 +10856,14 @@ class AMP_Allowed_Tags_Generated {
 					'type' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'href',
+						),
+						array(
+							'property',
+						),
+					),
 					'spec_name' => 'link property=',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9034,7 +10952,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -9120,7 +11040,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -9154,10 +11076,16 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'utf-8',
 						),
+						'value_casei_set' => 55,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
+					'mandatory_attrs' => array(
+						array(
+							'charset',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta charset=utf-8',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#required-markup',
@@ -9167,6 +11095,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'content' => array(
+						'attr_spec_id' => '6006f039',
 						'mandatory' => true,
 						'value_properties' => array(
 							'height' => array(),
@@ -9188,10 +11117,19 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'viewport',
 						),
+						'value_set' => 62,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=viewport',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#required-markup',
@@ -9201,6 +11139,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'content' => array(
+						'attr_spec_id' => '9ec4b42a',
 						'mandatory' => true,
 						'value_properties' => array(
 							'chrome' => array(
@@ -9217,10 +11156,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'x-ua-compatible',
 						),
+						'value_casei_set' => 63,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=X-UA-Compatible',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9228,8 +11176,10 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'content' => array(
+						'attr_spec_id' => '04449ebb',
 						'mandatory' => true,
 						'value_regex' => '.*app-id=.*',
+						'value_regex_pcre' => '/^(?:.*app-id=.*)$/uD',
 					),
 					'name' => array(
 						'dispatch_key' => 2,
@@ -9237,9 +11187,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'apple-itunes-app',
 						),
+						'value_casei_set' => 64,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=apple-itunes-app',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
@@ -9256,9 +11215,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-experiments-opt-in',
 						),
+						'value_casei_set' => 65,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=amp-experiments-opt-in',
 				),
@@ -9266,6 +11234,7 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'content' => array(
+						'attr_spec_id' => '73b5eaaa',
 						'mandatory' => true,
 						'value_url' => array(
 							'protocol' => array(
@@ -9279,9 +11248,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-3p-iframe-src',
 						),
+						'value_casei_set' => 66,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=amp-3p-iframe-src',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-ad',
@@ -9298,9 +11276,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-consent-blocking',
 						),
+						'value_casei_set' => 67,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=amp-consent-blocking',
 					'unique' => true,
@@ -9317,9 +11304,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-experiment-token',
 						),
+						'value_casei_set' => 68,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=amp-experiment-token',
 				),
@@ -9335,9 +11331,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-link-variable-allowed-origin',
 						),
+						'value_casei_set' => 69,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=amp-link-variable-allowed-origin',
 				),
@@ -9353,9 +11358,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-google-client-id-api',
 						),
+						'value_casei_set' => 70,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=amp-google-clientid-id-api',
 				),
@@ -9368,9 +11382,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-ad-doubleclick-sra',
 						),
+						'value_casei_set' => 71,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=amp-ad-doubleclick-sra',
 				),
@@ -9380,7 +11400,9 @@ class AMP_Allowed_Tags_Generated {
 					'content' => array(),
 					'itemprop' => array(),
 					'name' => array(
+						'attr_spec_id' => 'bfea0d4b',
 						'blacklisted_value_regex' => '(^|\\s)(amp-.*|amp4ads-.*|apple-itunes-app|content-disposition|revisit-after|viewport)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(amp-.*|amp4ads-.*|apple-itunes-app|content-disposition|revisit-after|viewport)(\\s|$)/uD',
 					),
 					'property' => array(),
 					'scheme' => array(),
@@ -9396,6 +11418,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'text/html; charset=utf-8',
 						),
+						'value_casei_set' => 72,
 					),
 					'http-equiv' => array(
 						'dispatch_key' => 2,
@@ -9403,10 +11426,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'content-type',
 						),
+						'value_casei_set' => 73,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=Content-Type',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9422,10 +11454,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'content-language',
 						),
+						'value_casei_set' => 74,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=content-language',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9441,10 +11482,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'pics-label',
 						),
+						'value_casei_set' => 75,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=pics-label',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9460,10 +11510,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'imagetoolbar',
 						),
+						'value_casei_set' => 76,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=imagetoolbar',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9475,6 +11534,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'text/css',
 						),
+						'value_casei_set' => 60,
 					),
 					'http-equiv' => array(
 						'dispatch_key' => 2,
@@ -9482,10 +11542,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'content-style-type',
 						),
+						'value_casei_set' => 77,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=Content-Style-Type',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9497,6 +11566,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 					'http-equiv' => array(
 						'dispatch_key' => 2,
@@ -9504,10 +11574,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'content-script-type',
 						),
+						'value_casei_set' => 79,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=Content-Script-Type',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9523,10 +11602,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'origin-trial',
 						),
+						'value_casei_set' => 80,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=origin-trial',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9542,10 +11630,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'resource-type',
 						),
+						'value_casei_set' => 81,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=resource-type',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9558,6 +11655,7 @@ class AMP_Allowed_Tags_Generated {
 							'off',
 							'on',
 						),
+						'value_casei_set' => 82,
 					),
 					'http-equiv' => array(
 						'dispatch_key' => 2,
@@ -9565,10 +11663,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'x-dns-prefetch-control',
 						),
+						'value_casei_set' => 83,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'http-equiv',
+						),
+					),
 					'spec_name' => 'meta http-equiv=x-dns-prefetch-control',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#html-tags',
 				),
@@ -9584,10 +11691,19 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-ad-enable-refresh',
 						),
+						'value_casei_set' => 84,
 					),
 				),
 				'tag_spec' => array(
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'spec_name' => 'meta name=amp-ad-enable-refresh',
 				),
 			),
@@ -9602,9 +11718,18 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-to-amp-navigation',
 						),
+						'value_casei_set' => 85,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'content',
+						),
+						array(
+							'name',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'meta name=amp-to-amp-navigation',
 					'unique' => true,
@@ -9615,7 +11740,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'xml:lang' => array(),
 					'xml:space' => array(),
@@ -9667,8 +11794,19 @@ class AMP_Allowed_Tags_Generated {
 						'child_tag_name_oneof' => array(
 							'ul',
 						),
+						'child_tag_name_set' => array(
+							'ul' => true,
+						),
 						'mandatory_num_child_tags' => 1,
 					),
+					'mandatory_attrs' => array(
+						array(
+							'toolbar',
+						),
+						array(
+							'toolbar-target',
+						),
+					),
 					'mandatory_parent' => 'amp-sidebar',
 					'spec_name' => 'amp-sidebar > nav',
 				),
@@ -9703,6 +11841,9 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'noscript',
 					),
+					'disallowed_ancestor_set' => array(
+						'noscript' => 'noscript',
+					),
 					'mandatory_ancestor' => 'body',
 				),
 			),
@@ -9720,12 +11861,17 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'start' => array(
+						'attr_spec_id' => '11972dcc',
 						'value_regex' => '[0-9]*',
+						'value_regex_pcre' => '/^(?:[0-9]*)$/uD',
 					),
 					'type' => array(
+						'attr_spec_id' => '9e84fc71',
 						'value_regex' => '[1AaIi]',
+						'value_regex_pcre' => '/^(?:[1AaIi])$/uD',
 					),
 				),
 				'tag_spec' => array(),
@@ -9768,7 +11914,9 @@ class AMP_Allowed_Tags_Generated {
 					'for' => array(),
 					'form' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 				),
 				'tag_spec' => array(),
@@ -9845,7 +11993,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -9933,7 +12083,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -9953,6 +12105,7 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => '68aed127',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -10048,7 +12201,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -10133,7 +12288,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -10175,7 +12332,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'cite' => array(
+						'attr_spec_id' => '5d48c103',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_empty' => true,
 							'protocol' => array(
@@ -10255,7 +12414,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -10271,6 +12432,7 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => '68aed127',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -10364,7 +12526,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -10434,6 +12598,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'src' => array(
@@ -10442,21 +12607,32 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'https://cdn.ampproject.org/v0.js',
 						),
+						'value_set' => 86,
 					),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'contents',
 						'regex' => '.',
+						'regex_pcre' => '/./uD',
 					),
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
+					'mandatory_attrs' => array(
+						array(
+							'async',
+						),
+						array(
+							'src',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'amphtml engine v0.js script',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#required-markup',
@@ -10472,15 +12648,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/ld+json',
 						),
+						'value_casei_set' => 87,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'spec_name' => 'script type=application/ld+json',
 				),
 			),
@@ -10492,6 +12675,7 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'amp-rtc',
 						),
+						'value_casei_set' => 88,
 					),
 					'nonce' => array(),
 					'type' => array(
@@ -10499,15 +12683,25 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'id',
+						),
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'script id=amp-rtc',
 					'unique' => true,
@@ -10521,15 +12715,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-ima-video',
 					'spec_name' => 'amp-ima-video > script[type=application/json]',
 				),
@@ -10541,20 +12742,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-3d-gltf',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10566,20 +12773,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-3q-player',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10591,22 +12804,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-access-laterpay',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'0.2',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'requires_extension' => array(
@@ -10621,21 +12838,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-access-poool',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'requires_extension' => array(
@@ -10650,21 +12872,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-access-scroll',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'requires_extension' => array(
@@ -10679,22 +12906,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-access',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10707,6 +12938,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-access',
 						),
+						'value_set' => 90,
 					),
 					'nonce' => array(),
 					'type' => array(
@@ -10714,15 +12946,25 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'id',
+						),
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'requires_extension' => array(
 						'amp-access',
@@ -10738,22 +12980,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-accordion',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10765,20 +13011,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-action-macro',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10790,22 +13042,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-ad',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'spec_name' => 'amp-ad extension .js script',
@@ -10818,20 +13074,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-addthis',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10843,22 +13105,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-analytics',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10872,15 +13138,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-analytics',
 					'requires_extension' => array(
 						'amp-analytics',
@@ -10896,22 +13169,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-anim',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10923,20 +13200,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-animation',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -10950,15 +13233,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-animation',
 					'requires_extension' => array(
 						'amp-animation',
@@ -10973,22 +13263,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-apester-media',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11000,21 +13294,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-app-banner',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11026,22 +13325,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-audio',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11053,20 +13356,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-auto-ads',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11078,20 +13387,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-beopinion',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11103,21 +13418,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-bind',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11131,17 +13451,24 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 					'max_bytes' => 100000,
 					'max_bytes_spec_url' => 'https://www.ampproject.org/docs/reference/components/dynamic/amp-bind#state',
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-state',
 					'requires_extension' => array(
 						'amp-bind',
@@ -11157,20 +13484,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-bodymovin-animation',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11182,22 +13515,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-brid-player',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11209,22 +13546,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-brightcove',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11236,20 +13577,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-byside-content',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11261,21 +13608,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-call-tracking',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11287,22 +13639,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-carousel',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11314,20 +13670,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-consent',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11341,15 +13703,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-consent',
 					'requires_extension' => array(
 						'amp-consent',
@@ -11365,22 +13734,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-dailymotion',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11392,20 +13765,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-date-countdown',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11417,20 +13796,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-date-display',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11442,23 +13827,29 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-date-picker',
-						'version' => array(
-							'0.1',
-							'latest',
-						),
 					),
-				),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
+						),
+					),
+				),
 			),
 			array(
 				'attr_spec_list' => array(
@@ -11467,20 +13858,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-delight-player',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11492,22 +13889,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-dynamic-css-classes',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11519,20 +13920,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-embedly-card',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11544,22 +13951,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-experiment',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11573,15 +13984,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-experiment',
 					'spec_name' => 'amp-experiment extension .json script',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-experiment',
@@ -11594,20 +14012,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-facebook-comments',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11619,20 +14043,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-facebook-like',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11644,20 +14074,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-facebook-page',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11669,22 +14105,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-facebook',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11696,22 +14136,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-fit-text',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11723,22 +14167,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-font',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11750,22 +14198,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-form',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11777,21 +14229,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-fx-collection',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11803,22 +14260,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-fx-flying-carpet',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11830,20 +14291,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-geo',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11857,15 +14324,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-geo',
 					'requires_extension' => array(
 						'amp-geo',
@@ -11881,22 +14355,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-gfycat',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11908,20 +14386,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-gist',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11933,20 +14417,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-google-document-embed',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11958,20 +14448,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-hulu',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -11983,22 +14479,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-iframe',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12010,20 +14510,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-ima-video',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12035,22 +14541,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-image-lightbox',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12062,20 +14572,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-image-slider',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12087,20 +14603,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-imgur',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12112,21 +14634,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-inputmask',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12138,22 +14665,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-instagram',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12165,22 +14696,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-install-serviceworker',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12192,21 +14727,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-izlesene',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12218,22 +14758,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-jwplayer',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12245,22 +14789,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-kaltura-player',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12272,21 +14820,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-lightbox-gallery',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12298,22 +14851,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-lightbox',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12325,22 +14882,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-list',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12352,21 +14913,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-live-list',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'mandatory_parent' => 'head',
@@ -12380,20 +14946,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-mathml',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12405,20 +14977,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-mowplayer',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12430,27 +15008,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
-						'deprecated_version' => array(
-							'0.1',
-						),
-						'is_custom_template' => true,
 						'name' => 'amp-mustache',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'0.2',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-template',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12464,18 +15041,21 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-mustache',
 						),
+						'value_set' => 91,
 					),
 					'type' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'text/plain',
 						),
+						'value_casei_set' => 92,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
@@ -12487,6 +15067,19 @@ class AMP_Allowed_Tags_Generated {
 						'form div [submitting][template]',
 						'form div [verify-error][template]',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-date-picker' => 'amp-date-picker',
+						'div' => 'form div [verify-error][template]',
+						'template' => 'template',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'template',
+						),
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-mustache',
 					),
@@ -12500,20 +15093,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-next-page',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12526,9 +15125,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-next-page',
 					'requires_extension' => array(
 						'amp-next-page',
@@ -12544,20 +15149,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-nexxtv-player',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12569,22 +15180,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-o2-player',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12596,20 +15211,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-ooyala-player',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12621,20 +15242,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-orientation-observer',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12646,20 +15273,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-pan-zoom',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12671,22 +15304,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-pinterest',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12698,20 +15335,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-playbuzz',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12723,20 +15366,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-position-observer',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12748,20 +15397,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-powr-player',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12773,22 +15428,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-reach-player',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12800,20 +15459,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-recaptcha-input',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12825,21 +15490,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-reddit',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12851,20 +15521,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-riddle-quiz',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12876,21 +15552,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-selector',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12902,22 +15583,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-sidebar',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12929,20 +15614,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-skimlinks',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12954,22 +15645,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-social-share',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -12981,22 +15676,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-soundcloud',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13008,22 +15707,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-springboard-player',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13035,25 +15738,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_version' => array(
-							'0.1',
-						),
 						'name' => 'amp-sticky-ad',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'1.0',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13065,20 +15769,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-story-auto-ads',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13092,15 +15802,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-story-auto-ads',
 					'requires_extension' => array(
 						'amp-story-auto-ads',
@@ -13116,21 +15833,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-story',
-						'version' => array(
-							'0.1',
-							'1.0',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13143,9 +15865,15 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-story-bookend',
 					'requires_extension' => array(
 						'amp-story',
@@ -13163,15 +15891,22 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-story-consent',
 					'requires_extension' => array(
 						'amp-consent',
@@ -13188,21 +15923,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-subscriptions',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13215,6 +15955,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-subscriptions',
 						),
+						'value_set' => 93,
 					),
 					'nonce' => array(),
 					'type' => array(
@@ -13222,15 +15963,25 @@ class AMP_Allowed_Tags_Generated {
 						'value_casei' => array(
 							'application/json',
 						),
+						'value_casei_set' => 89,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'html comments',
 						'regex' => '<!--',
+						'regex_pcre' => '/<!--/uD',
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'id',
+						),
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'requires_extension' => array(
 						'amp-subscriptions',
@@ -13246,21 +15997,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-subscriptions-google',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'requires_extension' => array(
@@ -13275,20 +16031,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-timeago',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13300,22 +16062,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-twitter',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13327,22 +16093,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-user-notification',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13354,20 +16124,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-video-docking',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'spec_name' => 'amp-video-docking',
@@ -13380,20 +16156,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-video-iframe',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13405,21 +16187,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-video',
-						'requires_usage' => 3,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'spec_name' => 'amp-video extension .js script',
@@ -13432,22 +16219,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-vimeo',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13459,22 +16250,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-vine',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13486,20 +16281,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-viqeo-player',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13511,20 +16312,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-vk',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13536,20 +16343,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-web-push',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13561,20 +16374,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-wistia-player',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13586,20 +16405,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
 						'name' => 'amp-yotpo',
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-yotpo',
@@ -13612,22 +16437,26 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/javascript',
 						),
+						'value_casei_set' => 78,
 					),
 				),
 				'tag_spec' => array(
 					'extension_spec' => array(
-						'deprecated_allow_duplicates' => true,
 						'name' => 'amp-youtube',
-						'requires_usage' => 2,
-						'version' => array(
-							'0.1',
-							'latest',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'custom-element',
+						),
+						array(
+							'async',
 						),
 					),
 				),
@@ -13640,6 +16469,9 @@ class AMP_Allowed_Tags_Generated {
 					'disallowed_ancestor' => array(
 						'amp-accordion',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-accordion' => 'amp-accordion',
+					),
 				),
 			),
 			array(
@@ -13648,6 +16480,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'tag_spec' => array(
@@ -13661,6 +16494,15 @@ class AMP_Allowed_Tags_Generated {
 							'h6',
 							'header',
 						),
+						'first_child_tag_name_set' => array(
+							'h1' => true,
+							'h2' => true,
+							'h3' => true,
+							'h4' => true,
+							'h5' => true,
+							'h6' => true,
+							'header' => true,
+						),
 						'mandatory_num_child_tags' => 2,
 					),
 					'mandatory_parent' => 'amp-accordion',
@@ -13680,12 +16522,15 @@ class AMP_Allowed_Tags_Generated {
 					'disabled' => array(),
 					'multiple' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'no-verify' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'required' => array(),
 					'size' => array(),
@@ -13699,7 +16544,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 				),
 				'tag_spec' => array(),
@@ -13770,7 +16617,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -13797,7 +16646,9 @@ class AMP_Allowed_Tags_Generated {
 					'media' => array(),
 					'sizes' => array(),
 					'srcset' => array(
+						'attr_spec_id' => 'e57b997a',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -13821,7 +16672,9 @@ class AMP_Allowed_Tags_Generated {
 					'[type]' => array(),
 					'media' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -13843,7 +16696,9 @@ class AMP_Allowed_Tags_Generated {
 					'[type]' => array(),
 					'media' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -13863,7 +16718,9 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'media' => array(),
 					'src' => array(
+						'attr_spec_id' => 'f12eba14',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => true,
@@ -13877,6 +16734,14 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'audio',
 					'spec_name' => 'audio > source',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-audio',
@@ -13886,7 +16751,9 @@ class AMP_Allowed_Tags_Generated {
 				'attr_spec_list' => array(
 					'media' => array(),
 					'src' => array(
+						'attr_spec_id' => 'f12eba14',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => true,
@@ -13900,6 +16767,14 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'video',
 					'spec_name' => 'video > source',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-video',
@@ -13911,7 +16786,9 @@ class AMP_Allowed_Tags_Generated {
 					'[type]' => array(),
 					'media' => array(),
 					'src' => array(
+						'attr_spec_id' => '7bf02739',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => true,
 							'protocol' => array(
@@ -13949,7 +16826,9 @@ class AMP_Allowed_Tags_Generated {
 					'stop-color' => array(),
 					'stop-opacity' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 				),
 				'tag_spec' => array(
@@ -13964,7 +16843,9 @@ class AMP_Allowed_Tags_Generated {
 					'stop-color' => array(),
 					'stop-opacity' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 				),
 				'tag_spec' => array(
@@ -13994,18 +16875,21 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 					'type' => array(
 						'value_casei' => array(
 							'text/css',
 						),
+						'value_casei_set' => 60,
 					),
 				),
 				'cdata' => array(
 					'blacklisted_cdata_regex' => array(
 						'error_message' => 'CSS !important',
 						'regex' => '!important',
+						'regex_pcre' => '/!important/uD',
 					),
 					'css_spec' => array(
 						'allowed_at_rules' => array(
@@ -14039,6 +16923,11 @@ class AMP_Allowed_Tags_Generated {
 					'max_bytes_spec_url' => 'https://www.ampproject.org/docs/reference/spec#maximum-size',
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'amp-custom',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'style amp-custom',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#stylesheets',
@@ -14053,14 +16942,21 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 				),
 				'cdata' => array(
 					'cdata_regex' => '\\s*body\\s*{\\s*-webkit-animation:\\s*-amp-start\\s+8s\\s+steps\\(1,\\s*end\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*-moz-animation:\\s*-amp-start\\s+8s\\s+steps\\s*\\(1\\s*,\\s*end\\s*\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*-ms-animation:\\s*-amp-start\\s+8s\\s+steps\\s*\\(1\\s*,\\s*end\\s*\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*animation:\\s*-amp-start\\s+8s\\s+steps\\(1,\\s*end\\)\\s+0s\\s+1\\s+normal\\s+both;?\\s*}\\s*@-webkit-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-moz-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-ms-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-o-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*',
+					'cdata_regex_pcre' => '/^(?:\\s*body\\s*{\\s*-webkit-animation:\\s*-amp-start\\s+8s\\s+steps\\(1,\\s*end\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*-moz-animation:\\s*-amp-start\\s+8s\\s+steps\\s*\\(1\\s*,\\s*end\\s*\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*-ms-animation:\\s*-amp-start\\s+8s\\s+steps\\s*\\(1\\s*,\\s*end\\s*\\)\\s+0s\\s+1\\s+normal\\s+both;\\s*animation:\\s*-amp-start\\s+8s\\s+steps\\(1,\\s*end\\)\\s+0s\\s+1\\s+normal\\s+both;?\\s*}\\s*@-webkit-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-moz-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-ms-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@-o-keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*@keyframes\\s+-amp-start\\s*{\\s*from\\s*{\\s*visibility:\\s*hidden;?\\s*}\\s*to\\s*{\\s*visibility:\\s*visible;?\\s*}\\s*}\\s*)$/uD',
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
+					'mandatory_attrs' => array(
+						array(
+							'amp-boilerplate',
+						),
+					),
 					'mandatory_parent' => 'head',
 					'spec_name' => 'head > style[amp-boilerplate]',
 					'spec_url' => 'https://github.com/ampproject/amphtml/blob/master/spec/amp-boilerplate.md',
@@ -14075,15 +16971,22 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'nonce' => array(),
 				),
 				'cdata' => array(
 					'cdata_regex' => '\\s*body\\s*{\\s*-webkit-animation:\\s*none;\\s*-moz-animation:\\s*none;\\s*-ms-animation:\\s*none;\\s*animation:\\s*none;?\\s*}\\s*',
+					'cdata_regex_pcre' => '/^(?:\\s*body\\s*{\\s*-webkit-animation:\\s*none;\\s*-moz-animation:\\s*none;\\s*-ms-animation:\\s*none;\\s*animation:\\s*none;?\\s*}\\s*)$/uD',
 				),
 				'tag_spec' => array(
 					'mandatory' => true,
 					'mandatory_ancestor' => 'head',
+					'mandatory_attrs' => array(
+						array(
+							'amp-boilerplate',
+						),
+					),
 					'mandatory_parent' => 'noscript',
 					'spec_name' => 'noscript > style[amp-boilerplate]',
 					'spec_url' => 'https://github.com/ampproject/amphtml/blob/master/spec/amp-boilerplate.md',
@@ -14098,6 +17001,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 				),
 				'cdata' => array(
@@ -14122,6 +17026,11 @@ class AMP_Allowed_Tags_Generated {
 					'max_bytes_spec_url' => 'https://www.ampproject.org/docs/reference/spec#keyframes-stylesheet',
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'amp-keyframes',
+						),
+					),
 					'mandatory_parent' => 'body',
 					'spec_name' => 'style[amp-keyframes]',
 					'unique' => true,
@@ -14212,7 +17121,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -14225,6 +17136,7 @@ class AMP_Allowed_Tags_Generated {
 							'1.0',
 							'1.1',
 						),
+						'value_set' => 94,
 					),
 					'viewbox' => array(),
 					'visibility' => array(),
@@ -14303,7 +17215,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -14384,7 +17298,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'text-anchor' => array(),
 					'text-decoration' => array(),
@@ -14416,6 +17332,7 @@ class AMP_Allowed_Tags_Generated {
 							'0',
 							'1',
 						),
+						'value_set' => 6,
 					),
 					'cellpadding' => array(),
 					'cellspacing' => array(),
@@ -14455,6 +17372,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'dates' => array(),
 					'default' => array(),
@@ -14463,9 +17381,18 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-mustache',
 						),
+						'value_set' => 91,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'date-template',
+						),
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-date-picker',
 					'requires_extension' => array(
 						'amp-mustache',
@@ -14484,9 +17411,18 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-mustache',
 						),
+						'value_set' => 91,
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'info-template',
+						),
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-date-picker',
 					'requires_extension' => array(
 						'amp-mustache',
@@ -14501,6 +17437,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-mustache',
 						),
+						'value_set' => 91,
 					),
 				),
 				'tag_spec' => array(
@@ -14513,6 +17450,17 @@ class AMP_Allowed_Tags_Generated {
 						'form div [submitting][template]',
 						'form div [verify-error][template]',
 					),
+					'disallowed_ancestor_set' => array(
+						'amp-date-picker' => 'amp-date-picker',
+						'amp-story-auto-ads' => 'amp-story-auto-ads',
+						'div' => 'form div [verify-error][template]',
+						'template' => 'template',
+					),
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'requires_extension' => array(
 						'amp-mustache',
 					),
@@ -14526,10 +17474,16 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'amp-mustache',
 						),
+						'value_set' => 91,
 					),
 				),
 				'tag_spec' => array(
 					'descendant_tag_list' => 'amp-story-grid-layer-allowed-descendants',
+					'mandatory_attrs' => array(
+						array(
+							'type',
+						),
+					),
 					'mandatory_parent' => 'amp-story-auto-ads',
 					'reference_points' => array(
 						'AMP-STORY-GRID-LAYER animate-in' => array(
@@ -14612,7 +17566,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -14669,12 +17625,15 @@ class AMP_Allowed_Tags_Generated {
 					'maxlength' => array(),
 					'minlength' => array(),
 					'name' => array(
+						'attr_spec_id' => '28acdcf9',
 						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+						'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					),
 					'no-verify' => array(
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'pattern' => array(),
 					'placeholder' => array(),
@@ -14755,7 +17714,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -14772,6 +17733,7 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => '68aed127',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -14845,7 +17807,9 @@ class AMP_Allowed_Tags_Generated {
 			array(
 				'attr_spec_list' => array(
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'xml:lang' => array(),
 					'xml:space' => array(),
@@ -14877,6 +17841,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'value' => array(
@@ -14885,10 +17850,13 @@ class AMP_Allowed_Tags_Generated {
 							'descriptions',
 							'metadata',
 						),
+						'value_set' => 95,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -14900,6 +17868,11 @@ class AMP_Allowed_Tags_Generated {
 					'srclang' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'mandatory_parent' => 'audio',
 					'spec_name' => 'audio > track',
 				),
@@ -14910,16 +17883,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'subtitles',
 						),
+						'value_casei_set' => 96,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -14933,6 +17910,17 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'kind',
+						),
+						array(
+							'src',
+						),
+						array(
+							'srclang',
+						),
+					),
 					'mandatory_parent' => 'audio',
 					'spec_name' => 'audio > track[kind=subtitles]',
 				),
@@ -14943,6 +17931,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'value' => array(
@@ -14951,10 +17940,13 @@ class AMP_Allowed_Tags_Generated {
 							'descriptions',
 							'metadata',
 						),
+						'value_set' => 95,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -14966,6 +17958,11 @@ class AMP_Allowed_Tags_Generated {
 					'srclang' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'mandatory_parent' => 'video',
 					'spec_name' => 'video > track',
 				),
@@ -14976,16 +17973,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'subtitles',
 						),
+						'value_casei_set' => 96,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -14999,6 +18000,17 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'kind',
+						),
+						array(
+							'src',
+						),
+						array(
+							'srclang',
+						),
+					),
 					'mandatory_parent' => 'video',
 					'spec_name' => 'video > track[kind=subtitles]',
 				),
@@ -15012,6 +18024,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'value' => array(
@@ -15020,10 +18033,13 @@ class AMP_Allowed_Tags_Generated {
 							'descriptions',
 							'metadata',
 						),
+						'value_set' => 95,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -15035,6 +18051,11 @@ class AMP_Allowed_Tags_Generated {
 					'srclang' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'mandatory_parent' => 'amp-audio',
 					'spec_name' => 'amp-audio > track',
 				),
@@ -15048,16 +18069,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'subtitles',
 						),
+						'value_casei_set' => 96,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -15071,6 +18096,17 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'kind',
+						),
+						array(
+							'src',
+						),
+						array(
+							'srclang',
+						),
+					),
 					'mandatory_parent' => 'amp-audio',
 					'spec_name' => 'amp-audio > track[kind=subtitles]',
 				),
@@ -15084,6 +18120,7 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'value' => array(
@@ -15092,10 +18129,13 @@ class AMP_Allowed_Tags_Generated {
 							'descriptions',
 							'metadata',
 						),
+						'value_set' => 95,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -15107,6 +18147,11 @@ class AMP_Allowed_Tags_Generated {
 					'srclang' => array(),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'src',
+						),
+					),
 					'mandatory_parent' => 'amp-video',
 					'spec_name' => 'amp-video > track',
 				),
@@ -15120,16 +18165,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'subtitles',
 						),
+						'value_casei_set' => 96,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -15143,6 +18192,17 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'kind',
+						),
+						array(
+							'src',
+						),
+						array(
+							'srclang',
+						),
+					),
 					'mandatory_parent' => 'amp-video',
 					'spec_name' => 'amp-video > track[kind=subtitles]',
 				),
@@ -15156,16 +18216,20 @@ class AMP_Allowed_Tags_Generated {
 						'value' => array(
 							'',
 						),
+						'value_set' => 3,
 					),
 					'kind' => array(
 						'mandatory' => true,
 						'value_casei' => array(
 							'subtitles',
 						),
+						'value_casei_set' => 96,
 					),
 					'label' => array(),
 					'src' => array(
+						'attr_spec_id' => 'd74e1c3e',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'mandatory' => true,
 						'value_url' => array(
 							'allow_relative' => false,
@@ -15179,6 +18243,17 @@ class AMP_Allowed_Tags_Generated {
 					),
 				),
 				'tag_spec' => array(
+					'mandatory_attrs' => array(
+						array(
+							'kind',
+						),
+						array(
+							'src',
+						),
+						array(
+							'srclang',
+						),
+					),
 					'mandatory_parent' => 'amp-ima-video',
 					'spec_name' => 'amp-ima-video > track[kind=subtitles]',
 					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-ima-video',
@@ -15245,7 +18320,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -15262,6 +18339,7 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => '68aed127',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -15349,7 +18427,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -15453,7 +18533,9 @@ class AMP_Allowed_Tags_Generated {
 					'stroke-opacity' => array(),
 					'stroke-width' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'systemlanguage' => array(),
 					'text-anchor' => array(),
@@ -15473,6 +18555,7 @@ class AMP_Allowed_Tags_Generated {
 						'alternative_names' => array(
 							'href',
 						),
+						'attr_spec_id' => '68aed127',
 						'value_url' => array(
 							'allow_empty' => false,
 							'protocol' => array(
@@ -15515,7 +18598,9 @@ class AMP_Allowed_Tags_Generated {
 					'poster' => array(),
 					'preload' => array(),
 					'src' => array(
+						'attr_spec_id' => '0601509a',
 						'blacklisted_value_regex' => '__amp_source_origin',
+						'blacklisted_value_regex_pcre' => '/__amp_source_origin/uD',
 						'value_url' => array(
 							'allow_relative' => false,
 							'protocol' => array(
@@ -15539,7 +18624,9 @@ class AMP_Allowed_Tags_Generated {
 					'externalresourcesrequired' => array(),
 					'preserveaspectratio' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'viewbox' => array(),
 					'viewtarget' => array(),
@@ -15562,7 +18649,9 @@ class AMP_Allowed_Tags_Generated {
 					'g2' => array(),
 					'k' => array(),
 					'style' => array(
+						'attr_spec_id' => '83314293',
 						'blacklisted_value_regex' => '!important',
+						'blacklisted_value_regex_pcre' => '/!important/uD',
 					),
 					'u1' => array(),
 					'u2' => array(),
@@ -15649,10 +18738,12 @@ class AMP_Allowed_Tags_Generated {
 		'amp-access-style' => array(),
 		'amp-access-template' => array(),
 		'amp-fx' => array(
+			'attr_spec_id' => '18048817',
 			'requires_extension' => array(
 				'amp-fx-collection',
 			),
 			'value_regex_casei' => '(fade-in|fade-in-scroll|float-in-bottom|float-in-top|fly-in-bottom|fly-in-left|fly-in-right|fly-in-top|parallax)(\\s|fade-in|fade-in-scroll|float-in-bottom|float-in-top|fly-in-bottom|fly-in-left|fly-in-right|fly-in-top|parallax)*',
+			'value_regex_casei_pcre' => '/^(?:(fade-in|fade-in-scroll|float-in-bottom|float-in-top|fly-in-bottom|fly-in-left|fly-in-right|fly-in-top|parallax)(\\s|fade-in|fade-in-scroll|float-in-bottom|float-in-top|fly-in-bottom|fly-in-left|fly-in-right|fly-in-top|parallax)*)$/uiD',
 		),
 		'aria-activedescendant' => array(),
 		'aria-atomic' => array(),
@@ -15692,7 +18783,9 @@ class AMP_Allowed_Tags_Generated {
 		'aria-valuetext' => array(),
 		'autoscroll' => array(),
 		'class' => array(
+			'attr_spec_id' => '9b215f0e',
 			'blacklisted_value_regex' => '(^|\\W)i-amphtml-',
+			'blacklisted_value_regex_pcre' => '/(^|\\W)i-amphtml-/uD',
 		),
 		'content' => array(),
 		'datatype' => array(),
@@ -15702,15 +18795,19 @@ class AMP_Allowed_Tags_Generated {
 			'value' => array(
 				'',
 			),
+			'value_set' => 3,
 		),
 		'hidden' => array(
 			'value' => array(
 				'',
 			),
+			'value_set' => 3,
 		),
 		'i-amp-access-id' => array(),
 		'id' => array(
+			'attr_spec_id' => '1a49f092',
 			'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+			'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 		),
 		'inlist' => array(),
 		'itemid' => array(),
@@ -15725,17 +18822,22 @@ class AMP_Allowed_Tags_Generated {
 			'value' => array(
 				'',
 			),
+			'value_set' => 3,
 		),
 		'prefix' => array(),
 		'property' => array(),
 		'rel' => array(
+			'attr_spec_id' => 'f2170dd8',
 			'blacklisted_value_regex' => '(^|\\s)(canonical|components|dns-prefetch|import|manifest|preconnect|preload|prerender|serviceworker|stylesheet|subresource)(\\s|$)',
+			'blacklisted_value_regex_pcre' => '/(^|\\s)(canonical|components|dns-prefetch|import|manifest|preconnect|preload|prerender|serviceworker|stylesheet|subresource)(\\s|$)/uD',
 		),
 		'resource' => array(),
 		'rev' => array(),
 		'role' => array(),
 		'style' => array(
+			'attr_spec_id' => '16e47faa',
 			'blacklisted_value_regex' => '(!important|<!--)',
+			'blacklisted_value_regex_pcre' => '/(!important|<!--)/uD',
 		),
 		'subscriptions-action' => array(
 			'requires_extension' => array(
@@ -15749,6 +18851,7 @@ class AMP_Allowed_Tags_Generated {
 			'value' => array(
 				'',
 			),
+			'value_set' => 3,
 		),
 		'subscriptions-decorate' => array(
 			'requires_extension' => array(
@@ -15762,6 +18865,7 @@ class AMP_Allowed_Tags_Generated {
 			'value' => array(
 				'',
 			),
+			'value_set' => 3,
 		),
 		'subscriptions-display' => array(
 			'requires_extension' => array(
@@ -15778,6 +18882,7 @@ class AMP_Allowed_Tags_Generated {
 				'content-not-granted',
 				'loading',
 			),
+			'value_casei_set' => 101,
 		),
 		'subscriptions-service' => array(
 			'requires_extension' => array(
@@ -15801,6 +18906,7 @@ class AMP_Allowed_Tags_Generated {
 				'typeMismatch',
 				'valueMissing',
 			),
+			'value_set' => 102,
 		),
 		'vocab' => array(),
 	);
@@ -15810,7 +18916,9 @@ class AMP_Allowed_Tags_Generated {
 		'AMP-CAROUSEL lightbox [child]' => array(
 			'attr_spec_list' => array(
 				'lightbox-thumbnail-id' => array(
+					'attr_spec_id' => 'f8b423aa',
 					'value_regex_casei' => '^[a-z][a-z\\d_-]*',
+					'value_regex_casei_pcre' => '/^(?:^[a-z][a-z\\d_-]*)$/uiD',
 				),
 			),
 			'tag_spec' => array(
@@ -15852,7 +18960,9 @@ class AMP_Allowed_Tags_Generated {
 				'data-tombstone' => array(),
 				'data-update-time' => array(),
 				'id' => array(
+					'attr_spec_id' => '8df4b967',
 					'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+					'blacklisted_value_regex_pcre' => '/(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|AMP|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|i-amphtml-\\S*|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)/uD',
 					'mandatory' => true,
 				),
 			),
@@ -15916,6 +19026,7 @@ class AMP_Allowed_Tags_Generated {
 					'value' => array(
 						'',
 					),
+					'value_set' => 3,
 				),
 				'option' => array(
 					'mandatory' => true,
@@ -15924,6 +19035,7 @@ class AMP_Allowed_Tags_Generated {
 					'value' => array(
 						'',
 					),
+					'value_set' => 3,
 				),
 			),
 			'tag_spec' => array(
@@ -15954,6 +19066,7 @@ class AMP_Allowed_Tags_Generated {
 						'zoom-in',
 						'zoom-out',
 					),
+					'value_set' => 97,
 				),
 				'animate-in-after' => array(),
 				'animate-in-delay' => array(),
@@ -15993,11 +19106,13 @@ class AMP_Allowed_Tags_Generated {
 						'zoom-in',
 						'zoom-out',
 					),
+					'value_set' => 97,
 				),
 				'animate-in-after' => array(),
 				'animate-in-delay' => array(),
 				'animate-in-duration' => array(),
 				'data-tooltip-icon' => array(
+					'attr_spec_id' => 'e0e082e4',
 					'value_url' => array(
 						'protocol' => array(
 							'http',
@@ -16010,6 +19125,7 @@ class AMP_Allowed_Tags_Generated {
 					'value' => array(
 						'_blank',
 					),
+					'value_set' => 98,
 				),
 			),
 			'tag_spec' => array(
@@ -16035,6 +19151,7 @@ class AMP_Allowed_Tags_Generated {
 						'start',
 						'stretch',
 					),
+					'value_set' => 99,
 				),
 				'align-items' => array(
 					'value' => array(
@@ -16043,6 +19160,7 @@ class AMP_Allowed_Tags_Generated {
 						'start',
 						'stretch',
 					),
+					'value_set' => 100,
 				),
 				'align-self' => array(
 					'value' => array(
@@ -16051,6 +19169,7 @@ class AMP_Allowed_Tags_Generated {
 						'start',
 						'stretch',
 					),
+					'value_set' => 100,
 				),
 				'animate-in' => array(
 					'value' => array(
@@ -16073,11 +19192,13 @@ class AMP_Allowed_Tags_Generated {
 						'zoom-in',
 						'zoom-out',
 					),
+					'value_set' => 97,
 				),
 				'animate-in-after' => array(),
 				'animate-in-delay' => array(),
 				'animate-in-duration' => array(),
 				'data-tooltip-icon' => array(
+					'attr_spec_id' => 'e0e082e4',
 					'value_url' => array(
 						'protocol' => array(
 							'http',
@@ -16097,6 +19218,7 @@ class AMP_Allowed_Tags_Generated {
 						'start',
 						'stretch',
 					),
+					'value_set' => 99,
 				),
 				'justify-items' => array(
 					'value' => array(
@@ -16105,6 +19227,7 @@ class AMP_Allowed_Tags_Generated {
 						'start',
 						'stretch',
 					),
+					'value_set' => 100,
 				),
 				'justify-self' => array(
 					'value' => array(
@@ -16113,11 +19236,13 @@ class AMP_Allowed_Tags_Generated {
 						'start',
 						'stretch',
 					),
+					'value_set' => 100,
 				),
 				'target' => array(
 					'value' => array(
 						'_blank',
 					),
+					'value_set' => 98,
 				),
 			),
 			'tag_spec' => array(
@@ -16144,91 +19269,3593 @@ class AMP_Allowed_Tags_Generated {
 		),
 	);
 
+	private static $alternative_attr_names = array(
+		'href' => 'xlink:href',
+		'srcset' => 'src',
+	);
 
-	/**
-	 * Get allowed tags.
-	 *
-	 * @since 0.5
-	 * @return array Allowed tags.
-	 */
-	public static function get_allowed_tags() {
-		return self::$allowed_tags;
-	}
-
-	/**
-	 * Get allowed tag.
-	 *
-	 * Get the rules for a single tag so that the entire data structure needn't be passed around.
-	 *
-	 * @since 0.7
-	 * @param string $node_name Tag name.
-	 * @return array|null Allowed tag, or null if the tag does not exist.
-	 */
-	public static function get_allowed_tag( $node_name ) {
-		if ( isset( self::$allowed_tags[ $node_name ] ) ) {
-			return self::$allowed_tags[ $node_name ];
-		}
-		return null;
-	}
-
-	/**
-	 * Get descendant tag lists.
-	 *
-	 * @since 1.1
-	 * @return array Descendant tags list.
-	 */
-	public static function get_descendant_tag_lists() {
-		return self::$descendant_tag_lists;
-	}
-
-	/**
-	 * Get allowed descendant tag list for a tag.
-	 *
-	 * Get the descendant rules for a single tag so that the entire data structure needn't be passed around.
-	 *
-	 * @since 1.1
-	 * @param string $name Name for the descendants list.
-	 * @return array|bool Allowed tags list, or false if there are no restrictions.
-	 */
-	public static function get_descendant_tag_list( $name ) {
-		if ( isset( self::$descendant_tag_lists[ $name ] ) ) {
-			return self::$descendant_tag_lists[ $name ];
-		}
-		return false;
-	}
-
-	/**
-	 * Get reference point spec.
-	 *
-	 * @since 1.0
-	 * @param string $tag_spec_name Tag spec name.
-	 * @return array|null Reference point spec, or null if does not exist.
-	 */
-	public static function get_reference_point_spec( $tag_spec_name ) {
-		if ( isset( self::$reference_points[ $tag_spec_name ] ) ) {
-			return self::$reference_points[ $tag_spec_name ];
-		}
-		return null;
-	}
+	private static $attr_value_sets = array(
+		array(
+			'_blank' => true,
+			'_self' => true,
+			'_top' => true,
+		),
+		array(
+			'text/html' => true,
+		),
+		array(
+			'false' => true,
+			'true' => true,
+		),
+		array(
+			'' => true,
+		),
+		array(
+			'visibility' => true,
+		),
+		array(
+			'auto' => true,
+			'metadata' => true,
+			'none' => true,
+		),
+		array(
+			true,
+			true,
+		),
+		array(
+			'false' => true,
+			'number' => true,
+			'true' => true,
+		),
+		array(
+			'html' => true,
+			'svg' => true,
+		),
+		array(
+			'slides' => true,
+		),
+		array(
+			'carousel' => true,
+		),
+		array(
+			'days' => true,
+			'hours' => true,
+			'minutes' => true,
+			'seconds' => true,
+		),
+		array(
+			'de' => true,
+			'en' => true,
+			'es' => true,
+			'fr' => true,
+			'id' => true,
+			'it' => true,
+			'ja' => true,
+			'ko' => true,
+			'nl' => true,
+			'pt' => true,
+			'ru' => true,
+			'th' => true,
+			'tr' => true,
+			'vi' => true,
+			'zh-cn' => true,
+			'zh-tw' => true,
+		),
+		array(
+			'continue' => true,
+			'stop' => true,
+		),
+		array(
+			'utc' => true,
+		),
+		array(
+			'static' => true,
+		),
+		array(
+			'single' => true,
+		),
+		array(
+			'overlay' => true,
+		),
+		array(
+			'range' => true,
+		),
+		array(
+			'auto' => true,
+			'no' => true,
+			'yes' => true,
+		),
+		array(
+			'fade-in' => true,
+			'fly-in-bottom' => true,
+			'fly-in-top' => true,
+		),
+		array(
+			'always' => true,
+			'no' => true,
+			'refresh' => true,
+		),
+		array(
+			'auto' => true,
+			'manual' => true,
+		),
+		array(
+			'' => true,
+			'always' => true,
+			'fetch' => true,
+		),
+		array(
+			'ascending' => true,
+		),
+		array(
+			'adsense' => true,
+		),
+		array(
+			'api' => true,
+			'static' => true,
+		),
+		array(
+			'album' => true,
+			'audio' => true,
+			'live' => true,
+			'playlist' => true,
+			'playlist-marked' => true,
+			'video' => true,
+		),
+		array(
+			'no-referrer' => true,
+		),
+		array(
+			'comment' => true,
+			'post' => true,
+		),
+		array(
+			'focus' => true,
+			'none' => true,
+			'select' => true,
+		),
+		array(
+			'left' => true,
+			'right' => true,
+		),
+		array(
+			'playlist' => true,
+			'video' => true,
+		),
+		array(
+			'blocking' => true,
+			'notification' => true,
+		),
+		array(
+			'nodisplay' => true,
+		),
+		array(
+			'fill' => true,
+			'horizontal' => true,
+			'thirds' => true,
+			'vertical' => true,
+		),
+		array(
+			'application/x-www-form-urlencoded' => true,
+		),
+		array(
+			'' => true,
+			'auto' => true,
+			'metadata' => true,
+			'none' => true,
+		),
+		array(
+			'amp-web-push' => true,
+		),
+		array(
+			'blocked' => true,
+			'subscribed' => true,
+			'unsubscribed' => true,
+		),
+		array(
+			'include' => true,
+			'omit' => true,
+		),
+		array(
+			'/' => true,
+		),
+		array(
+			'as-you-go' => true,
+			'interact-and-submit' => true,
+			'show-all-on-submit' => true,
+			'show-first-on-submit' => true,
+		),
+		array(
+			'get' => true,
+		),
+		array(
+			'_blank' => true,
+			'_top' => true,
+		),
+		array(
+			'post' => true,
+		),
+		array(
+			'async' => true,
+			'auto' => true,
+			'sync' => true,
+		),
+		array(
+			'file' => true,
+		),
+		array(
+			'password' => true,
+		),
+		array(
+			'search' => true,
+			'tel' => true,
+			'text' => true,
+		),
+		array(
+			'payment-card' => true,
+		),
+		array(
+			'date-dd-mm-yyyy' => true,
+		),
+		array(
+			'date-mm-dd-yyyy' => true,
+		),
+		array(
+			'date-mm-yy' => true,
+		),
+		array(
+			'date-yyyy-mm-dd' => true,
+		),
+		array(
+			'utf-8' => true,
+		),
+		array(
+			'canonical' => true,
+		),
+		array(
+			'manifest' => true,
+		),
+		array(
+			'preload' => true,
+		),
+		array(
+			'stylesheet' => true,
+		),
+		array(
+			'text/css' => true,
+		),
+		array(
+			'sameas' => true,
+		),
+		array(
+			'viewport' => true,
+		),
+		array(
+			'x-ua-compatible' => true,
+		),
+		array(
+			'apple-itunes-app' => true,
+		),
+		array(
+			'amp-experiments-opt-in' => true,
+		),
+		array(
+			'amp-3p-iframe-src' => true,
+		),
+		array(
+			'amp-consent-blocking' => true,
+		),
+		array(
+			'amp-experiment-token' => true,
+		),
+		array(
+			'amp-link-variable-allowed-origin' => true,
+		),
+		array(
+			'amp-google-client-id-api' => true,
+		),
+		array(
+			'amp-ad-doubleclick-sra' => true,
+		),
+		array(
+			'text/html; charset=utf-8' => true,
+		),
+		array(
+			'content-type' => true,
+		),
+		array(
+			'content-language' => true,
+		),
+		array(
+			'pics-label' => true,
+		),
+		array(
+			'imagetoolbar' => true,
+		),
+		array(
+			'content-style-type' => true,
+		),
+		array(
+			'text/javascript' => true,
+		),
+		array(
+			'content-script-type' => true,
+		),
+		array(
+			'origin-trial' => true,
+		),
+		array(
+			'resource-type' => true,
+		),
+		array(
+			'off' => true,
+			'on' => true,
+		),
+		array(
+			'x-dns-prefetch-control' => true,
+		),
+		array(
+			'amp-ad-enable-refresh' => true,
+		),
+		array(
+			'amp-to-amp-navigation' => true,
+		),
+		array(
+			'https://cdn.ampproject.org/v0.js' => true,
+		),
+		array(
+			'application/ld+json' => true,
+		),
+		array(
+			'amp-rtc' => true,
+		),
+		array(
+			'application/json' => true,
+		),
+		array(
+			'amp-access' => true,
+		),
+		array(
+			'amp-mustache' => true,
+		),
+		array(
+			'text/plain' => true,
+		),
+		array(
+			'amp-subscriptions' => true,
+		),
+		array(
+			'1.0' => true,
+			'1.1' => true,
+		),
+		array(
+			'captions' => true,
+			'chapters' => true,
+			'descriptions' => true,
+			'metadata' => true,
+		),
+		array(
+			'subtitles' => true,
+		),
+		array(
+			'drop' => true,
+			'fade-in' => true,
+			'fly-in-bottom' => true,
+			'fly-in-left' => true,
+			'fly-in-right' => true,
+			'fly-in-top' => true,
+			'pan-down' => true,
+			'pan-left' => true,
+			'pan-right' => true,
+			'pan-up' => true,
+			'pulse' => true,
+			'rotate-in-left' => true,
+			'rotate-in-right' => true,
+			'twirl-in' => true,
+			'whoosh-in-left' => true,
+			'whoosh-in-right' => true,
+			'zoom-in' => true,
+			'zoom-out' => true,
+		),
+		array(
+			'_blank' => true,
+		),
+		array(
+			'center' => true,
+			'end' => true,
+			'space-around' => true,
+			'space-between' => true,
+			'space-evenly' => true,
+			'start' => true,
+			'stretch' => true,
+		),
+		array(
+			'center' => true,
+			'end' => true,
+			'start' => true,
+			'stretch' => true,
+		),
+		array(
+			'actions' => true,
+			'content' => true,
+			'content-not-granted' => true,
+			'loading' => true,
+		),
+		array(
+			'badInput' => true,
+			'customError' => true,
+			'patternMismatch' => true,
+			'rangeOverflow' => true,
+			'rangeUnderflow' => true,
+			'stepMismatch' => true,
+			'tooLong' => true,
+			'typeMismatch' => true,
+			'valueMissing' => true,
+		),
+	);
 
-	/**
-	 * Get list of globally-allowed attributes.
-	 *
-	 * @since 0.5
-	 * @return array Allowed tag.
-	 */
-	public static function get_allowed_attributes() {
-		return self::$globally_allowed_attrs;
-	}
+	private static $layout_tables = array(
+		array(
+			192,
+			200,
+			200,
+			192,
+			192,
+			192,
+			192,
+			212,
+			196,
+			192,
+			192,
+			192,
+			192,
+			196,
+			212,
+			192,
+			192,
+			192,
+			192,
+			200,
+			200,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+		),
+		array(
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			212,
+			196,
+			192,
+			192,
+			192,
+			192,
+			196,
+			212,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+			192,
+		),
+		array(
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+		),
+		array(
+			450,
+			458,
+			458,
+			450,
+			450,
+			450,
+			450,
+			982,
+			454,
+			450,
+			450,
+			450,
+			450,
+			454,
+			982,
+			450,
+			450,
+			450,
+			450,
+			458,
+			458,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+			450,
+		),
+		array(
+			194,
+			202,
+			202,
+			194,
+			194,
+			194,
+			194,
+			214,
+			198,
+			194,
+			194,
+			194,
+			194,
+			198,
+			214,
+			194,
+			194,
+			194,
+			194,
+			202,
+			202,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+		),
+		array(
+			194,
+			202,
+			202,
+			194,
+			194,
+			194,
+			194,
+			726,
+			198,
+			194,
+			194,
+			194,
+			194,
+			198,
+			726,
+			194,
+			194,
+			194,
+			194,
+			202,
+			202,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+			194,
+		),
+		array(
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+		),
+		array(
+			2,
+			10,
+			10,
+			2,
+			2,
+			2,
+			2,
+			6,
+			6,
+			2,
+			2,
+			2,
+			2,
+			6,
+			6,
+			2,
+			2,
+			2,
+			2,
+			10,
+			10,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+		),
+		array(
+			224,
+			232,
+			232,
+			224,
+			224,
+			224,
+			224,
+			244,
+			228,
+			224,
+			224,
+			224,
+			224,
+			228,
+			244,
+			224,
+			224,
+			224,
+			224,
+			232,
+			232,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+			224,
+		),
+		array(
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+			34,
+		),
+		array(
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			16,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			16,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+		),
+		array(
+			0,
+			8,
+			8,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			8,
+			8,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+		),
+		array(
+			66,
+			74,
+			74,
+			66,
+			66,
+			66,
+			66,
+			86,
+			70,
+			66,
+			66,
+			66,
+			66,
+			70,
+			86,
+			66,
+			66,
+			66,
+			66,
+			74,
+			74,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+			66,
+		),
+		array(
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			534,
+			6,
+			2,
+			2,
+			2,
+			2,
+			6,
+			534,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+		),
+		array(
+			226,
+			234,
+			234,
+			226,
+			226,
+			226,
+			226,
+			758,
+			230,
+			226,
+			226,
+			226,
+			226,
+			230,
+			758,
+			226,
+			226,
+			226,
+			226,
+			234,
+			234,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+		),
+		array(
+			32,
+			40,
+			40,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			40,
+			40,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+			32,
+		),
+		array(
+			64,
+			72,
+			72,
+			64,
+			64,
+			64,
+			64,
+			84,
+			68,
+			64,
+			64,
+			64,
+			64,
+			68,
+			84,
+			64,
+			64,
+			64,
+			64,
+			72,
+			72,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+			64,
+		),
+		array(
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			6,
+			6,
+			2,
+			2,
+			2,
+			2,
+			6,
+			6,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+			2,
+		),
+		array(
+			0,
+			8,
+			8,
+			0,
+			0,
+			0,
+			0,
+			16,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			16,
+			0,
+			0,
+			0,
+			0,
+			8,
+			8,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+		),
+		array(
+			98,
+			106,
+			106,
+			98,
+			98,
+			98,
+			98,
+			118,
+			102,
+			98,
+			98,
+			98,
+			98,
+			102,
+			118,
+			98,
+			98,
+			98,
+			98,
+			106,
+			106,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+			98,
+		),
+		array(
+			226,
+			234,
+			234,
+			226,
+			226,
+			226,
+			226,
+			246,
+			230,
+			226,
+			226,
+			226,
+			226,
+			230,
+			246,
+			226,
+			226,
+			226,
+			226,
+			234,
+			234,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+			226,
+		),
+		array(
+			0,
+			8,
+			8,
+			0,
+			0,
+			0,
+			0,
+			20,
+			4,
+			0,
+			0,
+			0,
+			0,
+			4,
+			20,
+			0,
+			0,
+			0,
+			0,
+			8,
+			8,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+		),
+		array(
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			148,
+			132,
+			128,
+			128,
+			128,
+			128,
+			132,
+			148,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+			128,
+		),
+		array(
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			4,
+			4,
+			0,
+			0,
+			0,
+			0,
+			4,
+			4,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+			0,
+		),
+	);
 
-	/**
-	 * Get layout attributes.
-	 *
-	 * @since 0.5
-	 * @return array Allowed tag.
-	 */
-	public static function get_layout_attributes() {
-		return self::$layout_allowed_attrs;
+	private static $tag_spec_dispatch_index = array(
+		'amp-ad' => array(
+			'dispatch_keys' => array(
+				'data-enable-refresh=' => array(
+					2,
+				),
+				'data-multi-size=' => array(
+					1,
+				),
+			),
+		),
+		'amp-audio' => array(
+			'dispatch_keys' => array(),
+		),
+		'amp-carousel' => array(
+			'dispatch_keys' => array(),
+		),
+		'amp-consent' => array(
+			'dispatch_keys' => array(),
+		),
+		'amp-date-picker' => array(
+			'dispatch_keys' => array(),
+		),
+		'amp-embed' => array(
+			'dispatch_keys' => array(
+				'data-multi-size=' => array(
+					1,
+				),
+			),
+		),
+		'amp-next-page' => array(
+			'dispatch_keys' => array(),
+		),
+		'amp-sidebar' => array(
+			'dispatch_keys' => array(),
+		),
+		'amp-video' => array(
+			'dispatch_keys' => array(),
+		),
+		'amp-video-iframe' => array(
+			'dispatch_keys' => array(),
+		),
+		'button' => array(
+			'dispatch_keys' => array(),
+		),
+		'div' => array(
+			'dispatch_keys' => array(),
+		),
+		'form' => array(
+			'dispatch_keys' => array(
+				'method=post' => array(
+					1,
+				),
+			),
+		),
+		'input' => array(
+			'dispatch_keys' => array(
+				'mask' => array(
+					3,
+				),
+				'mask=date-dd-mm-yyyy' => array(
+					5,
+				),
+				'mask=date-mm-dd-yyyy' => array(
+					6,
+				),
+				'mask=date-mm-yy' => array(
+					7,
+				),
+				'mask=date-yyyy-mm-dd' => array(
+					8,
+				),
+				'mask=payment-card' => array(
+					4,
+				),
+				'type=file' => array(
+					1,
+				),
+				'type=password' => array(
+					2,
+				),
+			),
+		),
+		'link' => array(
+			'dispatch_keys' => array(
+				'itemprop=sameas' => array(
+					5,
+				),
+				'rel=canonical' => array(
+					1,
+				),
+				'rel=manifest' => array(
+					2,
+				),
+				'rel=preload' => array(
+					3,
+				),
+				'rel=stylesheet' => array(
+					4,
+				),
+			),
+		),
+		'meta' => array(
+			'dispatch_keys' => array(
+				'charset' => array(
+					0,
+				),
+				'http-equiv=content-language' => array(
+					13,
+				),
+				'http-equiv=content-script-type' => array(
+					17,
+				),
+				'http-equiv=content-style-type' => array(
+					16,
+				),
+				'http-equiv=content-type' => array(
+					12,
+				),
+				'http-equiv=imagetoolbar' => array(
+					15,
+				),
+				'http-equiv=origin-trial' => array(
+					18,
+				),
+				'http-equiv=pics-label' => array(
+					14,
+				),
+				'http-equiv=resource-type' => array(
+					19,
+				),
+				'http-equiv=x-dns-prefetch-control' => array(
+					20,
+				),
+				'http-equiv=x-ua-compatible' => array(
+					2,
+				),
+				'name=amp-3p-iframe-src' => array(
+					5,
+				),
+				'name=amp-ad-doubleclick-sra' => array(
+					10,
+				),
+				'name=amp-ad-enable-refresh' => array(
+					21,
+				),
+				'name=amp-consent-blocking' => array(
+					6,
+				),
+				'name=amp-experiment-token' => array(
+					7,
+				),
+				'name=amp-experiments-opt-in' => array(
+					4,
+				),
+				'name=amp-google-client-id-api' => array(
+					9,
+				),
+				'name=amp-link-variable-allowed-origin' => array(
+					8,
+				),
+				'name=amp-to-amp-navigation' => array(
+					22,
+				),
+				'name=apple-itunes-app' => array(
+					3,
+				),
+				'name=viewport' => array(
+					1,
+				),
+			),
+		),
+		'nav' => array(
+			'dispatch_keys' => array(
+				'toolbar' => array(
+					1,
+				),
+			),
+		),
+		'noscript' => array(
+			'dispatch_keys' => array(),
+		),
+		'script' => array(
+			'dispatch_keys' => array(
+				'custom-element=amp-3d-gltf' => array(
+					4,
+				),
+				'custom-element=amp-3q-player' => array(
+					5,
+				),
+				'custom-element=amp-access' => array(
+					9,
+				),
+				'custom-element=amp-access-laterpay' => array(
+					6,
+				),
+				'custom-element=amp-access-poool' => array(
+					7,
+				),
+				'custom-element=amp-access-scroll' => array(
+					8,
+				),
+				'custom-element=amp-accordion' => array(
+					11,
+				),
+				'custom-element=amp-action-macro' => array(
+					12,
+				),
+				'custom-element=amp-ad' => array(
+					13,
+				),
+				'custom-element=amp-addthis' => array(
+					14,
+				),
+				'custom-element=amp-analytics' => array(
+					15,
+				),
+				'custom-element=amp-anim' => array(
+					17,
+				),
+				'custom-element=amp-animation' => array(
+					18,
+				),
+				'custom-element=amp-apester-media' => array(
+					20,
+				),
+				'custom-element=amp-app-banner' => array(
+					21,
+				),
+				'custom-element=amp-audio' => array(
+					22,
+				),
+				'custom-element=amp-auto-ads' => array(
+					23,
+				),
+				'custom-element=amp-beopinion' => array(
+					24,
+				),
+				'custom-element=amp-bind' => array(
+					25,
+				),
+				'custom-element=amp-bodymovin-animation' => array(
+					27,
+				),
+				'custom-element=amp-brid-player' => array(
+					28,
+				),
+				'custom-element=amp-brightcove' => array(
+					29,
+				),
+				'custom-element=amp-byside-content' => array(
+					30,
+				),
+				'custom-element=amp-call-tracking' => array(
+					31,
+				),
+				'custom-element=amp-carousel' => array(
+					32,
+				),
+				'custom-element=amp-consent' => array(
+					33,
+				),
+				'custom-element=amp-dailymotion' => array(
+					35,
+				),
+				'custom-element=amp-date-countdown' => array(
+					36,
+				),
+				'custom-element=amp-date-display' => array(
+					37,
+				),
+				'custom-element=amp-date-picker' => array(
+					38,
+				),
+				'custom-element=amp-delight-player' => array(
+					39,
+				),
+				'custom-element=amp-dynamic-css-classes' => array(
+					40,
+				),
+				'custom-element=amp-embedly-card' => array(
+					41,
+				),
+				'custom-element=amp-experiment' => array(
+					42,
+				),
+				'custom-element=amp-facebook' => array(
+					47,
+				),
+				'custom-element=amp-facebook-comments' => array(
+					44,
+				),
+				'custom-element=amp-facebook-like' => array(
+					45,
+				),
+				'custom-element=amp-facebook-page' => array(
+					46,
+				),
+				'custom-element=amp-fit-text' => array(
+					48,
+				),
+				'custom-element=amp-font' => array(
+					49,
+				),
+				'custom-element=amp-form' => array(
+					50,
+				),
+				'custom-element=amp-fx-collection' => array(
+					51,
+				),
+				'custom-element=amp-fx-flying-carpet' => array(
+					52,
+				),
+				'custom-element=amp-geo' => array(
+					53,
+				),
+				'custom-element=amp-gfycat' => array(
+					55,
+				),
+				'custom-element=amp-gist' => array(
+					56,
+				),
+				'custom-element=amp-google-document-embed' => array(
+					57,
+				),
+				'custom-element=amp-hulu' => array(
+					58,
+				),
+				'custom-element=amp-iframe' => array(
+					59,
+				),
+				'custom-element=amp-ima-video' => array(
+					60,
+				),
+				'custom-element=amp-image-lightbox' => array(
+					61,
+				),
+				'custom-element=amp-image-slider' => array(
+					62,
+				),
+				'custom-element=amp-imgur' => array(
+					63,
+				),
+				'custom-element=amp-inputmask' => array(
+					64,
+				),
+				'custom-element=amp-instagram' => array(
+					65,
+				),
+				'custom-element=amp-install-serviceworker' => array(
+					66,
+				),
+				'custom-element=amp-izlesene' => array(
+					67,
+				),
+				'custom-element=amp-jwplayer' => array(
+					68,
+				),
+				'custom-element=amp-kaltura-player' => array(
+					69,
+				),
+				'custom-element=amp-lightbox' => array(
+					71,
+				),
+				'custom-element=amp-lightbox-gallery' => array(
+					70,
+				),
+				'custom-element=amp-list' => array(
+					72,
+				),
+				'custom-element=amp-live-list' => array(
+					73,
+				),
+				'custom-element=amp-mathml' => array(
+					74,
+				),
+				'custom-element=amp-mowplayer' => array(
+					75,
+				),
+				'custom-element=amp-next-page' => array(
+					78,
+				),
+				'custom-element=amp-nexxtv-player' => array(
+					80,
+				),
+				'custom-element=amp-o2-player' => array(
+					81,
+				),
+				'custom-element=amp-ooyala-player' => array(
+					82,
+				),
+				'custom-element=amp-orientation-observer' => array(
+					83,
+				),
+				'custom-element=amp-pan-zoom' => array(
+					84,
+				),
+				'custom-element=amp-pinterest' => array(
+					85,
+				),
+				'custom-element=amp-playbuzz' => array(
+					86,
+				),
+				'custom-element=amp-position-observer' => array(
+					87,
+				),
+				'custom-element=amp-powr-player' => array(
+					88,
+				),
+				'custom-element=amp-reach-player' => array(
+					89,
+				),
+				'custom-element=amp-recaptcha-input' => array(
+					90,
+				),
+				'custom-element=amp-reddit' => array(
+					91,
+				),
+				'custom-element=amp-riddle-quiz' => array(
+					92,
+				),
+				'custom-element=amp-selector' => array(
+					93,
+				),
+				'custom-element=amp-sidebar' => array(
+					94,
+				),
+				'custom-element=amp-skimlinks' => array(
+					95,
+				),
+				'custom-element=amp-social-share' => array(
+					96,
+				),
+				'custom-element=amp-soundcloud' => array(
+					97,
+				),
+				'custom-element=amp-springboard-player' => array(
+					98,
+				),
+				'custom-element=amp-sticky-ad' => array(
+					99,
+				),
+				'custom-element=amp-story' => array(
+					102,
+				),
+				'custom-element=amp-story-auto-ads' => array(
+					100,
+				),
+				'custom-element=amp-subscriptions' => array(
+					105,
+				),
+				'custom-element=amp-subscriptions-google' => array(
+					107,
+				),
+				'custom-element=amp-timeago' => array(
+					108,
+				),
+				'custom-element=amp-twitter' => array(
+					109,
+				),
+				'custom-element=amp-user-notification' => array(
+					110,
+				),
+				'custom-element=amp-video' => array(
+					113,
+				),
+				'custom-element=amp-video-docking' => array(
+					111,
+				),
+				'custom-element=amp-video-iframe' => array(
+					112,
+				),
+				'custom-element=amp-vimeo' => array(
+					114,
+				),
+				'custom-element=amp-vine' => array(
+					115,
+				),
+				'custom-element=amp-viqeo-player' => array(
+					116,
+				),
+				'custom-element=amp-vk' => array(
+					117,
+				),
+				'custom-element=amp-web-push' => array(
+					118,
+				),
+				'custom-element=amp-wistia-player' => array(
+					119,
+				),
+				'custom-element=amp-yotpo' => array(
+					120,
+				),
+				'custom-element=amp-youtube' => array(
+					121,
+				),
+				'custom-template=amp-mustache' => array(
+					76,
+				),
+				'id=amp-access' => array(
+					10,
+				),
+				'id=amp-rtc' => array(
+					2,
+				),
+				'id=amp-subscriptions' => array(
+					106,
+				),
+				'src=https://cdn.ampproject.org/v0.js' => array(
+					0,
+				),
+				'template=amp-mustache' => array(
+					77,
+				),
+				'type=application/json' => array(
+					3,
+					16,
+					19,
+					26,
+					34,
+					43,
+					54,
+					79,
+					101,
+					103,
+					104,
+				),
+				'type=application/ld+json' => array(
+					1,
+				),
+			),
+		),
+		'section' => array(
+			'dispatch_keys' => array(),
+		),
+		'source' => array(
+			'dispatch_keys' => array(),
+		),
+		'stop' => array(
+			'dispatch_keys' => array(),
+		),
+		'style' => array(
+			'dispatch_keys' => array(
+				'amp-boilerplate=' => array(
+					1,
+					2,
+				),
+				'amp-keyframes' => array(
+					3,
+				),
+			),
+		),
+		'template' => array(
+			'dispatch_keys' => array(
+				'date-template' => array(
+					0,
+				),
+				'info-template' => array(
+					1,
+				),
+				'type=amp-mustache' => array(
+					3,
+				),
+			),
+		),
+		'title' => array(
+			'dispatch_keys' => array(),
+		),
+		'track' => array(
+			'dispatch_keys' => array(),
+		),
+	);
+
+	private static $spec_name_components = array(
+		'!doctype' => array(
+			'attributes' => array(),
+			'tag_name' => '!doctype',
+		),
+		'amp-accordion' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-accordion',
+		),
+		'amp-analytics' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-analytics',
+		),
+		'amp-animation' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-animation',
+		),
+		'amp-app-banner' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-app-banner',
+		),
+		'amp-audio' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-audio',
+		),
+		'amp-auto-ads' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-auto-ads',
+		),
+		'amp-carousel' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-carousel',
+		),
+		'amp-consent' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-consent',
+		),
+		'amp-date-picker' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-date-picker',
+		),
+		'amp-experiment' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-experiment',
+		),
+		'amp-fx-flying-carpet' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-fx-flying-carpet',
+		),
+		'amp-geo' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-geo',
+		),
+		'amp-ima-video' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-ima-video',
+		),
+		'amp-image-slider' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-image-slider',
+		),
+		'amp-lightbox' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-lightbox',
+		),
+		'amp-list' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-list',
+		),
+		'amp-next-page' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-next-page',
+		),
+		'amp-selector' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-selector',
+		),
+		'amp-sidebar' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-sidebar',
+		),
+		'amp-state' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-state',
+		),
+		'amp-sticky-ad' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-sticky-ad',
+		),
+		'amp-story' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-story',
+		),
+		'amp-story-auto-ads' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-story-auto-ads',
+		),
+		'amp-story-bookend' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-story-bookend',
+		),
+		'amp-story-consent' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-story-consent',
+		),
+		'amp-story-page' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-story-page',
+		),
+		'amp-video' => array(
+			'attributes' => array(),
+			'tag_name' => 'amp-video',
+		),
+		'audio' => array(
+			'attributes' => array(),
+			'tag_name' => 'audio',
+		),
+		'body' => array(
+			'attributes' => array(),
+			'tag_name' => 'body',
+		),
+		'details' => array(
+			'attributes' => array(),
+			'tag_name' => 'details',
+		),
+		'form' => array(
+			'attributes' => array(),
+			'tag_name' => 'form',
+		),
+		'form [method=post]' => array(
+			'attributes' => array(
+				'method' => 'post',
+			),
+			'tag_name' => 'form',
+		),
+		'form div [submit-error][template]' => array(
+			'attributes' => array(
+				'submit-error' => true,
+				'template' => true,
+			),
+			'tag_name' => 'div',
+		),
+		'form div [submit-success][template]' => array(
+			'attributes' => array(
+				'submit-success' => true,
+				'template' => true,
+			),
+			'tag_name' => 'div',
+		),
+		'form div [submitting][template]' => array(
+			'attributes' => array(
+				'submitting' => true,
+				'template' => true,
+			),
+			'tag_name' => 'div',
+		),
+		'form div [verify-error][template]' => array(
+			'attributes' => array(
+				'template' => true,
+				'verify-error' => true,
+			),
+			'tag_name' => 'div',
+		),
+		'head' => array(
+			'attributes' => array(),
+			'tag_name' => 'head',
+		),
+		'html' => array(
+			'attributes' => array(),
+			'tag_name' => 'html',
+		),
+		'lineargradient' => array(
+			'attributes' => array(),
+			'tag_name' => 'lineargradient',
+		),
+		'noscript' => array(
+			'attributes' => array(),
+			'tag_name' => 'noscript',
+		),
+		'picture' => array(
+			'attributes' => array(),
+			'tag_name' => 'picture',
+		),
+		'radialgradient' => array(
+			'attributes' => array(),
+			'tag_name' => 'radialgradient',
+		),
+		'select' => array(
+			'attributes' => array(),
+			'tag_name' => 'select',
+		),
+		'svg' => array(
+			'attributes' => array(),
+			'tag_name' => 'svg',
+		),
+		'template' => array(
+			'attributes' => array(),
+			'tag_name' => 'template',
+		),
+		'video' => array(
+			'attributes' => array(),
+			'tag_name' => 'video',
+		),
+	);
+
+	private static $css_specs = array(
+		'style amp-custom' => array(
+			'allowed_at_rules' => array(
+				'font-face' => true,
+				'keyframes' => true,
+				'media' => true,
+				'page' => true,
+				'supports' => true,
+			),
+			'declarations' => array(),
+			'validate_keyframes' => false,
+		),
+		'style attribute' => array(
+			'allowed_at_rules' => array(),
+			'declarations' => array(),
+			'validate_keyframes' => false,
+		),
+		'style[amp-keyframes]' => array(
+			'allowed_at_rules' => array(
+				'keyframes' => true,
+				'media' => true,
+				'supports' => true,
+			),
+			'declarations' => array(
+				'-moz-animation-timing-function' => true,
+				'-moz-offset-distance' => true,
+				'-moz-opacity' => true,
+				'-moz-transform' => true,
+				'-moz-visibility' => true,
+				'-ms-animation-timing-function' => true,
+				'-ms-offset-distance' => true,
+				'-ms-opacity' => true,
+				'-ms-transform' => true,
+				'-ms-visibility' => true,
+				'-o-animation-timing-function' => true,
+				'-o-offset-distance' => true,
+				'-o-opacity' => true,
+				'-o-transform' => true,
+				'-o-visibility' => true,
+				'-webkit-animation-timing-function' => true,
+				'-webkit-offset-distance' => true,
+				'-webkit-opacity' => true,
+				'-webkit-transform' => true,
+				'-webkit-visibility' => true,
+				'animation-timing-function' => true,
+				'offset-distance' => true,
+				'opacity' => true,
+				'transform' => true,
+				'visibility' => true,
+			),
+			'validate_keyframes' => true,
+		),
+	);
+
+	private static $extension_index = array(
+		'attributes' => array(
+			'amp-fx' => array(
+				'amp-fx-collection',
+			),
+			'autoexpand' => array(
+				'amp-form',
+			),
+			'dock' => array(
+				'amp-video-docking',
+			),
+			'subscriptions-action' => array(
+				'amp-subscriptions',
+			),
+			'subscriptions-actions' => array(
+				'amp-subscriptions',
+			),
+			'subscriptions-decorate' => array(
+				'amp-subscriptions',
+			),
+			'subscriptions-dialog' => array(
+				'amp-subscriptions',
+			),
+			'subscriptions-display' => array(
+				'amp-subscriptions',
+			),
+			'subscriptions-section' => array(
+				'amp-subscriptions',
+			),
+			'subscriptions-service' => array(
+				'amp-subscriptions',
+			),
+		),
+		'tags' => array(
+			'amp-3d-gltf' => array(
+				'amp-3d-gltf',
+			),
+			'amp-3q-player' => array(
+				'amp-3q-player',
+			),
+			'amp-accordion' => array(
+				'amp-accordion',
+			),
+			'amp-action-macro' => array(
+				'amp-action-macro',
+			),
+			'amp-ad' => array(
+				'amp-ad',
+			),
+			'amp-addthis' => array(
+				'amp-addthis',
+			),
+			'amp-analytics' => array(
+				'amp-analytics',
+			),
+			'amp-anim' => array(
+				'amp-anim',
+			),
+			'amp-animation' => array(
+				'amp-animation',
+			),
+			'amp-apester-media' => array(
+				'amp-apester-media',
+			),
+			'amp-app-banner' => array(
+				'amp-app-banner',
+			),
+			'amp-audio' => array(
+				'amp-audio',
+			),
+			'amp-auto-ads' => array(
+				'amp-auto-ads',
+			),
+			'amp-beopinion' => array(
+				'amp-beopinion',
+			),
+			'amp-bind-macro' => array(
+				'amp-bind',
+			),
+			'amp-bodymovin-animation' => array(
+				'amp-bodymovin-animation',
+			),
+			'amp-brid-player' => array(
+				'amp-brid-player',
+			),
+			'amp-brightcove' => array(
+				'amp-brightcove',
+			),
+			'amp-byside-content' => array(
+				'amp-byside-content',
+			),
+			'amp-call-tracking' => array(
+				'amp-call-tracking',
+			),
+			'amp-consent' => array(
+				'amp-consent',
+			),
+			'amp-dailymotion' => array(
+				'amp-dailymotion',
+			),
+			'amp-date-countdown' => array(
+				'amp-date-countdown',
+			),
+			'amp-date-display' => array(
+				'amp-date-display',
+			),
+			'amp-date-picker' => array(
+				'amp-date-picker',
+			),
+			'amp-delight-player' => array(
+				'amp-delight-player',
+			),
+			'amp-embed' => array(
+				'amp-ad',
+			),
+			'amp-embedly-card' => array(
+				'amp-embedly-card',
+			),
+			'amp-embedly-key' => array(
+				'amp-embedly-card',
+			),
+			'amp-experiment' => array(
+				'amp-experiment',
+			),
+			'amp-facebook' => array(
+				'amp-facebook',
+			),
+			'amp-facebook-comments' => array(
+				'amp-facebook-comments',
+			),
+			'amp-facebook-like' => array(
+				'amp-facebook-like',
+			),
+			'amp-facebook-page' => array(
+				'amp-facebook-page',
+			),
+			'amp-fit-text' => array(
+				'amp-fit-text',
+			),
+			'amp-font' => array(
+				'amp-font',
+			),
+			'amp-fx-flying-carpet' => array(
+				'amp-fx-flying-carpet',
+			),
+			'amp-geo' => array(
+				'amp-geo',
+			),
+			'amp-gfycat' => array(
+				'amp-gfycat',
+			),
+			'amp-gist' => array(
+				'amp-gist',
+			),
+			'amp-google-document-embed' => array(
+				'amp-google-document-embed',
+			),
+			'amp-hulu' => array(
+				'amp-hulu',
+			),
+			'amp-iframe' => array(
+				'amp-iframe',
+			),
+			'amp-ima-video' => array(
+				'amp-ima-video',
+			),
+			'amp-image-lightbox' => array(
+				'amp-image-lightbox',
+			),
+			'amp-image-slider' => array(
+				'amp-image-slider',
+			),
+			'amp-imgur' => array(
+				'amp-imgur',
+			),
+			'amp-instagram' => array(
+				'amp-instagram',
+			),
+			'amp-install-serviceworker' => array(
+				'amp-install-serviceworker',
+			),
+			'amp-izlesene' => array(
+				'amp-izlesene',
+			),
+			'amp-jwplayer' => array(
+				'amp-jwplayer',
+			),
+			'amp-kaltura-player' => array(
+				'amp-kaltura-player',
+			),
+			'amp-lightbox' => array(
+				'amp-lightbox',
+			),
+			'amp-list' => array(
+				'amp-list',
+			),
+			'amp-list-load-more' => array(
+				'amp-list',
+			),
+			'amp-live-list' => array(
+				'amp-live-list',
+			),
+			'amp-mathml' => array(
+				'amp-mathml',
+			),
+			'amp-mowplayer' => array(
+				'amp-mowplayer',
+			),
+			'amp-next-page' => array(
+				'amp-next-page',
+			),
+			'amp-nexxtv-player' => array(
+				'amp-nexxtv-player',
+			),
+			'amp-o2-player' => array(
+				'amp-o2-player',
+			),
+			'amp-ooyala-player' => array(
+				'amp-ooyala-player',
+			),
+			'amp-orientation-observer' => array(
+				'amp-orientation-observer',
+			),
+			'amp-pan-zoom' => array(
+				'amp-pan-zoom',
+			),
+			'amp-pinterest' => array(
+				'amp-pinterest',
+			),
+			'amp-playbuzz' => array(
+				'amp-playbuzz',
+			),
+			'amp-position-observer' => array(
+				'amp-position-observer',
+			),
+			'amp-powr-player' => array(
+				'amp-powr-player',
+			),
+			'amp-reach-player' => array(
+				'amp-reach-player',
+			),
+			'amp-recaptcha-input' => array(
+				'amp-form',
+				'amp-recaptcha-input',
+			),
+			'amp-reddit' => array(
+				'amp-reddit',
+			),
+			'amp-riddle-quiz' => array(
+				'amp-riddle-quiz',
+			),
+			'amp-selector' => array(
+				'amp-selector',
+			),
+			'amp-sidebar' => array(
+				'amp-sidebar',
+			),
+			'amp-skimlinks' => array(
+				'amp-skimlinks',
+			),
+			'amp-social-share' => array(
+				'amp-social-share',
+			),
+			'amp-soundcloud' => array(
+				'amp-soundcloud',
+			),
+			'amp-springboard-player' => array(
+				'amp-springboard-player',
+			),
+			'amp-state' => array(
+				'amp-bind',
+			),
+			'amp-sticky-ad' => array(
+				'amp-sticky-ad',
+			),
+			'amp-story' => array(
+				'amp-story',
+			),
+			'amp-story-access' => array(
+				'amp-access',
+			),
+			'amp-story-auto-ads' => array(
+				'amp-story-auto-ads',
+			),
+			'amp-story-consent' => array(
+				'amp-consent',
+				'amp-story',
+			),
+			'amp-story-page' => array(
+				'amp-story',
+			),
+			'amp-timeago' => array(
+				'amp-timeago',
+			),
+			'amp-twitter' => array(
+				'amp-twitter',
+			),
+			'amp-user-notification' => array(
+				'amp-user-notification',
+			),
+			'amp-video' => array(
+				'amp-video',
+			),
+			'amp-video-iframe' => array(
+				'amp-video-iframe',
+			),
+			'amp-vimeo' => array(
+				'amp-vimeo',
+			),
+			'amp-vine' => array(
+				'amp-vine',
+			),
+			'amp-viqeo-player' => array(
+				'amp-viqeo-player',
+			),
+			'amp-vk' => array(
+				'amp-vk',
+			),
+			'amp-web-push' => array(
+				'amp-web-push',
+			),
+			'amp-web-push-widget' => array(
+				'amp-web-push',
+			),
+			'amp-wistia-player' => array(
+				'amp-wistia-player',
+			),
+			'amp-yotpo' => array(
+				'amp-yotpo',
+			),
+			'amp-youtube' => array(
+				'amp-youtube',
+			),
+			'form' => array(
+				'amp-form',
+			),
+			'template' => array(
+				'amp-mustache',
+			),
+		),
+	);
+
+	private static $extension_specs = array(
+		'amp-3d-gltf' => array(
+			'name' => 'amp-3d-gltf',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-3q-player' => array(
+			'name' => 'amp-3q-player',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-access' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-access',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-access-laterpay' => array(
+			'name' => 'amp-access-laterpay',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'0.2',
+				'latest',
+			),
+		),
+		'amp-access-poool' => array(
+			'name' => 'amp-access-poool',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-access-scroll' => array(
+			'name' => 'amp-access-scroll',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-accordion' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-accordion',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-action-macro' => array(
+			'name' => 'amp-action-macro',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-ad' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-ad',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-addthis' => array(
+			'name' => 'amp-addthis',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-analytics' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-analytics',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-anim' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-anim',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-animation' => array(
+			'name' => 'amp-animation',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-apester-media' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-apester-media',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-app-banner' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-app-banner',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-audio' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-audio',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-auto-ads' => array(
+			'name' => 'amp-auto-ads',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-beopinion' => array(
+			'name' => 'amp-beopinion',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-bind' => array(
+			'name' => 'amp-bind',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-bodymovin-animation' => array(
+			'name' => 'amp-bodymovin-animation',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-brid-player' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-brid-player',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-brightcove' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-brightcove',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-byside-content' => array(
+			'name' => 'amp-byside-content',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-call-tracking' => array(
+			'name' => 'amp-call-tracking',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-carousel' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-carousel',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-consent' => array(
+			'name' => 'amp-consent',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-dailymotion' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-dailymotion',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-date-countdown' => array(
+			'name' => 'amp-date-countdown',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-date-display' => array(
+			'name' => 'amp-date-display',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-date-picker' => array(
+			'name' => 'amp-date-picker',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-delight-player' => array(
+			'name' => 'amp-delight-player',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-dynamic-css-classes' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-dynamic-css-classes',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-embedly-card' => array(
+			'name' => 'amp-embedly-card',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-experiment' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-experiment',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-facebook' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-facebook',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-facebook-comments' => array(
+			'name' => 'amp-facebook-comments',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-facebook-like' => array(
+			'name' => 'amp-facebook-like',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-facebook-page' => array(
+			'name' => 'amp-facebook-page',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-fit-text' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-fit-text',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-font' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-font',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-form' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-form',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-fx-collection' => array(
+			'name' => 'amp-fx-collection',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-fx-flying-carpet' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-fx-flying-carpet',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-geo' => array(
+			'name' => 'amp-geo',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-gfycat' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-gfycat',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-gist' => array(
+			'name' => 'amp-gist',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-google-document-embed' => array(
+			'name' => 'amp-google-document-embed',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-hulu' => array(
+			'name' => 'amp-hulu',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-iframe' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-iframe',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-ima-video' => array(
+			'name' => 'amp-ima-video',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-image-lightbox' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-image-lightbox',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-image-slider' => array(
+			'name' => 'amp-image-slider',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-imgur' => array(
+			'name' => 'amp-imgur',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-inputmask' => array(
+			'name' => 'amp-inputmask',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-instagram' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-instagram',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-install-serviceworker' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-install-serviceworker',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-izlesene' => array(
+			'name' => 'amp-izlesene',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-jwplayer' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-jwplayer',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-kaltura-player' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-kaltura-player',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-lightbox' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-lightbox',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-lightbox-gallery' => array(
+			'name' => 'amp-lightbox-gallery',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-list' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-list',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-live-list' => array(
+			'name' => 'amp-live-list',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-mathml' => array(
+			'name' => 'amp-mathml',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-mowplayer' => array(
+			'name' => 'amp-mowplayer',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-mustache' => array(
+			'deprecated_allow_duplicates' => true,
+			'deprecated_version' => array(
+				'0.1',
+			),
+			'is_custom_template' => true,
+			'name' => 'amp-mustache',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'0.2',
+				'latest',
+			),
+		),
+		'amp-next-page' => array(
+			'name' => 'amp-next-page',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-nexxtv-player' => array(
+			'name' => 'amp-nexxtv-player',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-o2-player' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-o2-player',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-ooyala-player' => array(
+			'name' => 'amp-ooyala-player',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-orientation-observer' => array(
+			'name' => 'amp-orientation-observer',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-pan-zoom' => array(
+			'name' => 'amp-pan-zoom',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-pinterest' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-pinterest',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-playbuzz' => array(
+			'name' => 'amp-playbuzz',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-position-observer' => array(
+			'name' => 'amp-position-observer',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-powr-player' => array(
+			'name' => 'amp-powr-player',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-reach-player' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-reach-player',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-recaptcha-input' => array(
+			'name' => 'amp-recaptcha-input',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-reddit' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-reddit',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-riddle-quiz' => array(
+			'name' => 'amp-riddle-quiz',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-selector' => array(
+			'name' => 'amp-selector',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-sidebar' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-sidebar',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-skimlinks' => array(
+			'name' => 'amp-skimlinks',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-social-share' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-social-share',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-soundcloud' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-soundcloud',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-springboard-player' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-springboard-player',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-sticky-ad' => array(
+			'deprecated_version' => array(
+				'0.1',
+			),
+			'name' => 'amp-sticky-ad',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'1.0',
+				'latest',
+			),
+		),
+		'amp-story' => array(
+			'name' => 'amp-story',
+			'version' => array(
+				'0.1',
+				'1.0',
+				'latest',
+			),
+		),
+		'amp-story-auto-ads' => array(
+			'name' => 'amp-story-auto-ads',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-subscriptions' => array(
+			'name' => 'amp-subscriptions',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-subscriptions-google' => array(
+			'name' => 'amp-subscriptions-google',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-timeago' => array(
+			'name' => 'amp-timeago',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-twitter' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-twitter',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-user-notification' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-user-notification',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-video' => array(
+			'name' => 'amp-video',
+			'requires_usage' => 3,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-video-docking' => array(
+			'name' => 'amp-video-docking',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-video-iframe' => array(
+			'name' => 'amp-video-iframe',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-vimeo' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-vimeo',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-vine' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-vine',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-viqeo-player' => array(
+			'name' => 'amp-viqeo-player',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-vk' => array(
+			'name' => 'amp-vk',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-web-push' => array(
+			'name' => 'amp-web-push',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-wistia-player' => array(
+			'name' => 'amp-wistia-player',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-yotpo' => array(
+			'name' => 'amp-yotpo',
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+		'amp-youtube' => array(
+			'deprecated_allow_duplicates' => true,
+			'name' => 'amp-youtube',
+			'requires_usage' => 2,
+			'version' => array(
+				'0.1',
+				'latest',
+			),
+		),
+	);
+
+
+	/**
+	 * Get allowed tags.
+	 *
+	 * @since 0.5
+	 * @return array Allowed tags.
+	 */
+	public static function get_allowed_tags() {
+		return self::$allowed_tags;
+	}
+
+	/**
+	 * Get allowed tag.
+	 *
+	 * Get the rules for a single tag so that the entire data structure needn't be passed around.
+	 *
+	 * @since 0.7
+	 * @param string $node_name Tag name.
+	 * @return array|null Allowed tag, or null if the tag does not exist.
+	 */
+	public static function get_allowed_tag( $node_name ) {
+		if ( isset( self::$allowed_tags[ $node_name ] ) ) {
+			return self::$allowed_tags[ $node_name ];
+		}
+		return null;
+	}
+
+	/**
+	 * Get descendant tag lists.
+	 *
+	 * @since 1.1
+	 * @return array Descendant tags list.
+	 */
+	public static function get_descendant_tag_lists() {
+		return self::$descendant_tag_lists;
+	}
+
+	/**
+	 * Get allowed descendant tag list for a tag.
+	 *
+	 * Get the descendant rules for a single tag so that the entire data structure needn't be passed around.
+	 *
+	 * @since 1.1
+	 * @param string $name Name for the descendants list.
+	 * @return array|bool Allowed tags list, or false if there are no restrictions.
+	 */
+	public static function get_descendant_tag_list( $name ) {
+		if ( isset( self::$descendant_tag_lists[ $name ] ) ) {
+			return self::$descendant_tag_lists[ $name ];
+		}
+		return false;
+	}
+
+	/**
+	 * Get allowed descendant tag set for a tag.
+	 *
+	 * Like get_descendant_tag_list(), but with the tag names as keys so that they can be looked up directly.
+	 *
+	 * @since 1.1
+	 * @param string $name Name for the descendants list.
+	 * @return array|bool Allowed tags set, or false if there are no restrictions.
+	 */
+	public static function get_descendant_tag_set( $name ) {
+		if ( isset( self::$descendant_tag_sets[ $name ] ) ) {
+			return self::$descendant_tag_sets[ $name ];
+		}
+		return false;
+	}
+
+	/**
+	 * Get reference point spec.
+	 *
+	 * @since 1.0
+	 * @param string $tag_spec_name Tag spec name.
+	 * @return array|null Reference point spec, or null if does not exist.
+	 */
+	public static function get_reference_point_spec( $tag_spec_name ) {
+		if ( isset( self::$reference_points[ $tag_spec_name ] ) ) {
+			return self::$reference_points[ $tag_spec_name ];
+		}
+		return null;
+	}
+
+	/**
+	 * Get list of globally-allowed attributes.
+	 *
+	 * @since 0.5
+	 * @return array Allowed tag.
+	 */
+	public static function get_allowed_attributes() {
+		return self::$globally_allowed_attrs;
+	}
+
+	/**
+	 * Get layout attributes.
+	 *
+	 * @since 0.5
+	 * @return array Allowed tag.
+	 */
+	public static function get_layout_attributes() {
+		return self::$layout_allowed_attrs;
+	}
+
+	/**
+	 * Get the mapping of alternative attribute names to their primary names, across all tags.
+	 *
+	 * @since 1.1
+	 * @return array Primary attribute names keyed by alternative name.
+	 */
+	public static function get_alternative_attribute_names() {
+		return self::$alternative_attr_names;
+	}
+
+	/**
+	 * Get a set of allowed attribute values.
+	 *
+	 * The value_set and value_casei_set of an attribute spec are the IDs of the sets of its value and
+	 * (lowercased) value_casei lists, which have the values as keys so that they can be looked up directly.
+	 *
+	 * @since 1.1
+	 * @param int $id Value set ID.
+	 * @return array Allowed values as keys.
+	 */
+	public static function get_attr_value_set( $id ) {
+		return self::$attr_value_sets[ $id ];
+	}
+
+	/**
+	 * Get a layout table.
+	 *
+	 * The layout_table of a tag spec with supported layouts is the ID of a list of bitmasks, indexed by the
+	 * AMP_Rule_Spec::LAYOUT_DIMENSION_* class of the width times AMP_Rule_Spec::LAYOUT_DIMENSION_CLASSES plus
+	 * that of the height, with the bit 1 << layout set for each layout of AMP_Rule_Spec::$layout_enum allowed then.
+	 *
+	 * @since 1.1
+	 * @param int $id Layout table ID.
+	 * @return int[] Bitmasks of the allowed layouts.
+	 */
+	public static function get_layout_table( $id ) {
+		return self::$layout_tables[ $id ];
+	}
+
+	/**
+	 * Get the tag spec dispatch index for a tag.
+	 *
+	 * The dispatch keys map an attribute name, or an attribute name and value joined by '=', to the
+	 * indexes of the rule specs which a node with that attribute is dispatched to.
+	 *
+	 * @since 1.1
+	 * @param string $node_name Tag name.
+	 * @return array|null Dispatch keys, or null if the tag has less than two rule specs.
+	 */
+	public static function get_tag_spec_dispatch_index( $node_name ) {
+		if ( isset( self::$tag_spec_dispatch_index[ $node_name ] ) ) {
+			return self::$tag_spec_dispatch_index[ $node_name ];
+		}
+		return null;
+	}
+
+	/**
+	 * Get the tag name and attributes of a mandatory parent or ancestor spec name, or of a disallowed ancestor.
+	 *
+	 * @since 1.1
+	 * @param string $spec_name Spec name, for example 'body' or 'form [method=post]'.
+	 * @return array|null Tag name and attributes, or null if no tag spec references the spec name.
+	 */
+	public static function get_spec_name_components( $spec_name ) {
+		if ( isset( self::$spec_name_components[ $spec_name ] ) ) {
+			return self::$spec_name_components[ $spec_name ];
+		}
+		return null;
+	}
+
+	/**
+	 * Get the CSS spec of a context in which styles are allowed.
+	 *
+	 * The allowed at-rules and declarations are keys, so that they can be looked up directly. The declarations
+	 * also include their -webkit-, -moz-, -ms- and -o- prefixed variants.
+	 *
+	 * @since 1.1
+	 * @param string $context CSS context: 'style amp-custom', 'style[amp-keyframes]' or 'style attribute'.
+	 * @return array|null Allowed at-rules and declarations as keys and whether keyframes are validated, or null if the context is unknown.
+	 */
+	public static function get_css_spec( $context ) {
+		if ( isset( self::$css_specs[ $context ] ) ) {
+			return self::$css_specs[ $context ];
+		}
+		return null;
+	}
+
+	/**
+	 * Get the index of tag and attribute names to the extensions which they require.
+	 *
+	 * A tag or attribute is only in the index when it requires the same extensions in every spec that has it.
+	 * The others have to be looked up in the requires_extension of the spec which the element matches.
+	 *
+	 * @since 1.1
+	 * @return array Tag names and attribute names, under 'tags' and 'attributes', to their extension names.
+	 */
+	public static function get_extension_index() {
+		return self::$extension_index;
+	}
+
+	/**
+	 * Get the extension spec of an AMP component.
+	 *
+	 * The extension_spec of a script tag spec only has the name, to look the rest of it up here.
+	 *
+	 * @since 1.1
+	 * @param string $extension_name Extension name, for example 'amp-bind'.
+	 * @return array|null Extension spec, with the name, versions and requires_usage, or null if there is no such extension.
+	 */
+	public static function get_extension_spec( $extension_name ) {
+		if ( isset( self::$extension_specs[ $extension_name ] ) ) {
+			return self::$extension_specs[ $extension_name ];
+		}
+		return null;
+	}
+
+	/**
+	 * Get the extension specs of all AMP components.
+	 *
+	 * @since 1.1
+	 * @return array Extension names to their extension specs.
+	 */
+	public static function get_extension_specs() {
+		return self::$extension_specs;
 	}
 
 }
@@ -36,23 +36,44 @@ abstract class AMP_Rule_Spec {
 	const MANDATORY_PARENT    = 'mandatory_parent';
 	const DESCENDANT_TAG_LIST = 'descendant_tag_list';
 	const CHILD_TAGS          = 'child_tags';
+	const MANDATORY_ATTRS     = 'mandatory_attrs';
+	const LAYOUT_TABLE        = 'layout_table';
+
+	/**
+	 * Classes of the width and height of an element with a layout, which index the layout tables.
+	 *
+	 * @see AMP_Allowed_Tags_Generated::get_layout_table()
+	 */
+	const LAYOUT_DIMENSION_NONE    = 0;
+	const LAYOUT_DIMENSION_PX      = 1;
+	const LAYOUT_DIMENSION_UNIT    = 2;
+	const LAYOUT_DIMENSION_AUTO    = 3;
+	const LAYOUT_DIMENSION_FLUID   = 4;
+	const LAYOUT_DIMENSION_INVALID = 5;
+	const LAYOUT_DIMENSION_CLASSES = 6;
 
 	/**
 	 * HTML Element Attribute rule names
 	 */
-	const ALLOW_EMPTY             = 'allow_empty';
-	const ALLOW_RELATIVE          = 'allow_relative';
-	const ALLOWED_PROTOCOL        = 'protocol';
-	const ALTERNATIVE_NAMES       = 'alternative_names';
-	const BLACKLISTED_VALUE_REGEX = 'blacklisted_value_regex';
-	const DISALLOWED_DOMAIN       = 'disallowed_domain';
-	const MANDATORY               = 'mandatory';
-	const VALUE                   = 'value';
-	const VALUE_CASEI             = 'value_casei';
-	const VALUE_REGEX             = 'value_regex';
-	const VALUE_REGEX_CASEI       = 'value_regex_casei';
-	const VALUE_PROPERTIES        = 'value_properties';
-	const VALUE_URL               = 'value_url';
+	const ALLOW_EMPTY                  = 'allow_empty';
+	const ALLOW_RELATIVE               = 'allow_relative';
+	const ALLOWED_PROTOCOL             = 'protocol';
+	const ALTERNATIVE_NAMES            = 'alternative_names';
+	const ATTR_SPEC_ID                 = 'attr_spec_id';
+	const BLACKLISTED_VALUE_REGEX      = 'blacklisted_value_regex';
+	const BLACKLISTED_VALUE_REGEX_PCRE = 'blacklisted_value_regex_pcre';
+	const DISALLOWED_DOMAIN            = 'disallowed_domain';
+	const MANDATORY                    = 'mandatory';
+	const VALUE                        = 'value';
+	const VALUE_SET                    = 'value_set';
+	const VALUE_CASEI                  = 'value_casei';
+	const VALUE_CASEI_SET              = 'value_casei_set';
+	const VALUE_REGEX                  = 'value_regex';
+	const VALUE_REGEX_PCRE             = 'value_regex_pcre';
+	const VALUE_REGEX_CASEI            = 'value_regex_casei';
+	const VALUE_REGEX_CASEI_PCRE       = 'value_regex_casei_pcre';
+	const VALUE_PROPERTIES             = 'value_properties';
+	const VALUE_URL                    = 'value_url';
 
 	/**
 	 * Supported layout values.
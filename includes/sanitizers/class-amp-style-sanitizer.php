@@ -325,7 +325,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		$spec_name = 'link rel=stylesheet for fonts'; // phpcs:ignore WordPress.WP.EnqueuedResources.NonEnqueuedStylesheet
 		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'link' ) as $spec_rule ) {
 			if ( isset( $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) && $spec_name === $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) {
-				$this->allowed_font_src_regex = '@^(' . $spec_rule[ AMP_Rule_Spec::ATTR_SPEC_LIST ]['href']['value_regex'] . ')$@';
+				$this->allowed_font_src_regex = $spec_rule[ AMP_Rule_Spec::ATTR_SPEC_LIST ]['href'][ AMP_Rule_Spec::VALUE_REGEX_PCRE ];
 				break;
 			}
 		}
@@ -888,7 +888,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		// @todo Any @keyframes rules could be removed from amp-custom and instead added to amp-keyframes.
 		$is_keyframes = $element->hasAttribute( 'amp-keyframes' );
 		$stylesheet   = trim( $element->textContent );
-		$cdata_spec   = $is_keyframes ? $this->style_keyframes_cdata_spec : $this->style_custom_cdata_spec;
+		$css_spec     = AMP_Allowed_Tags_Generated::get_css_spec( $is_keyframes ? 'style[amp-keyframes]' : 'style amp-custom' );
 
 		// Honor the style's media attribute.
 		$media = $element->getAttribute( 'media' );
@@ -899,9 +899,9 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		$processed = $this->process_stylesheet(
 			$stylesheet,
 			array(
-				'allowed_at_rules'   => $cdata_spec['css_spec']['allowed_at_rules'],
-				'property_whitelist' => $cdata_spec['css_spec']['declaration'],
-				'validate_keyframes' => $cdata_spec['css_spec']['validate_keyframes'],
+				'allowed_at_rules'   => $css_spec['allowed_at_rules'],
+				'property_whitelist' => $css_spec['declarations'],
+				'validate_keyframes' => $css_spec['validate_keyframes'],
 			)
 		);
 
@@ -1011,11 +1011,12 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 
 		$this->set_current_node( $element ); // And sources when needing to be located.
 
+		$css_spec  = AMP_Allowed_Tags_Generated::get_css_spec( 'style amp-custom' );
 		$processed = $this->process_stylesheet(
 			$stylesheet,
 			array(
-				'allowed_at_rules'   => $this->style_custom_cdata_spec['css_spec']['allowed_at_rules'],
-				'property_whitelist' => $this->style_custom_cdata_spec['css_spec']['declaration'],
+				'allowed_at_rules'   => $css_spec['allowed_at_rules'],
+				'property_whitelist' => $css_spec['declarations'],
 				'stylesheet_url'     => $href,
 				'stylesheet_path'    => $css_file_path,
 			)
@@ -1079,11 +1080,11 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 	 * @param array  $options {
 	 *     Options.
 	 *
-	 *     @type string[] $property_whitelist          Exclusively-allowed properties.
+	 *     @type bool[]   $property_whitelist          Exclusively-allowed properties as keys, as in AMP_Allowed_Tags_Generated::get_css_spec().
 	 *     @type string[] $property_blacklist          Disallowed properties.
 	 *     @type string   $stylesheet_url              Original URL for stylesheet when originating via link or @import.
 	 *     @type string   $stylesheet_path             Original filesystem path for stylesheet when originating via link or @import.
-	 *     @type array    $allowed_at_rules            Allowed @-rules.
+	 *     @type bool[]   $allowed_at_rules            Allowed @-rules as keys.
 	 *     @type bool     $validate_keyframes          Whether keyframes should be validated.
 	 * }
 	 * @return array {
@@ -1588,7 +1589,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 					$this->process_css_declaration_block( $css_item, $css_list, $options )
 				);
 			} elseif ( $css_item instanceof AtRuleBlockList ) {
-				if ( ! in_array( $css_item->atRuleName(), $options['allowed_at_rules'], true ) ) {
+				if ( ! isset( $options['allowed_at_rules'][ $css_item->atRuleName() ] ) ) {
 					$error     = array(
 						'code'    => self::ILLEGAL_AT_RULE_ERROR_CODE,
 						'at_rule' => $css_item->atRuleName(),
@@ -1609,7 +1610,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 					$this->parse_import_stylesheet( $css_item, $css_list, $options )
 				);
 			} elseif ( $css_item instanceof AtRuleSet ) {
-				if ( ! in_array( $css_item->atRuleName(), $options['allowed_at_rules'], true ) ) {
+				if ( ! isset( $options['allowed_at_rules'][ $css_item->atRuleName() ] ) ) {
 					$error     = array(
 						'code'    => self::ILLEGAL_AT_RULE_ERROR_CODE,
 						'at_rule' => $css_item->atRuleName(),
@@ -1626,7 +1627,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 					);
 				}
 			} elseif ( $css_item instanceof KeyFrame ) {
-				if ( ! in_array( 'keyframes', $options['allowed_at_rules'], true ) ) {
+				if ( ! isset( $options['allowed_at_rules']['keyframes'] ) ) {
 					$error     = array(
 						'code'    => self::ILLEGAL_AT_RULE_ERROR_CODE,
 						'at_rule' => $css_item->atRuleName(),
@@ -1747,8 +1748,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		if ( ! empty( $options['property_whitelist'] ) ) {
 			$properties = $ruleset->getRules();
 			foreach ( $properties as $property ) {
-				$vendorless_property_name = preg_replace( '/^-\w+-/', '', $property->getRule() );
-				if ( ! in_array( $vendorless_property_name, $options['property_whitelist'], true ) ) {
+				if ( ! $this->is_allowed_property( $property->getRule(), $options['property_whitelist'] ) ) {
 					$error     = array(
 						'code'           => 'illegal_css_property',
 						'property_name'  => $property->getRule(),
@@ -1909,6 +1909,26 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 		}
 	}
 
+	/**
+	 * Determine whether a property is allowed by a set of properties from a CSS spec.
+	 *
+	 * The property is looked up without its vendor prefix. The CSS specs already have the variants of their
+	 * declarations with the common vendor prefixes, so the prefix only needs to be stripped for the others.
+	 *
+	 * @since 1.1
+	 * @see AMP_Allowed_Tags_Generated::get_css_spec()
+	 *
+	 * @param string $property_name      Property name.
+	 * @param bool[] $property_whitelist Allowed properties as keys.
+	 * @return bool Whether the property is allowed.
+	 */
+	private function is_allowed_property( $property_name, $property_whitelist ) {
+		if ( isset( $property_whitelist[ $property_name ] ) ) {
+			return true;
+		}
+		return '-' === substr( $property_name, 0, 1 ) && isset( $property_whitelist[ preg_replace( '/^-\w+-/', '', $property_name ) ] );
+	}
+
 	/**
 	 * Process CSS keyframes.
 	 *
@@ -1946,8 +1966,7 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 
 				$properties = $rules->getRules();
 				foreach ( $properties as $property ) {
-					$vendorless_property_name = preg_replace( '/^-\w+-/', '', $property->getRule() );
-					if ( ! in_array( $vendorless_property_name, $options['property_whitelist'], true ) ) {
+					if ( ! $this->is_allowed_property( $property->getRule(), $options['property_whitelist'] ) ) {
 						$error     = array(
 							'code'           => 'illegal_css_property',
 							'property_name'  => $property->getRule(),
@@ -2085,11 +2104,12 @@ class AMP_Style_Sanitizer extends AMP_Base_Sanitizer {
 
 		$this->set_current_node( $element ); // And sources when needing to be located.
 
+		$css_spec  = AMP_Allowed_Tags_Generated::get_css_spec( 'style attribute' );
 		$processed = $this->process_stylesheet(
 			$rule,
 			array(
-				'allowed_at_rules'   => array(),
-				'property_whitelist' => $this->style_custom_cdata_spec['css_spec']['declaration'],
+				'allowed_at_rules'   => $css_spec['allowed_at_rules'],
+				'property_whitelist' => $css_spec['declarations'],
 			)
 		);
 
@@ -28,11 +28,22 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	/**
 	 * Allowed tags.
 	 *
+	 * The rule specs for each tag name are prepared when first needed, see get_rule_spec_list().
+	 *
 	 * @since 0.5
 	 *
-	 * @var string[]
+	 * @var array[]
+	 */
+	protected $allowed_tags = array();
+
+	/**
+	 * Rule specs to allow in addition to those in the amp_allowed_tags arg, keyed by tag name.
+	 *
+	 * @since 1.1
+	 *
+	 * @var array[]
 	 */
-	protected $allowed_tags;
+	protected $additional_allowed_tags = array();
 
 	/**
 	 * Globally-allowed attributes.
@@ -69,6 +80,24 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	private $stack = array();
 
+	/**
+	 * Parent node and ancestor tag names of each node in the stack, collected when the node was pushed.
+	 *
+	 * @since 1.1
+	 *
+	 * @var array[]
+	 */
+	private $stack_ancestors = array();
+
+	/**
+	 * Node being processed and the tag names of its ancestors as keys, or null if they are not known.
+	 *
+	 * @since 1.1
+	 *
+	 * @var array|null
+	 */
+	private $current_ancestors;
+
 	/**
 	 * Default args.
 	 *
@@ -85,6 +114,71 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	protected $script_components = array();
 
+	/**
+	 * Index of tag and attribute names to the AMP script components which they require.
+	 *
+	 * @since 1.1
+	 * @see AMP_Allowed_Tags_Generated::get_extension_index()
+	 * @var array
+	 */
+	protected $extension_index = array();
+
+	/**
+	 * Names of the tags in the extension index which were found in the document, as keys.
+	 *
+	 * @since 1.1
+	 * @var array
+	 */
+	protected $extension_tag_names = array();
+
+	/**
+	 * Names of the attributes in the extension index which were found in the document, as keys.
+	 *
+	 * @since 1.1
+	 * @var array
+	 */
+	protected $extension_attribute_names = array();
+
+	/**
+	 * Maximum number of results of attribute spec rule checks which are memoized at once.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::check_attr_spec_rule_memoized()
+	 * @var int
+	 */
+	const ATTR_SPEC_RULE_RESULTS_LIMIT = 10000;
+
+	/**
+	 * Results of the attribute spec rule checks done so far, keyed by the check, the spec ID and the attribute values.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::check_attr_spec_rule_memoized()
+	 * @var int[]
+	 */
+	private $attr_spec_rule_results = array();
+
+	/**
+	 * Numbers of the attribute spec rule checks whose results were memoized, and of the times the memo was full and emptied.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::get_attr_spec_rule_result_stats()
+	 * @var int[]
+	 */
+	private $attr_spec_rule_result_stats = array(
+		'hits'      => 0,
+		'misses'    => 0,
+		'evictions' => 0,
+	);
+
+	/**
+	 * Numbers of hits and rejects, and seconds spent, of each spec, when the spec_hits_file arg is set.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::get_spec_hits()
+	 * @var array|null
+	 */
+	private $spec_hits;
+
 	/**
 	 * Keep track of nodes that should not be replaced to prevent duplicated validation errors since sanitization is rejected.
 	 *
@@ -102,21 +196,24 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	public function __construct( $dom, $args = array() ) {
 		$this->DEFAULT_ARGS = array(
-			'amp_allowed_tags'                => AMP_Allowed_Tags_Generated::get_allowed_tags(),
+			'amp_allowed_tags'                => null, // Defaults to loading each tag from AMP_Allowed_Tags_Generated on demand.
 			'amp_globally_allowed_attributes' => AMP_Allowed_Tags_Generated::get_allowed_attributes(),
 			'amp_layout_allowed_attributes'   => AMP_Allowed_Tags_Generated::get_layout_attributes(),
 			'amp_bind_placeholder_prefix'     => AMP_DOM_Utils::get_amp_bind_placeholder_prefix(),
+			'spec_hits_file'                  => null, // Path of a JSON file to add the spec hits to, see get_spec_hits().
 		);
 
 		parent::__construct( $dom, $args );
 
+		$this->extension_index = AMP_Allowed_Tags_Generated::get_extension_index();
+
 		if ( ! empty( $this->args['allow_dirty_styles'] ) ) {
 
 			// Allow style attribute on all elements.
 			$this->args['amp_globally_allowed_attributes']['style'] = array();
 
 			// Allow style elements.
-			$this->args['amp_allowed_tags']['style'][] = array(
+			$this->additional_allowed_tags['style'][] = array(
 				'attr_spec_list' => array(
 					'type' => array(
 						'value_casei' => 'text/css',
@@ -129,7 +226,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			);
 
 			// Allow stylesheet links.
-			$this->args['amp_allowed_tags']['link'][] = array(
+			$this->additional_allowed_tags['link'][] = array(
 				'attr_spec_list' => array(
 					'async'       => array(),
 					'crossorigin' => array(),
@@ -155,7 +252,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 
 		// Allow scripts if requested.
 		if ( ! empty( $this->args['allow_dirty_scripts'] ) ) {
-			$this->args['amp_allowed_tags']['script'][] = array(
+			$this->additional_allowed_tags['script'][] = array(
 				'attr_spec_list' => array(
 					'type'  => array(),
 					'src'   => array(),
@@ -170,27 +267,29 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 
 		// Prepare whitelists.
-		$this->allowed_tags = $this->args['amp_allowed_tags'];
 		foreach ( AMP_Rule_Spec::$additional_allowed_tags as $tag_name => $tag_rule_spec ) {
-			$this->allowed_tags[ $tag_name ][] = $tag_rule_spec;
+			$this->additional_allowed_tags[ $tag_name ][] = $tag_rule_spec;
 		}
 
-		// @todo Do the same for body when !use_document_element?
-		if ( ! empty( $this->args['use_document_element'] ) ) {
-			foreach ( $this->allowed_tags['html'] as &$rule_spec ) {
-				unset( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_PARENT ] );
+		// Tags are loaded on demand, so get the alternative names for all of them up front.
+		$this->rev_alternate_attr_name_lookup = AMP_Allowed_Tags_Generated::get_alternative_attribute_names();
+		if ( isset( $this->args['amp_allowed_tags'] ) ) {
+			foreach ( array_keys( array_merge( $this->args['amp_allowed_tags'], $this->additional_allowed_tags ) ) as $tag_name ) {
+				$this->get_rule_spec_list( $tag_name );
 			}
 		}
+		$this->globally_allowed_attributes = $this->args['amp_globally_allowed_attributes'];
+		$this->layout_allowed_attributes   = $this->args['amp_layout_allowed_attributes'];
 
-		foreach ( $this->allowed_tags as &$tag_specs ) {
-			foreach ( $tag_specs as &$tag_spec ) {
-				if ( isset( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
-					$tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] = $this->process_alternate_names( $tag_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] );
-				}
-			}
+		if ( ! empty( $this->args['spec_hits_file'] ) ) {
+			$this->spec_hits = array(
+				'documents'       => 1,
+				'tag_specs'       => array(),
+				'attr_spec_lists' => array(),
+				'attr_rules'      => array(),
+				'cdata'           => array(),
+			);
 		}
-		$this->globally_allowed_attributes = $this->process_alternate_names( $this->args['amp_globally_allowed_attributes'] );
-		$this->layout_allowed_attributes   = $this->process_alternate_names( $this->args['amp_layout_allowed_attributes'] );
 	}
 
 	/**
@@ -208,35 +307,134 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 *                  or if it did not find any HTML elements to convert to AMP equivalents.
 	 */
 	public function get_scripts() {
-		return array_fill_keys( array_unique( $this->script_components ), true );
+		$script_components = $this->script_components;
+		foreach ( array_keys( $this->extension_tag_names ) as $tag_name ) {
+			$script_components = array_merge( $script_components, $this->extension_index['tags'][ $tag_name ] );
+		}
+		foreach ( array_keys( $this->extension_attribute_names ) as $attribute_name ) {
+			$script_components = array_merge( $script_components, $this->extension_index['attributes'][ $attribute_name ] );
+		}
+		return array_fill_keys( array_unique( $script_components ), true );
 	}
 
 	/**
-	 * Process alternative names in attribute spec list.
+	 * Get the rule specs for a tag name, preparing them on first use.
 	 *
-	 * @since 0.7
+	 * Unless the amp_allowed_tags arg was supplied, the specs are loaded from AMP_Allowed_Tags_Generated
+	 * one tag at a time so that tags which do not occur in the document are never loaded.
+	 *
+	 * @since 1.1
 	 *
-	 * @param array $attr_spec_list Attribute spec list.
-	 * @return array Modified attribute spec list.
+	 * @param string $tag_name Tag name.
+	 * @return array[] Rule specs, or an empty array if the tag is not allowed.
 	 */
-	private function process_alternate_names( $attr_spec_list ) {
-		foreach ( $attr_spec_list as $attr_name => &$attr_spec ) {
-			if ( '[' === $attr_name[0] ) {
-				$placeholder_attr_name = $this->args['amp_bind_placeholder_prefix'] . trim( $attr_name, '[]' );
-				if ( ! isset( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
-					$attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] = array();
-				}
-				$attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ][] = $placeholder_attr_name;
+	private function get_rule_spec_list( $tag_name ) {
+		if ( isset( $this->allowed_tags[ $tag_name ] ) ) {
+			return $this->allowed_tags[ $tag_name ];
+		}
+
+		if ( ! isset( $this->args['amp_allowed_tags'] ) ) {
+			$rule_spec_list = (array) AMP_Allowed_Tags_Generated::get_allowed_tag( $tag_name );
+		} elseif ( isset( $this->args['amp_allowed_tags'][ $tag_name ] ) ) {
+			$rule_spec_list = $this->prepare_rule_spec_list( $this->args['amp_allowed_tags'][ $tag_name ] );
+		} else {
+			$rule_spec_list = array();
+		}
+		if ( isset( $this->additional_allowed_tags[ $tag_name ] ) ) {
+			$rule_spec_list = array_merge( $rule_spec_list, $this->prepare_rule_spec_list( $this->additional_allowed_tags[ $tag_name ] ) );
+		}
+
+		// @todo Do the same for body when !use_document_element?
+		if ( 'html' === $tag_name && ! empty( $this->args['use_document_element'] ) ) {
+			foreach ( $rule_spec_list as &$rule_spec ) {
+				unset( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_PARENT ] );
 			}
+		}
 
-			// Save all alternative names in lookup to improve performance.
-			if ( isset( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
-				foreach ( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
-					$this->rev_alternate_attr_name_lookup[ $alternative_name ] = $attr_name;
+		$this->allowed_tags[ $tag_name ] = $rule_spec_list;
+		return $rule_spec_list;
+	}
+
+	/**
+	 * Prepare rule specs which were not loaded from AMP_Allowed_Tags_Generated like the generated ones.
+	 *
+	 * The mandatory attributes are listed in the tag spec, and the alternative attribute names are added to the lookup.
+	 *
+	 * @since 1.1
+	 *
+	 * @param array[] $rule_spec_list Rule specs.
+	 * @return array[] Prepared rule specs.
+	 */
+	private function prepare_rule_spec_list( $rule_spec_list ) {
+		foreach ( $rule_spec_list as &$rule_spec ) {
+			if ( ! isset( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_ATTRS ] ) ) {
+				$rule_spec[ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_ATTRS ] = $this->get_mandatory_attrs( $rule_spec );
+			}
+			if ( ! isset( $rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
+				continue;
+			}
+			foreach ( $rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_name => $attr_spec ) {
+				if ( isset( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
+					foreach ( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
+						$this->rev_alternate_attr_name_lookup[ $alternative_name ] = $attr_name;
+					}
 				}
 			}
 		}
-		return $attr_spec_list;
+		return $rule_spec_list;
+	}
+
+	/**
+	 * Get the mandatory attributes of a rule spec, as amphtml-update.py lists them in the generated tag specs.
+	 *
+	 * @since 1.1
+	 *
+	 * @param array $rule_spec Rule spec.
+	 * @return string[][] Mandatory attributes, each with its name followed by its alternative names.
+	 */
+	private function get_mandatory_attrs( $rule_spec ) {
+		$mandatory_attrs = array();
+		if ( isset( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'] ) ) {
+			$mandatory_attrs[] = array( 'amp-mustache' === $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'] ? 'custom-template' : 'custom-element' );
+		}
+		if ( ! isset( $rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
+			return $mandatory_attrs;
+		}
+		foreach ( $rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] as $attr_name => $attr_spec ) {
+			if ( ! isset( $attr_spec[ AMP_Rule_Spec::MANDATORY ] ) || true !== $attr_spec[ AMP_Rule_Spec::MANDATORY ] ) {
+				continue;
+			}
+			if ( '\u' === substr( $attr_name, 0, 2 ) ) {
+				$attr_name = html_entity_decode( '&#x' . substr( $attr_name, 2 ) . ';' ); // Probably ⚡.
+			}
+			$mandatory_attrs[] = array_merge(
+				array( $attr_name ),
+				isset( $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ? $attr_spec[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] : array()
+			);
+		}
+		return $mandatory_attrs;
+	}
+
+	/**
+	 * Get the primary name of an alternative attribute name.
+	 *
+	 * The placeholders which AMP_DOM_Utils substitutes for amp-bind attributes, like amp-binding-…-src for [src],
+	 * have a prefix which differs for every request, so they are recognized by it rather than looked up.
+	 *
+	 * @since 1.1
+	 *
+	 * @param string $attr_name Attribute name.
+	 * @return string|null Primary attribute name, or null if the attribute name is not an alternative name.
+	 */
+	private function get_primary_attribute_name( $attr_name ) {
+		if ( isset( $this->rev_alternate_attr_name_lookup[ $attr_name ] ) ) {
+			return $this->rev_alternate_attr_name_lookup[ $attr_name ];
+		}
+		$prefix = $this->args['amp_bind_placeholder_prefix'];
+		if ( '' !== $prefix && 0 === strpos( $attr_name, $prefix ) ) {
+			return '[' . substr( $attr_name, strlen( $prefix ) ) . ']';
+		}
+		return null;
 	}
 
 	/**
@@ -247,7 +445,8 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	public function sanitize() {
 
 		// Add root of content to the stack.
-		$this->stack[] = $this->root_element;
+		$this->stack[]           = $this->root_element;
+		$this->stack_ancestors[] = array( $this->root_element->parentNode, $this->get_ancestor_tag_names( $this->root_element ) );
 
 		/**
 		 * This loop traverses through the DOM tree iteratively.
@@ -257,6 +456,16 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			// Get the next node to process.
 			$node = array_shift( $this->stack );
 
+			// The ancestors collected when the node was pushed only apply if it has not been moved since.
+			list( $parent, $ancestor_tag_names ) = array_shift( $this->stack_ancestors );
+			$this->current_ancestors             = null;
+			if ( null !== $ancestor_tag_names && $parent && $node->parentNode === $parent ) {
+				$this->current_ancestors = array(
+					'node'      => $node,
+					'tag_names' => $ancestor_tag_names,
+				);
+			}
+
 			/**
 			 * Process this node.
 			 */
@@ -267,13 +476,43 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * if node was removed, then it's parentNode value is null.
 			 */
 			if ( $node->parentNode ) {
+				$child_ancestor_tag_names = null;
+				if ( $this->current_ancestors ) {
+					$child_ancestor_tag_names                    = $this->current_ancestors['tag_names'];
+					$child_ancestor_tag_names[ $node->nodeName ] = true;
+				}
+
 				$child = $node->firstChild;
 				while ( $child ) {
-					$this->stack[] = $child;
-					$child         = $child->nextSibling;
+					$this->stack[]           = $child;
+					$this->stack_ancestors[] = array( $node, $child_ancestor_tag_names );
+					$child                   = $child->nextSibling;
 				}
 			}
 		}
+		$this->current_ancestors = null;
+
+		if ( isset( $this->spec_hits ) ) {
+			$this->write_spec_hits( $this->args['spec_hits_file'] );
+		}
+	}
+
+	/**
+	 * Get the tag names of the ancestors of a node by walking up the DOM.
+	 *
+	 * @since 1.1
+	 *
+	 * @param DOMNode $node Node.
+	 * @return array Ancestor tag names as keys.
+	 */
+	private function get_ancestor_tag_names( $node ) {
+		$ancestor_tag_names = array();
+		while ( $node->parentNode ) {
+			$node = $node->parentNode;
+
+			$ancestor_tag_names[ $node->nodeName ] = true;
+		}
+		return $ancestor_tag_names;
 	}
 
 	/**
@@ -287,9 +526,12 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	private function get_rule_spec_list_to_validate( $node, $rule_spec ) {
 
-		// Expand extension_spec into a set of attr_spec_list.
+		// Expand extension_spec into a set of attr_spec_list. The tag spec only names the extension, whose spec is looked up.
 		if ( isset( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec'] ) ) {
-			$extension_spec = $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec'];
+			$extension_spec = array_merge(
+				$rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec'],
+				(array) AMP_Allowed_Tags_Generated::get_extension_spec( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['extension_spec']['name'] )
+			);
 			$custom_attr    = 'amp-mustache' === $extension_spec['name'] ? 'custom-template' : 'custom-element';
 
 			$rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ][ $custom_attr ] = array(
@@ -318,8 +560,8 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 
 		// Augment the attribute list according to the parent's reference points, if it has them.
-		if ( ! empty( $node->parentNode ) && isset( $this->allowed_tags[ $node->parentNode->nodeName ] ) ) {
-			foreach ( $this->allowed_tags[ $node->parentNode->nodeName ] as $parent_rule_spec ) {
+		if ( ! empty( $node->parentNode ) ) {
+			foreach ( $this->get_rule_spec_list( $node->parentNode->nodeName ) as $parent_rule_spec ) {
 				if ( empty( $parent_rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['reference_points'] ) ) {
 					continue;
 				}
@@ -354,6 +596,68 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		return $rule_spec;
 	}
 
+	/**
+	 * Get the IDs of the rule specs which a node is dispatched to.
+	 *
+	 * As in the AMP validator, when an attribute of the node is a dispatch key of some of its tag's rule specs,
+	 * then only those rule specs are candidates. Candidates missing a mandatory attribute are skipped, unless
+	 * that leaves none. The rule specs added on top of AMP_Allowed_Tags_Generated are always candidates.
+	 *
+	 * @since 1.1
+	 * @see AMP_Allowed_Tags_Generated::get_tag_spec_dispatch_index()
+	 *
+	 * @param DOMElement $node           Node.
+	 * @param array[]    $rule_spec_list Rule specs for the node's tag.
+	 * @return int[] Candidate rule spec IDs, in order.
+	 */
+	private function get_candidate_rule_spec_ids( $node, $rule_spec_list ) {
+		$rule_spec_ids = array_keys( $rule_spec_list );
+		if ( isset( $this->args['amp_allowed_tags'] ) || count( $rule_spec_ids ) < 2 ) {
+			return $rule_spec_ids;
+		}
+		$dispatch_index = AMP_Allowed_Tags_Generated::get_tag_spec_dispatch_index( $node->nodeName );
+		if ( ! $dispatch_index ) {
+			return $rule_spec_ids;
+		}
+
+		$additional_count         = isset( $this->additional_allowed_tags[ $node->nodeName ] ) ? count( $this->additional_allowed_tags[ $node->nodeName ] ) : 0;
+		$additional_rule_spec_ids = array_slice( $rule_spec_ids, count( $rule_spec_ids ) - $additional_count );
+		$generated_rule_spec_ids  = array_slice( $rule_spec_ids, 0, count( $rule_spec_ids ) - $additional_count );
+
+		$dispatched_rule_spec_ids = array();
+		foreach ( $node->attributes as $attr_name => $attr_node ) {
+			$dispatch_keys = array_unique(
+				array(
+					$attr_name,
+					$attr_name . '=' . $attr_node->nodeValue,
+					$attr_name . '=' . strtolower( $attr_node->nodeValue ),
+				)
+			);
+			foreach ( $dispatch_keys as $dispatch_key ) {
+				if ( isset( $dispatch_index['dispatch_keys'][ $dispatch_key ] ) ) {
+					$dispatched_rule_spec_ids = array_merge( $dispatched_rule_spec_ids, $dispatch_index['dispatch_keys'][ $dispatch_key ] );
+				}
+			}
+		}
+		if ( ! empty( $dispatched_rule_spec_ids ) ) {
+			$generated_rule_spec_ids = array_unique( $dispatched_rule_spec_ids );
+			sort( $generated_rule_spec_ids );
+		}
+
+		$candidate_rule_spec_ids = array();
+		foreach ( $generated_rule_spec_ids as $id ) {
+			$tag_spec = $rule_spec_list[ $id ][ AMP_Rule_Spec::TAG_SPEC ];
+			if ( ! isset( $tag_spec[ AMP_Rule_Spec::MANDATORY_ATTRS ] ) || ! $this->is_missing_mandatory_attrs( $tag_spec[ AMP_Rule_Spec::MANDATORY_ATTRS ], $node ) ) {
+				$candidate_rule_spec_ids[] = $id;
+			}
+		}
+		if ( empty( $candidate_rule_spec_ids ) ) {
+			$candidate_rule_spec_ids = $generated_rule_spec_ids;
+		}
+
+		return array_merge( $candidate_rule_spec_ids, $additional_rule_spec_ids );
+	}
+
 	/**
 	 * Process a node by checking if an element and its attributes are valid, and removing them when invalid.
 	 *
@@ -390,35 +694,54 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		 * based on tag name of the node.
 		 */
 		$rule_spec_list_to_validate = array();
-		$rule_spec_list             = array();
-		if ( isset( $this->allowed_tags[ $node->nodeName ] ) ) {
-			$rule_spec_list = $this->allowed_tags[ $node->nodeName ];
-		}
-		foreach ( $rule_spec_list as $id => $rule_spec ) {
-			if ( $this->validate_tag_spec_for_node( $node, $rule_spec[ AMP_Rule_Spec::TAG_SPEC ] ) ) {
-				$rule_spec_list_to_validate[ $id ] = $this->get_rule_spec_list_to_validate( $node, $rule_spec );
+		$tag_spec_seconds           = array();
+		$rule_spec_list             = $this->get_rule_spec_list( $node->nodeName );
+		$candidate_rule_spec_ids    = $this->get_candidate_rule_spec_ids( $node, $rule_spec_list );
+
+		// Fall back to the other rule specs if none of the candidates apply.
+		$other_rule_spec_ids = array_diff( array_keys( $rule_spec_list ), $candidate_rule_spec_ids );
+		foreach ( array( $candidate_rule_spec_ids, $other_rule_spec_ids ) as $rule_spec_ids ) {
+			foreach ( $rule_spec_ids as $id ) {
+				$start_time = isset( $this->spec_hits ) ? microtime( true ) : null;
+				if ( $this->validate_tag_spec_for_node( $node, $rule_spec_list[ $id ][ AMP_Rule_Spec::TAG_SPEC ] ) ) {
+					$rule_spec_list_to_validate[ $id ] = $this->get_rule_spec_list_to_validate( $node, $rule_spec_list[ $id ] );
+				}
+				if ( isset( $start_time ) ) {
+					$tag_spec_seconds[ $id ] = microtime( true ) - $start_time;
+				}
+			}
+			if ( ! empty( $rule_spec_list_to_validate ) ) {
+				break;
 			}
 		}
 
 		// If no valid rule_specs exist, then remove this node and return.
 		if ( empty( $rule_spec_list_to_validate ) ) {
+			if ( isset( $this->spec_hits ) ) {
+				$this->record_tag_spec_hits( $node, $rule_spec_list, $tag_spec_seconds, array() );
+			}
 			$this->remove_node( $node );
 			return;
 		}
 
 		// The remaining validations all have to do with attributes.
-		$attr_spec_list = array();
-		$tag_spec       = array();
-		$cdata          = array();
+		$attr_spec_list  = array();
+		$tag_spec        = array();
+		$cdata           = array();
+		$mandatory_attrs = array();
 
 		/*
 		 * If we have exactly one rule_spec, use it's attr_spec_list
 		 * to validate the node's attributes.
 		 */
 		if ( 1 === count( $rule_spec_list_to_validate ) ) {
-			$rule_spec      = array_pop( $rule_spec_list_to_validate );
-			$attr_spec_list = $rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ];
-			$tag_spec       = $rule_spec[ AMP_Rule_Spec::TAG_SPEC ];
+			$matched_spec_ids = array_keys( $rule_spec_list_to_validate );
+			$rule_spec        = array_pop( $rule_spec_list_to_validate );
+			$attr_spec_list   = $rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ];
+			$tag_spec         = $rule_spec[ AMP_Rule_Spec::TAG_SPEC ];
+			if ( isset( $tag_spec[ AMP_Rule_Spec::MANDATORY_ATTRS ] ) ) {
+				$mandatory_attrs = $tag_spec[ AMP_Rule_Spec::MANDATORY_ATTRS ];
+			}
 			if ( isset( $rule_spec[ AMP_Rule_Spec::CDATA ] ) ) {
 				$cdata = $rule_spec[ AMP_Rule_Spec::CDATA ];
 			}
@@ -435,7 +758,11 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 */
 			$attr_spec_scores = array();
 			foreach ( $rule_spec_list_to_validate as $spec_id => $rule_spec ) {
+				$start_time                   = isset( $this->spec_hits ) ? microtime( true ) : null;
 				$attr_spec_scores[ $spec_id ] = $this->validate_attr_spec_list_for_node( $node, $rule_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] );
+				if ( isset( $start_time ) ) {
+					$this->record_spec_hit( 'attr_spec_lists', $this->get_spec_hit_name( $node->nodeName, $rule_spec[ AMP_Rule_Spec::TAG_SPEC ] ), 0 < $attr_spec_scores[ $spec_id ], microtime( true ) - $start_time );
+				}
 			}
 
 			// Remove all spec lists that didn't match.
@@ -443,6 +770,9 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 
 			// If no attribute spec lists match, then the element must be removed.
 			if ( empty( $attr_spec_scores ) ) {
+				if ( isset( $this->spec_hits ) ) {
+					$this->record_tag_spec_hits( $node, $rule_spec_list, $tag_spec_seconds, array() );
+				}
 				$this->remove_node( $node );
 				return;
 			}
@@ -452,8 +782,12 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 
 			// If there is exactly one attr_spec with a max score, use that one.
 			if ( 1 === count( $spec_ids_sorted ) ) {
-				$attr_spec_list = $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::ATTR_SPEC_LIST ];
-				$tag_spec       = $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::TAG_SPEC ];
+				$matched_spec_ids = $spec_ids_sorted;
+				$attr_spec_list   = $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::ATTR_SPEC_LIST ];
+				$tag_spec         = $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::TAG_SPEC ];
+				if ( isset( $tag_spec[ AMP_Rule_Spec::MANDATORY_ATTRS ] ) ) {
+					$mandatory_attrs = $tag_spec[ AMP_Rule_Spec::MANDATORY_ATTRS ];
+				}
 				if ( isset( $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::CDATA ] ) ) {
 					$cdata = $rule_spec_list_to_validate[ $spec_ids_sorted[0] ][ AMP_Rule_Spec::CDATA ];
 				}
@@ -461,11 +795,14 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 				// This should not happen very often, but...
 				// If we're here, then we're not sure which spec should
 				// be used. Let's use the top scoring ones.
+				$matched_spec_ids = array();
 				foreach ( $spec_ids_sorted as $id ) {
-					$spec_list = isset( $rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ? $rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::ATTR_SPEC_LIST ] : null;
-					if ( ! $this->is_missing_mandatory_attribute( $spec_list, $node ) ) {
-						$attr_spec_list = array_merge( $attr_spec_list, $spec_list );
-						$tag_spec       = array_merge(
+					$spec_list      = isset( $rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ? $rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::ATTR_SPEC_LIST ] : array();
+					$spec_mandatory = isset( $rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_ATTRS ] ) ? $rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_ATTRS ] : array();
+					if ( ! $this->is_missing_mandatory_attrs( $spec_mandatory, $node ) ) {
+						$matched_spec_ids[] = $id;
+						$attr_spec_list     = array_merge( $attr_spec_list, $spec_list );
+						$tag_spec           = array_merge(
 							$tag_spec,
 							$rule_spec_list_to_validate[ $id ][ AMP_Rule_Spec::TAG_SPEC ]
 						);
@@ -476,19 +813,31 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 				}
 				$first_spec = reset( $rule_spec_list_to_validate );
 				if ( empty( $attr_spec_list ) && isset( $first_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ] ) ) {
-					$attr_spec_list = $first_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ];
+					$matched_spec_ids = array( key( $rule_spec_list_to_validate ) );
+					$attr_spec_list   = $first_spec[ AMP_Rule_Spec::ATTR_SPEC_LIST ];
+					if ( isset( $first_spec[ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_ATTRS ] ) ) {
+						$mandatory_attrs = $first_spec[ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_ATTRS ];
+					}
 				}
 			}
 		}
 
-		if ( ! empty( $attr_spec_list ) && $this->is_missing_mandatory_attribute( $attr_spec_list, $node ) ) {
+		if ( isset( $this->spec_hits ) ) {
+			$this->record_tag_spec_hits( $node, $rule_spec_list, $tag_spec_seconds, $matched_spec_ids );
+		}
+
+		if ( ! empty( $attr_spec_list ) && $this->is_missing_mandatory_attrs( $mandatory_attrs, $node ) ) {
 			$this->remove_node( $node );
 			return;
 		}
 
 		// Remove element if it has illegal CDATA.
 		if ( ! empty( $cdata ) && $node instanceof DOMElement ) {
-			$validity = $this->validate_cdata_for_node( $node, $cdata );
+			$start_time = isset( $this->spec_hits ) ? microtime( true ) : null;
+			$validity   = $this->validate_cdata_for_node( $node, $cdata );
+			if ( isset( $start_time ) ) {
+				$this->record_spec_hit( 'cdata', $this->get_spec_hit_name( $node->nodeName, $tag_spec ), ! is_wp_error( $validity ), microtime( true ) - $start_time );
+			}
 			if ( is_wp_error( $validity ) ) {
 				$this->remove_node( $node );
 				return;
@@ -501,19 +850,32 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		);
 
 		// Amend spec list with layout.
+		$layout_table = null;
 		if ( isset( $tag_spec['amp_layout'] ) ) {
 			$merged_attr_spec_list = array_merge( $merged_attr_spec_list, $this->layout_allowed_attributes );
 
-			if ( isset( $tag_spec['amp_layout']['supported_layouts'] ) ) {
+			if ( isset( $tag_spec[ AMP_Rule_Spec::LAYOUT_TABLE ] ) ) {
+				// The layout is checked against the compiled layout table along with the width and height, below.
+				$layout_table = AMP_Allowed_Tags_Generated::get_layout_table( $tag_spec[ AMP_Rule_Spec::LAYOUT_TABLE ] );
+			} elseif ( isset( $tag_spec['amp_layout']['supported_layouts'] ) ) {
 				$layouts = wp_array_slice_assoc( AMP_Rule_Spec::$layout_enum, $tag_spec['amp_layout']['supported_layouts'] );
 
 				$merged_attr_spec_list['layout'][ AMP_Rule_Spec::VALUE_REGEX_CASEI ] = '(' . implode( '|', $layouts ) . ')';
+				unset( $merged_attr_spec_list['layout'][ AMP_Rule_Spec::VALUE_REGEX_CASEI_PCRE ], $merged_attr_spec_list['layout'][ AMP_Rule_Spec::ATTR_SPEC_ID ] );
 			}
 		}
 
 		// Identify any remaining disallowed attributes.
 		$disallowed_attributes = $this->get_disallowed_attributes_in_node( $node, $merged_attr_spec_list );
 
+		// Identify a layout which the tag spec doesn't support, or which the width and height don't allow.
+		if ( isset( $layout_table ) && $node->hasAttribute( 'layout' ) && ! $this->is_layout_allowed( $node, $layout_table ) ) {
+			$layout_attr = $node->getAttributeNode( 'layout' );
+			if ( ! in_array( $layout_attr, $disallowed_attributes, true ) ) {
+				$disallowed_attributes[] = $layout_attr;
+			}
+		}
+
 		// Identify attribute values that don't conform to the attr_spec.
 		$disallowed_attributes = $this->sanitize_disallowed_attribute_values_in_node( $node, $merged_attr_spec_list, $disallowed_attributes );
 
@@ -542,16 +904,24 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 
 		// Add required AMP component scripts if the element is still in the document.
 		if ( $node->parentNode ) {
-			if ( ! empty( $tag_spec['also_requires_tag_warning'] ) ) {
-				$this->script_components[] = strtok( $tag_spec['also_requires_tag_warning'][0], ' ' );
-			}
-			if ( ! empty( $tag_spec['requires_extension'] ) ) {
-				$this->script_components = array_merge( $this->script_components, $tag_spec['requires_extension'] );
+
+			// The components of the tags and attributes in the extension index are looked up in get_scripts(), once per name.
+			if ( isset( $this->extension_index['tags'][ $node->nodeName ] ) ) {
+				$this->extension_tag_names[ $node->nodeName ] = true;
+			} else {
+				if ( ! empty( $tag_spec['also_requires_tag_warning'] ) ) {
+					$this->script_components[] = strtok( $tag_spec['also_requires_tag_warning'][0], ' ' );
+				}
+				if ( ! empty( $tag_spec['requires_extension'] ) ) {
+					$this->script_components = array_merge( $this->script_components, $tag_spec['requires_extension'] );
+				}
 			}
 
 			// Add required AMP components for attributes.
 			foreach ( $node->attributes as $attribute ) {
-				if ( isset( $merged_attr_spec_list[ $attribute->nodeName ]['requires_extension'] ) ) {
+				if ( isset( $this->extension_index['attributes'][ $attribute->nodeName ] ) ) {
+					$this->extension_attribute_names[ $attribute->nodeName ] = true;
+				} elseif ( isset( $merged_attr_spec_list[ $attribute->nodeName ]['requires_extension'] ) ) {
 					$this->script_components = array_merge( $this->script_components, $merged_attr_spec_list[ $attribute->nodeName ]['requires_extension'] );
 				}
 			}
@@ -564,10 +934,11 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			// Check if element needs amp-bind component.
 			if ( $node instanceof DOMElement && ! in_array( 'amp-bind', $this->script_components, true ) ) {
 				foreach ( $node->attributes as $name => $value ) {
+					$primary_name      = $this->get_primary_attribute_name( $name );
 					$is_bind_attribute = (
 						'[' === $name[0]
 						||
-						( isset( $this->rev_alternate_attr_name_lookup[ $name ] ) && '[' === $this->rev_alternate_attr_name_lookup[ $name ][0] )
+						( isset( $primary_name ) && '[' === $primary_name[0] )
 					);
 					if ( $is_bind_attribute ) {
 						$this->script_components[] = 'amp-bind';
@@ -578,6 +949,28 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 	}
 
+	/**
+	 * Whether a node is missing one of the mandatory attributes which a tag spec lists.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::get_mandatory_attrs()
+	 *
+	 * @param string[][] $mandatory_attrs Mandatory attributes, each with its name followed by its alternative names.
+	 * @param DOMElement $node            The DOMElement of the node to check.
+	 * @return bool Whether the node has none of the names of a mandatory attribute.
+	 */
+	private function is_missing_mandatory_attrs( $mandatory_attrs, $node ) {
+		foreach ( $mandatory_attrs as $attr_names ) {
+			foreach ( $attr_names as $attr_name ) {
+				if ( $node->hasAttribute( $attr_name ) ) {
+					continue 2;
+				}
+			}
+			return true;
+		}
+		return false;
+	}
+
 	/**
 	 * Whether a node is missing a mandatory attribute.
 	 *
@@ -624,12 +1017,22 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	private function validate_cdata_for_node( $element, $cdata_spec ) {
 		if ( isset( $cdata_spec['blacklisted_cdata_regex'] ) ) {
-			if ( preg_match( '@' . $cdata_spec['blacklisted_cdata_regex']['regex'] . '@u', $element->textContent ) ) {
+			if ( isset( $cdata_spec['blacklisted_cdata_regex']['regex_pcre'] ) ) {
+				$pattern = $cdata_spec['blacklisted_cdata_regex']['regex_pcre'];
+			} else {
+				$pattern = '@' . $cdata_spec['blacklisted_cdata_regex']['regex'] . '@u';
+			}
+			if ( preg_match( $pattern, $element->textContent ) ) {
 				return new WP_Error( $cdata_spec['blacklisted_cdata_regex']['error_message'] );
 			}
 		} elseif ( isset( $cdata_spec['cdata_regex'] ) ) {
-			$delimiter = false === strpos( $cdata_spec['cdata_regex'], '@' ) ? '@' : '#';
-			if ( ! preg_match( $delimiter . $cdata_spec['cdata_regex'] . $delimiter . 'u', $element->textContent ) ) {
+			if ( isset( $cdata_spec['cdata_regex_pcre'] ) ) {
+				$pattern = $cdata_spec['cdata_regex_pcre'];
+			} else {
+				$delimiter = false === strpos( $cdata_spec['cdata_regex'], '@' ) ? '@' : '#';
+				$pattern   = $delimiter . $cdata_spec['cdata_regex'] . $delimiter . 'u';
+			}
+			if ( ! preg_match( $pattern, $element->textContent ) ) {
 				return new WP_Error( 'cdata_regex' );
 			}
 		}
@@ -661,7 +1064,11 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			return false;
 		}
 
-		if ( ! empty( $tag_spec[ AMP_Rule_Spec::DISALLOWED_ANCESTOR ] ) ) {
+		if ( ! empty( $tag_spec['disallowed_ancestor_set'] ) ) {
+			if ( $this->has_ancestor( $node, $tag_spec['disallowed_ancestor_set'] ) ) {
+				return false;
+			}
+		} elseif ( ! empty( $tag_spec[ AMP_Rule_Spec::DISALLOWED_ANCESTOR ] ) ) {
 			foreach ( $tag_spec[ AMP_Rule_Spec::DISALLOWED_ANCESTOR ] as $disallowed_ancestor_node_name ) {
 				if ( $this->has_ancestor( $node, $disallowed_ancestor_node_name ) ) {
 					return false;
@@ -674,7 +1081,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 
 		if ( ! empty( $tag_spec[ AMP_Rule_Spec::DESCENDANT_TAG_LIST ] ) ) {
-			$allowed_tags = AMP_Allowed_Tags_Generated::get_descendant_tag_list( $tag_spec[ AMP_Rule_Spec::DESCENDANT_TAG_LIST ] );
+			$allowed_tags = AMP_Allowed_Tags_Generated::get_descendant_tag_set( $tag_spec[ AMP_Rule_Spec::DESCENDANT_TAG_LIST ] );
 			if ( ! empty( $allowed_tags ) ) {
 				$this->remove_disallowed_descendants( $node, $allowed_tags );
 			}
@@ -783,7 +1190,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * specified by the value of rule to pass.
 			 */
 			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ] ) ) {
-				$result = $this->check_attr_spec_rule_value_regex( $node, $attr_name, $attr_spec_rule );
+				$result = $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_value_regex', $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
 				} elseif ( AMP_Rule_Spec::FAIL === $result ) {
@@ -811,7 +1218,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * pattern specified by the value of the rule to pass.
 			 */
 			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ] ) ) {
-				$result = $this->check_attr_spec_rule_value_regex_casei( $node, $attr_name, $attr_spec_rule );
+				$result = $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_value_regex_casei', $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
 				} elseif ( AMP_Rule_Spec::FAIL === $result ) {
@@ -824,7 +1231,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * be in the array specified by the rule's value to pass.
 			 */
 			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ] ) ) {
-				$result = $this->check_attr_spec_rule_allowed_protocol( $node, $attr_name, $attr_spec_rule );
+				$result = $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_allowed_protocol', $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
 				} elseif ( AMP_Rule_Spec::FAIL === $result ) {
@@ -837,7 +1244,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * be valid
 			 */
 			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ] ) ) {
-				$result = $this->check_attr_spec_rule_valid_url( $node, $attr_name, $attr_spec_rule );
+				$result = $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_valid_url', $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
 				} elseif ( AMP_Rule_Spec::FAIL === $result ) {
@@ -850,7 +1257,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * value is `false`, then pass.
 			 */
 			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOW_RELATIVE ] ) ) {
-				$result = $this->check_attr_spec_rule_disallowed_relative( $node, $attr_name, $attr_spec_rule );
+				$result = $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_disallowed_relative', $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
 				} elseif ( AMP_Rule_Spec::FAIL === $result ) {
@@ -876,7 +1283,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * of domains in the value of the rule, then pass.
 			 */
 			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::DISALLOWED_DOMAIN ] ) ) {
-				$result = $this->check_attr_spec_rule_disallowed_domain( $node, $attr_name, $attr_spec_rule );
+				$result = $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_disallowed_domain', $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
 				} elseif ( AMP_Rule_Spec::FAIL === $result ) {
@@ -889,7 +1296,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			 * by the rule's value, then pass.
 			 */
 			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX ] ) ) {
-				$result = $this->check_attr_spec_rule_blacklisted_value_regex( $node, $attr_name, $attr_spec_rule );
+				$result = $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_blacklisted_value_regex', $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
 				} elseif ( AMP_Rule_Spec::FAIL === $result ) {
@@ -899,7 +1306,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 
 			// If the attribute's value exists and it matches the value properties spec.
 			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_PROPERTIES ] ) && $node->hasAttribute( $attr_name ) ) {
-				$result = $this->check_attr_spec_rule_value_properties( $node, $attr_name, $attr_spec_rule );
+				$result = $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_value_properties', $node, $attr_name, $attr_spec_rule );
 				if ( AMP_Rule_Spec::PASS === $result ) {
 					$score++;
 				} elseif ( AMP_Rule_Spec::FAIL === $result ) {
@@ -1015,28 +1422,28 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_value_casei( $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ] ) &&
-				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_value_regex( $node, $attr_name, $attr_spec_rule ) ) {
+				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_value_regex', $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ] ) &&
-				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_value_regex_casei( $node, $attr_name, $attr_spec_rule ) ) {
+				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_value_regex_casei', $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOWED_PROTOCOL ] ) &&
-				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_allowed_protocol( $node, $attr_name, $attr_spec_rule ) ) {
+				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_allowed_protocol', $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ] ) &&
-				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_valid_url( $node, $attr_name, $attr_spec_rule ) ) {
+				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_valid_url', $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOW_RELATIVE ] ) &&
-				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_disallowed_relative( $node, $attr_name, $attr_spec_rule ) ) {
+				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_disallowed_relative', $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_URL ][ AMP_Rule_Spec::ALLOW_EMPTY ] ) &&
 				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_disallowed_empty( $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::DISALLOWED_DOMAIN ] ) &&
-				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_disallowed_domain( $node, $attr_name, $attr_spec_rule ) ) {
+				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_disallowed_domain', $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX ] ) &&
-				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_blacklisted_value_regex( $node, $attr_name, $attr_spec_rule ) ) {
+				AMP_Rule_Spec::FAIL === $this->check_attr_spec_rule_memoized( 'check_attr_spec_rule_blacklisted_value_regex', $node, $attr_name, $attr_spec_rule ) ) {
 				$should_remove_node = true;
 			}
 
@@ -1068,6 +1475,224 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		return $attributes_pending_removal;
 	}
 
+	/**
+	 * Run an attribute spec rule check, or get its result from the memo when it was already run for the same attribute values.
+	 *
+	 * Pages repeat the same attributes and values many times, so the checks which match regexes or parse URLs are memoized
+	 * for the specs which have an ID, see AMP_Rule_Spec::ATTR_SPEC_ID. A check only reads the values of the attribute and
+	 * of its alternative names, so these, the check and the spec ID determine its result. The memo holds up to
+	 * ATTR_SPEC_RULE_RESULTS_LIMIT results, and is emptied when it is full.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::get_attr_spec_rule_result_stats()
+	 *
+	 * @param string     $check          Name of the check_attr_spec_rule_* method.
+	 * @param DOMElement $node           Node.
+	 * @param string     $attr_name      Attribute name.
+	 * @param array      $attr_spec_rule Attribute spec rule.
+	 * @return int Result of the check, AMP_Rule_Spec::PASS, AMP_Rule_Spec::FAIL or AMP_Rule_Spec::NOT_APPLICABLE.
+	 */
+	private function check_attr_spec_rule_memoized( $check, $node, $attr_name, $attr_spec_rule ) {
+		if ( ! isset( $attr_spec_rule[ AMP_Rule_Spec::ATTR_SPEC_ID ] ) ) {
+			return $this->$check( $node, $attr_name, $attr_spec_rule );
+		}
+
+		$key        = $check . ':' . $attr_spec_rule[ AMP_Rule_Spec::ATTR_SPEC_ID ];
+		$attr_names = array( $attr_name );
+		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
+			$attr_names = array_merge( $attr_names, $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] );
+		}
+		foreach ( $attr_names as $name ) {
+			if ( $node->hasAttribute( $name ) ) {
+				$value = $node->getAttribute( $name );
+				$key  .= ':' . $name . ':' . strlen( $value ) . ':' . $value;
+			} else {
+				$key .= ':';
+			}
+		}
+
+		$start_time = isset( $this->spec_hits ) ? microtime( true ) : null;
+		if ( isset( $this->attr_spec_rule_results[ $key ] ) ) {
+			$this->attr_spec_rule_result_stats['hits']++;
+		} else {
+			$this->attr_spec_rule_result_stats['misses']++;
+			if ( count( $this->attr_spec_rule_results ) >= self::ATTR_SPEC_RULE_RESULTS_LIMIT ) {
+				$this->attr_spec_rule_results = array();
+				$this->attr_spec_rule_result_stats['evictions']++;
+			}
+			$this->attr_spec_rule_results[ $key ] = $this->$check( $node, $attr_name, $attr_spec_rule );
+		}
+		if ( isset( $start_time ) ) {
+			$this->record_spec_hit( 'attr_rules', substr( $check, strlen( 'check_attr_spec_rule_' ) ), AMP_Rule_Spec::FAIL !== $this->attr_spec_rule_results[ $key ], microtime( true ) - $start_time );
+		}
+		return $this->attr_spec_rule_results[ $key ];
+	}
+
+	/**
+	 * Get the numbers of memoized attribute spec rule checks, to show how well the memo works for a page.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::check_attr_spec_rule_memoized()
+	 *
+	 * @return array {
+	 *     Numbers of the memoized checks.
+	 *
+	 *     @type int   $hits      Checks whose result was found in the memo.
+	 *     @type int   $misses    Checks which were run and added to the memo.
+	 *     @type int   $evictions Times the memo was full and emptied.
+	 *     @type int   $size      Results in the memo.
+	 *     @type float $hit_rate  Share of the checks whose result was found in the memo, from 0 to 1.
+	 * }
+	 */
+	public function get_attr_spec_rule_result_stats() {
+		$stats             = $this->attr_spec_rule_result_stats;
+		$stats['size']     = count( $this->attr_spec_rule_results );
+		$total             = $stats['hits'] + $stats['misses'];
+		$stats['hit_rate'] = $total ? $stats['hits'] / $total : 0.0;
+		return $stats;
+	}
+
+	/**
+	 * Get the name which the hits of a tag spec are recorded under.
+	 *
+	 * This is the spec name, as amphtml-update.py matches the tag specs of AMP_Allowed_Tags_Generated by it, or the tag name
+	 * for a tag spec without one.
+	 *
+	 * @since 1.1
+	 *
+	 * @param string $tag_name Tag name.
+	 * @param array  $tag_spec Tag spec.
+	 * @return string Spec name.
+	 */
+	private function get_spec_hit_name( $tag_name, $tag_spec ) {
+		return isset( $tag_spec['spec_name'] ) ? $tag_spec['spec_name'] : $tag_name;
+	}
+
+	/**
+	 * Record a hit or reject of a spec, and the time spent checking it.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::get_spec_hits()
+	 *
+	 * @param string $type    Type of the spec: 'tag_specs', 'attr_spec_lists', 'attr_rules' or 'cdata'.
+	 * @param string $name    Name of the spec, or the type of the attribute rule.
+	 * @param bool   $is_hit  Whether the node matched the spec, or passed the rule.
+	 * @param float  $seconds Seconds spent checking it.
+	 */
+	private function record_spec_hit( $type, $name, $is_hit, $seconds ) {
+		if ( ! isset( $this->spec_hits[ $type ][ $name ] ) ) {
+			$this->spec_hits[ $type ][ $name ] = array(
+				'hits'    => 0,
+				'rejects' => 0,
+				'seconds' => 0.0,
+			);
+		}
+		$this->spec_hits[ $type ][ $name ][ $is_hit ? 'hits' : 'rejects' ]++;
+		$this->spec_hits[ $type ][ $name ]['seconds'] += $seconds;
+	}
+
+	/**
+	 * Record which of the tag specs checked for a node it was sanitized with, and which it was not.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::process_node()
+	 *
+	 * @param DOMNode $node             Node.
+	 * @param array[] $rule_spec_list   Rule specs of the node's tag.
+	 * @param float[] $tag_spec_seconds Seconds spent checking the placement of the node against each rule spec, by ID.
+	 * @param int[]   $matched_spec_ids IDs of the rule specs the node was sanitized with, empty if it was removed.
+	 */
+	private function record_tag_spec_hits( $node, $rule_spec_list, $tag_spec_seconds, $matched_spec_ids ) {
+		foreach ( $tag_spec_seconds as $id => $seconds ) {
+			$this->record_spec_hit( 'tag_specs', $this->get_spec_hit_name( $node->nodeName, $rule_spec_list[ $id ][ AMP_Rule_Spec::TAG_SPEC ] ), in_array( $id, $matched_spec_ids, true ), $seconds );
+		}
+	}
+
+	/**
+	 * Get the hits and rejects of the specs, and the time spent checking them, when the spec_hits_file arg is set.
+	 *
+	 * A tag spec is recorded as a hit when a node is sanitized with it, and as a reject when a node it was checked
+	 * against is sanitized with another spec or removed. The attribute spec lists of the tag specs are recorded when
+	 * they are scored against a node's attributes, both by spec name, the attribute rules which are memoized by type,
+	 * see check_attr_spec_rule_memoized(), and the CDATA by the spec name of the tag. Pass the file to
+	 * `amphtml-update.py --spec-hits` to order the tag specs of each tag by their hits.
+	 *
+	 * @since 1.1
+	 *
+	 * @return array|null {
+	 *     Spec hits, or null if they are not recorded.
+	 *
+	 *     @type int     $documents       Number of documents sanitized.
+	 *     @type array[] $tag_specs       Hits, rejects and seconds of the tag specs, by spec name.
+	 *     @type array[] $attr_spec_lists Hits, rejects and seconds of the attribute spec lists, by spec name.
+	 *     @type array[] $attr_rules      Hits, rejects and seconds of the attribute rules, by type.
+	 *     @type array[] $cdata           Hits, rejects and seconds of the CDATA specs, by spec name.
+	 * }
+	 */
+	public function get_spec_hits() {
+		return $this->spec_hits;
+	}
+
+	/**
+	 * Add the spec hits of the document to those in a JSON file.
+	 *
+	 * The file is locked while it is updated, so that concurrent requests can add to the same file.
+	 *
+	 * @since 1.1
+	 * @see AMP_Tag_And_Attribute_Sanitizer::get_spec_hits()
+	 *
+	 * @param string $path Path of the JSON file, which is created if it does not exist.
+	 * @return bool Whether the file was written.
+	 */
+	private function write_spec_hits( $path ) {
+		// Check first, as fopen() would warn on every request about a file which can't be written.
+		if ( ! is_writable( file_exists( $path ) ? $path : dirname( $path ) ) ) {
+			return false;
+		}
+		$handle = fopen( $path, 'c+' ); // phpcs:ignore WordPress.WP.AlternativeFunctions.file_system_read_fopen
+		if ( ! $handle ) {
+			return false;
+		}
+		if ( ! flock( $handle, LOCK_EX ) ) {
+			fclose( $handle ); // phpcs:ignore WordPress.WP.AlternativeFunctions.file_system_read_fclose
+			return false;
+		}
+
+		// Counts which the file does not have yet, or which it lost, start at 0.
+		$spec_hits = json_decode( stream_get_contents( $handle ), true );
+		if ( ! is_array( $spec_hits ) ) {
+			$spec_hits = array();
+		}
+		if ( ! isset( $spec_hits['documents'] ) || ! is_int( $spec_hits['documents'] ) ) {
+			$spec_hits['documents'] = 0;
+		}
+		$spec_hits['documents'] += $this->spec_hits['documents'];
+		foreach ( $this->spec_hits as $type => $counts ) {
+			if ( ! is_array( $counts ) ) {
+				continue;
+			}
+			foreach ( $counts as $name => $count ) {
+				if ( ! isset( $spec_hits[ $type ][ $name ] ) || ! is_array( $spec_hits[ $type ][ $name ] ) ) {
+					$spec_hits[ $type ][ $name ] = array();
+				}
+				foreach ( $count as $key => $value ) {
+					if ( ! isset( $spec_hits[ $type ][ $name ][ $key ] ) ) {
+						$spec_hits[ $type ][ $name ][ $key ] = 0;
+					}
+					$spec_hits[ $type ][ $name ][ $key ] += $value;
+				}
+			}
+		}
+
+		ftruncate( $handle, 0 );
+		rewind( $handle );
+		$written = fwrite( $handle, wp_json_encode( $spec_hits ) ); // phpcs:ignore WordPress.WP.AlternativeFunctions.file_system_read_fwrite
+		fflush( $handle );
+		flock( $handle, LOCK_UN );
+		fclose( $handle ); // phpcs:ignore WordPress.WP.AlternativeFunctions.file_system_read_fclose
+		return false !== $written;
+	}
+
 	/**
 	 * Check if attribute is mandatory determine whether it exists in $node.
 	 *
@@ -1118,8 +1743,9 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	private function check_attr_spec_rule_value( $node, $attr_name, $attr_spec_rule ) {
 		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) ) {
+			$value_set = $this->get_attr_spec_value_set( $attr_spec_rule, AMP_Rule_Spec::VALUE );
 			if ( $node->hasAttribute( $attr_name ) ) {
-				if ( $this->check_matching_attribute_value( $attr_name, $node->getAttribute( $attr_name ), $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) ) {
+				if ( $this->check_matching_attribute_value( $attr_name, $node->getAttribute( $attr_name ), $value_set ) ) {
 					return AMP_Rule_Spec::PASS;
 				} else {
 					return AMP_Rule_Spec::FAIL;
@@ -1127,7 +1753,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
 				foreach ( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
 					if ( $node->hasAttribute( $alternative_name ) ) {
-						if ( $this->check_matching_attribute_value( $attr_name, $node->getAttribute( $alternative_name ), $attr_spec_rule[ AMP_Rule_Spec::VALUE ] ) ) {
+						if ( $this->check_matching_attribute_value( $attr_name, $node->getAttribute( $alternative_name ), $value_set ) ) {
 							return AMP_Rule_Spec::PASS;
 						} else {
 							return AMP_Rule_Spec::FAIL;
@@ -1146,34 +1772,101 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 *
 	 * @since 0.7.0
 	 * @since 1.0.0 The spec value is now an array.
+	 * @since 1.1 The spec values are now a set, see get_attr_spec_value_set().
 	 *
-	 * @param string       $attr_name   Attribute name.
-	 * @param string       $attr_value  Attribute value.
-	 * @param string|array $spec_values Attribute spec value(s).
+	 * @param string $attr_name  Attribute name.
+	 * @param string $attr_value Attribute value.
+	 * @param array  $value_set  Attribute spec values as keys.
 	 * @return bool Is value valid.
 	 */
-	private function check_matching_attribute_value( $attr_name, $attr_value, $spec_values ) {
-		if ( is_string( $spec_values ) ) {
-			$spec_values = (array) $spec_values;
+	private function check_matching_attribute_value( $attr_name, $attr_value, $value_set ) {
+		if ( isset( $value_set[ $attr_value ] ) ) {
+			return true;
 		}
-		foreach ( $spec_values as $spec_value ) {
-			if ( $spec_value === $attr_value ) {
-				return true;
-			}
 
-			// Check for boolean attribute.
-			$is_bool_match = (
-				'' === $spec_value
-				&&
-				in_array( $attr_name, AMP_Rule_Spec::$boolean_attributes, true )
-				&&
-				strtolower( $attr_value ) === strtolower( $attr_name )
-			);
-			if ( $is_bool_match ) {
-				return true;
-			}
+		// Check for boolean attribute.
+		return (
+			isset( $value_set[''] )
+			&&
+			in_array( $attr_name, AMP_Rule_Spec::$boolean_attributes, true )
+			&&
+			strtolower( $attr_value ) === strtolower( $attr_name )
+		);
+	}
+
+	/**
+	 * Check whether the layout attribute of an element is allowed with its width and height.
+	 *
+	 * The layout table has a bitmask of the allowed layouts for each class of width and height,
+	 * see AMP_Allowed_Tags_Generated::get_layout_table().
+	 *
+	 * Only an explicit layout attribute is checked, since it is the one which can be removed. The layout
+	 * which the AMP validator implies for an element without one is not checked, as elements are kept
+	 * even when their width and height do not give a supported layout, like an amp-img with only a width.
+	 *
+	 * @since 1.1
+	 *
+	 * @param DOMElement $node         Element with a layout attribute.
+	 * @param int[]      $layout_table Layout table of the tag spec.
+	 * @return bool Whether the layout is allowed.
+	 */
+	private function is_layout_allowed( DOMElement $node, $layout_table ) {
+		$layout = array_search( strtolower( $node->getAttribute( 'layout' ) ), AMP_Rule_Spec::$layout_enum, true );
+		if ( false === $layout ) {
+			return false;
 		}
-		return false;
+
+		$key = $this->get_layout_dimension_class( $node, 'width' ) * AMP_Rule_Spec::LAYOUT_DIMENSION_CLASSES + $this->get_layout_dimension_class( $node, 'height' );
+		return 0 !== ( $layout_table[ $key ] & ( 1 << $layout ) );
+	}
+
+	/**
+	 * Get the class of the width or height of an element, as the layout tables are indexed by.
+	 *
+	 * @since 1.1
+	 *
+	 * @param DOMElement $node      Element.
+	 * @param string     $attr_name Either 'width' or 'height'.
+	 * @return int One of the AMP_Rule_Spec::LAYOUT_DIMENSION_* constants.
+	 */
+	private function get_layout_dimension_class( DOMElement $node, $attr_name ) {
+		if ( ! $node->hasAttribute( $attr_name ) ) {
+			return AMP_Rule_Spec::LAYOUT_DIMENSION_NONE;
+		}
+
+		$value = $node->getAttribute( $attr_name );
+		if ( 'auto' === $value ) {
+			return AMP_Rule_Spec::LAYOUT_DIMENSION_AUTO;
+		} elseif ( 'fluid' === $value ) {
+			return AMP_Rule_Spec::LAYOUT_DIMENSION_FLUID;
+		} elseif ( preg_match( '/^\d+(?:\.\d+)?(px|em|rem|vh|vw|vmin|vmax)?$/D', $value, $matches ) ) {
+			return empty( $matches[1] ) || 'px' === $matches[1] ? AMP_Rule_Spec::LAYOUT_DIMENSION_PX : AMP_Rule_Spec::LAYOUT_DIMENSION_UNIT;
+		}
+		return AMP_Rule_Spec::LAYOUT_DIMENSION_INVALID;
+	}
+
+	/**
+	 * Get the values of an attribute spec rule as a set, for looking up a value directly.
+	 *
+	 * The sets are precomputed for the specs in AMP_Allowed_Tags_Generated and built here for any others.
+	 *
+	 * @since 1.1
+	 *
+	 * @param array  $attr_spec_rule Attribute spec rule.
+	 * @param string $key            Either AMP_Rule_Spec::VALUE or AMP_Rule_Spec::VALUE_CASEI.
+	 * @return array Attribute spec values as keys, lowercased for AMP_Rule_Spec::VALUE_CASEI.
+	 */
+	private function get_attr_spec_value_set( $attr_spec_rule, $key ) {
+		$set_key = AMP_Rule_Spec::VALUE_CASEI === $key ? AMP_Rule_Spec::VALUE_CASEI_SET : AMP_Rule_Spec::VALUE_SET;
+		if ( isset( $attr_spec_rule[ $set_key ] ) ) {
+			return AMP_Allowed_Tags_Generated::get_attr_value_set( $attr_spec_rule[ $set_key ] );
+		}
+
+		$values = (array) $attr_spec_rule[ $key ];
+		if ( AMP_Rule_Spec::VALUE_CASEI === $key ) {
+			$values = array_map( 'strtolower', $values );
+		}
+		return array_fill_keys( $values, true );
 	}
 
 	/**
@@ -1194,27 +1887,26 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			return AMP_Rule_Spec::NOT_APPLICABLE;
 		}
 
-		$result      = AMP_Rule_Spec::NOT_APPLICABLE;
-		$rule_values = (array) $attr_spec_rule[ AMP_Rule_Spec::VALUE_CASEI ];
-		foreach ( $rule_values as $rule_value ) {
-			$rule_value = strtolower( $rule_value );
-			if ( $node->hasAttribute( $attr_name ) ) {
-				$attr_value = strtolower( $node->getAttribute( $attr_name ) );
-				if ( $attr_value === (string) $rule_value ) {
-					return AMP_Rule_Spec::PASS;
-				} else {
-					$result = AMP_Rule_Spec::FAIL;
-				}
-			} elseif ( isset( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
-				foreach ( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
-					if ( $node->hasAttribute( $alternative_name ) ) {
-						$attr_value = strtolower( $node->getAttribute( $alternative_name ) );
-						if ( $attr_value === (string) $rule_value ) {
-							return AMP_Rule_Spec::PASS;
-						} else {
-							$result = AMP_Rule_Spec::FAIL;
-						}
+		$value_set = $this->get_attr_spec_value_set( $attr_spec_rule, AMP_Rule_Spec::VALUE_CASEI );
+		if ( empty( $value_set ) ) {
+			return AMP_Rule_Spec::NOT_APPLICABLE;
+		}
+
+		if ( $node->hasAttribute( $attr_name ) ) {
+			if ( isset( $value_set[ strtolower( $node->getAttribute( $attr_name ) ) ] ) ) {
+				return AMP_Rule_Spec::PASS;
+			}
+			return AMP_Rule_Spec::FAIL;
+		}
+
+		$result = AMP_Rule_Spec::NOT_APPLICABLE;
+		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] ) ) {
+			foreach ( $attr_spec_rule[ AMP_Rule_Spec::ALTERNATIVE_NAMES ] as $alternative_name ) {
+				if ( $node->hasAttribute( $alternative_name ) ) {
+					if ( isset( $value_set[ strtolower( $node->getAttribute( $alternative_name ) ) ] ) ) {
+						return AMP_Rule_Spec::PASS;
 					}
+					$result = AMP_Rule_Spec::FAIL;
 				}
 			}
 		}
@@ -1237,16 +1929,20 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	private function check_attr_spec_rule_value_regex( $node, $attr_name, $attr_spec_rule ) {
 		// Check 'value_regex' - case sensitive regex match.
 		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ] ) && $node->hasAttribute( $attr_name ) ) {
-			$rule_value = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ];
-			$rule_value = str_replace( '/', '\\/', $rule_value );
 
 			/*
 			 * The regex pattern has '^' and '$' though they are not in the AMP spec.
 			 * Leaving them out would allow both '_blank' and 'yyy_blankzzz' to be
 			 * matched by a regex rule of '(_blank|_self|_top)'. As the AMP JS validator
-			 * only accepts '_blank' we leave it this way for now.
+			 * only accepts '_blank' we leave it this way for now. The patterns of the
+			 * generated specs are prepared by amphtml-update.py the same way.
 			 */
-			if ( preg_match( '/^(' . $rule_value . ')$/u', $node->getAttribute( $attr_name ) ) ) {
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_PCRE ] ) ) {
+				$pattern = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_PCRE ];
+			} else {
+				$pattern = '/^(' . str_replace( '/', '\\/', $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX ] ) . ')$/u';
+			}
+			if ( preg_match( $pattern, $node->getAttribute( $attr_name ) ) ) {
 				return AMP_Rule_Spec::PASS;
 			} else {
 				return AMP_Rule_Spec::FAIL;
@@ -1273,11 +1969,14 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		 * Check 'value_regex_casei' - case insensitive regex match
 		 */
 		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ] ) && $node->hasAttribute( $attr_name ) ) {
-			$rule_value = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ];
-			$rule_value = str_replace( '/', '\\/', $rule_value );
 
 			// See note above regarding the '^' and '$' that are added here.
-			if ( preg_match( '/^(' . $rule_value . ')$/ui', $node->getAttribute( $attr_name ) ) ) {
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI_PCRE ] ) ) {
+				$pattern = $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI_PCRE ];
+			} else {
+				$pattern = '/^(' . str_replace( '/', '\\/', $attr_spec_rule[ AMP_Rule_Spec::VALUE_REGEX_CASEI ] ) . ')$/ui';
+			}
+			if ( preg_match( $pattern, $node->getAttribute( $attr_name ) ) ) {
 				return AMP_Rule_Spec::PASS;
 			} else {
 				return AMP_Rule_Spec::FAIL;
@@ -1535,7 +2234,11 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 */
 	private function check_attr_spec_rule_blacklisted_value_regex( $node, $attr_name, $attr_spec_rule ) {
 		if ( isset( $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX ] ) ) {
-			$pattern = '/' . $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX ] . '/u';
+			if ( isset( $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX_PCRE ] ) ) {
+				$pattern = $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX_PCRE ];
+			} else {
+				$pattern = '/' . $attr_spec_rule[ AMP_Rule_Spec::BLACKLISTED_VALUE_REGEX ] . '/u';
+			}
 			if ( $node->hasAttribute( $attr_name ) ) {
 				$attr_value = $node->getAttribute( $attr_name );
 				if ( preg_match( $pattern, $attr_value ) ) {
@@ -1642,12 +2345,8 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			return true;
 		}
 
-		$is_allowed_alt_name_attr = (
-			isset( $this->rev_alternate_attr_name_lookup[ $attr_name ] )
-			&&
-			isset( $attr_spec_list[ $this->rev_alternate_attr_name_lookup[ $attr_name ] ] )
-		);
-		if ( $is_allowed_alt_name_attr ) {
+		$primary_attr_name = $this->get_primary_attribute_name( $attr_name );
+		if ( isset( $primary_attr_name ) && isset( $attr_spec_list[ $primary_attr_name ] ) ) {
 			return true;
 		}
 
@@ -1690,7 +2389,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		 */
 		return (
 			( XML_TEXT_NODE === $node->nodeType ) ||
-			isset( $this->allowed_tags[ $node->nodeName ] ) ||
+			0 !== count( $this->get_rule_spec_list( $node->nodeName ) ) ||
 			( XML_COMMENT_NODE === $node->nodeType ) ||
 			( XML_CDATA_SECTION_NODE === $node->nodeType )
 		);
@@ -1731,12 +2430,40 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 * Determine if the supplied $node has an ancestor with the specified tag name.
 	 *
 	 * @since 0.5
+	 * @since 1.1 Accepts a set of tag names to spec names, like the disallowed_ancestor_set of a tag spec.
 	 *
-	 * @param DOMNode $node              Node.
-	 * @param string  $ancestor_tag_name Ancestor tag name.
+	 * @param DOMNode      $node              Node.
+	 * @param string|array $ancestor_tag_name Ancestor tag name, or set of ancestor tag names to their spec names.
 	 * @return bool Return true if given node has any ancestor with the give name, false otherwise.
 	 */
 	private function has_ancestor( $node, $ancestor_tag_name ) {
+
+		// Intersect the set with the ancestor tag names at once, and only check the attributes of the ones found.
+		if ( is_array( $ancestor_tag_name ) ) {
+			if ( $this->current_ancestors && $node === $this->current_ancestors['node'] ) {
+				$ancestor_tag_names = $this->current_ancestors['tag_names'];
+			} else {
+				$ancestor_tag_names = $this->get_ancestor_tag_names( $node );
+			}
+			foreach ( array_intersect_key( $ancestor_tag_name, $ancestor_tag_names ) as $spec_name ) {
+				if ( $this->has_ancestor( $node, $spec_name ) ) {
+					return true;
+				}
+			}
+			return false;
+		}
+
+		// Look up the tag name among the ancestors collected during the traversal instead of walking up the DOM.
+		if ( $this->current_ancestors && $node === $this->current_ancestors['node'] ) {
+			$parsed_spec_name = $this->parse_tag_and_attributes_from_spec_name( $ancestor_tag_name );
+			if ( ! isset( $this->current_ancestors['tag_names'][ $parsed_spec_name['tag_name'] ] ) ) {
+				return false;
+			}
+			if ( empty( $parsed_spec_name['attributes'] ) ) {
+				return true;
+			}
+		}
+
 		if ( $this->get_ancestor_with_matching_spec_name( $node, $ancestor_tag_name ) ) {
 			return true;
 		}
@@ -1747,6 +2474,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 * Parse tag name and attributes from spec name.
 	 *
 	 * Given a spec name like 'form [method=post]', extract the tag name 'form' and the attributes.
+	 * Spec names which are referenced by tag specs come parsed from AMP_Allowed_Tags_Generated.
 	 *
 	 * @todo This is admittedly rudimentary. It would be more robust to actually look up the tag spec by the name and obtain the required attributes from there, but this is not necessary yet.
 	 *
@@ -1759,6 +2487,12 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			return $parsed_specs[ $spec_name ];
 		}
 
+		$spec_name_components = AMP_Allowed_Tags_Generated::get_spec_name_components( $spec_name );
+		if ( $spec_name_components ) {
+			$parsed_specs[ $spec_name ] = $spec_name_components;
+			return $parsed_specs[ $spec_name ];
+		}
+
 		$attributes = array();
 
 		/*
@@ -1792,8 +2526,10 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	/**
 	 * Loop through node's descendants and remove the ones that are not whitelisted.
 	 *
-	 * @param DOMNode $node Node.
-	 * @param array   $allowed_descendants List of allowed descendant tags.
+	 * @since 1.1 The allowed descendants are now a set, see AMP_Allowed_Tags_Generated::get_descendant_tag_set().
+	 *
+	 * @param DOMNode $node                Node.
+	 * @param array   $allowed_descendants Allowed descendant tags as keys.
 	 */
 	private function remove_disallowed_descendants( $node, $allowed_descendants ) {
 		if ( ! $node->hasChildNodes() ) {
@@ -1809,7 +2545,7 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		}
 
 		foreach ( $child_elements as $child_element ) {
-			if ( ! in_array( $child_element->nodeName, $allowed_descendants, true ) ) {
+			if ( ! isset( $allowed_descendants[ $child_element->nodeName ] ) ) {
 				$this->remove_invalid_child( $child_element );
 			} else {
 				$this->remove_disallowed_descendants( $child, $allowed_descendants );
@@ -1825,7 +2561,9 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 	 *     List of allowed child tags.
 	 *
 	 *     @type array $first_child_tag_name_oneof   List of tag names that are allowed as the first element child.
+	 *     @type array $first_child_tag_name_set     Tag names that are allowed as the first element child, as keys.
 	 *     @type array $child_tag_name_oneof         List of tag names that are allowed as children.
+	 *     @type array $child_tag_name_set           Tag names that are allowed as children, as keys.
 	 *     @type int   $mandatory_num_child_tags     Mandatory number of child tags.
 	 *     @type int   $mandatory_min_num_child_tags Mandatory minimum number of child tags.
 	 * }
@@ -1840,16 +2578,23 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 			}
 		}
 
+		// The sets are missing from tag specs which did not come from AMP_Allowed_Tags_Generated.
+		foreach ( array( 'first_child_tag_name', 'child_tag_name' ) as $key ) {
+			if ( isset( $child_tags[ $key . '_oneof' ] ) && ! isset( $child_tags[ $key . '_set' ] ) ) {
+				$child_tags[ $key . '_set' ] = array_fill_keys( $child_tags[ $key . '_oneof' ], true );
+			}
+		}
+
 		// If the first element is not of the required type, invalidate the entire element.
-		if ( isset( $child_tags['first_child_tag_name_oneof'] ) && ( empty( $child_elements[0] ) || ! in_array( $child_elements[0]->nodeName, $child_tags['first_child_tag_name_oneof'], true ) ) ) {
+		if ( isset( $child_tags['first_child_tag_name_set'] ) && ( empty( $child_elements[0] ) || ! isset( $child_tags['first_child_tag_name_set'][ $child_elements[0]->nodeName ] ) ) ) {
 			return false;
 		}
 
 		// Verify that all of the child are among the set of allowed elements.
 		$removed_count = 0;
-		if ( isset( $child_tags['child_tag_name_oneof'] ) ) {
+		if ( isset( $child_tags['child_tag_name_set'] ) ) {
 			foreach ( $child_elements as $child_element ) {
-				if ( ! in_array( $child_element->nodeName, $child_tags['child_tag_name_oneof'], true ) ) {
+				if ( ! isset( $child_tags['child_tag_name_set'][ $child_element->nodeName ] ) ) {
 					$removed_count++;
 					$this->remove_invalid_child( $child_element );
 				}
@@ -1931,12 +2676,19 @@ class AMP_Tag_And_Attribute_Sanitizer extends AMP_Base_Sanitizer {
 		 */
 		$fragment = $this->dom->createDocumentFragment();
 
+		// The children take the place of the node, so they share its ancestors.
+		$ancestors = array( $node->parentNode, null );
+		if ( $this->current_ancestors && $node === $this->current_ancestors['node'] ) {
+			$ancestors[1] = $this->current_ancestors['tag_names'];
+		}
+
 		// Add all children to fragment/stack.
 		$child = $node->firstChild;
 		while ( $child ) {
 			$fragment->appendChild( $child );
-			$this->stack[] = $child;
-			$child         = $node->firstChild;
+			$this->stack[]           = $child;
+			$this->stack_ancestors[] = $ancestors;
+			$child                   = $node->firstChild;
 		}
 
 		// Prevent double-reporting nodes that are rejected for sanitization.
@@ -0,0 +1,206 @@
+<?php
+/**
+ * Excerpt of class-amp-allowed-tags-generated.php for spec revision 829, as it was written
+ * by piping the rules through `php -r var_export(...)` before bin/amphtml-update.py emitted
+ * the PHP arrays itself.
+ */
+
+	private static $spec_file_revision = 829;
+	private static $minimum_validator_revision_required = 375;
+
+	private static $allowed_tags = array(
+		'a' => array(
+			array(
+				'attr_spec_list' => array(
+					'[href]' => array(),
+					'border' => array(),
+					'download' => array(),
+					'href' => array(
+						'blacklisted_value_regex' => '__amp_source_origin',
+						'value_url' => array(
+							'allow_empty' => true,
+							'protocol' => array(
+								'ftp',
+								'geo',
+								'http',
+								'https',
+								'mailto',
+								'maps',
+								'bip',
+								'bbmi',
+								'fb-me',
+								'fb-messenger',
+								'intent',
+								'line',
+								'skype',
+								'sms',
+								'snapchat',
+								'tel',
+								'tg',
+								'threema',
+								'twitter',
+								'viber',
+								'webcal',
+								'web+mastodon',
+								'wh',
+								'whatsapp',
+							),
+						),
+					),
+					'hreflang' => array(),
+					'media' => array(),
+					'name' => array(
+						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+					),
+					'referrerpolicy' => array(),
+					'rel' => array(
+						'blacklisted_value_regex' => '(^|\\s)(components|dns-prefetch|import|manifest|preconnect|prefetch|preload|prerender|serviceworker|stylesheet|subresource|)(\\s|$)',
+					),
+					'role' => array(),
+					'tabindex' => array(),
+					'target' => array(
+						'value' => array(
+							'_blank',
+							'_self',
+							'_top',
+						),
+					),
+					'type' => array(
+						'value_casei' => array(
+							'text/html',
+						),
+					),
+				),
+				'tag_spec' => array(
+					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#links',
+				),
+			),
+		),
+		'amp-sticky-ad' => array(
+			array(
+				'attr_spec_list' => array(
+					'media' => array(),
+					'noloading' => array(
+						'value' => array(
+							'',
+						),
+					),
+				),
+				'tag_spec' => array(
+					'amp_layout' => array(
+						'supported_layouts' => array(
+							1,
+						),
+					),
+					'child_tags' => array(
+						'first_child_tag_name_oneof' => array(
+							'amp-ad',
+						),
+						'mandatory_num_child_tags' => 1,
+					),
+					'disallowed_ancestor' => array(
+						'amp-app-banner',
+					),
+					'requires_extension' => array(
+						'amp-sticky-ad',
+					),
+					'unique' => true,
+				),
+			),
+		),
+		'html' => array(
+			array(
+				'attr_spec_list' => array(),
+				'tag_spec' => array(
+					'mandatory' => true,
+					'mandatory_parent' => '!doctype',
+					'spec_url' => 'https://www.ampproject.org/docs/reference/spec#required-markup',
+					'unique' => true,
+				),
+			),
+		),
+		'iframe' => array(
+			array(
+				'attr_spec_list' => array(
+					'frameborder' => array(
+						'value' => array(
+							'0',
+							'1',
+						),
+					),
+					'height' => array(),
+					'name' => array(
+						'blacklisted_value_regex' => '(^|\\s)(__amp_\\S*|__count__|__defineGetter__|__defineSetter__|__lookupGetter__|__lookupSetter__|__noSuchMethod__|__parent__|__proto__|__AMP_\\S*|\\$p|\\$proxy|acceptCharset|addEventListener|appendChild|assignedSlot|attachShadow|baseURI|checkValidity|childElementCount|childNodes|classList|className|clientHeight|clientLeft|clientTop|clientWidth|compareDocumentPosition|computedName|computedRole|contentEditable|createShadowRoot|enqueAction|firstChild|firstElementChild|getAnimations|getAttribute|getAttributeNS|getAttributeNode|getAttributeNodeNS|getBoundingClientRect|getClientRects|getDestinationInsertionPoints|getElementsByClassName|getElementsByTagName|getElementsByTagNameNS|getRootNode|hasAttribute|hasAttributeNS|hasAttributes|hasChildNodes|hasPointerCapture|innerHTML|innerText|inputMode|insertAdjacentElement|insertAdjacentHTML|insertAdjacentText|isContentEditable|isDefaultNamespace|isEqualNode|isSameNode|lastChild|lastElementChild|lookupNamespaceURI|namespaceURI|nextElementSibling|nextSibling|nodeName|nodeType|nodeValue|offsetHeight|offsetLeft|offsetParent|offsetTop|offsetWidth|outerHTML|outerText|ownerDocument|parentElement|parentNode|previousElementSibling|previousSibling|querySelector|querySelectorAll|releasePointerCapture|removeAttribute|removeAttributeNS|removeAttributeNode|removeChild|removeEventListener|replaceChild|reportValidity|requestPointerLock|scrollHeight|scrollIntoView|scrollIntoViewIfNeeded|scrollLeft|scrollWidth|setAttribute|setAttributeNS|setAttributeNode|setAttributeNodeNS|setPointerCapture|shadowRoot|styleMap|tabIndex|tagName|textContent|toString|valueOf|(webkit|ms|moz|o)dropzone|(webkit|moz|ms|o)MatchesSelector|(webkit|moz|ms|o)RequestFullScreen|(webkit|moz|ms|o)RequestFullscreen)(\\s|$)',
+					),
+					'referrerpolicy' => array(),
+					'resizable' => array(
+						'value' => array(
+							'',
+						),
+					),
+					'sandbox' => array(),
+					'scrolling' => array(
+						'value' => array(
+							'auto',
+							'yes',
+							'no',
+						),
+					),
+					'src' => array(
+						'blacklisted_value_regex' => '__amp_source_origin',
+						'value_url' => array(
+							'allow_relative' => false,
+							'protocol' => array(
+								'data',
+								'https',
+							),
+						),
+					),
+					'srcdoc' => array(),
+					'width' => array(),
+				),
+				'tag_spec' => array(
+					'mandatory_ancestor' => 'noscript',
+					'mandatory_ancestor_suggested_alternative' => 'amp-iframe',
+					'spec_url' => 'https://www.ampproject.org/docs/reference/components/amp-iframe',
+				),
+			),
+		),
+		'nav' => array(
+			array(
+				'attr_spec_list' => array(),
+				'tag_spec' => array(),
+			),
+			array(
+				'attr_spec_list' => array(
+					'toolbar' => array(
+						'dispatch_key' => 1,
+						'mandatory' => true,
+					),
+					'toolbar-target' => array(
+						'mandatory' => true,
+					),
+				),
+				'tag_spec' => array(
+					'child_tags' => array(
+						'child_tag_name_oneof' => array(
+							'ul',
+						),
+						'mandatory_num_child_tags' => 1,
+					),
+					'mandatory_parent' => 'amp-sidebar',
+					'spec_name' => 'amp-sidebar > nav',
+				),
+			),
+		),
+	);
+
+	private static $layout_allowed_attrs = array(
+		'[height]' => array(),
+		'[width]' => array(),
+		'height' => array(),
+		'heights' => array(),
+		'layout' => array(),
+		'sizes' => array(),
+		'width' => array(),
+	);
@@ -0,0 +1,96 @@
+"""
+Tests for bin/amphtml-corpus.py.
+
+Run from the root of the plugin with:
+
+`python -m unittest discover -s tests/python`
+"""
+
+import copy
+import imp
+import json
+import os
+import random
+import re
+import shutil
+import tempfile
+import unittest
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+FIXTURE_DIRECTORY = os.path.join(PROJECT_PATH, 'tests', 'benchmark', 'amphtml')
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(PROJECT_PATH, 'bin', 'amphtml-update.py'))
+amphtml_validate = imp.load_source('amphtml_validate', os.path.join(PROJECT_PATH, 'bin', 'amphtml-validate.py'))
+amphtml_corpus = imp.load_source('amphtml_corpus', os.path.join(PROJECT_PATH, 'bin', 'amphtml-corpus.py'))
+
+
+class RegexMatchTest(unittest.TestCase):
+
+	def test_matches(self):
+		rnd = random.Random(1)
+		for pattern in (r'[a-z][-a-z0-9]*', r'\d+(px|%)?', r'(top|bottom)\s(left|right)', r'[^\s]{2,5}', r'amp-\w+'):
+			for i in range(20):
+				value = amphtml_corpus.GenerateRegexMatch(pattern, rnd)
+				self.assertTrue(re.match(u'^(%s)$' % pattern, value), '%s does not match %s' % (value, pattern))
+
+	def test_case_insensitive(self):
+		value = amphtml_corpus.GenerateRegexMatch(r'(AUTO|NONE)', random.Random(1), re.I)
+		self.assertIn(value.lower(), ('auto', 'none'))
+
+
+class CorpusTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.rules = amphtml_corpus.LoadRules(FIXTURE_DIRECTORY)
+		self.validator = amphtml_validate.Validator(amphtml_update.GetRulesData(*copy.deepcopy(self.rules)))
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def generate(self, name, **options):
+		out_dir = os.path.join(self.directory, name)
+		manifest = amphtml_corpus.GenerateCorpus(self.rules, out_dir, **options)
+		documents = {}
+		for entry in manifest['documents']:
+			with open(os.path.join(out_dir, entry['file']), 'rb') as document_file:
+				documents[entry['file']] = document_file.read()
+		return (manifest, documents)
+
+	def test_valid_documents(self):
+		(manifest, documents) = self.generate('valid', documents=20, elements=40, depth=4, error_rate=0)
+		self.assertEqual({}, manifest['totals']['violations'])
+		for (name, html) in sorted(documents.items()):
+			self.assertEqual([], self.validator.Validate(html.decode('utf-8')), name)
+
+	def test_violations(self):
+		(manifest, documents) = self.generate('invalid', documents=40, elements=3, depth=1, error_rate=0.5, seed=2)
+		self.assertEqual(set(amphtml_corpus.VIOLATIONS), set(manifest['totals']['violations']))
+		for entry in manifest['documents']:
+			errors = self.validator.Validate(documents[entry['file']].decode('utf-8'))
+			self.assertEqual(bool(entry['violations']), bool(errors), entry)
+
+	def test_oversized_css(self):
+		(manifest, documents) = self.generate('css', documents=10, elements=2, depth=0, error_rate=1)
+		max_bytes = amphtml_corpus.CorpusGenerator(self.rules).max_css_bytes
+		self.assertEqual(50000, max_bytes)
+		for entry in manifest['documents']:
+			if any('oversized_css' == violation['type'] for violation in entry['violations']):
+				css = re.search(r'<style>(.*)</style>', documents[entry['file']], re.S).group(1)
+				self.assertGreater(len(css), max_bytes)
+
+	def test_reproducible(self):
+		(manifest, documents) = self.generate('first', documents=5, error_rate=0.2, seed=7)
+		self.assertEqual((manifest, documents), self.generate('second', documents=5, error_rate=0.2, seed=7))
+		self.assertNotEqual(documents, self.generate('other', documents=5, error_rate=0.2, seed=8)[1])
+		with open(os.path.join(self.directory, 'first', 'manifest.json')) as manifest_file:
+			self.assertEqual(manifest, json.load(manifest_file))
+
+	def test_manifest(self):
+		(manifest, documents) = self.generate('sizes', documents=3, elements=25)
+		self.assertEqual(['document-00001.html', 'document-00002.html', 'document-00003.html'], [entry['file'] for entry in manifest['documents']])
+		self.assertEqual(3, manifest['totals']['documents'])
+		self.assertEqual(sum(len(html) for html in documents.values()), manifest['totals']['bytes'])
+		for entry in manifest['documents']:
+			self.assertGreaterEqual(entry['elements'], 25)
+			self.assertEqual(len(documents[entry['file']]), entry['bytes'])
@@ -0,0 +1,68 @@
+"""
+Tests for bin/amphtml-generator-benchmark.py.
+
+Run from the root of the plugin with:
+
+`python -m unittest discover -s tests/python`
+"""
+
+import imp
+import os
+import shutil
+import tempfile
+import unittest
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(PROJECT_PATH, 'bin', 'amphtml-update.py'))
+amphtml_generator_benchmark = imp.load_source('amphtml_generator_benchmark', os.path.join(PROJECT_PATH, 'bin', 'amphtml-generator-benchmark.py'))
+
+
+class ScaledFixtureTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def read(self, amphtml_directory):
+		validator_directory = os.path.join(amphtml_directory, 'validator')
+		return amphtml_update.ReadValidatorRules(os.path.join(validator_directory, 'validator.proto'), amphtml_update.GetValidatorProtoasciiFiles(validator_directory))
+
+	def test_top_level_fields(self):
+		fields = amphtml_generator_benchmark.GetTopLevelFields('# Comment\nspec_file_revision: 2\ntags: {  # a {\n  tag_name: "A}"\n  attrs: < name: "x" >\n}\nattr_lists { name: "y" }\n')
+		self.assertEqual([
+			('spec_file_revision', 'spec_file_revision: 2'),
+			('tags', 'tags: {  # a {\n  tag_name: "A}"\n  attrs: < name: "x" >\n}'),
+			('attr_lists', 'attr_lists { name: "y" }'),
+		], fields)
+
+	def test_scale(self):
+		amphtml_generator_benchmark.WriteScaledFixture(amphtml_generator_benchmark.FIXTURE_DIRECTORY, os.path.join(self.directory, 'amphtml'), 3)
+		(allowed_tags, attr_lists, descendant_lists, reference_points, versions) = self.read(amphtml_generator_benchmark.FIXTURE_DIRECTORY)
+		(scaled_allowed_tags, scaled_attr_lists, scaled_descendant_lists, scaled_reference_points, scaled_versions) = self.read(os.path.join(self.directory, 'amphtml'))
+
+		self.assertEqual(allowed_tags['amp-state'], scaled_allowed_tags['amp-state'])
+		self.assertEqual(allowed_tags['amp-carousel'], scaled_allowed_tags['amp-carousel'])
+		self.assertIn('amp-carousel-s3', scaled_allowed_tags)
+		self.assertEqual(['amp-bind-s3'], scaled_allowed_tags['amp-state-s3'][0]['tag_spec']['requires_extension'])
+		self.assertIn('amp-bind-s2', [rule_spec['tag_spec']['extension_spec']['name'] for rule_spec in scaled_allowed_tags['script'] if 'extension_spec' in rule_spec['tag_spec']])
+		self.assertEqual(allowed_tags['p'], scaled_allowed_tags['p-s2'])
+		self.assertEqual(attr_lists, scaled_attr_lists)
+		self.assertEqual(reference_points, dict((spec_name, scaled_reference_points[spec_name]) for spec_name in reference_points))
+		self.assertEqual(3 * len(reference_points), len(scaled_reference_points))
+
+		# The copies of HTML are left out, like every tag outside of the document element.
+		self.assertEqual(3 * sum(len(rule_specs) for rule_specs in allowed_tags.values()) - 2, sum(len(rule_specs) for rule_specs in scaled_allowed_tags.values()))
+
+	def test_regressions(self):
+		stages = dict((stage, {'best': 1.0, 'median': 1.0}) for stage in amphtml_generator_benchmark.STAGES)
+		baseline = {'scales': {'1': {'peak_memory_kb': 1000, 'stages': stages}}}
+		results = {'scales': {'1': {'peak_memory_kb': 1100, 'stages': dict(stages, GeneratePHP={'best': 1.5, 'median': 1.5})}}}
+		self.assertEqual(['1x GeneratePHP: best 1.500s, was 1.000s (+50%)'], amphtml_generator_benchmark.GetRegressions(results, baseline, 0.2))
+		self.assertEqual([], amphtml_generator_benchmark.GetRegressions(results, baseline, 0.5))
+
+
+if __name__ == '__main__':
+	unittest.main()
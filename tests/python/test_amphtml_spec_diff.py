@@ -0,0 +1,67 @@
+"""
+Tests for bin/amphtml-spec-diff.py.
+
+Run from the root of the plugin with:
+
+`python -m unittest discover -s tests/python`
+"""
+
+import copy
+import imp
+import os
+import unittest
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+amphtml_spec_diff = imp.load_source('amphtml_spec_diff', os.path.join(PROJECT_PATH, 'bin', 'amphtml-spec-diff.py'))
+
+
+class ManifestTest(unittest.TestCase):
+
+	def setUp(self):
+		self.rules = amphtml_spec_diff.LoadRules(os.path.join(PROJECT_PATH, 'tests', 'benchmark', 'amphtml'))
+
+	def test_same(self):
+		manifest = amphtml_spec_diff.GetManifest(self.rules, copy.deepcopy(self.rules))
+		self.assertEqual([], manifest['affected_tags'])
+		self.assertEqual({'added': [], 'removed': [], 'changed': {}}, manifest['tags'])
+		self.assertFalse(manifest['all_tags_affected'])
+
+	def test_changes(self):
+		new_rules = copy.deepcopy(self.rules)
+		del new_rules['allowed_tags']['amp-video']
+		new_rules['allowed_tags']['amp-foo'] = [{'tag_spec': {}, 'attr_spec_list': {}}]
+		new_rules['allowed_tags']['amp-state'][0]['attr_spec_list']['[foo]'] = {}
+		new_rules['allowed_tags']['amp-state'][0]['tag_spec']['unique'] = True
+
+		# Value set IDs are assigned anew for every revision.
+		for attr_spec in new_rules['allowed_tags']['amp-img'][0]['attr_spec_list'].values():
+			if 'value_set' in attr_spec:
+				attr_spec['value_set'] += 100
+
+		list_name = sorted(new_rules['descendant_tag_lists'])[0]
+		new_rules['descendant_tag_lists'][list_name].append('amp-foo')
+
+		manifest = amphtml_spec_diff.GetManifest(self.rules, new_rules)
+		self.assertEqual(['amp-foo'], manifest['tags']['added'])
+		self.assertEqual(['amp-video'], manifest['tags']['removed'])
+		self.assertEqual(
+			{'amp-state': {'added': [], 'removed': [], 'changed': {'amp-state': {'tag_spec': ['unique'], 'attr_spec_list': {'added': ['[foo]'], 'removed': [], 'changed': []}}}}},
+			manifest['tags']['changed']
+		)
+		self.assertEqual([list_name], manifest['descendant_tag_lists']['changed'])
+
+		users = [tag_name for (tag_name, rule_specs) in self.rules['allowed_tags'].items() if any(list_name == rule_spec['tag_spec'].get('descendant_tag_list') for rule_spec in rule_specs)]
+		self.assertTrue(users)
+		self.assertEqual(sorted(set(['amp-foo', 'amp-video', 'amp-state'] + users)), manifest['affected_tags'])
+
+	def test_global_attrs(self):
+		new_rules = copy.deepcopy(self.rules)
+		new_rules['globally_allowed_attrs']['foo'] = {}
+		manifest = amphtml_spec_diff.GetManifest(self.rules, new_rules)
+		self.assertEqual(['foo'], manifest['globally_allowed_attrs']['added'])
+		self.assertTrue(manifest['all_tags_affected'])
+
+
+if __name__ == '__main__':
+	unittest.main()
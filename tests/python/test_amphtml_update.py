@@ -0,0 +1,906 @@
+"""
+Tests for bin/amphtml-update.py.
+
+Run from the root of the plugin with:
+
+`python -m unittest discover -s tests/python`
+
+These tests do not need the google.protobuf Python module. The ones which need
+protoc are skipped when it is not installed.
+"""
+
+import distutils.spawn
+import imp
+import json
+import os
+import re
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+GENERATED_FILE = os.path.join(PROJECT_PATH, 'includes', 'sanitizers', 'class-amp-allowed-tags-generated.php')
+VAR_EXPORT_FILE = os.path.join(PROJECT_PATH, 'tests', 'python', 'fixtures', 'var-export-rules.php')
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(PROJECT_PATH, 'bin', 'amphtml-update.py'))
+
+PHP_TOKEN = re.compile(r"\s*(?:(array\()|(\))|(,)|(=>)|'((?:[^'\\]|\\.)*)'|(-?\d+\.\d+)|(-?\d+)|(true|false|NULL))", re.S)
+
+
+def ReadPhpValue(php, pos):
+	"""Reads a PHP literal as written by Phpize, returning the value and the position after it."""
+	match = PHP_TOKEN.match(php, pos)
+	if match.group(1):
+		items = []
+		pos = match.end()
+		while not PHP_TOKEN.match(php, pos).group(2):
+			key, pos = ReadPhpValue(php, pos)
+			match = PHP_TOKEN.match(php, pos)
+			if match.group(4):
+				value, pos = ReadPhpValue(php, match.end())
+				items.append((key, value))
+			else:
+				items.append((None, key))
+			pos = PHP_TOKEN.match(php, pos).end()
+		pos = PHP_TOKEN.match(php, pos).end()
+		if len(items) > 0 and items[0][0] is not None:
+			return dict(items), pos
+		return [value for (key, value) in items], pos
+	if match.group(5) is not None:
+		return re.sub(r"\\([\\'])", r'\1', match.group(5)), match.end()
+	if match.group(6):
+		return float(match.group(6)), match.end()
+	if match.group(7):
+		return int(match.group(7)), match.end()
+	return {'true': True, 'false': False, 'NULL': None}[match.group(8)], match.end()
+
+
+def NormalizeAttrSpecList(attr_spec_list):
+	"""Turns an empty attribute spec list and its empty attribute specs back into dictionaries."""
+	return dict((attr_name, attr_spec or {}) for (attr_name, attr_spec) in (attr_spec_list or {}).items())
+
+
+def NormalizeRuleSpec(rule_spec):
+	"""Turns the empty tag spec and attribute specs of a rule spec back into dictionaries."""
+	rule_spec['tag_spec'] = rule_spec['tag_spec'] or {}
+	rule_spec['attr_spec_list'] = NormalizeAttrSpecList(rule_spec['attr_spec_list'])
+	return rule_spec
+
+
+def ReadGeneratedProperties(php):
+	"""Reads the static properties of the generated class into a dictionary.
+
+	PHP has the same empty array for an empty list and an empty dictionary, so the empty specs read back
+	as lists. They are turned back into dictionaries, as the rules parsed from the spec have them. The
+	extension specs, which the script tag specs refer to by name, are put back into them as well.
+	"""
+	properties = {}
+	for match in re.finditer(r'private static \$(\w+) = ', php):
+		properties[match.group(1)] = ReadPhpValue(php, match.end())[0]
+	for rule_specs in properties['allowed_tags'].values():
+		for rule_spec in rule_specs:
+			NormalizeRuleSpec(rule_spec)
+			if 'extension_spec' in rule_spec['tag_spec']:
+				rule_spec['tag_spec']['extension_spec'] = properties['extension_specs'][rule_spec['tag_spec']['extension_spec']['name']]
+	for rule_spec in properties['reference_points'].values():
+		NormalizeRuleSpec(rule_spec)
+	for name in ('globally_allowed_attrs', 'layout_allowed_attrs'):
+		properties[name] = NormalizeAttrSpecList(properties[name])
+	return properties
+
+
+class PhpizeTest(unittest.TestCase):
+
+	def test_scalars(self):
+		self.assertEqual("'foo'", amphtml_update.Phpize('foo'))
+		self.assertEqual("'it\\'s \\\\d'", amphtml_update.Phpize("it's \\d"))
+		self.assertEqual("'\xe2\x9a\xa1'", amphtml_update.Phpize(u'\u26a1'))
+		self.assertEqual('true', amphtml_update.Phpize(True))
+		self.assertEqual('false', amphtml_update.Phpize('False'))
+		self.assertEqual('50000', amphtml_update.Phpize(50000))
+		self.assertEqual('NULL', amphtml_update.Phpize(None))
+
+	def test_arrays(self):
+		self.assertEqual('array()', amphtml_update.Phpize({}))
+		self.assertEqual('\tarray()', amphtml_update.Phpize([], 1))
+		self.assertEqual(
+			"\tarray(\n\t\t'a' => array(\n\t\t\t'x',\n\t\t\t2,\n\t\t),\n\t\t'b' => array(),\n\t\t'z' => true,\n\t)",
+			amphtml_update.Phpize({'z': True, 'b': {}, 'a': ['x', 2]}, 1)
+		)
+
+	def test_numeric_keys(self):
+		self.assertEqual("array(\n\t-1 => 'y',\n\t'x',\n\t'01' => 'z',\n)", amphtml_update.Phpize({'0': 'x', '-1': 'y', '01': 'z'}))
+		self.assertEqual("array(\n\t1 => true,\n\t'a' => true,\n)", amphtml_update.Phpize({'1': True, 'a': True}))
+
+	def test_var_export_output(self):
+		"""The arrays must be emitted as the former php var_export path wrote them."""
+		expected = open(VAR_EXPORT_FILE).read()
+		properties = 0
+		for match in re.finditer(r'\tprivate static \$(\w+) = ', expected):
+			(value, pos) = ReadPhpValue(expected, match.end())
+			self.assertEqual(expected[match.start():pos + 1], '\tprivate static $%s = %s;' % (match.group(1), amphtml_update.Phpize(value, 1).lstrip()))
+			properties += 1
+		self.assertEqual(4, properties)
+
+	def test_generated_file_round_trip(self):
+		"""Re-emitting the data in the committed generated file must reproduce it byte for byte."""
+		expected = open(GENERATED_FILE).read()
+		properties = ReadGeneratedProperties(expected)
+
+		versions = {
+			'spec_file_revision': properties['spec_file_revision'],
+			'min_validator_revision_required': properties['minimum_validator_revision_required'],
+		}
+		attr_lists = {
+			'$AMP_LAYOUT_ATTRS': properties['layout_allowed_attrs'],
+			'$GLOBAL_ATTRS': properties['globally_allowed_attrs'],
+		}
+		actual = amphtml_update.GenerateRulesPHP(properties['allowed_tags'], attr_lists, properties['descendant_tag_lists'], properties['reference_points'], versions)[0]
+
+		self.assertEqual(expected, actual)
+
+
+class ShardTest(unittest.TestCase):
+
+	allowed_tags = {
+		'amp-selector': [{'tag_spec': {'requires_extension': ['amp-selector'], 'reference_points': {'AMP-SELECTOR option': {}}}, 'attr_spec_list': {}}],
+		'div': [{'tag_spec': {}, 'attr_spec_list': {}}],
+		'img': [{'tag_spec': {}, 'attr_spec_list': {}}],
+	}
+	reference_points = {
+		'AMP-SELECTOR option': {'attr_spec_list': {'option': {}}},
+		'UNUSED': {'attr_spec_list': {}},
+	}
+
+	def test_shard_by_tag(self):
+		shards = amphtml_update.GetShards(self.allowed_tags, self.reference_points, 'tag')
+		self.assertEqual({'amp-selector': 'amp-selector', 'div': 'div', 'img': 'img'}, shards['tags'])
+		self.assertEqual({'AMP-SELECTOR option': 'amp-selector', 'UNUSED': '_reference_point'}, shards['reference_points'])
+		self.assertEqual(['AMP-SELECTOR option'], shards['shards']['amp-selector']['reference_points'].keys())
+
+	def test_shard_by_extension(self):
+		shards = amphtml_update.GetShards(self.allowed_tags, self.reference_points, 'extension')
+		self.assertEqual({'amp-selector': 'amp-selector', 'div': 'html', 'img': 'html'}, shards['tags'])
+		self.assertEqual(['div', 'img'], sorted(shards['shards']['html']['allowed_tags'].keys()))
+
+
+class TagSpecDispatchIndexTest(unittest.TestCase):
+
+	def test_dispatch_keys(self):
+		allowed_tags = {
+			'meta': [
+				{'tag_spec': {}, 'attr_spec_list': {'charset': {'dispatch_key': 1, 'mandatory': True}}},
+				{'tag_spec': {}, 'attr_spec_list': {'http-equiv': {'dispatch_key': 2, 'mandatory': True, 'value_casei': ['X-UA-Compatible']}, 'content': {}}},
+			],
+			'script': [
+				{'tag_spec': {'extension_spec': {'name': 'amp-mustache'}}, 'attr_spec_list': {}},
+				{'tag_spec': {'extension_spec': {'name': 'amp-bind'}}, 'attr_spec_list': {}},
+			],
+			'div': [{'tag_spec': {}, 'attr_spec_list': {}}],
+		}
+		index = amphtml_update.GetTagSpecDispatchIndex(allowed_tags)
+		self.assertEqual(['meta', 'script'], sorted(index.keys()))
+		self.assertEqual({'charset': [0], 'http-equiv=x-ua-compatible': [1]}, index['meta']['dispatch_keys'])
+		self.assertEqual({'custom-template=amp-mustache': [0], 'custom-element=amp-bind': [1]}, index['script']['dispatch_keys'])
+
+	def test_mandatory_attrs(self):
+		allowed_tags = {
+			'amp-img': [{'tag_spec': {}, 'attr_spec_list': {'src': {'mandatory': True, 'alternative_names': ['srcset']}, 'alt': {}, 'id': {'mandatory': False}}}],
+			'script': [
+				{'tag_spec': {'extension_spec': {'name': 'amp-mustache'}}, 'attr_spec_list': {'nonce': {}}},
+				{'tag_spec': {'extension_spec': {'name': 'amp-bind'}, 'mandatory_attrs': [['stale']]}, 'attr_spec_list': {'async': {'mandatory': True}}},
+			],
+			'div': [{'tag_spec': {'mandatory_attrs': [['stale']]}, 'attr_spec_list': {}}],
+		}
+		amphtml_update.AddMandatoryAttrs(allowed_tags)
+		self.assertEqual([['src', 'srcset']], allowed_tags['amp-img'][0]['tag_spec']['mandatory_attrs'])
+		self.assertEqual([['custom-template']], allowed_tags['script'][0]['tag_spec']['mandatory_attrs'])
+		self.assertEqual([['custom-element'], ['async']], allowed_tags['script'][1]['tag_spec']['mandatory_attrs'])
+		self.assertEqual({}, allowed_tags['div'][0]['tag_spec'])
+
+	def test_disallowed_ancestor_sets(self):
+		allowed_tags = {
+			'amp-img': [{'tag_spec': {'disallowed_ancestor': ['amp-sidebar', 'form [method=post]']}, 'attr_spec_list': {}}],
+			'div': [{'tag_spec': {}, 'attr_spec_list': {}}],
+		}
+		amphtml_update.AddDisallowedAncestorSets(allowed_tags, {})
+		self.assertEqual({'amp-sidebar': 'amp-sidebar', 'form': 'form [method=post]'}, allowed_tags['amp-img'][0]['tag_spec']['disallowed_ancestor_set'])
+		self.assertEqual({}, allowed_tags['div'][0]['tag_spec'])
+
+
+class ProtoasciiTest(unittest.TestCase):
+
+	proto = '''
+		syntax = "proto2";
+		package amp.validator;
+		message HtmlFormat {
+			enum Code {
+				UNKNOWN_CODE = 0;
+				AMP = 1;
+			}
+		}
+		message AttrSpec {
+			optional string name = 1;
+			repeated string alternative_names = 2;
+			repeated string value = 5;
+			repeated string value_casei = 6;
+			repeated string enabled_by = 17;
+			enum DispatchKeyType {
+				NONE_DISPATCH = 0;
+				NAME_DISPATCH = 1;
+			}
+			optional DispatchKeyType dispatch_key = 14;
+			optional bool mandatory = 3;
+		}
+		message AttrList {
+			optional string name = 1;
+			repeated AttrSpec attrs = 2;
+		}
+		message ChildTagSpec {
+			optional int32 mandatory_num_child_tags = 1 [default = -1];
+		}
+		message TagSpec {
+			optional string tag_name = 1;
+			optional string spec_name = 2;
+			optional string mandatory_parent = 8;
+			repeated string disallowed_ancestor = 11;
+			repeated AttrSpec attrs = 12;
+			repeated string attr_lists = 13;
+			optional ChildTagSpec child_tags = 16;
+			optional string deprecation = 18;
+			repeated string enabled_by = 20;
+			repeated HtmlFormat.Code html_format = 21;
+		}
+		message ValidatorRules {
+			optional int32 spec_file_revision = 2;
+			repeated TagSpec tags = 3;
+			repeated AttrList attr_lists = 4;
+		}
+	'''
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.proto_file = os.path.join(self.directory, 'validator.proto')
+		open(self.proto_file, 'w').write(self.proto)
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def read(self, protoascii):
+		protoascii_file = os.path.join(self.directory, 'validator-main.protoascii')
+		open(protoascii_file, 'w').write(protoascii)
+		message_types = amphtml_update.ParseProtoSchema(self.proto_file)
+		return list(amphtml_update.ReadProtoascii(protoascii_file, message_types['amp.validator.ValidatorRules']))
+
+	def test_schema(self):
+		message_types = amphtml_update.ParseProtoSchema(self.proto_file)
+		self.assertEqual(-1, message_types['amp.validator.ChildTagSpec'].fields['mandatory_num_child_tags'].default_value)
+		self.assertEqual({'NONE_DISPATCH': 0, 'NAME_DISPATCH': 1}, dict(message_types['amp.validator.AttrSpec'].fields['dispatch_key'].enum_values))
+		self.assertIs(message_types['amp.validator.AttrSpec'], message_types['amp.validator.TagSpec'].fields['attrs'].message_type)
+
+	def test_values(self):
+		fields = self.read('''
+			# A comment.
+			spec_file_revision: 0x10
+			tags {
+				tag_name: "P" " [x]"
+				attrs: < name: 'it\\'s \\xe2\\x9a\\xa1' value: ["a\\tb", "\\101"] dispatch_key: NAME_DISPATCH >
+				attrs { name: "b", mandatory: t };
+			}
+		''')
+		self.assertEqual(['spec_file_revision', 'tags'], [name for (name, value) in fields])
+		self.assertEqual(16, fields[0][1])
+		tag_spec = fields[1][1]
+		self.assertEqual(u'P [x]', tag_spec.tag_name)
+		self.assertEqual(u"it's \u26a1", tag_spec.attrs[0].name)
+		self.assertEqual([u'a\tb', u'A'], tag_spec.attrs[0].value)
+		self.assertEqual(1, tag_spec.attrs[0].dispatch_key)
+		self.assertTrue(tag_spec.attrs[1].mandatory)
+		self.assertEqual(0, tag_spec.attrs[1].dispatch_key)
+		self.assertFalse(tag_spec.attrs[1].HasField('dispatch_key'))
+		self.assertEqual(-1, tag_spec.child_tags.mandatory_num_child_tags)
+		self.assertEqual(['tag_name', 'attrs'], [field.name for (field, value) in tag_spec.ListFields()])
+		self.assertRaises(AttributeError, getattr, tag_spec, 'unknown_field')
+
+	def test_rule_entries(self):
+		"""Attribute lists which are defined after the tags are still added to them."""
+		fields = self.read('''
+			tags { tag_name: "DIV" html_format: AMP attrs { name: "a" } attr_lists: "common" }
+			tags { tag_name: "DIV" html_format: [0] }
+			tags { tag_name: "$REFERENCE_POINT" spec_name: "DIV item" attr_lists: "common" }
+			tags { tag_name: "OLD" deprecation: "div" }
+			tags { tag_name: "BODY" mandatory_parent: "$ROOT" }
+			attr_lists { name: "common" attrs { name: "b" value: "1" } }
+		''')
+		allowed_tags, attr_lists, descendant_lists, reference_points, versions = amphtml_update.CollectRules(amphtml_update.GetRuleEntries(fields))
+		self.assertEqual(['div'], allowed_tags.keys())
+		self.assertEqual(1, len(allowed_tags['div']))
+		self.assertEqual({'a': {}, 'b': {'value': ['1']}}, allowed_tags['div'][0]['attr_spec_list'])
+		self.assertEqual(['common'], allowed_tags['div'][0]['attr_lists'])
+		self.assertEqual({'b': {'value': ['1']}}, reference_points['DIV item']['attr_spec_list'])
+		self.assertEqual({'common': {'b': {'value': ['1']}}}, attr_lists)
+
+
+class ArchiveTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.amphtml_directory = os.path.join(PROJECT_PATH, 'tests', 'benchmark', 'amphtml')
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def read(self, validator_directory):
+		protoascii_files = amphtml_update.GetValidatorProtoasciiFiles(validator_directory)
+		rules = amphtml_update.ReadValidatorRules(os.path.join(validator_directory, 'validator.proto'), protoascii_files)
+		return ([os.path.relpath(path, os.path.dirname(validator_directory)) for path in protoascii_files], rules)
+
+	def test_read_archives(self):
+		tar_archive = os.path.join(self.directory, 'amphtml-1.tar.gz')
+		with tarfile.open(tar_archive, 'w:gz') as tar_file:
+			tar_file.add(self.amphtml_directory, 'amphtml-1')
+			tar_file.add(os.path.join(self.amphtml_directory, 'validator'), 'amphtml-1/node_modules/x/validator')
+		zip_archive = os.path.join(self.directory, 'amphtml-2.zip')
+		with zipfile.ZipFile(zip_archive, 'w') as zip_file:
+			zip_file.writestr('README.md', 'Not a spec file.')
+			for (root, dirs, files) in os.walk(self.amphtml_directory):
+				for name in files:
+					path = os.path.join(root, name)
+					zip_file.write(path, os.path.relpath(path, self.amphtml_directory))
+
+		expected = self.read(os.path.join(self.amphtml_directory, 'validator'))
+		for archive in (tar_archive, zip_archive):
+			validator_directory = amphtml_update.ReadArchiveSpecFiles(archive)
+			self.assertEqual(os.path.join(archive, 'validator'), validator_directory)
+			self.assertEqual(expected, self.read(validator_directory))
+
+	def test_jobs(self):
+		"""Reading the spec files in worker processes gives the same rules as reading them one after another."""
+		validator_directory = os.path.join(self.amphtml_directory, 'validator')
+		proto_file = os.path.join(validator_directory, 'validator.proto')
+		protoascii_files = amphtml_update.GetValidatorProtoasciiFiles(validator_directory)
+		self.assertGreater(len(protoascii_files), 1)
+		self.assertEqual(
+			amphtml_update.ReadValidatorRules(proto_file, protoascii_files, jobs=1),
+			amphtml_update.ReadValidatorRules(proto_file, protoascii_files, jobs=2)
+		)
+
+	def test_archive_spec_path(self):
+		self.assertEqual(('amphtml-1', 'validator/validator.proto'), amphtml_update.GetArchiveSpecPath('amphtml-1/validator/validator.proto'))
+		self.assertEqual(('', 'validator/validator-main.protoascii'), amphtml_update.GetArchiveSpecPath('validator/validator-main.protoascii'))
+		self.assertEqual(('amphtml-1', 'extensions/amp-bind/validator-amp-bind.protoascii'), amphtml_update.GetArchiveSpecPath('amphtml-1/extensions/amp-bind/validator-amp-bind.protoascii'))
+		self.assertIsNone(amphtml_update.GetArchiveSpecPath('amphtml-1/validator/validator.js'))
+		self.assertIsNone(amphtml_update.GetArchiveSpecPath('amphtml-1/extensions/amp-bind/0.1/amp-bind.js'))
+
+
+class DedupeTest(unittest.TestCase):
+
+	def resolve(self, rule_spec, deduped):
+		"""Resolves a deduplicated rule spec like AMP_Allowed_Tags_Generated::resolve_rule_spec()."""
+		rule_spec = dict(rule_spec)
+		attr_spec_list = dict(rule_spec['attr_spec_list'])
+		for attr_list_name in rule_spec.pop('attr_lists', []):
+			attr_spec_list.update(deduped['named_attr_lists'][attr_list_name])
+		for (attr_name, attr_spec) in attr_spec_list.items():
+			for key in amphtml_update.SHARED_ATTR_VALUE_KEYS:
+				if isinstance(attr_spec.get(key), int):
+					attr_spec_list[attr_name] = dict(attr_spec_list[attr_name])
+					attr_spec_list[attr_name][key] = deduped['shared_attr_values'][attr_spec[key]]
+		rule_spec['attr_spec_list'] = attr_spec_list
+		return rule_spec
+
+	def test_deduped_rules_resolve_to_inlined_rules(self):
+		https = {'protocol': ['https']}
+		attr_lists = {
+			'$GLOBAL_ATTRS': {'id': {}},
+			'$AMP_LAYOUT_ATTRS': {'width': {}},
+			'mandatory-src': {'src': {'mandatory': True, 'value_url': https}},
+			'unused': {'foo': {}},
+		}
+		allowed_tags = {
+			'amp-anim': [{'tag_spec': {}, 'attr_spec_list': {'alt': {}}, 'attr_lists': ['mandatory-src']}],
+			'amp-img': [{'tag_spec': {}, 'attr_spec_list': {'alt': {}, 'src': {'mandatory': True, 'value_url': https}}, 'attr_lists': ['mandatory-src']}],
+			'amp-video': [{'tag_spec': {}, 'attr_spec_list': {'poster': {'value_url': https}, 'src': {'mandatory': True, 'value_url': https}}}],
+			'div': [{'tag_spec': {}, 'attr_spec_list': {'src': {}}}],
+		}
+		reference_points = {'AMP-IMG source': {'attr_spec_list': {'src': {'mandatory': True, 'value_url': https}}, 'attr_lists': ['mandatory-src']}}
+
+		attr_list_names = amphtml_update.PopAttrListNames(allowed_tags, reference_points)
+		self.assertEqual([['mandatory-src']], attr_list_names['allowed_tags']['amp-img'])
+		self.assertEqual([[]], attr_list_names['allowed_tags']['div'])
+		self.assertNotIn('attr_lists', allowed_tags['amp-img'][0])
+		deduped = amphtml_update.GetDedupedRules(allowed_tags, attr_lists, reference_points, attr_list_names)
+
+		self.assertEqual(['mandatory-src'], deduped['named_attr_lists'].keys())
+		self.assertEqual(['mandatory-src'], deduped['allowed_tags']['amp-img'][0]['attr_lists'])
+		self.assertEqual(['mandatory-src'], deduped['reference_points']['AMP-IMG source']['attr_lists'])
+		self.assertNotIn('attr_lists', deduped['allowed_tags']['div'][0])
+
+		# The spec doesn't add the list to amp-video, which only has the same attribute, and the rules of amp-anim were pruned.
+		self.assertNotIn('attr_lists', deduped['allowed_tags']['amp-video'][0])
+		self.assertNotIn('attr_lists', deduped['allowed_tags']['amp-anim'][0])
+		self.assertEqual([https], deduped['shared_attr_values'])
+		self.assertEqual(0, deduped['allowed_tags']['amp-video'][0]['attr_spec_list']['poster']['value_url'])
+		for tag_name in allowed_tags:
+			self.assertEqual(allowed_tags[tag_name], [self.resolve(rule_spec, deduped) for rule_spec in deduped['allowed_tags'][tag_name]])
+		self.assertEqual(reference_points['AMP-IMG source'], self.resolve(deduped['reference_points']['AMP-IMG source'], deduped))
+		self.assertEqual({'id': {}}, deduped['attr_lists']['$GLOBAL_ATTRS'])
+
+
+class OutputFormatsTest(unittest.TestCase):
+
+	def test_serialized(self):
+		self.assertEqual('s:3:"foo";', amphtml_update.PhpSerializeScalar('foo'))
+		self.assertEqual('s:3:"\xe2\x9a\xa1";', amphtml_update.PhpSerializeScalar(u'\u26a1'))
+		self.assertEqual('b:1;', amphtml_update.PhpSerializeScalar('True'))
+		self.assertEqual('N;', amphtml_update.PhpSerializeScalar(None))
+		self.assertEqual(
+			'a:3:{i:1;b:1;s:1:"a";a:2:{i:0;s:1:"x";i:1;i:2;}s:1:"b";a:0:{}}',
+			amphtml_update.GenerateRulesSerialized({'b': {}, '1': True, 'a': ['x', 2]})
+		)
+
+	def test_json(self):
+		self.assertEqual(
+			'{"1":true,"a":["x",false],"b":{}}\n',
+			amphtml_update.GenerateRulesJSON({'b': {}, 1: 'True', 'a': ('x', False)})
+		)
+
+	def test_rules_data_of_generated_file(self):
+		"""The JSON output must have the same rules as the committed generated file."""
+		properties = ReadGeneratedProperties(open(GENERATED_FILE).read())
+		versions = {
+			'spec_file_revision': properties['spec_file_revision'],
+			'min_validator_revision_required': properties['minimum_validator_revision_required'],
+		}
+		attr_lists = {
+			'$AMP_LAYOUT_ATTRS': properties['layout_allowed_attrs'],
+			'$GLOBAL_ATTRS': properties['globally_allowed_attrs'],
+		}
+		rules_data = amphtml_update.GetRulesData(properties['allowed_tags'], attr_lists, properties['descendant_tag_lists'], properties['reference_points'], versions)
+
+		self.assertEqual(sorted(properties), sorted(rules_data))
+		decoded = json.loads(amphtml_update.GenerateRulesJSON(rules_data))
+		self.assertEqual(properties['allowed_tags']['a'][0]['attr_spec_list']['href'], decoded['allowed_tags']['a'][0]['attr_spec_list']['href'])
+		self.assertEqual(properties['spec_file_revision'], decoded['spec_file_revision'])
+
+
+
+class CssSpecsTest(unittest.TestCase):
+
+	def test_css_specs(self):
+		allowed_tags = {
+			'style': [
+				{'tag_spec': {'spec_name': 'style amp-custom'}, 'attr_spec_list': {}, 'cdata': {'css_spec': {'allowed_at_rules': ['media', 'Font-Face'], 'declaration': [], 'validate_keyframes': False}}},
+				{'tag_spec': {'spec_name': 'style[amp-keyframes]'}, 'attr_spec_list': {}, 'cdata': {'css_spec': {'allowed_at_rules': ['keyframes'], 'declaration': ['Opacity', '-webkit-foo'], 'validate_keyframes': True}}},
+				{'tag_spec': {'spec_name': 'head > style[amp-boilerplate]'}, 'attr_spec_list': {}, 'cdata': {'cdata_regex': 'body'}},
+			],
+		}
+		css_specs = amphtml_update.GetCssSpecs(allowed_tags)
+
+		self.assertEqual(['style amp-custom', 'style attribute', 'style[amp-keyframes]'], sorted(css_specs))
+		self.assertEqual({'media': True, 'font-face': True}, css_specs['style amp-custom']['allowed_at_rules'])
+		self.assertEqual({}, css_specs['style attribute']['allowed_at_rules'])
+		self.assertEqual(
+			{'opacity': True, '-webkit-opacity': True, '-moz-opacity': True, '-ms-opacity': True, '-o-opacity': True},
+			css_specs['style[amp-keyframes]']['declarations']
+		)
+		self.assertTrue(css_specs['style[amp-keyframes]']['validate_keyframes'])
+
+
+class ExtensionIndexTest(unittest.TestCase):
+
+	def test_extension_index(self):
+		allowed_tags = {
+			'amp-ad': [{'tag_spec': {'also_requires_tag_warning': ['amp-ad extension .js script']}, 'attr_spec_list': {}}],
+			'amp-video': [
+				{'tag_spec': {'requires_extension': ['amp-video']}, 'attr_spec_list': {'dock': {'requires_extension': ['amp-video-docking']}}},
+				{'tag_spec': {'also_requires_tag_warning': ['amp-video extension .js script']}, 'attr_spec_list': {'dock': {'requires_extension': ['amp-video-docking']}}},
+			],
+			'input': [
+				{'tag_spec': {}, 'attr_spec_list': {'type': {}}},
+				{'tag_spec': {'requires_extension': ['amp-inputmask']}, 'attr_spec_list': {'mask': {}, 'type': {'requires_extension': ['amp-form']}}},
+			],
+			'p': [{'tag_spec': {}, 'attr_spec_list': {}}],
+			'script': [
+				{'tag_spec': {'extension_spec': {'name': 'amp-video', 'version': ['0.1', 'latest']}}, 'attr_spec_list': {}},
+				{'tag_spec': {'spec_name': 'amphtml engine v0.js script'}, 'attr_spec_list': {}},
+			],
+		}
+		attr_lists = {'$GLOBAL_ATTRS': {'amp-fx': {'requires_extension': ['amp-fx-collection']}}, '$AMP_LAYOUT_ATTRS': {}}
+		extension_index = amphtml_update.GetExtensionIndex(allowed_tags, attr_lists, {})
+
+		# The input tag and type attribute require different extensions depending on the spec, so they are not indexed.
+		self.assertEqual({'amp-ad': ['amp-ad'], 'amp-video': ['amp-video']}, extension_index['tags'])
+		self.assertEqual({'amp-fx': ['amp-fx-collection'], 'dock': ['amp-video-docking']}, extension_index['attributes'])
+		self.assertEqual({'amp-video': {'name': 'amp-video', 'version': ['0.1', 'latest']}}, amphtml_update.GetExtensionSpecs(allowed_tags))
+
+		# The script tag specs of the class only refer to the extension specs by name.
+		references = amphtml_update.GetExtensionSpecReferences(allowed_tags)
+		self.assertEqual({'name': 'amp-video'}, references['script'][0]['tag_spec']['extension_spec'])
+		self.assertEqual(allowed_tags['script'][1], references['script'][1])
+		self.assertEqual(['0.1', 'latest'], allowed_tags['script'][0]['tag_spec']['extension_spec']['version'])
+
+
+class RegexTest(unittest.TestCase):
+
+	def test_js_regex_to_pcre(self):
+		self.assertEqual(r'/^(?:https:\/\/a\.b\/[^\/]+)$/uD', amphtml_update.JsRegexToPcre(r'https://a\.b/[^/]+', anchored=True))
+		self.assertEqual(r'/\x{00e9}[\s\S](?!)\\\//uiD', amphtml_update.JsRegexToPcre(r'\u00e9[^][]\\/', casei=True))
+		self.assertEqual(r'/[\]\/]\u/uD', amphtml_update.JsRegexToPcre(r'[\]/]\u'))
+
+	def test_regex_patterns(self):
+		allowed_tags = {
+			'style': [{'tag_spec': {'spec_name': 'style[amp-boilerplate]'}, 'attr_spec_list': {}, 'cdata': {'cdata_regex': 'body', 'blacklisted_cdata_regex': {'regex': '<!--', 'error_message': 'html comments'}}}],
+			'a': [{'tag_spec': {}, 'attr_spec_list': {'rel': {'value_regex_casei': 'a/b'}, 'href': {'blacklisted_value_regex': '__amp_source_origin'}}}],
+		}
+		attr_lists = {'$GLOBAL_ATTRS': {'id': {'value_regex': 'x'}}, '$AMP_LAYOUT_ATTRS': {}}
+		amphtml_update.AddRegexPatterns(allowed_tags, attr_lists, {})
+		amphtml_update.AddRegexPatterns(allowed_tags, attr_lists, {})
+
+		self.assertEqual('/^(?:body)$/uD', allowed_tags['style'][0]['cdata']['cdata_regex_pcre'])
+		self.assertEqual('/<!--/uD', allowed_tags['style'][0]['cdata']['blacklisted_cdata_regex']['regex_pcre'])
+		self.assertEqual({'value_regex_casei': 'a/b', 'value_regex_casei_pcre': '/^(?:a\\/b)$/uiD'}, allowed_tags['a'][0]['attr_spec_list']['rel'])
+		self.assertEqual('/__amp_source_origin/uD', allowed_tags['a'][0]['attr_spec_list']['href']['blacklisted_value_regex_pcre'])
+		self.assertEqual('/^(?:x)$/uD', attr_lists['$GLOBAL_ATTRS']['id']['value_regex_pcre'])
+
+	def test_check_regexes(self):
+		attr_lists = {
+			'$GLOBAL_ATTRS': {
+				'id': {'value_regex': '[a-z][a-z0-9_-]*'},
+				'class': {'blacklisted_value_regex': '(^|\\W)i-amphtml-'},
+			},
+			'$AMP_LAYOUT_ATTRS': {},
+		}
+		self.assertEqual([], amphtml_update.CheckRegexes({}, attr_lists, {}, budget=0.05))
+
+		# Nested quantifiers backtrack exponentially on a run of a's which does not end the value.
+		attr_lists['$GLOBAL_ATTRS']['title'] = {'blacklisted_value_regex': '(a+)+$'}
+		self.assertEqual(['$GLOBAL_ATTRS [title] blacklisted_value_regex'], amphtml_update.CheckRegexes({}, attr_lists, {}, budget=0.05))
+		with self.assertRaises(SystemExit):
+			amphtml_update.CheckRegexes({}, attr_lists, {}, budget=0.05, strict=True)
+
+	def test_check_regexes_compile(self):
+		attr_lists = {'$GLOBAL_ATTRS': {'id': {'value_regex': '(unbalanced'}}, '$AMP_LAYOUT_ATTRS': {}}
+		with self.assertRaises(SystemExit):
+			amphtml_update.CheckRegexes({}, attr_lists, {}, budget=0)
+
+
+class AttrSpecIdTest(unittest.TestCase):
+
+	def test_attr_spec_ids(self):
+		allowed_tags = {
+			'a': [{'tag_spec': {}, 'attr_spec_list': {'href': {'value_url': {'protocol': ['https']}, 'value_set': 1}, 'id': {}}}],
+			'form': [{'tag_spec': {}, 'attr_spec_list': {'action': {'value_url': {'protocol': ['https']}, 'value_set': 2}, 'target': {'value_regex': '_blank'}}}],
+		}
+		attr_lists = {'$GLOBAL_ATTRS': {'title': {'blacklisted_value_regex': 'x'}, 'lang': {'value': ['en']}}}
+		amphtml_update.AddAttrSpecIds(allowed_tags, attr_lists, {})
+
+		# Identical specs share an ID, whatever their value set IDs.
+		href = allowed_tags['a'][0]['attr_spec_list']['href']
+		self.assertEqual(href['attr_spec_id'], allowed_tags['form'][0]['attr_spec_list']['action']['attr_spec_id'])
+		self.assertNotEqual(href['attr_spec_id'], allowed_tags['form'][0]['attr_spec_list']['target']['attr_spec_id'])
+		self.assertIn('attr_spec_id', attr_lists['$GLOBAL_ATTRS']['title'])
+
+		# Only the specs with a memoized check get one.
+		self.assertEqual({}, allowed_tags['a'][0]['attr_spec_list']['id'])
+		self.assertNotIn('attr_spec_id', attr_lists['$GLOBAL_ATTRS']['lang'])
+
+		# The IDs are the same in every run.
+		attr_spec_id = href['attr_spec_id']
+		amphtml_update.AddAttrSpecIds(allowed_tags, attr_lists, {})
+		self.assertEqual(attr_spec_id, href['attr_spec_id'])
+		self.assertRegexpMatches(attr_spec_id, '^[0-9a-f]{8}$')
+
+
+class LayoutTableTest(unittest.TestCase):
+
+	def lookup(self, layout_table, layout, width_class, height_class):
+		classes = amphtml_update.LAYOUT_DIMENSION_CLASSES
+		layouts = dict((name, value) for (value, name) in amphtml_update.LAYOUT_ENUM.items())
+		return bool(layout_table[classes.index(width_class) * len(classes) + classes.index(height_class)] & (1 << layouts[layout]))
+
+	def test_layout_table(self):
+		# fixed, fixed-height, responsive and fill.
+		layout_table = amphtml_update.GetLayoutTable([2, 3, 4, 6])
+		self.assertEqual(len(amphtml_update.LAYOUT_DIMENSION_CLASSES) ** 2, len(layout_table))
+
+		self.assertTrue(self.lookup(layout_table, 'fixed', 'px', 'px'))
+		self.assertFalse(self.lookup(layout_table, 'fixed', 'px', 'none'))
+		self.assertFalse(self.lookup(layout_table, 'fixed', 'auto', 'px'))
+		self.assertTrue(self.lookup(layout_table, 'fixed-height', 'auto', 'px'))
+		self.assertTrue(self.lookup(layout_table, 'fixed-height', 'none', 'unit'))
+		self.assertFalse(self.lookup(layout_table, 'fixed-height', 'px', 'px'))
+		self.assertFalse(self.lookup(layout_table, 'fixed-height', 'none', 'none'))
+		self.assertTrue(self.lookup(layout_table, 'responsive', 'unit', 'unit'))
+		self.assertFalse(self.lookup(layout_table, 'responsive', 'unit', 'px'))
+		self.assertTrue(self.lookup(layout_table, 'fill', 'none', 'none'))
+
+		# Unsupported layouts are never allowed, and invalid lengths count as missing for the layouts which need them.
+		self.assertFalse(self.lookup(layout_table, 'container', 'none', 'none'))
+		self.assertFalse(self.lookup(layout_table, 'fixed', 'invalid', 'none'))
+		self.assertFalse(self.lookup(layout_table, 'fixed', 'invalid', 'px'))
+		self.assertFalse(self.lookup(layout_table, 'fixed-height', 'none', 'fluid'))
+		self.assertTrue(self.lookup(layout_table, 'fill', 'invalid', 'invalid'))
+
+	def test_shared_layout_tables(self):
+		allowed_tags = {
+			'amp-img': [{'tag_spec': {'amp_layout': {'supported_layouts': [2, 4]}}, 'attr_spec_list': {}}],
+			'amp-video': [{'tag_spec': {'amp_layout': {'supported_layouts': [4, 2]}}, 'attr_spec_list': {}}],
+			'amp-pixel': [{'tag_spec': {'amp_layout': {'supported_layouts': [1]}}, 'attr_spec_list': {}}],
+			'p': [{'tag_spec': {}, 'attr_spec_list': {}}],
+		}
+		layout_tables = amphtml_update.AddLayoutTables(allowed_tags)
+
+		self.assertEqual(2, len(layout_tables))
+		self.assertEqual(allowed_tags['amp-img'][0]['tag_spec']['layout_table'], allowed_tags['amp-video'][0]['tag_spec']['layout_table'])
+		self.assertEqual(layout_tables[allowed_tags['amp-img'][0]['tag_spec']['layout_table']], amphtml_update.GetLayoutTable([2, 4]))
+		self.assertNotIn('layout_table', allowed_tags['p'][0]['tag_spec'])
+
+		# The IDs are the same in every run.
+		self.assertEqual(layout_tables, amphtml_update.AddLayoutTables(allowed_tags))
+
+
+class PruneTest(unittest.TestCase):
+
+	def setUp(self):
+		self.allowed_tags = {
+			'amp-img': [{'tag_spec': {'amp_layout': {}}, 'attr_spec_list': {'src': {}}}],
+			'amp-pixel': [{'tag_spec': {}, 'attr_spec_list': {}}],
+			'amp-selector': [{'tag_spec': {'requires_extension': ['amp-selector'], 'reference_points': {'AMP-SELECTOR option': {}}}, 'attr_spec_list': {}}],
+			'amp-video': [{'tag_spec': {'requires_extension': ['amp-video'], 'descendant_tag_list': 'amp-video-allowed-descendants'}, 'attr_spec_list': {'dock': {'requires_extension': ['amp-video-docking']}, 'src': {}}}],
+			'form': [{'tag_spec': {'also_requires_tag_warning': ['amp-form extension .js script'], 'descendant_tag_list': 'form-allowed-descendants'}, 'attr_spec_list': {}}],
+			'p': [{'tag_spec': {}, 'attr_spec_list': {}}],
+			'script': [
+				{'tag_spec': {'extension_spec': {'name': 'amp-selector'}}, 'attr_spec_list': {}},
+				{'tag_spec': {'extension_spec': {'name': 'amp-video'}}, 'attr_spec_list': {}},
+				{'tag_spec': {'spec_name': 'amphtml engine v0.js script'}, 'attr_spec_list': {}},
+			],
+		}
+		self.attr_lists = {'$GLOBAL_ATTRS': {'id': {}, 'amp-fx': {'requires_extension': ['amp-fx-collection']}}, '$AMP_LAYOUT_ATTRS': {'layout': {}}}
+		self.descendant_lists = {'amp-video-allowed-descendants': ['p', 'amp-img'], 'form-allowed-descendants': ['p']}
+		self.reference_points = {'AMP-SELECTOR option': {'tag_spec': {}, 'attr_spec_list': {'option': {}}}}
+
+	def test_prune_rules(self):
+		profile_file = tempfile.NamedTemporaryFile(suffix='.json')
+		profile_file.write(json.dumps({'extensions': ['amp-video'], 'tags': ['amp-img']}))
+		profile_file.flush()
+		spec_profile = amphtml_update.LoadSpecProfile(profile_file.name, self.allowed_tags, self.attr_lists)
+		amphtml_update.PruneRules(self.allowed_tags, self.attr_lists, self.descendant_lists, self.reference_points, spec_profile)
+
+		self.assertEqual(['amp-img', 'amp-video', 'p', 'script'], sorted(self.allowed_tags))
+		self.assertEqual(['src'], list(self.allowed_tags['amp-video'][0]['attr_spec_list']))
+		self.assertEqual(['amp-video', None], [rule_spec['tag_spec'].get('extension_spec', {}).get('name') for rule_spec in self.allowed_tags['script']])
+		self.assertEqual({'amp-video-allowed-descendants': ['p', 'amp-img']}, self.descendant_lists)
+		self.assertEqual({}, self.reference_points)
+		self.assertEqual({'$GLOBAL_ATTRS': {'id': {}}, '$AMP_LAYOUT_ATTRS': {'layout': {}}}, self.attr_lists)
+
+	def test_unknown_names(self):
+		profile_file = tempfile.NamedTemporaryFile(suffix='.json')
+		profile_file.write(json.dumps({'extensions': ['amp-fx-collection', 'amp-carousel']}))
+		profile_file.flush()
+		with self.assertRaises(SystemExit):
+			amphtml_update.LoadSpecProfile(profile_file.name, self.allowed_tags, self.attr_lists)
+
+	def test_extension_sizes(self):
+		rules = (self.allowed_tags, self.attr_lists, self.descendant_lists, self.reference_points)
+		sizes = amphtml_update.GetExtensionSizes(*rules)
+
+		self.assertEqual(['', 'amp-form', 'amp-fx-collection', 'amp-selector', 'amp-video', 'amp-video-docking'], sorted(sizes))
+		self.assertEqual(3, sizes['amp-video-docking']['entries'])
+		self.assertEqual(len(amphtml_update.Phpize({'amp-fx': {'requires_extension': ['amp-fx-collection']}}, 2)), sizes['amp-fx-collection']['bytes'])
+
+		# The reference point and descendant tag lists count toward the only extensions using them.
+		selector_entries = sizes['amp-selector']['entries']
+		del self.reference_points['AMP-SELECTOR option']
+		self.assertEqual(selector_entries - 4, amphtml_update.GetExtensionSizes(*rules)['amp-selector']['entries'])
+
+
+class SpecHitsTest(unittest.TestCase):
+
+	def test_order_rules_by_spec_hits(self):
+		allowed_tags = {
+			'input': [
+				{'tag_spec': {}, 'attr_spec_list': {}},
+				{'tag_spec': {'spec_name': 'input[type=file]'}, 'attr_spec_list': {}},
+				{'tag_spec': {'spec_name': 'input[type=password]'}, 'attr_spec_list': {}},
+			],
+			'script': [
+				{'tag_spec': {'spec_name': 'amphtml engine v0.js script'}, 'attr_spec_list': {}},
+				{'tag_spec': {'spec_name': 'amp-bind extension .js script'}, 'attr_spec_list': {}},
+			],
+		}
+		spec_hits_file = tempfile.NamedTemporaryFile(suffix='.json')
+		spec_hits_file.write(json.dumps({
+			'documents': 2,
+			'tag_specs': {
+				'input': {'hits': 3, 'rejects': 1, 'seconds': 0.1},
+				'input[type=password]': {'hits': 5, 'rejects': 0, 'seconds': 0.1},
+				'amphtml engine v0.js script': {'hits': 2, 'rejects': 4, 'seconds': 0.1},
+			},
+		}))
+		spec_hits_file.flush()
+		amphtml_update.OrderRulesBySpecHits(allowed_tags, amphtml_update.LoadSpecHits(spec_hits_file.name))
+
+		# The tag specs without a spec name are counted by tag name, and those never hit keep their order.
+		self.assertEqual(['input[type=password]', None, 'input[type=file]'], [rule_spec['tag_spec'].get('spec_name') for rule_spec in allowed_tags['input']])
+		self.assertEqual(['amphtml engine v0.js script', 'amp-bind extension .js script'], [rule_spec['tag_spec']['spec_name'] for rule_spec in allowed_tags['script']])
+
+	def test_invalid_spec_hits(self):
+		spec_hits_file = tempfile.NamedTemporaryFile(suffix='.json')
+		spec_hits_file.write(json.dumps({'documents': 1}))
+		spec_hits_file.flush()
+		with self.assertRaises(SystemExit):
+			amphtml_update.LoadSpecHits(spec_hits_file.name)
+
+
+class BuildCacheTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+		self.validator_directory = os.path.join(PROJECT_PATH, 'tests', 'benchmark', 'amphtml', 'validator')
+		self.check_regexes = amphtml_update.CheckRegexes
+		self.screened = []
+
+		def CheckRegexes(*args):
+			self.screened.append(args[3:])
+			return self.check_regexes(*args)
+		amphtml_update.CheckRegexes = CheckRegexes
+
+	def tearDown(self):
+		amphtml_update.CheckRegexes = self.check_regexes
+		shutil.rmtree(self.directory)
+
+	def build(self, regex_budget=0, strict_regexes=False):
+		php_file = os.path.join(self.directory, 'rules.php')
+		amphtml_update.Build(
+			self.validator_directory, os.path.join(self.directory, 'out'), os.path.join(self.directory, 'cache'), 1, False, None, 'tag',
+			False, 'protoascii', {'php': php_file}, regex_budget, strict_regexes, None, False, None
+		)
+		return open(php_file, 'rb').read()
+
+	def test_output_cache_key(self):
+		proto_file = os.path.join(self.validator_directory, 'validator.proto')
+		protoascii_files = amphtml_update.GetValidatorProtoasciiFiles(self.validator_directory)
+		source_files = [proto_file] + protoascii_files
+		digests = dict((source_file, amphtml_update.HashFile(source_file)) for source_file in source_files)
+		cache_key = amphtml_update.GetOutputCacheKey(digests, source_files)
+		self.assertEqual(cache_key, amphtml_update.GetOutputCacheKey(dict(digests), list(source_files)))
+
+		# A change to a spec file.
+		changed_digests = dict(digests)
+		changed_digests[protoascii_files[0]] = amphtml_update.HashFile(proto_file)
+		self.assertNotEqual(cache_key, amphtml_update.GetOutputCacheKey(changed_digests, source_files))
+
+		# An option which changes the output.
+		self.assertNotEqual(cache_key, amphtml_update.GetOutputCacheKey(digests, source_files, ['dedupe']))
+		self.assertNotEqual(
+			amphtml_update.GetOutputCacheKey(digests, source_files, ['spec-hits=1']),
+			amphtml_update.GetOutputCacheKey(digests, source_files, ['spec-hits=2'])
+		)
+
+		# A change to the script. Copies of it are compared, since the loaded module may come from a .pyc file.
+		cache_keys = []
+		for (name, addition) in (('copy', ''), ('same', ''), ('changed', '\n# Changed.\n')):
+			os.mkdir(os.path.join(self.directory, name))
+			script_file = os.path.join(self.directory, name, 'amphtml-update.py')
+			shutil.copy(os.path.join(PROJECT_PATH, 'bin', 'amphtml-update.py'), script_file)
+			with open(script_file, 'a') as script:
+				script.write(addition)
+			cache_keys.append(imp.load_source('amphtml_update_%s' % name, script_file).GetOutputCacheKey(digests, source_files))
+		self.assertEqual(cache_keys[0], cache_keys[1])
+		self.assertNotEqual(cache_keys[0], cache_keys[2])
+
+	def test_protoascii_cache(self):
+		proto_file = os.path.join(self.validator_directory, 'validator.proto')
+		protoascii_files = amphtml_update.GetValidatorProtoasciiFiles(self.validator_directory)
+		digests = dict((source_file, amphtml_update.HashFile(source_file)) for source_file in [proto_file] + protoascii_files)
+		cache_dir = os.path.join(self.directory, 'cache')
+		rules = amphtml_update.ReadValidatorRules(proto_file, protoascii_files, cache_dir=cache_dir, digests=digests)
+		self.assertEqual(rules, amphtml_update.ReadValidatorRules(proto_file, protoascii_files))
+		self.assertEqual(len(protoascii_files), len(os.listdir(os.path.join(cache_dir, 'protoascii-entries'))))
+
+		# Only a changed file is read again.
+		read_protoascii_rule_entries = amphtml_update.ReadProtoasciiRuleEntries
+		read = []
+
+		def ReadProtoasciiRuleEntries(args):
+			read.append(args[1])
+			return read_protoascii_rule_entries(args)
+		amphtml_update.ReadProtoasciiRuleEntries = ReadProtoasciiRuleEntries
+		try:
+			self.assertEqual(rules, amphtml_update.ReadValidatorRules(proto_file, protoascii_files, cache_dir=cache_dir, digests=digests))
+			self.assertEqual([], read)
+			digests[protoascii_files[-1]] = amphtml_update.HashFile(proto_file)
+			self.assertEqual(rules, amphtml_update.ReadValidatorRules(proto_file, protoascii_files, cache_dir=cache_dir, digests=digests))
+			self.assertEqual([protoascii_files[-1]], read)
+		finally:
+			amphtml_update.ReadProtoasciiRuleEntries = read_protoascii_rule_entries
+
+	def test_cached_output(self):
+		output = self.build()
+		self.assertEqual(1, len(self.screened))
+		self.assertEqual(1, len(os.listdir(os.path.join(self.directory, 'cache', 'output'))))
+		os.remove(os.path.join(self.directory, 'rules.php'))
+		self.assertEqual(output, self.build())
+		self.assertEqual(1, len(self.screened))
+
+	@unittest.skipUnless(distutils.spawn.find_executable('protoc'), 'protoc is needed.')
+	def test_protoc_cache_key(self):
+		proto_file = os.path.join(self.validator_directory, 'validator.proto')
+		cache_dir = os.path.join(self.directory, 'cache')
+		os.mkdir(cache_dir)
+		digests = {proto_file: amphtml_update.HashFile(proto_file)}
+		get_protoc_version = amphtml_update.GetProtocVersion
+		try:
+			for protoc_version in ('libprotoc 3.0.0', 'libprotoc 3.0.0', 'libprotoc 3.17.3'):
+				amphtml_update.GetProtocVersion = lambda: protoc_version
+				amphtml_update.GenValidatorPb2Py(self.validator_directory, None, cache_dir, digests, load=False)
+		finally:
+			amphtml_update.GetProtocVersion = get_protoc_version
+		self.assertEqual(2, len([name for name in os.listdir(cache_dir) if name.startswith('validator_pb2-')]))
+
+	def test_cache_dir(self):
+		xdg_cache_home = os.environ.get('XDG_CACHE_HOME')
+		os.environ['XDG_CACHE_HOME'] = self.directory
+		try:
+			self.assertEqual(os.path.join(self.directory, 'amp-wp'), amphtml_update.GetDefaultCacheDir())
+		finally:
+			if xdg_cache_home is None:
+				del os.environ['XDG_CACHE_HOME']
+			else:
+				os.environ['XDG_CACHE_HOME'] = xdg_cache_home
+
+		cache_dir = os.path.join(self.directory, 'cache')
+		amphtml_update.SetupCacheDir(cache_dir)
+		self.assertEqual(0700, os.stat(cache_dir).st_mode & 0777)
+		os.chmod(cache_dir, 0777)
+		with self.assertRaises(SystemExit):
+			self.build()
+		self.assertEqual([], os.listdir(cache_dir))
+
+	def test_strict_regexes_skip_cached_output(self):
+		output = self.build()
+		self.assertEqual(output, self.build())
+		self.assertEqual([(0, False)], self.screened)
+		self.assertEqual(output, self.build(0.5, True))
+		self.assertEqual([(0, False), (0.5, True)], self.screened)
+
+
+class ProfilerTest(unittest.TestCase):
+
+	def setUp(self):
+		self.profiler = amphtml_update.PROFILER
+		amphtml_update.PROFILER = amphtml_update.Profiler()
+
+	def tearDown(self):
+		amphtml_update.PROFILER = self.profiler
+
+	def test_spans_and_counters(self):
+		for i in range(2):
+			amphtml_update.Phpize([i])
+		with amphtml_update.PROFILER.Span('outer'):
+			amphtml_update.PROFILER.Count('things', 3)
+			amphtml_update.PROFILER.Count('things')
+
+		report = amphtml_update.PROFILER.GetReport()
+		self.assertEqual(['Phpize', 'outer'], list(report['spans']))
+		self.assertEqual(2, report['spans']['Phpize']['calls'])
+		self.assertEqual({'things': 4}, dict(report['counters']))
+		self.assertGreater(report['peak_memory_kb']['self'], 0)
+
+	def test_count_rules(self):
+		allowed_tags = {
+			'script': [{'tag_spec': {}, 'attr_spec_list': {'type': {}}, 'cdata': {'blacklisted_cdata_regex': {'regex': '<!--'}}}],
+			'a': [
+				{'tag_spec': {}, 'attr_spec_list': {'href': {'blacklisted_value_regex': '__amp_source_origin'}}},
+				{'tag_spec': {}, 'attr_spec_list': {'rel': {'value_regex_casei': 'x', 'value_regex': 'y'}}},
+			],
+		}
+		amphtml_update.CountRules(allowed_tags, {'$GLOBAL_ATTRS': {'id': {}, 'class': {}}})
+		self.assertEqual({'tags': 2, 'tag specs': 3, 'attr specs': 5, 'regexes': 4}, dict(amphtml_update.PROFILER.counters))
+
+
+if __name__ == '__main__':
+	unittest.main()
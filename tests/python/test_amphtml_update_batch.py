@@ -0,0 +1,120 @@
+"""
+Tests for bin/amphtml-update-batch.py.
+
+Run from the root of the plugin with:
+
+`python -m unittest discover -s tests/python`
+"""
+
+import distutils.spawn
+import imp
+import json
+import os
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+amphtml_update_batch = imp.load_source('amphtml_update_batch', os.path.join(PROJECT_PATH, 'bin', 'amphtml-update-batch.py'))
+
+FIXTURE_DIRECTORY = os.path.join(PROJECT_PATH, 'tests', 'benchmark', 'amphtml')
+
+
+
+def HasProtobuf():
+	"""Checks that protoc compiles a module which the installed google.protobuf can import."""
+	if not distutils.spawn.find_executable('protoc'):
+		return False
+	directory = tempfile.mkdtemp()
+	try:
+		with open(os.path.join(directory, 'check.proto'), 'w') as proto_file:
+			proto_file.write('syntax = "proto2";\nmessage Check {\n  optional string name = 1;\n}\n')
+		if subprocess.call(['protoc', '--proto_path=%s' % directory, '--python_out=%s' % directory, 'check.proto']):
+			return False
+		imp.load_source('check_pb2', os.path.join(directory, 'check_pb2.py')).Check(name='check')
+		return True
+	except Exception:
+		return False
+	finally:
+		shutil.rmtree(directory)
+
+
+HAS_PROTOBUF = HasProtobuf()
+
+
+class BatchTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_generate_revisions(self):
+		archive = os.path.join(self.directory, 'amphtml-archived.tar.gz')
+		with tarfile.open(archive, 'w:gz') as tar_file:
+			tar_file.add(FIXTURE_DIRECTORY, 'amphtml-archived')
+		zip_archive = os.path.join(self.directory, 'amphtml.zip')
+		with zipfile.ZipFile(zip_archive, 'w') as zip_file:
+			for (root, dirs, files) in os.walk(FIXTURE_DIRECTORY):
+				for name in files:
+					path = os.path.join(root, name)
+					zip_file.write(path, os.path.join('amphtml-zipped', os.path.relpath(path, FIXTURE_DIRECTORY)))
+			zip_file.writestr('amphtml-zipped/README.md', 'Not a spec file.')
+
+		out_dir = os.path.join(self.directory, 'out')
+		summary = amphtml_update_batch.GenerateRevisions([FIXTURE_DIRECTORY, archive, zip_archive], out_dir, jobs=2)
+
+		self.assertEqual(['amphtml', 'amphtml-archived', 'amphtml-2'], [revision['name'] for revision in summary['revisions']])
+		self.assertEqual(summary, json.load(open(os.path.join(out_dir, 'summary.json'))))
+
+		# The same spec gives the same outputs from a directory and from archives.
+		(expected, archived, zipped) = summary['revisions']
+		for key in ('spec_file_revision', 'tags', 'tag_specs', 'attr_specs'):
+			self.assertEqual(expected[key], archived[key])
+			self.assertEqual(expected[key], zipped[key])
+		for output_format in ('php', 'json'):
+			contents = open(expected['outputs'][output_format]).read()
+			self.assertEqual(contents, open(archived['outputs'][output_format]).read())
+			self.assertEqual(contents, open(zipped['outputs'][output_format]).read())
+		self.assertEqual(expected['spec_file_revision'], json.load(open(expected['outputs']['json']))['spec_file_revision'])
+		self.assertIn('ReadValidatorRules', expected['stages'])
+
+	def copy_fixture(self, name, proto_addition=''):
+		directory = os.path.join(self.directory, name)
+		shutil.copytree(FIXTURE_DIRECTORY, directory)
+		with open(os.path.join(directory, 'validator', 'validator.proto'), 'a') as proto_file:
+			proto_file.write(proto_addition)
+		return directory
+
+	def read_outputs(self, summary):
+		return [dict((output_format, open(path).read()) for (output_format, path) in revision['outputs'].items()) for revision in summary['revisions']]
+
+	def test_sequential(self):
+		sources = [FIXTURE_DIRECTORY, self.copy_fixture('amphtml-copy')]
+		sequential = amphtml_update_batch.GenerateRevisions(sources, os.path.join(self.directory, 'sequential'), jobs=1)
+		parallel = amphtml_update_batch.GenerateRevisions(sources, os.path.join(self.directory, 'parallel'), jobs=2)
+		self.assertEqual(['amphtml', 'amphtml-copy'], [revision['name'] for revision in sequential['revisions']])
+		self.assertEqual(self.read_outputs(parallel), self.read_outputs(sequential))
+
+	def test_missing_source(self):
+		with self.assertRaises(amphtml_update_batch.BatchError):
+			amphtml_update_batch.GenerateRevisions([os.path.join(self.directory, 'missing.tar.gz')], os.path.join(self.directory, 'out'))
+		with self.assertRaises(amphtml_update_batch.BatchError):
+			amphtml_update_batch.GenerateRevisions([os.path.join(self.directory, 'missing')], os.path.join(self.directory, 'out'))
+
+	@unittest.skipUnless(HAS_PROTOBUF, 'protoc and a google.protobuf Python module which can import its output are needed.')
+	def test_protobuf_versions(self):
+		# Two versions of validator.proto give two validator_pb2 modules, which can't be loaded into the same process.
+		sources = [FIXTURE_DIRECTORY, self.copy_fixture('amphtml-next', '\nmessage UnusedSpec {\n  optional string name = 1;\n}\n')]
+		summary = amphtml_update_batch.GenerateRevisions(sources, os.path.join(self.directory, 'protobuf'), jobs=1, parser='protobuf')
+		protoascii = amphtml_update_batch.GenerateRevisions(sources, os.path.join(self.directory, 'protoascii'), jobs=1)
+		self.assertEqual(self.read_outputs(protoascii), self.read_outputs(summary))
+
+
+if __name__ == '__main__':
+	unittest.main()
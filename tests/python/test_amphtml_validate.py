@@ -0,0 +1,132 @@
+"""
+Tests for bin/amphtml-validate.py.
+
+Run from the root of the plugin with:
+
+`python -m unittest discover -s tests/python`
+"""
+
+import imp
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+amphtml_update = imp.load_source('amphtml_update', os.path.join(PROJECT_PATH, 'bin', 'amphtml-update.py'))
+amphtml_validate = imp.load_source('amphtml_validate', os.path.join(PROJECT_PATH, 'bin', 'amphtml-validate.py'))
+
+
+def GetRules():
+	"""Gets a few rules, as loaded from the JSON written by `amphtml-update.py --json-out`."""
+	allowed_tags = {
+		'a': [{'tag_spec': {}, 'attr_spec_list': {'href': {'value_url': {'protocol': ['https']}}, 'target': {'value': ['_blank']}}}],
+		'amp-img': [{'tag_spec': {'amp_layout': {'supported_layouts': [2, 4]}}, 'attr_spec_list': {'src': {'mandatory': True, 'value_url': {'protocol': ['https']}}}}],
+		'body': [{'tag_spec': {}, 'attr_spec_list': {}}],
+		'p': [{'tag_spec': {}, 'attr_spec_list': {}}],
+	}
+	attr_lists = {
+		'$GLOBAL_ATTRS': {'id': {}},
+		'$AMP_LAYOUT_ATTRS': {'height': {}, 'layout': {}, 'width': {}},
+	}
+	versions = {'spec_file_revision': 1, 'min_validator_revision_required': 1}
+	rules_data = amphtml_update.GetRulesData(allowed_tags, attr_lists, {}, {}, versions)
+	return json.loads(amphtml_update.GenerateRulesJSON(rules_data))
+
+
+class ValidatorTest(unittest.TestCase):
+
+	def setUp(self):
+		self.validator = amphtml_validate.Validator(GetRules())
+
+	def test_valid(self):
+		self.assertEqual([], self.validator.Validate('<p id="x">Hi <a href="https://example.com/" target="_blank">there</a></p>'))
+
+	def test_invalid_element_and_attribute(self):
+		errors = self.validator.Validate('<p><font color="red"><a href="javascript:alert(1)" onclick="x()">there</a></font></p>')
+
+		self.assertEqual(3, len(errors))
+		self.assertEqual({'code': 'invalid_element', 'type': 'html_element_error', 'node_name': 'font', 'parent_name': 'p', 'node_attributes': {'color': 'red'}}, errors[0])
+
+		# The children of the removed font element are still validated.
+		self.assertEqual(['href', 'onclick'], sorted(error['node_name'] for error in errors[1:]))
+		for error in errors[1:]:
+			self.assertEqual('invalid_attribute', error['code'])
+			self.assertEqual('a', error['parent_name'])
+			self.assertEqual({'href': 'javascript:alert(1)', 'onclick': 'x()'}, error['element_attributes'])
+		self.assertEqual('js_error', [error for error in errors if 'onclick' == error['node_name']][0]['type'])
+
+	def test_mandatory_attribute(self):
+		errors = self.validator.Validate('<amp-img width="1" height="1"></amp-img>')
+		self.assertEqual(['invalid_element'], [error['code'] for error in errors])
+		self.assertEqual('body', errors[0]['parent_name'])
+
+	def test_layout(self):
+		self.assertEqual([], self.validator.Validate('<amp-img src="https://example.com/a.jpg" width="1" height="1" layout="RESPONSIVE"></amp-img>'))
+		errors = self.validator.Validate('<amp-img src="https://example.com/a.jpg" layout="fill"></amp-img>')
+		self.assertEqual([('invalid_attribute', 'layout')], [(error['code'], error['node_name']) for error in errors])
+
+	def test_layout_dimensions(self):
+		# The responsive layout needs a width and height in the same unit.
+		self.assertEqual([], self.validator.Validate('<amp-img src="https://example.com/a.jpg" width="16em" height="9em" layout="responsive"></amp-img>'))
+		for dimensions in ('width="1"', 'width="auto" height="1"', 'width="16em" height="9"', 'width="10%" height="1"'):
+			errors = self.validator.Validate('<amp-img src="https://example.com/a.jpg" %s layout="responsive"></amp-img>' % dimensions)
+			self.assertEqual([('invalid_attribute', 'layout')], [(error['code'], error['node_name']) for error in errors], dimensions)
+
+
+class PrunedRulesTest(unittest.TestCase):
+
+	def test_pruned_tags_are_rejected(self):
+		allowed_tags = {
+			'amp-video': [{'tag_spec': {'requires_extension': ['amp-video']}, 'attr_spec_list': {}}],
+			'body': [{'tag_spec': {}, 'attr_spec_list': {}}],
+			'p': [{'tag_spec': {}, 'attr_spec_list': {}}],
+		}
+		attr_lists = {'$GLOBAL_ATTRS': {}, '$AMP_LAYOUT_ATTRS': {}}
+		amphtml_update.PruneRules(allowed_tags, attr_lists, {}, {}, {'extensions': set(), 'tags': None})
+		rules_data = amphtml_update.GetRulesData(allowed_tags, attr_lists, {}, {}, {'spec_file_revision': 1, 'min_validator_revision_required': 1})
+		validator = amphtml_validate.Validator(json.loads(amphtml_update.GenerateRulesJSON(rules_data)))
+
+		errors = validator.Validate('<p>Hi</p><amp-video></amp-video>')
+		self.assertEqual([('invalid_element', 'amp-video')], [(error['code'], error['node_name']) for error in errors])
+
+
+class DocumentsTest(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_wxr(self):
+		wxr_file = os.path.join(self.directory, 'export.xml')
+		open(wxr_file, 'w').write(
+			'<?xml version="1.0" encoding="UTF-8" ?>\n'
+			'<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:wp="http://wordpress.org/export/1.2/">'
+			'<channel>'
+			'<item><content:encoded><![CDATA[<p>First</p>]]></content:encoded><wp:post_id>12</wp:post_id></item>'
+			'<item><content:encoded></content:encoded><wp:post_id>13</wp:post_id></item>'
+			'<item><content:encoded><![CDATA[<p>Third</p>]]></content:encoded><wp:post_id>14</wp:post_id></item>'
+			'</channel></rss>'
+		)
+		self.assertEqual(
+			[(wxr_file + '#12', '<p>First</p>'), (wxr_file + '#14', '<p>Third</p>')],
+			list(amphtml_validate.GetDocuments([wxr_file]))
+		)
+
+	def test_directory(self):
+		os.mkdir(os.path.join(self.directory, 'b'))
+		open(os.path.join(self.directory, 'b', 'post.html'), 'w').write('<p>B</p>')
+		open(os.path.join(self.directory, 'a.htm'), 'w').write('<p>A</p>')
+		open(os.path.join(self.directory, 'notes.txt'), 'w').write('Not a post')
+		self.assertEqual(
+			[(os.path.join(self.directory, 'a.htm'), '<p>A</p>'), (os.path.join(self.directory, 'b', 'post.html'), '<p>B</p>')],
+			list(amphtml_validate.GetDocuments([self.directory]))
+		)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -1358,6 +1358,12 @@ class AMP_Style_Sanitizer_Test extends WP_UnitTestCase {
 				array( 'illegal_css_property', 'illegal_css_property', 'illegal_css_property' ),
 			),
 
+			'vendor_prefixed_keyframe_properties' => array(
+				'<style amp-keyframes>@keyframes anim1 { 50% { -moz-opacity: 0.5; -khtml-transform: none; -webkit-color: red; } }</style>',
+				'<style amp-keyframes="">@keyframes anim1{50%{-moz-opacity:.5;-khtml-transform:none}}</style>',
+				array( 'illegal_css_property' ),
+			),
+
 			'style_amp_keyframes_with_disallowed_rules' => array(
 				'<style amp-keyframes>body { color:red; opacity:1; } @keyframes anim1 { 50% { opacity:0.5 !important; } } @font-face { font-family: "Open Sans"; src: url("/fonts/OpenSans-Regular-webfont.woff2") format("woff2"); }</style>',
 				'<style amp-keyframes="">@keyframes anim1{50%{opacity:.5}}</style>',
@@ -1398,6 +1404,36 @@ class AMP_Style_Sanitizer_Test extends WP_UnitTestCase {
 		$this->assertEquals( $expected_errors, $error_codes );
 	}
 
+	/**
+	 * Test that the CSS specs of the generated class have the at-rules and declarations of the style tag specs as keys.
+	 *
+	 * @covers \AMP_Allowed_Tags_Generated::get_css_spec()
+	 */
+	public function test_get_css_spec() {
+		$spec_names = array();
+		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'style' ) as $spec_rule ) {
+			if ( ! isset( $spec_rule[ AMP_Rule_Spec::CDATA ]['css_spec'] ) ) {
+				continue;
+			}
+			$spec_names[] = $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'];
+			$css_spec     = AMP_Allowed_Tags_Generated::get_css_spec( $spec_rule[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] );
+
+			$this->assertEqualSets( $spec_rule[ AMP_Rule_Spec::CDATA ]['css_spec']['allowed_at_rules'], array_keys( $css_spec['allowed_at_rules'] ) );
+			$this->assertSame( $spec_rule[ AMP_Rule_Spec::CDATA ]['css_spec']['validate_keyframes'], $css_spec['validate_keyframes'] );
+			foreach ( $spec_rule[ AMP_Rule_Spec::CDATA ]['css_spec']['declaration'] as $declaration ) {
+				$this->assertArrayHasKey( $declaration, $css_spec['declarations'] );
+				$this->assertArrayHasKey( '-webkit-' . $declaration, $css_spec['declarations'] );
+			}
+		}
+		$this->assertEqualSets( array( 'style amp-custom', 'style[amp-keyframes]' ), $spec_names );
+
+		$custom_css_spec    = AMP_Allowed_Tags_Generated::get_css_spec( 'style amp-custom' );
+		$attribute_css_spec = AMP_Allowed_Tags_Generated::get_css_spec( 'style attribute' );
+		$this->assertSame( array(), $attribute_css_spec['allowed_at_rules'] );
+		$this->assertSame( $custom_css_spec['declarations'], $attribute_css_spec['declarations'] );
+		$this->assertNull( AMP_Allowed_Tags_Generated::get_css_spec( 'style unknown' ) );
+	}
+
 	/**
 	 * Get stylesheet URLs.
 	 *
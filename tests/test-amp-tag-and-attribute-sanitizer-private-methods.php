@@ -1693,6 +1693,67 @@ class AMP_Tag_And_Attribute_Sanitizer_Attr_Spec_Rules_Test extends WP_UnitTestCa
 		$this->assertEquals( $expected, $got, sprintf( "using source: %s\n%s", $data['source'], wp_json_encode( $data ) ) );
 	}
 
+	/**
+	 * Test that an extension script is only validated against its own rule spec.
+	 *
+	 * @group allowed-tags-private-methods
+	 */
+	public function test_get_candidate_rule_spec_ids() {
+		$dom  = AMP_DOM_Utils::get_dom( '<html><head><script async custom-element="amp-carousel" src="https://cdn.ampproject.org/v0/amp-carousel-0.1.js"></script></head><body></body></html>' );
+		$node = $dom->getElementsByTagName( 'script' )->item( 0 );
+
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom );
+		$got       = $this->invoke_method( $sanitizer, 'get_candidate_rule_spec_ids', array( $node, $this->allowed_tags['script'] ) );
+		$this->assertCount( 1, $got );
+		$this->assertEquals( 'amp-carousel', $this->allowed_tags['script'][ $got[0] ]['tag_spec']['extension_spec']['name'] );
+
+		// Without the dispatch index all of the rule specs are candidates.
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom, array( 'amp_allowed_tags' => $this->allowed_tags ) );
+		$got       = $this->invoke_method( $sanitizer, 'get_candidate_rule_spec_ids', array( $node, $this->allowed_tags['script'] ) );
+		$this->assertEquals( array_keys( $this->allowed_tags['script'] ), $got );
+	}
+
+	/**
+	 * Test has_ancestor with the ancestors collected during the traversal.
+	 *
+	 * @covers AMP_Tag_And_Attribute_Sanitizer::get_ancestor_tag_names()
+	 * @covers AMP_Tag_And_Attribute_Sanitizer::has_ancestor()
+	 */
+	public function test_has_ancestor_with_ancestor_tag_names() {
+		$dom       = AMP_DOM_Utils::get_dom_from_content( '<form method="get"><div><p>Good Data</p></div></form>' );
+		$node      = $dom->getElementsByTagName( 'p' )->item( 0 );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom );
+
+		$ancestor_tag_names = $this->invoke_method( $sanitizer, 'get_ancestor_tag_names', array( $node ) );
+		$this->assertEquals( array( 'div', 'form', 'body', 'html', '#document' ), array_keys( $ancestor_tag_names ) );
+
+		$property = new ReflectionProperty( 'AMP_Tag_And_Attribute_Sanitizer', 'current_ancestors' );
+		$property->setAccessible( true );
+		$property->setValue(
+			$sanitizer,
+			array(
+				'node'      => $node,
+				'tag_names' => $ancestor_tag_names,
+			)
+		);
+		$this->assertTrue( $this->invoke_method( $sanitizer, 'has_ancestor', array( $node, 'form' ) ) );
+		$this->assertFalse( $this->invoke_method( $sanitizer, 'has_ancestor', array( $node, 'amp-sidebar' ) ) );
+
+		// Attributes are still checked on the ancestor itself.
+		$this->assertFalse( $this->invoke_method( $sanitizer, 'has_ancestor', array( $node, 'form [method=post]' ) ) );
+
+		// A set of disallowed ancestors is looked up at once, with or without the collected ancestors.
+		$disallowed_ancestor_set = array(
+			'amp-sidebar' => 'amp-sidebar',
+			'form'        => 'form [method=get]',
+		);
+		$this->assertTrue( $this->invoke_method( $sanitizer, 'has_ancestor', array( $node, $disallowed_ancestor_set ) ) );
+		$this->assertFalse( $this->invoke_method( $sanitizer, 'has_ancestor', array( $node, array( 'form' => 'form [method=post]' ) ) ) );
+		$property->setValue( $sanitizer, null );
+		$this->assertTrue( $this->invoke_method( $sanitizer, 'has_ancestor', array( $node, $disallowed_ancestor_set ) ) );
+		$this->assertFalse( $this->invoke_method( $sanitizer, 'has_ancestor', array( $node, array( 'template' => 'template' ) ) ) );
+	}
+
 	/**
 	 * Use this to call private methods.
 	 *
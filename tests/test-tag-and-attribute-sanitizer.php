@@ -1035,7 +1035,7 @@ class AMP_Tag_And_Attribute_Sanitizer_Test extends WP_UnitTestCase {
 					array(
 						'<amp-img src="/img1.png" width="50" height="50" layout="fill"></amp-img>',
 						'<amp-img src="/img1.png" width="50" height="50" layout="fixed"></amp-img>',
-						'<amp-img src="/img1.png" width="50" height="50" layout="fixed-height"></amp-img>',
+						'<amp-img src="/img1.png" width="auto" height="50" layout="fixed-height"></amp-img>',
 						'<amp-img src="/img1.png" width="50" height="50" layout="flex-item"></amp-img>',
 						'<amp-img src="/img1.png" width="50" height="50" layout="intrinsic"></amp-img>',
 						'<amp-img src="/img1.png" width="50" height="50" layout="nodisplay"></amp-img>',
@@ -1058,6 +1058,49 @@ class AMP_Tag_And_Attribute_Sanitizer_Test extends WP_UnitTestCase {
 				array(),
 			),
 
+			'amp-img-layout-dimensions-allowed' => array(
+				implode(
+					'',
+					array(
+						'<amp-img src="/img1.png" layout="fill"></amp-img>',
+						'<amp-img src="/img1.png" width="auto" height="50" layout="fixed-height"></amp-img>',
+						'<amp-img src="/img1.png" width="16em" height="9em" layout="responsive"></amp-img>',
+						'<amp-img src="/img1.png" width="50px" height="50" layout="intrinsic"></amp-img>',
+						'<amp-img src="/img1.png" width="10%" height="10%" layout="fill"></amp-img>',
+					)
+				),
+				null, // No change.
+				array(),
+			),
+
+			'amp-img-layout-dimensions-illegal' => array(
+				implode(
+					'',
+					array(
+						'<amp-img src="/img1.png" width="50" layout="responsive"></amp-img>',
+						'<amp-img src="/img1.png" width="auto" height="50" layout="fixed"></amp-img>',
+						'<amp-img src="/img1.png" width="50" layout="fixed-height"></amp-img>',
+						'<amp-img src="/img1.png" width="16em" height="9" layout="intrinsic"></amp-img>',
+						'<amp-img src="/img1.png" width="300" height="50" layout="fixed-height"></amp-img>',
+						'<amp-img src="/img1.png" width="10%" layout="fixed"></amp-img>',
+						'<amp-img src="/img1.png" width="10%" height="50" layout="responsive"></amp-img>',
+					)
+				),
+				implode(
+					'',
+					array(
+						'<amp-img src="/img1.png" width="50"></amp-img>',
+						'<amp-img src="/img1.png" width="auto" height="50"></amp-img>',
+						'<amp-img src="/img1.png" width="50"></amp-img>',
+						'<amp-img src="/img1.png" width="16em" height="9"></amp-img>',
+						'<amp-img src="/img1.png" width="300" height="50"></amp-img>',
+						'<amp-img src="/img1.png" width="10%"></amp-img>',
+						'<amp-img src="/img1.png" width="10%" height="50"></amp-img>',
+					)
+				),
+				array(),
+			),
+
 			'non-layout-span-element-attrs' => array(
 				'<span id="test" width="1" height="1" heights="(min-width:500px) 200px, 80%" sizes="(min-width: 650px) 50vw, 100vw" layout="nodisplay" [height]="1" [width]="1">Test</span>',
 				'<span id="test">Test</span>',
@@ -1427,6 +1470,230 @@ class AMP_Tag_And_Attribute_Sanitizer_Test extends WP_UnitTestCase {
 		$this->assertEqualSets( $scripts, array_keys( $sanitizer->get_scripts() ) );
 	}
 
+	/**
+	 * Test that passing all of the allowed tags up front gives the same result as loading them on demand.
+	 *
+	 * @dataProvider get_body_data
+	 * @group        allowed-tags
+	 *
+	 * @param string $source   Markup to process.
+	 * @param string $expected The markup to expect.
+	 * @param array  $scripts  The AMP component script names that are obtained through sanitization.
+	 */
+	public function test_body_sanitizer_with_amp_allowed_tags_arg( $source, $expected = null, $scripts = array() ) {
+		$expected  = isset( $expected ) ? $expected : $source;
+		$dom       = AMP_DOM_Utils::get_dom_from_content( $source );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer(
+			$dom,
+			array(
+				'amp_allowed_tags' => AMP_Allowed_Tags_Generated::get_allowed_tags(),
+			)
+		);
+		$sanitizer->sanitize();
+		$content = AMP_DOM_Utils::get_content_from_dom( $dom );
+
+		$this->assertEqualMarkup( $expected, $content );
+		$this->assertEqualSets( $scripts, array_keys( $sanitizer->get_scripts() ) );
+	}
+
+	/**
+	 * Test that the extension index of the generated class agrees with the tag specs it was built from.
+	 *
+	 * @covers \AMP_Allowed_Tags_Generated::get_extension_index()
+	 * @covers \AMP_Allowed_Tags_Generated::get_extension_spec()
+	 */
+	public function test_get_extension_index() {
+		$extension_index = AMP_Allowed_Tags_Generated::get_extension_index();
+		$this->assertEquals( array( 'amp-ad' ), $extension_index['tags']['amp-ad'] );
+		$this->assertEquals( array( 'amp-video-docking' ), $extension_index['attributes']['dock'] );
+
+		// The input tag requires amp-inputmask only when it matches a spec with a mask attribute.
+		$this->assertArrayNotHasKey( 'input', $extension_index['tags'] );
+
+		foreach ( $extension_index['tags'] as $tag_name => $extensions ) {
+			foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( $tag_name ) as $rule_spec ) {
+				if ( isset( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['requires_extension'] ) ) {
+					$this->assertEqualSets( $extensions, $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['requires_extension'] );
+				}
+			}
+			foreach ( $extensions as $extension ) {
+				$this->assertNotNull( AMP_Allowed_Tags_Generated::get_extension_spec( $extension ), $extension );
+			}
+		}
+
+		$extension_spec = AMP_Allowed_Tags_Generated::get_extension_spec( 'amp-bind' );
+		$this->assertEquals( 'amp-bind', $extension_spec['name'] );
+		$this->assertContains( 'latest', $extension_spec['version'] );
+		$this->assertNull( AMP_Allowed_Tags_Generated::get_extension_spec( 'amp-unknown' ) );
+	}
+
+	/**
+	 * Test that the mandatory attributes listed in the generated tag specs agree with their attribute specs.
+	 *
+	 * @covers \AMP_Tag_And_Attribute_Sanitizer::get_mandatory_attrs()
+	 */
+	public function test_generated_mandatory_attrs() {
+		$dom       = AMP_DOM_Utils::get_dom_from_content( '' );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom );
+		$method    = new ReflectionMethod( $sanitizer, 'get_mandatory_attrs' );
+		$method->setAccessible( true );
+
+		foreach ( AMP_Allowed_Tags_Generated::get_allowed_tags() as $tag_name => $rule_specs ) {
+			foreach ( $rule_specs as $rule_spec ) {
+				$mandatory_attrs = isset( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_ATTRS ] ) ? $rule_spec[ AMP_Rule_Spec::TAG_SPEC ][ AMP_Rule_Spec::MANDATORY_ATTRS ] : array();
+				$this->assertEqualSets( $method->invoke( $sanitizer, $rule_spec ), $mandatory_attrs, $tag_name );
+			}
+		}
+	}
+
+	/**
+	 * Test that the placeholders for amp-bind attributes are allowed where their bracketed attributes are.
+	 */
+	public function test_amp_bind_placeholder_attributes() {
+		$prefix    = AMP_DOM_Utils::get_amp_bind_placeholder_prefix();
+		$dom       = AMP_DOM_Utils::get_dom_from_content( sprintf( '<amp-img src="https://example.com/a.jpg" width="1" height="1" %1$ssrc="foo.src" %1$sbar="baz"></amp-img>', $prefix ) );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom );
+		$sanitizer->sanitize();
+
+		$img = $dom->getElementsByTagName( 'amp-img' )->item( 0 );
+		$this->assertTrue( $img->hasAttribute( $prefix . 'src' ) );
+		$this->assertFalse( $img->hasAttribute( $prefix . 'bar' ) );
+		$this->assertEquals( array( 'amp-bind' ), array_keys( $sanitizer->get_scripts() ) );
+	}
+
+	/**
+	 * Test that repeated attribute values are checked once, with the same results as when checked each time.
+	 *
+	 * @covers \AMP_Tag_And_Attribute_Sanitizer::check_attr_spec_rule_memoized()
+	 * @covers \AMP_Tag_And_Attribute_Sanitizer::get_attr_spec_rule_result_stats()
+	 */
+	public function test_attr_spec_rule_memo() {
+		$links     = str_repeat( '<a href="https://example.com/">Valid</a><a rel="import">Invalid</a>', 20 );
+		$dom       = AMP_DOM_Utils::get_dom_from_content( $links );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom );
+		$sanitizer->sanitize();
+
+		$this->assertEquals(
+			str_repeat( '<a href="https://example.com/">Valid</a><a>Invalid</a>', 20 ),
+			AMP_DOM_Utils::get_content_from_dom( $dom )
+		);
+
+		$stats = $sanitizer->get_attr_spec_rule_result_stats();
+		$this->assertGreaterThan( 0, $stats['misses'] );
+		$this->assertGreaterThanOrEqual( 19 * $stats['misses'], $stats['hits'] );
+		$this->assertEquals( $stats['misses'], $stats['size'] );
+		$this->assertEquals( 0, $stats['evictions'] );
+		$this->assertGreaterThan( 0.9, $stats['hit_rate'] );
+	}
+
+	/**
+	 * Test that the spec hits are recorded when the spec_hits_file arg is set, and added to the file.
+	 *
+	 * @covers \AMP_Tag_And_Attribute_Sanitizer::get_spec_hits()
+	 */
+	public function test_spec_hits() {
+		$spec_hits_file = wp_tempnam( 'spec-hits.json' );
+		$content        = '<a href="https://example.com/">Valid</a><a rel="import">Invalid</a><input type="text">';
+
+		$dom       = AMP_DOM_Utils::get_dom_from_content( $content );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom );
+		$sanitizer->sanitize();
+		$this->assertNull( $sanitizer->get_spec_hits() );
+
+		for ( $i = 0; $i < 2; $i++ ) {
+			$dom       = AMP_DOM_Utils::get_dom_from_content( $content );
+			$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom, array( 'spec_hits_file' => $spec_hits_file ) );
+			$sanitizer->sanitize();
+		}
+
+		$spec_hits = $sanitizer->get_spec_hits();
+		$this->assertEquals( 1, $spec_hits['documents'] );
+		$this->assertEquals( 2, $spec_hits['tag_specs']['a']['hits'] );
+		$this->assertEquals( 1, $spec_hits['tag_specs']['input']['hits'] );
+		foreach ( $spec_hits['tag_specs'] as $spec_name => $counts ) {
+			if ( 0 === strpos( $spec_name, 'INPUT [' ) ) {
+				$this->assertEquals( 0, $counts['hits'], $spec_name );
+			}
+		}
+		$this->assertGreaterThan( 0, $spec_hits['attr_rules']['allowed_protocol']['hits'] );
+		$this->assertGreaterThanOrEqual( 0, $spec_hits['tag_specs']['a']['seconds'] );
+
+		$written = json_decode( file_get_contents( $spec_hits_file ), true ); // phpcs:ignore WordPress.WP.AlternativeFunctions.file_get_contents_file_get_contents
+		$this->assertEquals( 2, $written['documents'] );
+		$this->assertEquals( 4, $written['tag_specs']['a']['hits'] );
+		$this->assertEquals( 2, $written['tag_specs']['input']['hits'] );
+		unlink( $spec_hits_file );
+	}
+
+	/**
+	 * Test that the spec hits are added to a file which lacks some of the counts, and not written to a path which can't be written.
+	 *
+	 * @covers \AMP_Tag_And_Attribute_Sanitizer::write_spec_hits()
+	 */
+	public function test_spec_hits_file() {
+		$spec_hits_file = wp_tempnam( 'spec-hits.json' );
+		file_put_contents( $spec_hits_file, wp_json_encode( array( 'tag_specs' => array( 'a' => array( 'hits' => 3 ) ) ) ) ); // phpcs:ignore WordPress.WP.AlternativeFunctions.file_system_read_file_put_contents
+
+		$dom       = AMP_DOM_Utils::get_dom_from_content( '<a href="https://example.com/">Valid</a>' );
+		$sanitizer = new AMP_Tag_And_Attribute_Sanitizer( $dom, array( 'spec_hits_file' => $spec_hits_file ) );
+		$sanitizer->sanitize();
+
+		$written = json_decode( file_get_contents( $spec_hits_file ), true ); // phpcs:ignore WordPress.WP.AlternativeFunctions.file_get_contents_file_get_contents
+		$this->assertEquals( 1, $written['documents'] );
+		$this->assertEquals( 4, $written['tag_specs']['a']['hits'] );
+		$this->assertArrayHasKey( 'seconds', $written['tag_specs']['a'] );
+		unlink( $spec_hits_file );
+
+		$spec_hits_file = get_temp_dir() . 'amp-missing-' . wp_generate_password( 12, false ) . '/spec-hits.json';
+		$dom            = AMP_DOM_Utils::get_dom_from_content( '<a href="https://example.com/">Valid</a>' );
+		$sanitizer      = new AMP_Tag_And_Attribute_Sanitizer( $dom, array( 'spec_hits_file' => $spec_hits_file ) );
+		$sanitizer->sanitize();
+		$spec_hits = $sanitizer->get_spec_hits();
+		$this->assertEquals( 1, $spec_hits['documents'] );
+		$this->assertFileNotExists( $spec_hits_file );
+	}
+
+	/**
+	 * Test that the regex patterns prepared by amphtml-update.py compile and match like the regexes they were translated from.
+	 *
+	 * @covers \AMP_Tag_And_Attribute_Sanitizer::validate_cdata_for_node()
+	 */
+	public function test_generated_regex_patterns() {
+		$patterns = array();
+		$collect  = function( $value, $key ) use ( &$patterns ) {
+			if ( '_pcre' === substr( $key, -5 ) ) {
+				$patterns[] = $value;
+			}
+		};
+		$specs    = array(
+			AMP_Allowed_Tags_Generated::get_allowed_tags(),
+			AMP_Allowed_Tags_Generated::get_allowed_attributes(),
+			AMP_Allowed_Tags_Generated::get_layout_attributes(),
+		);
+		array_walk_recursive( $specs, $collect );
+		$this->assertNotEmpty( $patterns );
+		foreach ( array_unique( $patterns ) as $pattern ) {
+			$this->assertNotFalse( @preg_match( $pattern, '' ), $pattern ); // phpcs:ignore WordPress.PHP.NoSilencedErrors.Discouraged
+		}
+
+		// The cdata_regex must match the whole boilerplate, as in the AMP validator.
+		preg_match_all( '#<style amp-boilerplate>(.+?)</style>#', amp_get_boilerplate_code(), $matches );
+		$boilerplate = array(
+			'head > style[amp-boilerplate]'     => $matches[1][0],
+			'noscript > style[amp-boilerplate]' => $matches[1][1],
+		);
+		foreach ( $boilerplate as $spec_name => $css ) {
+			$cdata = null;
+			foreach ( AMP_Allowed_Tags_Generated::get_allowed_tag( 'style' ) as $rule_spec ) {
+				if ( isset( $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) && $spec_name === $rule_spec[ AMP_Rule_Spec::TAG_SPEC ]['spec_name'] ) {
+					$cdata = $rule_spec[ AMP_Rule_Spec::CDATA ];
+				}
+			}
+			$this->assertEquals( 1, preg_match( $cdata['cdata_regex_pcre'], $css ), $spec_name );
+			$this->assertEquals( 0, preg_match( $cdata['cdata_regex_pcre'], $css . 'body{}' ), $spec_name );
+		}
+	}
+
 	/**
 	 * Get data for testing sanitization in the html.
 	 *